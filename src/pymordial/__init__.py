@@ -12,7 +12,8 @@ from pymordial.controller import (
     PymordialController,
     TextController,
 )
-from pymordial.core import PymordialApp, PymordialElement, PymordialScreen
+from pymordial.core import Frame, PymordialApp, PymordialElement, PymordialScreen
+from pymordial.core.elements.pymordial_feature_image import PymordialFeatureImage
 from pymordial.core.elements.pymordial_image import PymordialImage
 from pymordial.core.elements.pymordial_pixel import PymordialPixel
 from pymordial.core.elements.pymordial_text import PymordialText
@@ -29,6 +30,7 @@ from pymordial.state_machine import AppLifecycleState, BluestacksState, StateMac
 __all__ = [
     "AdbController",
     "AppLifecycleState",
+    "Frame",
     "PymordialApp",
     "PymordialAppError",
     "PymordialConnectionError",
@@ -36,6 +38,7 @@ __all__ = [
     "PymordialElement",
     "PymordialEmulatorError",
     "PymordialError",
+    "PymordialFeatureImage",
     "PymordialImage",
     "PymordialPixel",
     "PymordialScreen",
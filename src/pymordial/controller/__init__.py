@@ -2,6 +2,7 @@ from .adb_controller import AdbController
 from .bluestacks_controller import BluestacksController, BluestacksElements
 from .image_controller import ImageController
 from .pymordial_controller import PymordialController
+from .snapshot import Snapshot
 from .text_controller import TextController
 
 __all__ = [
@@ -10,5 +11,6 @@ __all__ = [
     "BluestacksElements",
     "ImageController",
     "PymordialController",
+    "Snapshot",
     "TextController",
 ]
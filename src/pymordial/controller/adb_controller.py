@@ -12,6 +12,7 @@ from adb_shell.adb_device import AdbDeviceTcp
 
 from pymordial.core.pymordial_app import PymordialApp
 from pymordial.utils.config import get_config
+from pymordial.utils.retry import FixedRetry, RetryPolicy
 
 _CONFIG = get_config()
 
@@ -88,6 +89,9 @@ class AdbController:
         self._stream_thread: threading.Thread | None = None
         self._latest_frame: np.ndarray | None = None
         self._is_streaming = threading.Event()
+        # Counts decoded frames; waiters are woken on every new frame
+        self._frame_index = 0
+        self._new_frame = threading.Condition()
 
     def connect(self) -> bool:
         """Establishes the TCP connection to the ADB service.
@@ -260,8 +264,10 @@ class AdbController:
                         if not self._is_streaming.is_set():
                             break
                         rgb_frame = frame.to_ndarray(format="rgb24")
-                        # No lock needed - assignment is atomic in Python (GIL)
-                        self._latest_frame = rgb_frame
+                        with self._new_frame:
+                            self._latest_frame = rgb_frame
+                            self._frame_index += 1
+                            self._new_frame.notify_all()
 
             except Exception as e:
                 if self._is_streaming.is_set():
@@ -269,6 +275,9 @@ class AdbController:
             finally:
                 stream_reader.close()
                 self._is_streaming.clear()
+                # Release frame waiters; the stream is gone
+                with self._new_frame:
+                    self._new_frame.notify_all()
                 self.logger.debug("Stream ended")
 
         self._stream_thread = threading.Thread(target=stream_worker, daemon=True)
@@ -297,6 +306,28 @@ class AdbController:
         self._latest_frame = None
         self.logger.info("Stream stopped")
 
+    @property
+    def frame_index(self) -> int:
+        """Number of frames decoded since the controller was created."""
+        return self._frame_index
+
+    def wait_for_frame(self, after: int, timeout: float) -> int | None:
+        """Blocks until the stream decodes a frame newer than ``after``.
+
+        Args:
+            after: The last frame index seen by the caller.
+            timeout: Most seconds to wait.
+
+        Returns:
+            The new frame index, or None on timeout or if the stream stopped.
+        """
+        with self._new_frame:
+            self._new_frame.wait_for(
+                lambda: self._frame_index > after or not self._is_streaming.is_set(),
+                timeout=max(0.0, timeout),
+            )
+            return self._frame_index if self._frame_index > after else None
+
     def get_latest_frame(self) -> np.ndarray | None:
         """Gets the latest decoded frame from the stream.
 
@@ -366,13 +397,21 @@ class AdbController:
         app: PymordialApp,
         timeout: int,
         wait_time: int,
+        retry_policy: RetryPolicy | None = None,
     ) -> bool:
         """Opens an app using the PymordialApp object.
 
+        Each attempt launches the app and checks up to 5 times whether its
+        process started; those checks share the ``timeout`` budget, so the
+        call returns within ``timeout`` seconds plus one ADB command.
+
         Args:
             app: The PymordialApp object to open.
             timeout: The timeout for the ADB command.
             wait_time: The wait time between retries.
+            retry_policy: Optional policy replacing the fixed ``wait_time``
+                interval between launch attempts; it is still bounded by
+                ``timeout``.
 
         Returns:
             True if the app is opened, False otherwise.
@@ -383,21 +422,19 @@ class AdbController:
                 "ADB device not initialized. Skipping 'open_app' method call."
             )
             return False
-        # Wait for app to open by checking if it's running
-        start_time: float = time.time()
-        while time.time() - start_time < timeout:
-            self.shell_command(
-                f"monkey -p {app.package_name} -v {MONKEY_VERBOSITY}"
+
+        def launch() -> bool:
+            self.shell_command(f"monkey -p {app.package_name} -v {MONKEY_VERBOSITY}")
+            return self.is_app_running(app, max_retries=5, wait_time=wait_time)
+
+        policy = (retry_policy or FixedRetry(interval=wait_time)).with_limits(
+            timeout=timeout
+        )
+        if policy.run(launch, name="adb.open_app"):
+            self.logger.debug(
+                f"App with package name: {app.package_name} opened via ADB"
             )
-            match self.is_app_running(app, max_retries=5, wait_time=wait_time):
-                case True:
-                    self.logger.debug(
-                        f"App with package name: {app.package_name} opened via ADB"
-                    )
-                    return True
-                case False:
-                    time.sleep(wait_time)
-                    continue
+            return True
         # If app isn't running after timeout, raise error
         self.logger.warning(
             f"App with package name: {app.package_name} did not start within {timeout} seconds"
@@ -409,6 +446,7 @@ class AdbController:
         app: PymordialApp,
         max_retries: int = 1,
         wait_time: int = 1,
+        retry_policy: RetryPolicy | None = None,
     ) -> bool:
         """Checks if an app is running using ps command.
 
@@ -419,6 +457,8 @@ class AdbController:
             max_retries: Number of times to retry (default: 1 for quick check).
                         Set higher when waiting for app to start.
             wait_time: Seconds to wait between retries.
+            retry_policy: Optional policy replacing the fixed ``wait_time``
+                interval; it is still bounded by ``max_retries``.
 
         Returns:
             True if the app process is found, False otherwise.
@@ -436,52 +476,36 @@ class AdbController:
             )
             return False
 
-        for attempt in range(max_retries):
-            try:
-                # Use ps -A to list ALL processes and grep for the package name
-                output: bytes | None = self.shell_command(
-                    f"ps -A | grep {app.package_name}"
-                )
-
-                found = False
-                if output:
-                    # Parse output to ensure exact match (avoid partial matches)
-                    lines = output.decode("utf-8").strip().splitlines()
-                    for line in lines:
-                        parts = line.split()
-                        if not parts:
-                            continue
-                        # The process name is usually the last column
-                        process_name = parts[-1]
-                        if process_name == app.package_name:
-                            found = True
-                            break
-
-                if found:
-                    self.logger.debug(
-                        f"Found {app.app_name} process (attempt {attempt + 1}/{max_retries})"
-                    )
-                    return True
-                else:
-                    if attempt < max_retries - 1:  # More retries remaining
-                        self.logger.debug(
-                            f"{app.app_name} process not found. Retrying... ({attempt + 1}/{max_retries})"
-                        )
-                        time.sleep(wait_time)
-                    else:  # Last attempt
-                        self.logger.debug(
-                            f"{app.app_name} process not found after {max_retries} attempts"
-                        )
-            except Exception as e:
-                # grep returns exit code 1 when no match found - this is expected
-                if attempt < max_retries - 1:
-                    self.logger.debug(
-                        f"App process check attempt {attempt + 1} failed: {e}"
-                    )
-                    time.sleep(wait_time)
-                else:
-                    self.logger.debug(f"App process not found or error: {e}")
+        policy = (retry_policy or FixedRetry(interval=wait_time)).with_limits(
+            max_attempts=max_retries
+        )
+        if policy.run(lambda: self._app_process_found(app), name="adb.is_app_running"):
+            self.logger.debug(f"Found {app.app_name} process")
+            return True
+        self.logger.debug(
+            f"{app.app_name} process not found after {policy.max_attempts} attempts"
+        )
+        return False
 
+    def _app_process_found(self, app: PymordialApp) -> bool:
+        """Checks once whether the app's process is listed by ps."""
+        try:
+            # Use ps -A to list ALL processes and grep for the package name
+            output: bytes | None = self.shell_command(
+                f"ps -A | grep {app.package_name}"
+            )
+        except Exception as e:
+            # grep returns exit code 1 when no match found - this is expected
+            self.logger.debug(f"App process check failed: {e}")
+            return False
+        if not output:
+            return False
+        # Parse output to ensure exact match (avoid partial matches)
+        for line in output.decode("utf-8").strip().splitlines():
+            parts = line.split()
+            # The process name is usually the last column
+            if parts and parts[-1] == app.package_name:
+                return True
         return False
 
     def close_app(
@@ -489,13 +513,19 @@ class AdbController:
         app: PymordialApp,
         timeout: int,
         wait_time: int,
+        retry_policy: RetryPolicy | None = None,
     ) -> bool:
         """Closes an app using the PymordialApp object.
 
+        The app is force-stopped, then polled until its process is gone;
+        the force-stop is repeated after every poll that still finds it.
+
         Args:
             app: The PymordialApp object to close.
             timeout: The timeout for the ADB command.
             wait_time: The wait time between retries.
+            retry_policy: Optional policy replacing the fixed ``wait_time``
+                interval between polls; it is still bounded by ``timeout``.
 
         Returns:
             True if the app is closed, False otherwise.
@@ -507,25 +537,18 @@ class AdbController:
             )
             return False
 
-        # Force stop the app
-        self.shell_command(
-            f"am force-stop {app.package_name}",
-        )
-
-        # Wait a moment for the app to close
-        time.sleep(wait_time)
-
-        self.shell_command(f"am force-stop {app.package_name}")
+        def force_stop() -> bool:
+            self.shell_command(f"am force-stop {app.package_name}")
+            return not self._app_process_found(app)
 
-        # Poll for app closure
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if not self.is_app_running(app, max_retries=1, wait_time=0.1):
-                self.logger.debug(
-                    f"App with package name: {app.package_name} closed via ADB"
-                )
-                return True
-            time.sleep(wait_time)
+        policy = (retry_policy or FixedRetry(interval=wait_time)).with_limits(
+            timeout=timeout
+        )
+        if policy.run(force_stop, name="adb.close_app"):
+            self.logger.debug(
+                f"App with package name: {app.package_name} closed via ADB"
+            )
+            return True
 
         self.logger.warning(
             f"App with package name: {app.package_name} may still be running after force stop"
@@ -15,12 +15,14 @@ from pymordial.core.pymordial_element import PymordialElement
 from pymordial.state_machine import BluestacksState, StateMachine
 from pymordial.utils import validate_and_convert_int
 from pymordial.utils.config import get_config
+from pymordial.utils.retry import FixedRetry, RetryPolicy
 
 _CONFIG = get_config()
 
 # --- Bluestacks Configuration ---
 DEFAULT_TRANSPORT_TIMEOUT_S = _CONFIG["bluestacks"]["default_transport_timeout_s"]
 WAIT_FOR_LOAD_TIMEOUT = _CONFIG["bluestacks"]["wait_for_load_timeout"]
+UI_SETTLE_TIME = _CONFIG["bluestacks"]["ui_settle_time"]
 HD_PLAYER_EXE = _CONFIG["bluestacks"]["hd_player_exe"]
 DEFAULT_REF_WINDOW_SIZE = tuple(_CONFIG["bluestacks"]["resolution"])
 DEFAULT_MAX_RETRIES = _CONFIG["bluestacks"]["default_max_retries"]
@@ -354,6 +356,7 @@ class BluestacksController:
         max_retries: int = DEFAULT_MAX_RETRIES,
         wait_time: int = DEFAULT_WAIT_TIME,
         timeout_s: int = DEFAULT_TIMEOUT,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """Opens the BlueStacks emulator.
 
@@ -361,6 +364,9 @@ class BluestacksController:
             max_retries: Maximum number of retries.
             wait_time: Wait time between retries.
             timeout_s: Timeout in seconds.
+            retry_policy: Optional policy replacing the fixed ``wait_time``
+                interval between window checks; it is still bounded by
+                ``max_retries`` and ``timeout_s``.
 
         Raises:
             ValueError: If BlueStacks fails to start.
@@ -380,35 +386,27 @@ class BluestacksController:
                     logger.error(f"Failed to start Bluestacks: {e}")
                     raise ValueError(f"Failed to start Bluestacks: {e}")
 
-                start_time: float = time.time()
-
-                for attempt in range(max_retries):
-                    is_open: bool = any(
+                policy = (retry_policy or FixedRetry(interval=wait_time)).with_limits(
+                    max_attempts=max_retries, timeout=timeout_s
+                )
+                is_open: bool = policy.run(
+                    lambda: any(
                         p.name().lower() == HD_PLAYER_EXE.lower()
                         for p in psutil.process_iter(["name"])
-                    )
-                    if is_open:
-                        logger.info("Bluestacks controller opened successfully.")
-                        # Transition to LOADING - state handler will automatically call wait_for_load()
-                        self.bluestacks_state.transition_to(BluestacksState.LOADING)
-                        return
-
-                    if time.time() - start_time > timeout_s:
-                        logger.error("Timeout waiting for Bluestacks window to appear")
-                        raise Exception(
-                            "Timeout waiting for Bluestacks window to appear"
-                        )
-
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries}: Could not find Bluestacks window."
-                    )
-                    time.sleep(wait_time)
+                    ),
+                    name="bluestacks.open",
+                )
+                if is_open:
+                    logger.info("Bluestacks controller opened successfully.")
+                    # Transition to LOADING - state handler will automatically call wait_for_load()
+                    self.bluestacks_state.transition_to(BluestacksState.LOADING)
+                    return
 
                 logger.error(
-                    f"Failed to find Bluestacks window after all attempts {attempt + 1}/{max_retries}"
+                    f"Failed to find Bluestacks window within {max_retries} attempts or {timeout_s}s"
                 )
                 raise Exception(
-                    f"Failed to find Bluestacks window after all attempts {attempt + 1}/{max_retries}"
+                    f"Failed to find Bluestacks window within {max_retries} attempts or {timeout_s}s"
                 )
             case BluestacksState.LOADING:
                 logger.info(
@@ -419,38 +417,48 @@ class BluestacksController:
                 logger.info("Bluestacks controller is already open and ready.")
                 return
 
-    def wait_for_load(self, timeout_s: int = WAIT_FOR_LOAD_TIMEOUT):
+    def wait_for_load(
+        self,
+        timeout_s: int = WAIT_FOR_LOAD_TIMEOUT,
+        retry_policy: RetryPolicy | None = None,
+    ):
         """Waits for Bluestacks to finish loading by polling ADB connection.
 
         Args:
             timeout_s: Maximum number of seconds to wait.
+            retry_policy: Optional policy replacing the fixed
+                ``DEFAULT_WAIT_TIME`` interval between connection attempts;
+                it is still bounded by ``timeout_s``.
 
         Raises:
             TimeoutError: If loading takes longer than timeout.
         """
         logger.debug("Waiting for Bluestacks to load (ADB check)...")
-        start_time = time.time()
-
-        while self.bluestacks_state.current_state == BluestacksState.LOADING:
-            # Try to connect to ADB
-            if self._adb_controller.connect():
-                logger.debug("ADB connected! Waiting 5 seconds for UI to stabilize...")
-                time.sleep(5)
-                logger.info("Bluestacks is loaded & ready.")
-                self.bluestacks_state.transition_to(BluestacksState.READY)
-                return
 
-            # Check timeout
-            if time.time() - start_time > timeout_s:
-                logger.error(
-                    f"Timeout waiting for Bluestacks to load after {timeout_s}s"
-                )
-                # We transition to READY anyway to allow retry logic elsewhere if needed,
-                # or maybe we should raise? For now, mimicking previous behavior.
-                self.bluestacks_state.transition_to(BluestacksState.READY)
-                return
+        def loaded() -> bool:
+            # Stop polling if the state was changed elsewhere
+            if self.bluestacks_state.current_state != BluestacksState.LOADING:
+                return True
+            return self._adb_controller.connect()
 
-            time.sleep(DEFAULT_WAIT_TIME)
+        policy = (retry_policy or FixedRetry(interval=DEFAULT_WAIT_TIME)).with_limits(
+            timeout=timeout_s
+        )
+        if not policy.run(loaded, name="bluestacks.wait_for_load"):
+            logger.error(f"Timeout waiting for Bluestacks to load after {timeout_s}s")
+            # We transition to READY anyway to allow retry logic elsewhere if needed,
+            # or maybe we should raise? For now, mimicking previous behavior.
+            self.bluestacks_state.transition_to(BluestacksState.READY)
+            return
+        if self.bluestacks_state.current_state != BluestacksState.LOADING:
+            return
+
+        logger.debug(
+            f"ADB connected! Waiting {UI_SETTLE_TIME} seconds for UI to stabilize..."
+        )
+        time.sleep(UI_SETTLE_TIME)
+        logger.info("Bluestacks is loaded & ready.")
+        self.bluestacks_state.transition_to(BluestacksState.READY)
 
     def kill_bluestacks(self) -> bool:
         """Kills the Bluestacks controller process.
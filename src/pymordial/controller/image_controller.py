@@ -1,19 +1,31 @@
 """Controller for image processing and element detection."""
 
 import logging
-from io import BytesIO
-from time import sleep
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 from adb_shell.exceptions import TcpTimeoutException
 from PIL import Image
-from pyautogui import ImageNotFoundException, center, locate
+from pyautogui import center
 
+from pymordial.core.elements.pymordial_feature_image import PymordialFeatureImage
 from pymordial.core.elements.pymordial_image import PymordialImage
 from pymordial.core.elements.pymordial_pixel import PymordialPixel
+from pymordial.core.frame import Frame
 from pymordial.core.pymordial_element import PymordialElement
 from pymordial.utils.config import get_config
+from pymordial.utils.debug_images import PIXEL_SNAPSHOT_SIZE, DebugImageWriter
+from pymordial.utils.retry import FixedRetry, RetryPolicy
+from pymordial.vision.bundle import AssetBundle, load_asset_bundle
+from pymordial.vision.features import (
+    FeatureMatch,
+    FeatureSet,
+    extract_features,
+    load_template_features,
+    match_features,
+)
+from pymordial.vision.templates import Template, load_template, match_template
 
 if TYPE_CHECKING:
     from pymordial.controller.pymordial_controller import PymordialController
@@ -31,40 +43,119 @@ class ImageController:
 
     Attributes:
         text_controller: Helper for checking text in images.
+        asset_bundles: Precompiled asset bundles consulted before loading
+            element images from disk.
+        debug_writer: Optional background writer receiving a snapshot of
+            every template match and pixel check, with the match outlined.
     """
 
     def __init__(self, PymordialController: "PymordialController"):
         """Initializes the ImageController."""
         self.pymordial_controller = PymordialController
+        self.asset_bundles: list[AssetBundle] = []
+        self.debug_writer: DebugImageWriter | None = None
+
+    def _debug_snapshot(
+        self,
+        name: str,
+        frame: Frame,
+        region: "tuple[float, float, float, float] | None" = None,
+        boxes: tuple[tuple[int, int, int, int], ...] = (),
+    ) -> None:
+        """Queues a region of the frame, with screen-space boxes, for debugging.
+
+        Args:
+            name: Snapshot name.
+            frame: The screen frame.
+            region: (left, top, right, bottom) area to save; the whole frame
+                if None.
+            boxes: (left, top, right, bottom) boxes to outline.
+        """
+        if self.debug_writer is None:
+            return
+        width, height = frame.size
+        left, top, right, bottom = region or (0, 0, width, height)
+        left, top = max(0, int(left)), max(0, int(top))
+        right, bottom = min(width, int(right)), min(height, int(bottom))
+        if right <= left or bottom <= top:
+            return
+        self.debug_writer.submit(
+            name,
+            frame.bgr[top:bottom, left:right],
+            boxes=[
+                (x0 - left, y0 - top, x1 - left, y1 - top) for x0, y0, x1, y1 in boxes
+            ],
+        )
+
+    def add_asset_bundle(self, bundle: "AssetBundle | str | Path") -> AssetBundle:
+        """Registers a precompiled asset bundle.
+
+        Elements whose image file is in the bundle are matched against its
+        memory-mapped arrays instead of decoding their image file.
+
+        Args:
+            bundle: An AssetBundle or the path of a bundle file.
+
+        Returns:
+            The registered AssetBundle.
+
+        Raises:
+            ValueError: If the bundle cannot be opened.
+        """
+        if not isinstance(bundle, AssetBundle):
+            bundle = load_asset_bundle(bundle)
+        if bundle not in self.asset_bundles:
+            self.asset_bundles.append(bundle)
+            logger.debug(f"Registered {bundle}")
+        return bundle
+
+    def get_template(
+        self,
+        pymordial_image: PymordialImage,
+        scale: tuple[float, float] = (1.0, 1.0),
+    ) -> Template:
+        """Returns the matching template for an image element.
+
+        Registered asset bundles are checked first, by filepath. A bundled
+        asset is only used if its source file, when present, is unchanged
+        since the build; otherwise the element's image file is decoded (and
+        cached).
+
+        Args:
+            pymordial_image: The image element.
+            scale: (x, y) factors applied to the template size.
+
+        Returns:
+            The Template.
+        """
+        for bundle in self.asset_bundles:
+            if bundle.matches(pymordial_image.filepath):
+                return bundle.template(pymordial_image.filepath, scale)
+        return load_template(pymordial_image.filepath, scale)
 
     def scale_img_to_screen(
         self,
         image_path: str,
-        screen_image: "str | Image.Image | bytes | np.ndarray",
+        screen_image: "str | Image.Image | bytes | np.ndarray | Frame",
         bluestacks_resolution: tuple[int, int],
     ) -> Image.Image:
         """Scales an image to match the current screen resolution.
 
         Args:
             image_path: Path to the image to scale.
-            screen_image: The current screen image (path, bytes, numpy array, or PIL Image).
+            screen_image: The current screen image (path, bytes, numpy array,
+                PIL Image, or Frame).
             bluestacks_resolution: The original window size the image was designed for.
 
         Returns:
             The scaled PIL Image.
         """
-        # If screen_image is bytes, convert to PIL Image
-        if isinstance(screen_image, bytes):
-            screen_image = Image.open(BytesIO(screen_image))
-        # If screen_image is numpy array, convert to PIL Image
-        elif isinstance(screen_image, np.ndarray):
-            screen_image = Image.fromarray(screen_image)
-        # If screen_image is a string (file path), open it
-        elif isinstance(screen_image, str):
-            screen_image = Image.open(screen_image)
-
-        # At this point, screen_image should be a PIL Image
-        game_screen_width, game_screen_height = screen_image.size
+        # Only the screen dimensions are needed, which a Frame can report
+        # without decoding the pixel data.
+        if isinstance(screen_image, Image.Image):
+            game_screen_width, game_screen_height = screen_image.size
+        else:
+            game_screen_width, game_screen_height = Frame.from_image(screen_image).size
 
         needle_img: Image.Image = Image.open(image_path)
 
@@ -85,13 +176,13 @@ class ImageController:
     def check_pixel_color(
         self,
         pymordial_pixel: PymordialPixel,
-        screenshot_img_bytes: "bytes | np.ndarray | None" = None,
+        screenshot_img_bytes: "bytes | np.ndarray | Frame | None" = None,
     ) -> bool | None:
         """Checks if the pixel at (x, y) matches the target color within a tolerance.
 
         Args:
             pymordial_pixel: The PymordialPixel to check.
-            screenshot_img_bytes: The screenshot image bytes or numpy array.
+            screenshot_img_bytes: The screenshot image bytes, numpy array, or Frame.
 
         Returns:
             True if the pixel matches, False otherwise.
@@ -136,27 +227,29 @@ class ImageController:
                     f"Failed to capture screenshot for {pymordial_pixel.label}"
                 )
 
-            if isinstance(screenshot_img_bytes, bytes):
-                with Image.open(BytesIO(screenshot_img_bytes)) as image:
-                    pixel_color = image.getpixel(target_coords)
-                    return check_color_with_tolerance(
-                        pixel_color,
-                        pymordial_pixel.pixel_color,
-                        pymordial_pixel.tolerance,
-                    )
-            elif isinstance(screenshot_img_bytes, np.ndarray):
-                image = Image.fromarray(screenshot_img_bytes)
-                pixel_color = image.getpixel(target_coords)
-                return check_color_with_tolerance(
-                    pixel_color,
-                    pymordial_pixel.pixel_color,
-                    pymordial_pixel.tolerance,
-                )
-            else:
+            if not isinstance(screenshot_img_bytes, (bytes, np.ndarray, Frame)):
                 raise ValueError(
-                    f"Image must be a bytes or numpy array, not {type(screenshot_img_bytes)}"
+                    f"Image must be a bytes, numpy array or Frame, not {type(screenshot_img_bytes)}"
                 )
 
+            frame = Frame.from_image(screenshot_img_bytes)
+            pixel_color = frame.pixel(*target_coords)
+            is_match = check_color_with_tolerance(
+                pixel_color,
+                pymordial_pixel.pixel_color,
+                pymordial_pixel.tolerance,
+            )
+            if self.debug_writer is not None:
+                x, y = target_coords
+                half = PIXEL_SNAPSHOT_SIZE // 2
+                self._debug_snapshot(
+                    f"pixel_{pymordial_pixel.label}_{'match' if is_match else 'miss'}",
+                    frame,
+                    region=(x - half, y - half, x + half + 1, y + half + 1),
+                    boxes=((x - 1, y - 1, x + 2, y + 2),),
+                )
+            return is_match
+
         except ValueError as e:
             logger.error(f"ValueError in check_pixel_color: {e}")
             raise
@@ -164,23 +257,79 @@ class ImageController:
             logger.error(f"Error in check_pixel_color: {e}")
             raise ValueError(f"Error checking pixel color: {e}") from e
 
+    def locate_features(
+        self,
+        pymordial_element: PymordialFeatureImage,
+        screenshot_img_bytes: "bytes | np.ndarray | Frame",
+    ) -> FeatureMatch | None:
+        """Locates a PymordialFeatureImage with a single feature-matching pass.
+
+        Template descriptors are computed once per asset and cached. Screen
+        descriptors are cached on the Frame, so several feature elements
+        checked against the same frame share one keypoint detection.
+
+        Args:
+            pymordial_element: The PymordialFeatureImage to find.
+            screenshot_img_bytes: The screenshot bytes, numpy array, or Frame.
+
+        Returns:
+            The FeatureMatch in screen coordinates, or None if not found.
+        """
+        frame = Frame.from_image(screenshot_img_bytes)
+        template = load_template_features(
+            pymordial_element.filepath, pymordial_element.detector
+        )
+
+        region = pymordial_element.region
+        left, top = (int(region[0]), int(region[1])) if region else (0, 0)
+
+        def compute_scene():
+            gray = frame.gray
+            if region:
+                gray = gray[top : int(region[3]), left : int(region[2])]
+            scene = extract_features(gray, pymordial_element.detector)
+            if region:
+                scene = FeatureSet(
+                    points=scene.points + np.float32([left, top]),
+                    descriptors=scene.descriptors,
+                    size=scene.size,
+                )
+            return scene
+
+        scene = frame.cached(
+            ("features", pymordial_element.detector, region), compute_scene
+        )
+        return match_features(
+            template,
+            scene,
+            ratio_test=pymordial_element.ratio_test,
+            min_matches=pymordial_element.min_matches,
+            min_inlier_ratio=pymordial_element.confidence,
+        )
+
     def where_element(
         self,
         pymordial_element: PymordialElement,
-        screenshot_img_bytes: "bytes | np.ndarray | None" = None,
+        screenshot_img_bytes: "bytes | np.ndarray | Frame | None" = None,
         max_tries: int = DEFAULT_FIND_UI_RETRIES,
         set_position: bool = False,
         set_size: bool = False,
+        retry_policy: RetryPolicy | None = None,
     ) -> tuple[int, int] | None:
         """Finds the coordinates of a PymordialElement on the screen.
 
         Args:
             pymordial_element: The PymordialElement to find.
-            screenshot_img_bytes: Optional pre-captured screenshot (bytes or numpy array).
+            screenshot_img_bytes: Optional pre-captured screenshot (bytes, numpy
+                array, or Frame). Only the first attempt uses it; retries
+                capture a new screen.
             max_tries: Maximum number of retries. If None, will retry indefinitely.
                 This is useful for waiting out loading screens with unknown/dynamic duration.
             set_position: If True, updates the element's position with found coordinates.
             set_size: If True, updates the element's size with found dimensions.
+            retry_policy: Optional policy replacing the fixed
+                ``DEFAULT_WAIT_TIME`` interval between tries; it is still
+                bounded by ``max_tries``.
 
         Returns:
             (x, y) coordinates if found, None otherwise.
@@ -193,136 +342,179 @@ class ImageController:
         logger.debug(
             f"Looking for PymordialElement(Max retries: {max_tries}): {pymordial_element.label}..."
         )
+        if max_tries is not None and max_tries < 1:
+            return None
 
-        find_ui_retries: int = 0
-        current_img = screenshot_img_bytes
+        pending_img = [screenshot_img_bytes]
 
-        while (find_ui_retries < max_tries) if max_tries is not None else True:
-            # Capture screen if we don't have an image to check
+        def attempt() -> tuple[int, int] | None:
+            # The pre-captured screenshot is only valid for the first attempt
+            current_img, pending_img[0] = pending_img[0], None
             if current_img is None:
-                # Ensures PymordialController's ADB is connected
-                if not self.pymordial_controller.adb.is_connected():
-                    self.pymordial_controller.adb.connect()
-                    if not self.pymordial_controller.adb.is_connected():
-                        raise ValueError("PymordialController's ADB is not connected")
-
-                try:
-                    current_img = self.pymordial_controller.capture_screen()
-                    if current_img is None:
-                        logger.warning("Failed to capture screen.")
-                except TcpTimeoutException:
-                    raise TcpTimeoutException(
-                        f"TCP timeout while finding element {pymordial_element.label}"
-                    )
-                except Exception as e:
-                    logger.error(f"Error capturing screen: {e}")
-
-            if current_img is not None:
-                if isinstance(pymordial_element, PymordialImage):
-                    ui_location = None
-                    try:
-                        if isinstance(current_img, bytes):
-                            haystack_img = Image.open(BytesIO(current_img))
-                        elif isinstance(current_img, np.ndarray):
-                            haystack_img = Image.fromarray(current_img)
-                        else:
-                            # Should not happen if capture_screen returns correct types
-                            # But if user passes something else...
-                            logger.warning(
-                                f"Unsupported image type: {type(current_img)}. Attempting to open as file path if string."
-                            )
-                            if isinstance(current_img, str):
-                                haystack_img = Image.open(current_img)
-                            else:
-                                raise ValueError(
-                                    f"Unsupported image type: {type(current_img)}"
-                                )
-
-                        # Scale the needle image to match current resolution
-                        scaled_img = self.scale_img_to_screen(
-                            image_path=pymordial_element.filepath,
-                            screen_image=haystack_img,
-                            bluestacks_resolution=pymordial_element.og_resolution,
-                        )
+                current_img = self._capture_for(pymordial_element)
+            if current_img is None:
+                return None
+            return self._locate(pymordial_element, current_img, set_position, set_size)
 
-                        ui_location = locate(
-                            needleImage=scaled_img,
-                            haystackImage=haystack_img,
-                            confidence=pymordial_element.confidence,
-                            grayscale=True,
-                            region=pymordial_element.region,
-                        )
-                    except ImageNotFoundException:
-                        logger.debug(
-                            f"Failed to find PymordialImage element: {pymordial_element.label}"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error finding element {pymordial_element.label}: {e}"
-                        )
+        policy = (retry_policy or FixedRetry(interval=DEFAULT_WAIT_TIME)).with_limits(
+            max_attempts=max_tries
+        )
+        coords = policy.run(attempt, name="image.where_element")
+        if coords is None:
+            logger.info(
+                f"Wasn't able to find PymordialImage within {policy.max_attempts} retries: {pymordial_element.label}"
+            )
+        return coords
 
-                    if ui_location:
-                        coords = center(ui_location)
-                        logger.debug(
-                            f"PymordialImage {pymordial_element.label} found at: {coords}"
-                        )
+    def _capture_for(
+        self, pymordial_element: PymordialElement
+    ) -> "bytes | np.ndarray | Frame | None":
+        """Captures the screen to look for an element in.
 
-                        if set_position:
-                            # ui_location is (left, top, width, height)
-                            pymordial_element.position = (
-                                ui_location[0],
-                                ui_location[1],
-                            )
-                            logger.debug(
-                                f"Updated position for {pymordial_element.label} to {pymordial_element.position}"
-                            )
+        Raises:
+            ValueError: If the ADB connection cannot be established.
+            TcpTimeoutException: If the capture timed out.
+        """
+        # Ensures PymordialController's ADB is connected
+        if not self.pymordial_controller.adb.is_connected():
+            self.pymordial_controller.adb.connect()
+            if not self.pymordial_controller.adb.is_connected():
+                raise ValueError("PymordialController's ADB is not connected")
 
-                        if set_size:
-                            # ui_location is (left, top, width, height)
-                            pymordial_element.size = (ui_location[2], ui_location[3])
-                            logger.debug(
-                                f"Updated size for {pymordial_element.label} to {pymordial_element.size}"
-                            )
+        try:
+            current_img = self.pymordial_controller.capture_screen()
+            if current_img is None:
+                logger.warning("Failed to capture screen.")
+            return current_img
+        except TcpTimeoutException:
+            raise TcpTimeoutException(
+                f"TCP timeout while finding element {pymordial_element.label}"
+            )
+        except Exception as e:
+            logger.error(f"Error capturing screen: {e}")
+            return None
+
+    def _locate(
+        self,
+        pymordial_element: PymordialElement,
+        current_img: "bytes | np.ndarray | Frame",
+        set_position: bool,
+        set_size: bool,
+    ) -> tuple[int, int] | None:
+        """Looks for an element once in a captured screen.
 
-                        return coords
+        Raises:
+            NotImplementedError: If the element type is not supported.
+        """
+        if isinstance(pymordial_element, PymordialImage):
+            ui_location = None
+            try:
+                haystack = Frame.from_image(current_img)
+
+                if isinstance(pymordial_element, PymordialFeatureImage):
+                    # Keypoint matching is scale-invariant, so the
+                    # needle does not need rescaling
+                    feature_match = self.locate_features(pymordial_element, haystack)
+                    if feature_match is not None:
+                        ui_location = feature_match.box
                 else:
-                    raise NotImplementedError(
-                        f"Element type: {type(pymordial_element)} is not supported."
+                    # Scale the needle to the current resolution; the
+                    # decoded (and alpha-masked) template is cached
+                    screen_width, screen_height = haystack.size
+                    og_width, og_height = pymordial_element.og_resolution
+                    template = self.get_template(
+                        pymordial_element,
+                        scale=(
+                            screen_width / og_width,
+                            screen_height / og_height,
+                        ),
+                    )
+                    ui_location = match_template(
+                        template,
+                        haystack.gray,
+                        confidence=pymordial_element.confidence,
+                        region=pymordial_element.region,
                     )
+                    if ui_location is None:
+                        logger.debug(
+                            f"Failed to find PymordialImage element: {pymordial_element.label}"
+                        )
+            except Exception as e:
+                logger.error(f"Error finding element {pymordial_element.label}: {e}")
+            else:
+                if self.debug_writer is not None:
+                    self._debug_snapshot(
+                        f"template_{pymordial_element.label}_"
+                        f"{'found' if ui_location else 'missing'}",
+                        haystack,
+                        region=pymordial_element.region,
+                        boxes=(
+                            (
+                                (
+                                    ui_location[0],
+                                    ui_location[1],
+                                    ui_location[0] + ui_location[2],
+                                    ui_location[1] + ui_location[3],
+                                ),
+                            )
+                            if ui_location
+                            else ()
+                        ),
+                    )
+
+            if ui_location:
+                coords = center(ui_location)
+                logger.debug(
+                    f"PymordialImage {pymordial_element.label} found at: {coords}"
+                )
 
-            # Prepare for next retry
-            find_ui_retries += 1
-            current_img = None  # Force capture on next iteration
+                if set_position:
+                    # ui_location is (left, top, width, height)
+                    pymordial_element.position = (
+                        ui_location[0],
+                        ui_location[1],
+                    )
+                    logger.debug(
+                        f"Updated position for {pymordial_element.label} to {pymordial_element.position}"
+                    )
 
-            if max_tries is not None and find_ui_retries >= max_tries:
-                break
+                if set_size:
+                    # ui_location is (left, top, width, height)
+                    pymordial_element.size = (ui_location[2], ui_location[3])
+                    logger.debug(
+                        f"Updated size for {pymordial_element.label} to {pymordial_element.size}"
+                    )
 
-            logger.debug(
-                f"PymordialImage {pymordial_element.label} not found. Retrying... ({find_ui_retries}/{max_tries})"
+                return coords
+        else:
+            raise NotImplementedError(
+                f"Element type: {type(pymordial_element)} is not supported."
             )
-            sleep(DEFAULT_WAIT_TIME)
 
-        logger.info(
-            f"Wasn't able to find PymordialImage within {max_tries} retries: {pymordial_element.label}"
+        logger.debug(
+            f"PymordialImage {pymordial_element.label} not found in this capture"
         )
         return None
 
     def where_elements(
         self,
         pymordial_elements: list[PymordialElement],
-        screenshot_img_bytes: "bytes | np.ndarray | None" = None,
+        screenshot_img_bytes: "bytes | np.ndarray | Frame | None" = None,
         max_tries: int = DEFAULT_FIND_UI_RETRIES,
     ) -> tuple[int, int] | None:
         """Finds the coordinates of the first found element from a list.
 
         Args:
             pymordial_elements: List of elements to search for.
-            screenshot_img_bytes: Optional pre-captured screenshot (bytes or numpy array).
+            screenshot_img_bytes: Optional pre-captured screenshot (bytes, numpy
+                array, or Frame). It is decoded once and shared by all elements.
             max_tries: Maximum number of retries per element.
 
         Returns:
             (x, y) coordinates of the first found element, or None if none found.
         """
+        if screenshot_img_bytes is not None:
+            screenshot_img_bytes = Frame.from_image(screenshot_img_bytes)
         for pymordial_element in pymordial_elements:
             coord: tuple[int, int] | None = self.where_element(
                 pymordial_element=pymordial_element,
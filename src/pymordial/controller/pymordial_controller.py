@@ -1,24 +1,32 @@
 """Main controller for the Pymordial automation framework."""
 
 import logging
-from io import BytesIO
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from PIL import Image
 
 from pymordial.controller.adb_controller import AdbController
 from pymordial.controller.bluestacks_controller import BluestacksController
 from pymordial.controller.image_controller import ImageController
+from pymordial.controller.snapshot import Snapshot
 from pymordial.controller.text_controller import TextController
 from pymordial.core.elements.pymordial_image import PymordialImage
 from pymordial.core.elements.pymordial_pixel import PymordialPixel
 from pymordial.core.elements.pymordial_text import PymordialText
+from pymordial.core.frame import Frame
 from pymordial.core.pymordial_element import PymordialElement
+from pymordial.ocr.cache import engine_identity, strategy_identity
 from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+from pymordial.ocr.result import OcrResult
 from pymordial.state_machine import BluestacksState
 from pymordial.utils.config import get_config
+from pymordial.utils.deadline import bound_timeout, deadline_scope
+from pymordial.utils.retry import ExponentialRetry
 
 if TYPE_CHECKING:
     from pymordial.core.pymordial_app import PymordialApp
@@ -41,6 +49,10 @@ class PymordialController:
     DEFAULT_MAX_TRIES = _CONFIG["controller"]["default_max_tries"]
     CLICK_COORD_TIMES = _CONFIG["controller"]["click_coord_times"]
     CMD_TAP = _CONFIG["adb"]["commands"]["tap"]
+    DEFAULT_WAIT_TIMEOUT = _CONFIG["controller"]["wait"]["timeout"]
+    WAIT_INITIAL_INTERVAL = _CONFIG["controller"]["wait"]["initial_interval"]
+    WAIT_MAX_INTERVAL = _CONFIG["controller"]["wait"]["max_interval"]
+    WAIT_BACKOFF = _CONFIG["controller"]["wait"]["backoff"]
 
     def __init__(
         self,
@@ -63,6 +75,7 @@ class PymordialController:
         )
         self._apps: dict[str, "PymordialApp"] = {}
         self.is_streaming = False
+        self._snapshots = threading.local()
 
         if apps:
             for app in apps:
@@ -171,6 +184,7 @@ class PymordialController:
         times: int = DEFAULT_CLICK_TIMES,
         screenshot_img_bytes: bytes | None = None,
         max_tries: int = DEFAULT_MAX_TRIES,
+        timeout: float | None = None,
     ) -> bool:
         """Clicks a UI element on the screen.
 
@@ -179,6 +193,8 @@ class PymordialController:
             times: Optional number of times to click. Defaults to DEFAULT_CLICK_TIMES config.
             screenshot_img_bytes: Optional pre-captured screenshot to look for the element in. Defaults to None.
             max_tries: Optional maximum number of retries to find the element. Defaults to DEFAULT_MAX_TRIES config.
+            timeout: Optional budget in seconds for finding the element,
+                shared by every nested retry (see ``deadline_scope``).
 
         Returns:
             True if the element was found and clicked, False otherwise.
@@ -200,6 +216,7 @@ class PymordialController:
                     pymordial_element=pymordial_element,
                     screenshot_img_bytes=screenshot_img_bytes,
                     max_tries=max_tries,
+                    timeout=timeout,
                 )
                 if not coord:
                     logger.debug(f"UI element {pymordial_element.label} not found")
@@ -222,6 +239,7 @@ class PymordialController:
         pymordial_elements: list[PymordialElement],
         screenshot_img_bytes: bytes | None = None,
         max_tries: int = DEFAULT_MAX_TRIES,
+        timeout: float | None = None,
     ) -> bool:
         """Clicks any of the elements in the list.
 
@@ -229,18 +247,20 @@ class PymordialController:
             pymordial_elements: List of elements to try clicking.
             screenshot_img_bytes: Optional pre-captured screenshot.
             max_tries: Maximum number of retries per element.
+            timeout: Optional budget in seconds shared by all the elements.
 
         Returns:
             True if any element was clicked, False otherwise.
         """
-        return any(
-            self.click_element(
-                pymordial_element=pymordial_element,
-                screenshot_img_bytes=screenshot_img_bytes,
-                max_tries=max_tries,
+        with deadline_scope(timeout):
+            return any(
+                self.click_element(
+                    pymordial_element=pymordial_element,
+                    screenshot_img_bytes=screenshot_img_bytes,
+                    max_tries=max_tries,
+                )
+                for pymordial_element in pymordial_elements
             )
-            for pymordial_element in pymordial_elements
-        )
 
     def go_home(self) -> None:
         """Navigate to Android home screen.
@@ -283,13 +303,71 @@ class PymordialController:
         """
         return self.adb.swipe(start_x, start_y, end_x, end_y, duration)
 
-    def capture_screen(self) -> "bytes | np.ndarray | None":
+    @property
+    def active_snapshot(self) -> Snapshot | None:
+        """The innermost snapshot active on the calling thread, if any."""
+        stack = getattr(self._snapshots, "stack", None)
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def snapshot(
+        self, frame: "bytes | np.ndarray | Frame | None" = None
+    ) -> Iterator[Snapshot]:
+        """Captures the screen once for every check inside a ``with`` block.
+
+        Inside the block, on the calling thread, ``capture_screen`` returns
+        the snapshot's frame and ``find_element``/``is_element_visible``
+        answer from it (memoized per element) when no screenshot is passed,
+        so a screen check over many elements costs one capture and sees one
+        consistent screen::
+
+            with controller.snapshot() as snap:
+                if snap.is_visible(battle_menu) or controller.is_element_visible(hp_bar):
+                    ...
+
+        Nested calls without a frame reuse the active snapshot.
+
+        Args:
+            frame: Optional frame to use instead of capturing.
+
+        Yields:
+            The Snapshot.
+        """
+        active = self.active_snapshot
+        if active is not None and frame is None:
+            yield active
+            return
+
+        frame = Frame.from_image(frame) if frame is not None else self.capture_screen()
+        if frame is None:
+            logger.warning("Snapshot capture failed; elements will not be found")
+        snap = Snapshot(self, frame)
+        stack = getattr(self._snapshots, "stack", None)
+        if stack is None:
+            stack = self._snapshots.stack = []
+        stack.append(snap)
+        try:
+            yield snap
+        finally:
+            stack.remove(snap)
+
+    def capture_screen(self) -> Frame | None:
         """Captures the current BlueStacks screen using the appropriate capture strategy.
 
+        The capture is wrapped in a Frame, which defers decoding until a
+        representation is needed and caches it for every later check. Inside
+        a ``snapshot()`` block, the snapshot's frame is returned instead.
+
         Returns:
-            The screenshot as bytes or numpy array, or None if failed.
+            The screenshot as a Frame, or None if failed.
         """
+        snap = self.active_snapshot
+        if snap is not None and snap.frame is not None:
+            return snap.frame
+        return self._capture_fresh()
 
+    def _capture_fresh(self) -> Frame | None:
+        """Captures a new frame, ignoring any active snapshot."""
         if not self.adb.is_connected():
             self.adb.connect()
             if not self.adb.is_connected():
@@ -301,7 +379,7 @@ class PymordialController:
         if self.is_streaming:
             frame = self.adb.get_latest_frame()
             if frame is not None:
-                return frame
+                return Frame(frame)
             # If streaming is active but no frame is available yet,
             # we might want to fallback to ADB screencap or just return None/wait.
             # For now, let's fallback to ADB screencap to ensure we get *something*.
@@ -309,43 +387,75 @@ class PymordialController:
                 "Streaming active but no frame available. Falling back to ADB screencap."
             )
 
-        return self.adb.capture_screenshot()
+        screenshot = self.adb.capture_screenshot()
+        return Frame(screenshot) if screenshot is not None else None
 
     def find_element(
         self,
         pymordial_element: PymordialElement,
-        screenshot_img_bytes: bytes | None = None,
+        screenshot_img_bytes: "bytes | np.ndarray | Frame | None" = None,
         max_tries: int = DEFAULT_MAX_TRIES,
+        timeout: float | None = None,
     ) -> tuple[int, int] | None:
         """Finds the coordinates of a UI element on the screen.
 
         Args:
             pymordial_element: The element to find.
-            screenshot_img_bytes: Optional pre-captured screenshot.
+            screenshot_img_bytes: Optional pre-captured screenshot (bytes, numpy
+                array, or Frame).
             max_tries: Maximum number of retries.
+            timeout: Optional budget in seconds; retries stop once it is
+                spent, even if max_tries is not reached.
 
         Returns:
             (x, y) coordinates if found, None otherwise.
         """
-        if isinstance(pymordial_element, PymordialImage):
-            return self.image.where_element(
-                pymordial_element=pymordial_element,
-                screenshot_img_bytes=screenshot_img_bytes,
-                max_tries=max_tries,
-            )
-        elif isinstance(pymordial_element, PymordialText):
-            return self.text.find_text(
-                text_to_find=pymordial_element.element_text,
-                image_path=screenshot_img_bytes or self.capture_screen(),
-                strategy=pymordial_element.extract_strategy,
-            )
-        elif isinstance(pymordial_element, PymordialPixel):
-
-            is_match = self.image.check_pixel_color(
-                pymordial_pixel=pymordial_element,
-                screenshot_img_bytes=screenshot_img_bytes or self.capture_screen(),
-            )
-            return pymordial_element.position if is_match else None
+        snap = self.active_snapshot
+        if snap is not None and screenshot_img_bytes is None:
+            return snap.find(pymordial_element)
+        if screenshot_img_bytes is not None:
+            screenshot_img_bytes = Frame.from_image(screenshot_img_bytes)
+
+        with deadline_scope(timeout):
+            if isinstance(pymordial_element, PymordialImage):
+                return self.image.where_element(
+                    pymordial_element=pymordial_element,
+                    screenshot_img_bytes=screenshot_img_bytes,
+                    max_tries=max_tries,
+                )
+            elif isinstance(pymordial_element, PymordialText):
+                frame = (
+                    screenshot_img_bytes
+                    if screenshot_img_bytes is not None
+                    else self.capture_screen()
+                )
+                if frame is None:
+                    return None
+                if pymordial_element.region is None:
+                    return self.text.find_text(
+                        text_to_find=pymordial_element.element_text,
+                        image_path=frame,
+                        strategy=pymordial_element.extract_strategy,
+                        min_score=pymordial_element.min_score,
+                    )
+                return self.find_frame_text(
+                    frame,
+                    pymordial_element.element_text,
+                    region=pymordial_element.region,
+                    strategy=pymordial_element.extract_strategy,
+                    min_score=pymordial_element.min_score,
+                )
+            elif isinstance(pymordial_element, PymordialPixel):
+
+                is_match = self.image.check_pixel_color(
+                    pymordial_pixel=pymordial_element,
+                    screenshot_img_bytes=(
+                        screenshot_img_bytes
+                        if screenshot_img_bytes is not None
+                        else self.capture_screen()
+                    ),
+                )
+                return pymordial_element.position if is_match else None
 
         raise NotImplementedError(
             f"find_element() not implemented for this element type: {type(pymordial_element)}"
@@ -354,15 +464,19 @@ class PymordialController:
     def is_element_visible(
         self,
         pymordial_element: PymordialElement,
-        screenshot_img_bytes: bytes | None = None,
+        screenshot_img_bytes: "bytes | np.ndarray | Frame | None" = None,
         max_tries: int | None = None,
+        timeout: float | None = None,
     ) -> bool:
         """Checks if a UI element is visible on the screen.
 
         Args:
             pymordial_element: The element to check for.
-            screenshot_img_bytes: Optional pre-captured screenshot.
+            screenshot_img_bytes: Optional pre-captured screenshot (bytes, numpy
+                array, or Frame).
             max_tries: Optional maximum number of retries.
+            timeout: Optional budget in seconds shared by every nested
+                retry (see ``deadline_scope``).
 
         Returns:
             True if the element is found, False otherwise.
@@ -372,58 +486,298 @@ class PymordialController:
                 f"pymordial_element must be an instance of PymordialElement, not {type(pymordial_element)}"
             )
 
-        if isinstance(pymordial_element, PymordialImage):
-            return (
-                self.find_element(
-                    pymordial_element=pymordial_element,
-                    screenshot_img_bytes=screenshot_img_bytes,
-                    max_tries=max_tries or PymordialController.DEFAULT_MAX_TRIES,
+        snap = self.active_snapshot
+        if snap is not None and screenshot_img_bytes is None:
+            return snap.is_visible(pymordial_element)
+
+        with deadline_scope(timeout):
+            if isinstance(pymordial_element, PymordialImage):
+                return (
+                    self.find_element(
+                        pymordial_element=pymordial_element,
+                        screenshot_img_bytes=screenshot_img_bytes,
+                        max_tries=max_tries or PymordialController.DEFAULT_MAX_TRIES,
+                    )
+                    is not None
                 )
-                is not None
-            )
-        elif isinstance(pymordial_element, PymordialText):
-            # For text, we use the text controller to check existence
-            # Note: This doesn't return coordinates yet, so click_element won't work for Text
-            # unless find_element is implemented for Text.
+            elif isinstance(pymordial_element, PymordialText):
+                frame = (
+                    Frame.from_image(screenshot_img_bytes)
+                    if screenshot_img_bytes is not None
+                    else self.capture_screen()
+                )
+                if frame is None:
+                    return False
 
-            image_to_check = screenshot_img_bytes or self.capture_screen()
+                result = self.read_frame_text(
+                    frame,
+                    region=pymordial_element.region,
+                    strategy=pymordial_element.extract_strategy,
+                )
+                return result.contains(
+                    pymordial_element.element_text,
+                    min_score=pymordial_element.min_score,
+                )
+            elif isinstance(pymordial_element, PymordialPixel):
+                return (
+                    self.find_element(
+                        pymordial_element=pymordial_element,
+                        screenshot_img_bytes=screenshot_img_bytes,
+                        max_tries=max_tries or PymordialController.DEFAULT_MAX_TRIES,
+                    )
+                    is not None
+                )
+        raise NotImplementedError(
+            f"is_element_visible not implemented for {type(pymordial_element)}"
+        )
+
+    def read_frame_text(
+        self,
+        frame: Frame,
+        region: tuple[int, int, int, int] | None = None,
+        strategy: PymordialExtractStrategy | None = None,
+    ) -> OcrResult:
+        """Reads the text of a frame region once and memoizes it on the frame.
 
-            # If the element has a defined region, crop the image to that region
-            if pymordial_element.region and image_to_check is not None:
+        Text elements sharing a region and strategy are answered from the
+        same OCR pass, so checking many of them against one frame costs a
+        single OCR run.
+
+        Args:
+            frame: The captured frame.
+            region: Optional (left, top, right, bottom) area to read.
+            strategy: Optional preprocessing strategy.
+
+        Returns:
+            OcrResult with word boxes relative to the region.
+        """
+
+        def read() -> OcrResult:
+            image = frame
+            if region:
                 try:
-                    if isinstance(image_to_check, bytes):
-                        pil_img = Image.open(BytesIO(image_to_check))
-                    elif isinstance(image_to_check, np.ndarray):
-                        pil_img = Image.fromarray(image_to_check)
-                    else:
-                        pil_img = None
-
-                    if pil_img:
-                        # region is (left, top, right, bottom)
-                        pil_img = pil_img.crop(pymordial_element.region)
-                        image_to_check = np.array(pil_img)
+                    image = frame.crop(region)
                 except Exception as e:
                     logger.warning(f"Failed to crop image for text detection: {e}")
+            return self.text.read(image, strategy=strategy)
+
+        identity = strategy_identity(strategy)
+        if identity is None:
+            return read()
+        key = (
+            "ocr",
+            engine_identity(self.text.ocr_engine),
+            tuple(region) if region else None,
+            identity,
+        )
+        return frame.cached(key, read)
 
-            return self.text.check_text(
-                text_to_find=pymordial_element.element_text,
-                image_path=image_to_check,
-                strategy=pymordial_element.extract_strategy,
-                case_sensitive=False,
-            )
-        elif isinstance(pymordial_element, PymordialPixel):
-            return (
-                self.find_element(
-                    pymordial_element=pymordial_element,
-                    screenshot_img_bytes=screenshot_img_bytes,
-                    max_tries=max_tries or PymordialController.DEFAULT_MAX_TRIES,
-                )
-                is not None
-            )
+    def find_frame_text(
+        self,
+        frame: Frame,
+        text: str,
+        region: tuple[int, int, int, int] | None = None,
+        strategy: PymordialExtractStrategy | None = None,
+        min_score: float = 1.0,
+    ) -> tuple[int, int] | None:
+        """Finds text in a frame region and returns its screen coordinates.
+
+        Only the region is read (a NumPy view of the frame), through the
+        OcrResult memoized by read_frame_text, and the match is translated
+        from region coordinates back to the full frame.
+
+        Args:
+            frame: The captured frame.
+            text: Text to search for.
+            region: Optional (left, top, right, bottom) area to search.
+            strategy: Optional preprocessing strategy.
+            min_score: Lowest accepted match score; below 1, the best
+                approximate match is used (see OcrResult.match).
+
+        Returns:
+            (x, y) screen coordinates of the match center, or None.
+        """
+        result = self.read_frame_text(frame, region=region, strategy=strategy)
+        if min_score < 1.0:
+            match = result.match(text, min_score=min_score)
         else:
-            raise NotImplementedError(
-                f"is_element_visible not implemented for {type(pymordial_element)}"
+            match = result.find(text)
+        if match is None:
+            return None
+        x, y = match.center
+        if region:
+            return (region[0] + x, region[1] + y)
+        return (x, y)
+
+    # --- Waiting ---
+
+    @staticmethod
+    def _regions_changed(
+        previous: Frame, frame: Frame, elements: list[PymordialElement]
+    ) -> bool:
+        """Returns whether any element's region differs between two frames.
+
+        Elements without a region compare the whole frame, so they always
+        count as changed.
+        """
+        if previous.size != frame.size:
+            return True
+        for element in elements:
+            region = element.region
+            if region is None:
+                return True
+            left, top, right, bottom = (int(value) for value in region)
+            if not np.array_equal(
+                previous.rgb[top:bottom, left:right], frame.rgb[top:bottom, left:right]
+            ):
+                return True
+        return False
+
+    def _wait(
+        self,
+        elements: list[PymordialElement],
+        condition: Callable[[Snapshot], Any],
+        timeout: float,
+    ) -> Any:
+        """Evaluates a condition on fresh frames until it holds or time runs out.
+
+        While streaming, the condition is evaluated once per decoded frame,
+        and only when one of the elements' regions changed since the last
+        evaluation. Otherwise the screen is captured with exponential
+        backoff between attempts (``controller.wait`` in the config). Frames
+        are always captured fresh, even inside a ``snapshot()`` block, whose
+        frame could never change.
+
+        Args:
+            elements: Elements the condition looks at.
+            condition: Called with a snapshot of each frame; any result other
+                than None ends the wait.
+            timeout: Most seconds to wait, shortened to the active deadline
+                (see ``deadline_scope``).
+
+        Returns:
+            The condition's result, or None on timeout.
+
+        Raises:
+            ValueError: If elements is empty or timeout is negative.
+        """
+        if not elements:
+            raise ValueError("At least one element is required")
+        if timeout < 0:
+            raise ValueError(f"Timeout cannot be negative, got {timeout}")
+
+        deadline = time.monotonic() + bound_timeout(timeout)
+        backoff = ExponentialRetry(
+            initial=self.WAIT_INITIAL_INTERVAL,
+            factor=self.WAIT_BACKOFF,
+            max_interval=self.WAIT_MAX_INTERVAL,
+        )
+        polls = 0
+        previous: Frame | None = None
+        frame_index: int | None = None
+        while True:
+            polling = True
+            if self.is_streaming:
+                index = (
+                    self.adb.frame_index
+                    if frame_index is None
+                    else self.adb.wait_for_frame(
+                        frame_index, deadline - time.monotonic()
+                    )
+                )
+                if index is not None:
+                    frame_index = index
+                    polling = False
+
+            frame = self._capture_fresh()
+            if frame is not None and (
+                previous is None or self._regions_changed(previous, frame, elements)
+            ):
+                with self.snapshot(frame) as snap:
+                    result = condition(snap)
+                if result is not None:
+                    return result
+                previous = frame
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            if polling:
+                polls += 1
+                time.sleep(min(backoff.delay(polls), remaining))
+
+    def wait_for(
+        self,
+        pymordial_element: PymordialElement,
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+    ) -> tuple[int, int] | None:
+        """Waits until an element appears and returns its coordinates.
+
+        Returns as soon as the element is found: on the next decoded frame
+        while streaming, otherwise on the next capture of an exponentially
+        backed-off poll.
+
+        Args:
+            pymordial_element: The element to wait for.
+            timeout: Most seconds to wait.
+
+        Returns:
+            (x, y) coordinates of the element, or None on timeout.
+        """
+        return self._wait(
+            [pymordial_element], lambda snap: snap.find(pymordial_element), timeout
+        )
+
+    def wait_for_any(
+        self,
+        pymordial_elements: Iterable[PymordialElement],
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+    ) -> tuple[PymordialElement, tuple[int, int]] | None:
+        """Waits until any of several elements appears.
+
+        Every element is checked against the same frame, in order.
+
+        Args:
+            pymordial_elements: The elements to wait for.
+            timeout: Most seconds to wait.
+
+        Returns:
+            The first element found and its (x, y) coordinates, or None on
+            timeout.
+        """
+        elements = list(pymordial_elements)
+
+        def condition(snap: Snapshot):
+            for element in elements:
+                coords = snap.find(element)
+                if coords is not None:
+                    return element, coords
+            return None
+
+        return self._wait(elements, condition, timeout)
+
+    def wait_until_gone(
+        self,
+        pymordial_element: PymordialElement,
+        timeout: float = DEFAULT_WAIT_TIMEOUT,
+    ) -> bool:
+        """Waits until an element is no longer visible.
+
+        Args:
+            pymordial_element: The element to wait on.
+            timeout: Most seconds to wait.
+
+        Returns:
+            True if the element disappeared, False on timeout.
+        """
+        return (
+            self._wait(
+                [pymordial_element],
+                lambda snap: True if not snap.is_visible(pymordial_element) else None,
+                timeout,
             )
+            is not None
+        )
 
     # --- Input Methods ---
 
@@ -480,7 +834,7 @@ class PymordialController:
 
     def read_text(
         self,
-        image_path: "Path | bytes | str",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         case_sensitive: bool = False,
         strategy: "PymordialExtractStrategy | None" = None,
     ) -> list[str]:
@@ -500,7 +854,7 @@ class PymordialController:
     def check_text(
         self,
         text_to_find: str,
-        image_path: "Path | bytes | str",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         case_sensitive: bool = False,
         strategy: "PymordialExtractStrategy | None" = None,
     ) -> bool:
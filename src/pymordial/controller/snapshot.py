@@ -0,0 +1,121 @@
+"""Capture-once evaluation of many element checks."""
+
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from pymordial.core.frame import Frame
+from pymordial.core.pymordial_element import PymordialElement
+from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+from pymordial.ocr.result import OcrResult
+
+if TYPE_CHECKING:
+    from pymordial.controller.pymordial_controller import PymordialController
+
+
+class Snapshot:
+    """One captured frame shared by every query of a logical tick.
+
+    Created by ``PymordialController.snapshot()``. While the ``with`` block is
+    active on a thread, the controller's ``capture_screen``, ``find_element``
+    and ``is_element_visible`` use the snapshot's frame instead of capturing,
+    so every check sees the same screen. Results are memoized per element;
+    image elements are matched once, without retries, since retrying against
+    the same frame cannot change the outcome.
+
+    Attributes:
+        controller: The controller that took the snapshot.
+        frame: The captured frame, or None if the capture failed (every
+            query then reports the element as not found).
+        hits: Number of queries answered from the memo.
+    """
+
+    def __init__(self, controller: "PymordialController", frame: Frame | None):
+        """Initializes the snapshot.
+
+        Args:
+            controller: The controller answering the queries.
+            frame: The captured frame, or None if the capture failed.
+        """
+        self.controller = controller
+        self.frame = frame
+        self.hits = 0
+        # Keyed by element id; the element is kept alive so its id is not
+        # reused while the snapshot exists
+        self._results: dict[tuple[str, int], tuple[PymordialElement, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _memoize(
+        self, kind: str, element: PymordialElement, compute: Callable[[], Any]
+    ) -> Any:
+        """Returns a memoized per-element result, computing it on first use."""
+        key = (kind, id(element))
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return self._results[key][1]
+        result = compute()
+        with self._lock:
+            self._results[key] = (element, result)
+        return result
+
+    def find(self, element: PymordialElement) -> tuple[int, int] | None:
+        """Finds an element in the snapshot.
+
+        Args:
+            element: The element to find.
+
+        Returns:
+            (x, y) coordinates if found, None otherwise.
+        """
+        if self.frame is None:
+            return None
+        return self._memoize(
+            "find",
+            element,
+            lambda: self.controller.find_element(element, self.frame, max_tries=1),
+        )
+
+    def is_visible(self, element: PymordialElement) -> bool:
+        """Checks whether an element is visible in the snapshot.
+
+        Args:
+            element: The element to check for.
+
+        Returns:
+            True if the element is visible, False otherwise.
+        """
+        if self.frame is None:
+            return False
+        return self._memoize(
+            "visible",
+            element,
+            lambda: self.controller.is_element_visible(
+                element, self.frame, max_tries=1
+            ),
+        )
+
+    def read_text(
+        self,
+        region: tuple[int, int, int, int] | None = None,
+        strategy: PymordialExtractStrategy | None = None,
+    ) -> OcrResult:
+        """Reads the text of a snapshot region (memoized on the frame).
+
+        Args:
+            region: Optional (left, top, right, bottom) area to read.
+            strategy: Optional preprocessing strategy.
+
+        Returns:
+            The OcrResult, empty if the capture failed.
+        """
+        if self.frame is None:
+            return OcrResult()
+        return self.controller.read_frame_text(
+            self.frame, region=region, strategy=strategy
+        )
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the snapshot."""
+        size = self.frame.size if self.frame is not None else None
+        return f"Snapshot(size={size}, results={len(self._results)}, hits={self.hits})"
@@ -1,51 +1,203 @@
 """Utility for checking text in images using OCR."""
 
 import logging
+from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from pymordial.core.frame import Frame
 from pymordial.ocr.base import PymordialOCR
+from pymordial.ocr.cache import (
+    OcrCache,
+    OcrCacheStats,
+    engine_identity,
+    image_digest,
+    strategy_identity,
+)
 from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+from pymordial.ocr.matching import DEFAULT_MIN_SCORE
+from pymordial.ocr.result import OcrResult, TextMatch
 from pymordial.ocr.tesseract_ocr import TesseractOCR
+from pymordial.utils.config import get_config
 
 if TYPE_CHECKING:
     import numpy as np
 
+    from pymordial.vision.text_regions import TextRegionDetector
+
 logger = logging.getLogger(__name__)
 
+_CONFIG = get_config()
+
+# --- Text Controller Configuration ---
+DEFAULT_OCR_CACHE_SIZE = _CONFIG["text_controller"]["ocr_cache_size"]
+
 
 class TextController:
     """Checks for text in images using a pluggable OCR engine.
 
     Supports optional preprocessing strategies when using TesseractOCR.
+    OCR results are cached by image content, so re-reading an unchanged
+    region costs a hash instead of an OCR run.
+
+    Attributes:
+        ocr_engine: The OCR engine in use.
+        ocr_cache: LRU cache of OCR results, or None if caching is disabled.
+        text_detector: Optional text-region detector restricting ``find_text``
+            to candidate areas.
     """
 
-    def __init__(self, ocr_engine: PymordialOCR | None = None):
+    def __init__(
+        self,
+        ocr_engine: PymordialOCR | None = None,
+        cache_size: int = DEFAULT_OCR_CACHE_SIZE,
+        text_detector: "TextRegionDetector | None" = None,
+    ):
         """Initialize with a specific OCR engine.
 
         Args:
             ocr_engine: The OCR engine instance to use. Defaults to TesseractOCR.
+            cache_size: Maximum number of cached OCR results. 0 disables the
+                cache.
+            text_detector: Optional TextRegionDetector. When set, ``find_text``
+                only OCRs the detected text regions (in one batched call for
+                engines with ``read_regions``) instead of the whole image.
         """
         if ocr_engine is None:
             self.ocr_engine = TesseractOCR()
         else:
             self.ocr_engine = ocr_engine
+        self.ocr_cache: OcrCache | None = OcrCache(cache_size) if cache_size else None
+        self.text_detector = text_detector
+
+    def _cached(
+        self,
+        operation: tuple,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        strategy: PymordialExtractStrategy | None,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Runs an OCR operation through the result cache."""
+        identity = strategy_identity(strategy)
+        if self.ocr_cache is None or identity is None:
+            return compute()
+        key = (
+            image_digest(image_path),
+            engine_identity(self.ocr_engine),
+            identity,
+            operation,
+        )
+        return self.ocr_cache.get_or_compute(key, compute)
+
+    def _extract_text(
+        self,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        strategy: PymordialExtractStrategy | None,
+    ) -> str:
+        """Extracts text with optional strategy (if supported), using the cache."""
+        if strategy is not None and isinstance(self.ocr_engine, TesseractOCR):
+            return self._cached(
+                ("extract_text",),
+                image_path,
+                strategy,
+                lambda: self.ocr_engine.extract_text(image_path, strategy=strategy),
+            )
+        return self._cached(
+            ("extract_text",),
+            image_path,
+            None,
+            lambda: self.ocr_engine.extract_text(image_path),
+        )
+
+    def cache_stats(self) -> OcrCacheStats | None:
+        """Returns OCR cache hit/miss statistics, or None if caching is disabled."""
+        return self.ocr_cache.stats() if self.ocr_cache is not None else None
+
+    def clear_cache(self) -> None:
+        """Drops all cached OCR results."""
+        if self.ocr_cache is not None:
+            self.ocr_cache.clear()
+
+    def read(
+        self,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        strategy: PymordialExtractStrategy | None = None,
+    ) -> OcrResult:
+        """Reads all text of an image once, for answering many queries.
+
+        Args:
+            image_path: Path to image file, image bytes, numpy array, or Frame.
+            strategy: Preprocessing strategy to use. Only supported by
+                TesseractOCR. If None, uses default strategy.
+
+        Returns:
+            OcrResult with every recognized word and its box.
+
+        Raises:
+            ValueError: If the image cannot be read.
+        """
+        try:
+            if strategy is not None and isinstance(self.ocr_engine, TesseractOCR):
+                return self._cached(
+                    ("read",),
+                    image_path,
+                    strategy,
+                    lambda: self.ocr_engine.read(image_path, strategy=strategy),
+                )
+            return self._cached(
+                ("read",),
+                image_path,
+                None,
+                lambda: self.ocr_engine.read(image_path),
+            )
+        except Exception as e:
+            logger.error(f"Error reading text from image: {e}")
+            raise ValueError(f"Error reading text from image: {e}") from e
+
+    def _find_text_in_regions(
+        self,
+        text_to_find: str,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        strategy: PymordialExtractStrategy | None,
+        min_score: float = 1.0,
+    ) -> tuple[int, int] | None:
+        """Finds text by reading only the detector's candidate regions."""
+        if isinstance(image_path, (bytes, str, Path)):
+            # Decode once for both the detector and the OCR engine
+            image_path = Frame.from_image(image_path)
+        regions = self.text_detector.detect(image_path)
+        if not regions:
+            return None
+        if isinstance(self.ocr_engine, TesseractOCR):
+            words = self.ocr_engine.read_regions(image_path, regions, strategy=strategy)
+        else:
+            words = self.ocr_engine.read_regions(image_path, regions)
+        result = OcrResult(words=tuple(word for region in words for word in region))
+        if min_score < 1.0:
+            match = result.match(text_to_find, min_score=min_score)
+        else:
+            match = result.find(text_to_find)
+        return match.center if match is not None else None
 
     def check_text(
         self,
         text_to_find: str,
-        image_path: "Path | bytes | str | np.ndarray",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         case_sensitive: bool = False,
         strategy: PymordialExtractStrategy | None = None,
+        min_score: float = 1.0,
     ) -> bool:
         """Checks if specific text is present in the image.
 
         Args:
             text_to_find: Text to search for in the image.
-            image_path: Path to image file, image bytes, or numpy array.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
             case_sensitive: Whether to perform a case-sensitive search. Defaults to False.
             strategy: Preprocessing strategy to use. Only supported by
                 TesseractOCR. If None, uses default strategy.
+            min_score: Lowest accepted match score. Below 1, the text may
+                differ from the OCR output by a few misread characters (see
+                match_text).
 
         Returns:
             True if the text is found, False otherwise.
@@ -53,12 +205,19 @@ class TextController:
         Raises:
             ValueError: If the image cannot be read.
         """
+        if min_score < 1.0:
+            return (
+                self.match_text(
+                    text_to_find,
+                    image_path,
+                    strategy=strategy,
+                    min_score=min_score,
+                    case_sensitive=case_sensitive,
+                )
+                is not None
+            )
         try:
-            # Extract text with optional strategy (if supported)
-            if strategy is not None and isinstance(self.ocr_engine, TesseractOCR):
-                extracted = self.ocr_engine.extract_text(image_path, strategy=strategy)
-            else:
-                extracted = self.ocr_engine.extract_text(image_path)
+            extracted = self._extract_text(image_path, strategy)
 
             if case_sensitive:
                 return text_to_find in extracted
@@ -69,14 +228,14 @@ class TextController:
 
     def read_text(
         self,
-        image_path: "Path | bytes | str | np.ndarray",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         case_sensitive: bool = False,
         strategy: PymordialExtractStrategy | None = None,
     ) -> list[str]:
         """Reads text from the image.
 
         Args:
-            image_path: Path to image file, image bytes, or numpy array.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
             case_sensitive: Whether to return text in its original case. Defaults to False.
             strategy: Preprocessing strategy to use. Only supported by
                 TesseractOCR. If None, uses default strategy.
@@ -88,11 +247,7 @@ class TextController:
             ValueError: If the image cannot be read.
         """
         try:
-            # Extract text with optional strategy (if supported)
-            if strategy is not None and isinstance(self.ocr_engine, TesseractOCR):
-                text = self.ocr_engine.extract_text(image_path, strategy=strategy)
-            else:
-                text = self.ocr_engine.extract_text(image_path)
+            text = self._extract_text(image_path, strategy)
             if case_sensitive:
                 return [line.strip() for line in text.split("\n") if line.strip()]
             return [
@@ -107,28 +262,57 @@ class TextController:
     def find_text(
         self,
         text_to_find: str,
-        image_path: "Path | bytes | str | np.ndarray",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         strategy: PymordialExtractStrategy | None = None,
+        min_score: float = 1.0,
     ) -> tuple[int, int] | None:
         """Finds the coordinates of specific text in the image.
 
         Args:
-            text_to_find: Text to search for.
-            image_path: Path to image file or image bytes.
+            text_to_find: Text to search for. May span several words.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
             strategy: Optional preprocessing strategy.
+            min_score: Lowest accepted match score. Below 1, the best
+                approximate match is returned (see match_text).
 
         Returns:
             (x, y) coordinates if found, None otherwise.
         """
         try:
+            if self.text_detector is not None and hasattr(
+                self.ocr_engine, "read_regions"
+            ):
+                return self._cached(
+                    ("find_text", text_to_find, min_score, "regions"),
+                    image_path,
+                    strategy,
+                    lambda: self._find_text_in_regions(
+                        text_to_find, image_path, strategy, min_score
+                    ),
+                )
+            if min_score < 1.0:
+                match = self.match_text(
+                    text_to_find, image_path, strategy=strategy, min_score=min_score
+                )
+                return match.center if match is not None else None
             # Check if the OCR engine supports find_text (it should as per PymordialOCR)
             if hasattr(self.ocr_engine, "find_text"):
                 # Pass strategy if it's TesseractOCR, otherwise just the required args
                 if isinstance(self.ocr_engine, TesseractOCR):
-                    return self.ocr_engine.find_text(
-                        text_to_find, image_path, strategy=strategy
+                    return self._cached(
+                        ("find_text", text_to_find),
+                        image_path,
+                        strategy,
+                        lambda: self.ocr_engine.find_text(
+                            text_to_find, image_path, strategy=strategy
+                        ),
                     )
-                return self.ocr_engine.find_text(text_to_find, image_path)
+                return self._cached(
+                    ("find_text", text_to_find),
+                    image_path,
+                    None,
+                    lambda: self.ocr_engine.find_text(text_to_find, image_path),
+                )
             else:
                 logger.warning(
                     f"OCR engine {type(self.ocr_engine).__name__} does not support find_text"
@@ -138,6 +322,42 @@ class TextController:
             logger.error(f"Error finding text in image: {e}")
             return None
 
+    def match_text(
+        self,
+        text_to_find: str,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        strategy: PymordialExtractStrategy | None = None,
+        min_score: float = DEFAULT_MIN_SCORE,
+        case_sensitive: bool = False,
+    ) -> TextMatch | None:
+        """Finds the best approximate occurrence of text in the image.
+
+        Phrases match across adjacent words of a line, and every misread
+        character lowers the score instead of failing the match.
+
+        Args:
+            text_to_find: Text to search for. May span several words.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
+            strategy: Preprocessing strategy to use. Only supported by
+                TesseractOCR. If None, uses default strategy.
+            min_score: Lowest accepted score, from 0 to 1.
+            case_sensitive: Whether the comparison is case-sensitive.
+
+        Returns:
+            The TextMatch with the matched text, box, score and OCR
+            confidence, or None.
+
+        Raises:
+            ValueError: If the image cannot be read.
+        """
+        return self.read(image_path, strategy=strategy).match(
+            text_to_find, min_score=min_score, case_sensitive=case_sensitive
+        )
+
     def __repr__(self) -> str:
         """Returns a string representation of the TextController."""
-        return f"TextController(" f"ocr_engine={type(self.ocr_engine).__name__})"
+        return (
+            f"TextController("
+            f"ocr_engine={type(self.ocr_engine).__name__}, "
+            f"ocr_cache={self.ocr_cache})"
+        )
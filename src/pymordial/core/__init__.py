@@ -2,12 +2,20 @@
 Core module for Pymordial.
 """
 
-from .elements import PymordialImage, PymordialPixel, PymordialText
+from .elements import (
+    PymordialFeatureImage,
+    PymordialImage,
+    PymordialPixel,
+    PymordialText,
+)
+from .frame import Frame
 from .pymordial_app import PymordialApp
 from .pymordial_element import PymordialElement
 from .pymordial_screen import PymordialScreen
 
 __all__ = [
+    "Frame",
+    "PymordialFeatureImage",
     "PymordialImage",
     "PymordialPixel",
     "PymordialText",
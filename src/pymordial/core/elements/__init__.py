@@ -1,8 +1,10 @@
+from .pymordial_feature_image import PymordialFeatureImage
 from .pymordial_image import PymordialImage
 from .pymordial_pixel import PymordialPixel
 from .pymordial_text import PymordialText
 
 __all__ = [
+    "PymordialFeatureImage",
     "PymordialImage",
     "PymordialPixel",
     "PymordialText",
@@ -0,0 +1,72 @@
+"""Implementation of PymordialFeatureImage element."""
+
+from dataclasses import dataclass
+
+from pymordial.core.elements.pymordial_image import PymordialImage
+from pymordial.vision.features import (
+    DEFAULT_DETECTOR,
+    DEFAULT_MIN_MATCHES,
+    DEFAULT_RATIO_TEST,
+    SUPPORTED_DETECTORS,
+)
+
+
+@dataclass(kw_only=True)
+class PymordialFeatureImage(PymordialImage):
+    """PymordialImage located by keypoint matching instead of template matching.
+
+    Use this for elements that scale, rotate slightly or animate, where a
+    pixel-for-pixel template match fails.
+
+    Attributes:
+        detector: Keypoint detector to use ("orb" or "akaze").
+        min_matches: Minimum number of matches consistent with the homography.
+        ratio_test: Lowe ratio used to discard ambiguous descriptor matches.
+
+    Note:
+        ``confidence`` is the minimum fraction of descriptor matches that must
+        agree with the fitted homography.
+    """
+
+    detector: str = DEFAULT_DETECTOR
+    min_matches: int = DEFAULT_MIN_MATCHES
+    ratio_test: float = DEFAULT_RATIO_TEST
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        if not isinstance(self.detector, str):
+            raise TypeError(
+                f"Detector must be a string, not {type(self.detector).__name__}"
+            )
+        self.detector = self.detector.lower()
+        if self.detector not in SUPPORTED_DETECTORS:
+            raise ValueError(
+                f"Detector must be one of {SUPPORTED_DETECTORS}, got '{self.detector}'"
+            )
+
+        if not isinstance(self.min_matches, int):
+            raise TypeError(
+                f"Min matches must be an integer, not {type(self.min_matches).__name__}"
+            )
+        if self.min_matches < 4:
+            raise ValueError(
+                f"Min matches must be at least 4 to fit a homography, got {self.min_matches}"
+            )
+
+        if not (0 < self.ratio_test <= 1):
+            raise ValueError(
+                f"Ratio test must be between 0 and 1, got {self.ratio_test}"
+            )
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the feature image element."""
+        return (
+            f"PymordialFeatureImage("
+            f"label='{self.label}', "
+            f"filepath='{self.filepath}', "
+            f"detector='{self.detector}', "
+            f"confidence={self.confidence}, "
+            f"position={self.position}, "
+            f"size={self.size})"
+        )
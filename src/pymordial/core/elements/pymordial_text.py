@@ -15,11 +15,14 @@ class PymordialText(PymordialElement):
         element_text: Known text that the element contains.
         filepath: Optional absolute path for where the element's image will be saved. When not provided, no image is saved.
         extract_strategy: Optional OCR preprocessing strategy.
+        min_score: Lowest accepted match score, from 0 to 1. Below 1 the
+            element also matches OCR output with a few misread characters.
     """
 
     element_text: str
     filepath: str | Path | None = None
     extract_strategy: PymordialExtractStrategy | None = None
+    min_score: float = 1.0
 
     def __post_init__(self):
         super().__post_init__()
@@ -46,6 +49,9 @@ class PymordialText(PymordialElement):
                     f"Extract strategy must be a PymordialExtractStrategy, not {type(self.extract_strategy).__name__}"
                 )
 
+        if not 0.0 <= self.min_score <= 1.0:
+            raise ValueError(f"Min score must be between 0 and 1, not {self.min_score}")
+
     def __repr__(self) -> str:
         """Returns a string representation of the text element."""
         return (
@@ -0,0 +1,239 @@
+"""Single captured screen image with lazily decoded, memoized views."""
+
+import time
+from collections.abc import Callable, Hashable
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+class Frame:
+    """A captured screen image that decodes at most once.
+
+    The raw source (PNG bytes from ``screencap``, an RGB array from the video
+    stream, or a PIL image) is kept as-is until a representation is requested.
+    Every derived representation (RGB, BGR, grayscale, PIL, downscaled) is
+    computed on first access and cached on the instance, so a detection chain
+    that runs template matching, pixel checks and OCR on the same frame only
+    pays for each decode and color conversion once.
+
+    Arrays returned by this class are shared with the cache and must be
+    treated as read-only.
+
+    Attributes:
+        data: The encoded image bytes, if the frame was built from bytes.
+        timestamp: ``time.monotonic()`` value recorded when the frame was created.
+    """
+
+    def __init__(
+        self,
+        source: "bytes | np.ndarray | Image.Image",
+        timestamp: float | None = None,
+    ):
+        """Initializes the Frame.
+
+        Args:
+            source: Encoded image bytes, a numpy array (RGB, RGBA or grayscale),
+                or a PIL Image.
+            timestamp: Optional capture time. Defaults to ``time.monotonic()``.
+
+        Raises:
+            TypeError: If the source type is not supported.
+        """
+        self.data: bytes | None = None
+        self.timestamp: float = timestamp if timestamp is not None else time.monotonic()
+        self._pil: Image.Image | None = None
+        self._rgb: np.ndarray | None = None
+        self._gray: np.ndarray | None = None
+        self._bgr: np.ndarray | None = None
+        self._downscaled: dict[float, np.ndarray] = {}
+        self._memo: dict[Hashable, Any] = {}
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.data = bytes(source)
+        elif isinstance(source, np.ndarray):
+            if source.ndim == 2:
+                self._gray = source
+            elif source.ndim == 3 and source.shape[2] == 4:
+                self._rgb = source[:, :, :3]
+            elif source.ndim == 3 and source.shape[2] == 3:
+                self._rgb = source
+            else:
+                raise TypeError(f"Unsupported array shape for Frame: {source.shape}")
+        elif isinstance(source, Image.Image):
+            self._pil = source
+        else:
+            raise TypeError(
+                f"Frame source must be bytes, numpy array or PIL Image, not {type(source).__name__}"
+            )
+
+    @classmethod
+    def from_image(
+        cls, image: "Frame | bytes | np.ndarray | Image.Image | Path | str"
+    ) -> "Frame":
+        """Wraps any supported image input in a Frame.
+
+        Existing frames are returned unchanged so their caches are reused.
+
+        Args:
+            image: A Frame, image bytes, numpy array, PIL Image, or file path.
+
+        Returns:
+            The Frame for the given image.
+
+        Raises:
+            TypeError: If the image type is not supported.
+        """
+        if isinstance(image, Frame):
+            return image
+        if isinstance(image, (str, Path)):
+            return cls(Path(image).read_bytes())
+        return cls(image)
+
+    @property
+    def pil(self) -> Image.Image:
+        """The frame as a PIL Image."""
+        if self._pil is None:
+            if self.data is not None:
+                self._pil = Image.open(BytesIO(self.data))
+            elif self._rgb is not None:
+                self._pil = Image.fromarray(self._rgb)
+            else:
+                self._pil = Image.fromarray(self._gray)
+        return self._pil
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """The frame as an RGB ``uint8`` array of shape (height, width, 3)."""
+        if self._rgb is None:
+            if self._pil is None and self.data is None and self._gray is not None:
+                self._rgb = cv2.cvtColor(self._gray, cv2.COLOR_GRAY2RGB)
+            else:
+                pil = self.pil
+                if pil.mode != "RGB":
+                    pil = pil.convert("RGB")
+                self._rgb = np.asarray(pil)
+        return self._rgb
+
+    @property
+    def bgr(self) -> np.ndarray:
+        """The frame as a BGR ``uint8`` array, as expected by OpenCV."""
+        if self._bgr is None:
+            self._bgr = cv2.cvtColor(self.rgb, cv2.COLOR_RGB2BGR)
+        return self._bgr
+
+    @property
+    def gray(self) -> np.ndarray:
+        """The frame as a single-channel grayscale ``uint8`` array."""
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.rgb, cv2.COLOR_RGB2GRAY)
+        return self._gray
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """The (width, height) of the frame."""
+        if self._pil is not None:
+            return self._pil.size
+        if self._rgb is None and self._gray is None:
+            return self.pil.size
+        height, width = (self._rgb if self._rgb is not None else self._gray).shape[:2]
+        return (width, height)
+
+    @property
+    def width(self) -> int:
+        """The width of the frame in pixels."""
+        return self.size[0]
+
+    @property
+    def height(self) -> int:
+        """The height of the frame in pixels."""
+        return self.size[1]
+
+    def downscaled(self, factor: float) -> np.ndarray:
+        """Returns the RGB frame shrunk by ``factor`` (e.g. 2 halves each side).
+
+        Args:
+            factor: Downscale factor greater than or equal to 1.
+
+        Returns:
+            The downscaled RGB array.
+
+        Raises:
+            ValueError: If factor is smaller than 1.
+        """
+        if factor < 1:
+            raise ValueError(f"Downscale factor must be >= 1, got {factor}")
+        if factor == 1:
+            return self.rgb
+        if factor not in self._downscaled:
+            self._downscaled[factor] = cv2.resize(
+                self.rgb,
+                None,
+                fx=1 / factor,
+                fy=1 / factor,
+                interpolation=cv2.INTER_AREA,
+            )
+        return self._downscaled[factor]
+
+    def cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the value memoized on this frame under ``key``.
+
+        Lets detectors attach their own per-frame derived data (keypoints,
+        hashes, preprocessed crops) so it is computed once per frame.
+
+        Args:
+            key: Hashable cache key, unique to the kind of derived data.
+            compute: Zero-argument callable producing the value on first use.
+
+        Returns:
+            The cached value.
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def pixel(self, x: int, y: int) -> tuple[int, int, int]:
+        """Returns the (r, g, b) color of the pixel at (x, y).
+
+        Args:
+            x: X coordinate.
+            y: Y coordinate.
+
+        Returns:
+            The RGB color tuple.
+        """
+        r, g, b = self.rgb[y, x]
+        return (int(r), int(g), int(b))
+
+    def crop(self, region: tuple[int, int, int, int]) -> "Frame":
+        """Returns a new Frame for a (left, top, right, bottom) region.
+
+        The crop is a view into the already decoded RGB array, so no pixels
+        are copied.
+
+        Args:
+            region: The (left, top, right, bottom) region to crop.
+
+        Returns:
+            The cropped Frame.
+        """
+        left, top, right, bottom = (int(v) for v in region)
+        return Frame(self.rgb[top:bottom, left:right], timestamp=self.timestamp)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the Frame."""
+        decoded = [
+            name
+            for name, value in (
+                ("rgb", self._rgb),
+                ("bgr", self._bgr),
+                ("gray", self._gray),
+                ("pil", self._pil),
+            )
+            if value is not None
+        ]
+        return f"Frame(encoded={self.data is not None}, decoded={decoded})"
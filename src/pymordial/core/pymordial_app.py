@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
+from pymordial.core.screen_signatures import (
+    DEFAULT_MIN_CONFIDENCE,
+    ScreenDetection,
+    ScreenSignatureIndex,
+)
 from pymordial.state_machine import AppLifecycleState, StateMachine
 from pymordial.utils.config import get_config
+from pymordial.vision.fingerprint import ScreenFingerprintIndex
 
 if TYPE_CHECKING:
     from pymordial.controller.pymordial_controller import PymordialController
+    from pymordial.core.frame import Frame
     from pymordial.core.pymordial_element import PymordialElement
     from pymordial.core.pymordial_screen import PymordialScreen
 
+logger = logging.getLogger(__name__)
 
 _CONFIG = get_config()
 
@@ -72,6 +81,11 @@ class PymordialApp:
             screens if screens is not None else {}
         )
         self.ready_element: "PymordialElement | None" = ready_element
+        self._fingerprint_index: ScreenFingerprintIndex | None = None
+        self._fingerprint_key: tuple | None = None
+        self._signature_index: ScreenSignatureIndex | None = None
+        self._signature_key: tuple | None = None
+        self._last_screen: str | None = None
 
         self.app_state = StateMachine(
             current_state=AppLifecycleState.CLOSED,
@@ -86,6 +100,124 @@ class PymordialApp:
         """
         self.screens[screen.name] = screen
 
+    @property
+    def fingerprint_index(self) -> ScreenFingerprintIndex:
+        """Perceptual-hash index over the reference images of all screens.
+
+        Built on first access and rebuilt whenever a screen or its
+        ``reference_images`` change.
+        """
+        key = tuple(
+            (name, id(screen), tuple(screen.reference_images))
+            for name, screen in self.screens.items()
+        )
+        if self._fingerprint_index is None or key != self._fingerprint_key:
+            self._fingerprint_index = ScreenFingerprintIndex.from_screens(
+                self.screens.values()
+            )
+            self._fingerprint_key = key
+        return self._fingerprint_index
+
+    def identify_screen(self, frame: "Frame | None" = None) -> PymordialScreen | None:
+        """Identifies the visible screen with one fingerprint lookup.
+
+        Only screens with ``reference_images`` take part.
+
+        Args:
+            frame: Optional pre-captured frame. Captured from the controller
+                when omitted.
+
+        Returns:
+            The matching PymordialScreen, or None if no screen is close enough.
+
+        Raises:
+            ValueError: If no frame is given and the controller is not initialized.
+        """
+        if frame is None:
+            if not self.pymordial_controller:
+                raise ValueError(
+                    f"{self.app_name}'s pymordial_controller is not initialized"
+                )
+            frame = self.pymordial_controller.capture_screen()
+            if frame is None:
+                return None
+
+        match = self.fingerprint_index.match(frame)
+        if match is None:
+            return None
+        return self.screens.get(match.name)
+
+    @property
+    def signature_index(self) -> ScreenSignatureIndex:
+        """Index of each screen's cheapest discriminating elements.
+
+        Built on first access and rebuilt whenever a screen is added,
+        replaced or removed, or an element is added to or removed from one.
+        """
+        key = tuple(
+            (
+                name,
+                id(screen),
+                tuple(
+                    (label, id(element)) for label, element in screen.elements.items()
+                ),
+            )
+            for name, screen in self.screens.items()
+        )
+        if self._signature_index is None or key != self._signature_key:
+            self._signature_index = ScreenSignatureIndex(self.screens.values())
+            self._signature_key = key
+        return self._signature_index
+
+    def detect_screen(
+        self,
+        frame: "Frame | None" = None,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    ) -> ScreenDetection | None:
+        """Detects the visible screen by checking signature elements.
+
+        Each screen is checked through a few of its own elements, pixels
+        first, then templates, then OCR, stopping at the first screen whose
+        elements are all found. The last detected screen is checked first,
+        followed by the fingerprint match when screens have
+        ``reference_images``. Every check shares one snapshot of the frame.
+
+        Args:
+            frame: Optional pre-captured frame. Captured from the controller
+                (or taken from the active snapshot) when omitted.
+            min_confidence: Lowest fraction of a screen's signature elements
+                that must be found.
+
+        Returns:
+            A ScreenDetection with the screen and confidence, or None if no
+            screen matches.
+
+        Raises:
+            ValueError: If the controller is not initialized.
+        """
+        if not self.pymordial_controller:
+            raise ValueError(
+                f"{self.app_name}'s pymordial_controller is not initialized"
+            )
+        with self.pymordial_controller.snapshot(frame) as snap:
+            if snap.frame is None:
+                return None
+            prefer = [self._last_screen] if self._last_screen else []
+            if len(self.fingerprint_index):
+                match = self.fingerprint_index.match(snap.frame)
+                if match is not None:
+                    prefer.append(match.name)
+            detection = self.signature_index.detect(
+                snap, min_confidence=min_confidence, prefer=prefer
+            )
+        if detection is not None:
+            self._last_screen = detection.screen.name
+            logger.debug(
+                f"Detected screen '{detection.screen.name}' "
+                f"({detection.confidence:.0%}, {detection.checks} check(s))"
+            )
+        return detection
+
     def open(self) -> bool:
         """Opens the application on the emulator.
 
@@ -127,7 +259,11 @@ class PymordialApp:
                 self.check_ready()
         return result
 
-    def check_ready(self, max_tries: int = DEFAULT_READY_CHECK_MAX_TRIES) -> bool:
+    def check_ready(
+        self,
+        max_tries: int = DEFAULT_READY_CHECK_MAX_TRIES,
+        timeout: float | None = None,
+    ) -> bool:
         """Check if ready_element is visible and transition to READY if so.
 
         This is automatically called after open() if ready_element is defined.
@@ -135,6 +271,9 @@ class PymordialApp:
 
         Args:
             max_tries: Maximum detection attempts (default: 3).
+            timeout: If given, waits up to this many seconds for the element
+                with ``controller.wait_for`` instead of retrying max_tries
+                times, returning as soon as it appears.
 
         Returns:
             True if transitioned to READY, False if still loading.
@@ -155,9 +294,16 @@ class PymordialApp:
 
         # Check if ready element is visible
         try:
-            if self.pymordial_controller.is_element_visible(
-                self.ready_element, max_tries=max_tries
-            ):
+            if timeout is not None:
+                is_ready = (
+                    self.pymordial_controller.wait_for(self.ready_element, timeout)
+                    is not None
+                )
+            else:
+                is_ready = self.pymordial_controller.is_element_visible(
+                    self.ready_element, max_tries=max_tries
+                )
+            if is_ready:
                 self.app_state.transition_to(AppLifecycleState.READY)
                 return True
         except Exception:
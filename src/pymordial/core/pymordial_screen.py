@@ -1,6 +1,7 @@
 """Container for Pymordial UI elements representing a screen."""
 
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from pymordial.core.pymordial_element import PymordialElement
 from pymordial.exceptions import ElementNotFoundError
@@ -13,17 +14,21 @@ class PymordialScreen:
     Attributes:
         name: The name of the screen.
         elements: A dictionary of elements belonging to this screen.
+        reference_images: Screenshots of this screen used to build perceptual
+            hash fingerprints for instant screen identification.
     """
 
     name: str
     elements: dict[str, PymordialElement] = field(default_factory=dict)
+    reference_images: list[str | Path] = field(default_factory=list)
 
     def __post_init__(self) -> None:
         """Validates the screen attributes after initialization.
 
         Raises:
             ValueError: If the name is empty or not a string.
-            TypeError: If elements is not a dictionary or contains invalid keys/values.
+            TypeError: If elements is not a dictionary or contains invalid keys/values,
+                or reference_images is not a list of paths.
         """
         if not isinstance(self.name, str) or not self.name:
             raise ValueError("Screen name must be a non-empty string")
@@ -41,6 +46,17 @@ class PymordialScreen:
                     f"Values must be PymordialElement instances, got {type(element).__name__}"
                 )
 
+        if not isinstance(self.reference_images, list):
+            raise TypeError("Reference images must be a list")
+        for reference in self.reference_images:
+            if not isinstance(reference, (str, Path)):
+                raise TypeError(
+                    f"Reference images must be strings or Path objects, got {type(reference).__name__}"
+                )
+        self.reference_images = [
+            Path(reference).resolve() for reference in self.reference_images
+        ]
+
     def add_element(self, element: PymordialElement) -> None:
         """Adds an element to the screen.
 
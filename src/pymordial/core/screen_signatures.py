@@ -0,0 +1,215 @@
+"""Active-screen detection from each screen's cheapest discriminating elements."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pymordial.core.elements.pymordial_feature_image import PymordialFeatureImage
+from pymordial.core.elements.pymordial_image import PymordialImage
+from pymordial.core.elements.pymordial_pixel import PymordialPixel
+from pymordial.core.elements.pymordial_text import PymordialText
+from pymordial.utils.config import get_config
+
+if TYPE_CHECKING:
+    from pymordial.controller.snapshot import Snapshot
+    from pymordial.core.pymordial_element import PymordialElement
+    from pymordial.core.pymordial_screen import PymordialScreen
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Screen Detection Configuration ---
+_SCREEN_DETECTION = _CONFIG["app"]["screen_detection"]
+DEFAULT_MAX_SIGNATURE_ELEMENTS = _SCREEN_DETECTION["max_signature_elements"]
+DEFAULT_MIN_CONFIDENCE = _SCREEN_DETECTION["min_confidence"]
+
+# Relative check costs, cheapest first
+COST_PIXEL = 0
+COST_REGION_TEMPLATE = 1
+COST_TEMPLATE = 2
+COST_FEATURES = 3
+COST_REGION_TEXT = 4
+COST_TEXT = 5
+
+
+def element_cost(element: PymordialElement) -> int | None:
+    """Ranks how expensive an element is to check.
+
+    Pixel checks read one value; templates confined to a region search a
+    small area; whole-frame templates and feature matching scan the screen;
+    OCR is the most expensive, especially without a region.
+
+    Args:
+        element: The element.
+
+    Returns:
+        The cost rank, or None if the element cannot be checked on its own
+        (a pixel without position, or text without expected text).
+    """
+    if isinstance(element, PymordialPixel):
+        return COST_PIXEL if element.position is not None else None
+    if isinstance(element, PymordialFeatureImage):
+        return COST_FEATURES
+    if isinstance(element, PymordialImage):
+        return COST_REGION_TEMPLATE if element.region else COST_TEMPLATE
+    if isinstance(element, PymordialText):
+        if not element.element_text:
+            return None
+        return COST_REGION_TEXT if element.region else COST_TEXT
+    return None
+
+
+@dataclass(frozen=True)
+class ScreenDetection:
+    """Result of an active-screen detection.
+
+    Attributes:
+        screen: The detected screen.
+        confidence: Fraction of the screen's signature elements found.
+        checks: Number of element checks run to reach the answer.
+    """
+
+    screen: PymordialScreen
+    confidence: float
+    checks: int
+
+
+class ScreenSignatureIndex:
+    """Per-screen signatures of cheap, discriminating elements.
+
+    A screen's signature is its ``max_elements`` cheapest checkable elements
+    whose labels no other screen uses (shared elements such as a common back
+    button cannot tell screens apart; they are only used when a screen has
+    nothing else). Detection walks the screens, checking each signature
+    cheapest-first and abandoning a screen as soon as it misses more
+    elements than ``min_confidence`` allows; the first screen with every
+    element found ends the search.
+
+    Attributes:
+        max_elements: Most elements in a signature.
+        signatures: Signature elements keyed by screen name, cheapest first.
+    """
+
+    def __init__(
+        self,
+        screens: Iterable[PymordialScreen],
+        max_elements: int = DEFAULT_MAX_SIGNATURE_ELEMENTS,
+    ):
+        """Builds the signatures.
+
+        Args:
+            screens: Screens to index.
+            max_elements: Most elements in a signature.
+
+        Raises:
+            ValueError: If max_elements is not positive.
+        """
+        if max_elements < 1:
+            raise ValueError(
+                f"Max signature elements must be positive, got {max_elements}"
+            )
+        self.max_elements = max_elements
+        self._screens: dict[str, PymordialScreen] = {
+            screen.name: screen for screen in screens
+        }
+
+        label_counts: dict[str, int] = {}
+        for screen in self._screens.values():
+            for label in {element.label for element in screen.elements.values()}:
+                label_counts[label] = label_counts.get(label, 0) + 1
+
+        self.signatures: dict[str, list[PymordialElement]] = {}
+        for name, screen in self._screens.items():
+            ranked = sorted(
+                (
+                    (cost, label_counts[element.label] > 1, index, element)
+                    for index, element in enumerate(screen.elements.values())
+                    if (cost := element_cost(element)) is not None
+                ),
+                key=lambda item: (item[1], item[0], item[2]),
+            )
+            unique = [item for item in ranked if not item[1]]
+            chosen = (unique or ranked)[:max_elements]
+            if not chosen:
+                logger.debug(f"Screen '{name}' has no checkable elements")
+                continue
+            # Evaluate cheapest first
+            self.signatures[name] = [
+                element for *_, element in sorted(chosen, key=lambda item: item[0])
+            ]
+
+    def cost(self, name: str) -> int:
+        """Returns the cost of checking a screen's full signature."""
+        return sum(element_cost(element) + 1 for element in self.signatures[name])
+
+    def detect(
+        self,
+        snapshot: Snapshot,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+        prefer: Iterable[str] = (),
+    ) -> ScreenDetection | None:
+        """Finds the screen showing in a snapshot.
+
+        Args:
+            snapshot: Snapshot of the screen; its per-element memo and the
+                frame's cached conversions are shared by every check.
+            min_confidence: Lowest fraction of signature elements that must
+                be found for a screen to match.
+            prefer: Screen names to check first (e.g. the last detected
+                screen); the rest follow from cheapest signature.
+
+        Returns:
+            The complete match found first, otherwise the best partial match
+            at or above min_confidence, or None.
+
+        Raises:
+            ValueError: If min_confidence is outside 0 to 1.
+        """
+        if not 0.0 < min_confidence <= 1.0:
+            raise ValueError(f"Min confidence must be in (0, 1], got {min_confidence}")
+        preferred = [name for name in dict.fromkeys(prefer) if name in self.signatures]
+        order = preferred + sorted(
+            (name for name in self.signatures if name not in preferred),
+            key=self.cost,
+        )
+
+        checks = 0
+        best: ScreenDetection | None = None
+        for name in order:
+            signature = self.signatures[name]
+            max_misses = int(len(signature) * (1.0 - min_confidence) + 1e-9)
+            found = misses = 0
+            for element in signature:
+                checks += 1
+                if snapshot.is_visible(element):
+                    found += 1
+                else:
+                    misses += 1
+                    if misses > max_misses:
+                        break
+            if misses > max_misses:
+                continue
+            confidence = found / len(signature)
+            if confidence == 1.0:
+                return ScreenDetection(self._screens[name], 1.0, checks)
+            if best is None or confidence > best.confidence:
+                best = ScreenDetection(self._screens[name], confidence, checks)
+        if best is not None:
+            best = ScreenDetection(best.screen, best.confidence, checks)
+        return best
+
+    def __len__(self) -> int:
+        """Returns the number of screens with a signature."""
+        return len(self.signatures)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the index."""
+        elements = sum(len(signature) for signature in self.signatures.values())
+        return (
+            f"ScreenSignatureIndex(screens={len(self.signatures)}, "
+            f"elements={elements})"
+        )
@@ -4,22 +4,73 @@ This module provides a pluggable OCR architecture using the Strategy Pattern.
 """
 
 from pymordial.ocr.base import PymordialOCR
+from pymordial.ocr.executor import OcrExecutor, OcrJob
 from pymordial.ocr.extract_strategy import (
     DefaultExtractStrategy,
+    PipelineStrategy,
     PymordialExtractStrategy,
 )
+from pymordial.ocr.glyph_ocr import GlyphOCR
+from pymordial.ocr.pipeline import (
+    Crop,
+    Denoise,
+    Gray,
+    Invert,
+    Pad,
+    PreprocessStage,
+    Resize,
+    Threshold,
+    run_pipeline,
+)
+from pymordial.ocr.result import OcrResult, OcrWord, TextMatch
 from pymordial.ocr.tesseract_ocr import TesseractOCR
 
 # Optional OCR engines (require additional dependencies)
 try:
-    from pymordial.ocr.easyocr_ocr import EasyOCR
+    from pymordial.ocr.easyocr_ocr import (
+        EasyOcrOCR,
+        get_easyocr_reader,
+        warmup_easyocr_reader,
+    )
+
+    EasyOCR = EasyOcrOCR
 except ImportError:
+    EasyOcrOCR = None
     EasyOCR = None
+    get_easyocr_reader = None
+    warmup_easyocr_reader = None
+
+try:
+    from pymordial.ocr.tesserocr_ocr import TesseractApiPool, TesserocrOCR
+except ImportError:
+    TesseractApiPool = None
+    TesserocrOCR = None
 
 __all__ = [
     "PymordialOCR",
+    "OcrExecutor",
+    "OcrJob",
+    "OcrResult",
+    "OcrWord",
+    "TextMatch",
     "TesseractOCR",
+    "GlyphOCR",
+    "TesserocrOCR",
+    "TesseractApiPool",
+    "EasyOcrOCR",
     "EasyOCR",
+    "get_easyocr_reader",
+    "warmup_easyocr_reader",
     "DefaultExtractStrategy",
     "PymordialExtractStrategy",
+    "PipelineStrategy",
+    "PreprocessStage",
+    "Crop",
+    "Resize",
+    "Gray",
+    "Denoise",
+    "Threshold",
+    "Invert",
+    "Pad",
+    "run_pipeline",
 ]
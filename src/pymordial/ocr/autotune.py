@@ -0,0 +1,393 @@
+"""Offline search for the cheapest OCR strategy meeting an accuracy target.
+
+Given labelled crops of each text element, the tuner builds a pipeline
+strategy for every combination of upscale factor, denoise filter, threshold
+method, page segmentation mode and character whitelist, discards the ones
+that misread too many crops, times the survivors and keeps the fastest one.
+
+Crops for several elements live in one directory per element label::
+
+    crops/
+        hp_value/   labels.json, 001.png, 002.png, ...
+        move_1/     labels.json, ...
+
+The result is saved as JSON and loaded back as ready-to-use strategies::
+
+    tuned = load_tuned_strategies("tuned_ocr.json")
+    apply_tuned_strategies(app.screens["battle"].elements.values(), tuned)
+"""
+
+import itertools
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from pymordial.ocr.benchmark import (
+    LABELS_FILENAME,
+    LabelledCrop,
+    StrategyBenchmark,
+    benchmark_strategy,
+    load_labelled_crops,
+)
+from pymordial.ocr.extract_strategy import (
+    TESSERACT_BASE_CONFIG,
+    PipelineStrategy,
+)
+from pymordial.ocr.matching import normalize_text
+from pymordial.ocr.pipeline import (
+    DENOISE_NONE,
+    THRESHOLD_OTSU,
+    Denoise,
+    Gray,
+    Invert,
+    PreprocessStage,
+    Resize,
+    Threshold,
+)
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+from pymordial.utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Autotune Configuration ---
+_AUTOTUNE = _CONFIG["extract_strategy"]["autotune"]
+DEFAULT_TARGET_ACCURACY = _AUTOTUNE["target_accuracy"]
+DEFAULT_UPSCALE_FACTORS = tuple(_AUTOTUNE["upscale_factors"])
+DEFAULT_DENOISE_METHODS = tuple(_AUTOTUNE["denoise_methods"])
+DEFAULT_THRESHOLD_METHODS = tuple(_AUTOTUNE["threshold_methods"])
+DEFAULT_PSM_MODES = tuple(_AUTOTUNE["psm_modes"])
+WHITELIST_EXTRA_CHARS = _AUTOTUNE["whitelist_chars"]
+
+
+@dataclass(frozen=True)
+class TuningParams:
+    """One point of the strategy search space.
+
+    Attributes:
+        upscale: Fixed upscale factor, or None to upscale adaptively from the
+            estimated text height.
+        denoise: Denoise method ("none", "median", "bilateral" or "nlmeans").
+        threshold: Threshold method ("otsu" or "adaptive").
+        psm: Tesseract page segmentation mode.
+        whitelist: Characters Tesseract may output; empty for no whitelist.
+    """
+
+    upscale: float | None = None
+    denoise: str = DENOISE_NONE
+    threshold: str = THRESHOLD_OTSU
+    psm: int = 7
+    whitelist: str = ""
+
+    def stages(self) -> tuple[PreprocessStage, ...]:
+        """Returns the preprocessing stages for these parameters."""
+        stages: list[PreprocessStage] = [Gray()]
+        if self.upscale is None:
+            stages.append(Resize(None, interpolation="linear"))
+        elif self.upscale != 1.0:
+            stages.append(Resize(self.upscale, interpolation="cubic"))
+        stages += [Denoise(self.denoise), Threshold(self.threshold), Invert()]
+        return tuple(stages)
+
+    def tesseract_config(self) -> str:
+        """Returns the Tesseract configuration for these parameters."""
+        config = f"{TESSERACT_BASE_CONFIG} --psm {self.psm}"
+        if self.whitelist:
+            config += f" -c tessedit_char_whitelist={self.whitelist}"
+        return config
+
+    def strategy(self) -> PipelineStrategy:
+        """Builds the strategy for these parameters."""
+        return PipelineStrategy(self.stages(), config=self.tesseract_config())
+
+
+@dataclass(frozen=True)
+class TuningResult:
+    """The strategy chosen for one element.
+
+    Attributes:
+        params: The chosen parameters.
+        benchmark: Timing and accuracy of the chosen strategy.
+        meets_target: Whether the accuracy target was reached. If not, the
+            most accurate candidate was chosen.
+        candidates: Number of parameter combinations tried.
+    """
+
+    params: TuningParams
+    benchmark: StrategyBenchmark
+    meets_target: bool
+    candidates: int
+
+    def strategy(self) -> PipelineStrategy:
+        """Builds the chosen strategy."""
+        return self.params.strategy()
+
+    def to_dict(self) -> dict:
+        """Returns the JSON-serializable form of the result."""
+        return {
+            "params": asdict(self.params),
+            "accuracy": self.benchmark.accuracy,
+            "char_accuracy": self.benchmark.char_accuracy,
+            "total_ms": round(self.benchmark.total_ms, 3),
+            "samples": self.benchmark.samples,
+            "meets_target": self.meets_target,
+            "candidates": self.candidates,
+        }
+
+
+def label_whitelist(crops: Iterable[LabelledCrop]) -> str:
+    """Returns the characters used by the labels, or "" if none can be listed.
+
+    Only alphanumerics and ``extract_strategy.autotune.whitelist_chars`` are
+    whitelisted; labels with any other character get no whitelist.
+
+    Args:
+        crops: The labelled crops.
+
+    Returns:
+        The sorted characters, without whitespace.
+    """
+    chars = {char for crop in crops for char in crop.label if not char.isspace()}
+    if any(not char.isalnum() and char not in WHITELIST_EXTRA_CHARS for char in chars):
+        return ""
+    return "".join(sorted(chars))
+
+
+def search_space(
+    crops: list[LabelledCrop],
+    upscale_factors: Iterable[float | None] = DEFAULT_UPSCALE_FACTORS,
+    denoise_methods: Iterable[str] = DEFAULT_DENOISE_METHODS,
+    threshold_methods: Iterable[str] = DEFAULT_THRESHOLD_METHODS,
+    psm_modes: Iterable[int] = DEFAULT_PSM_MODES,
+) -> list[TuningParams]:
+    """Lists the parameter combinations to try for a crop set.
+
+    Every combination is tried with and without a whitelist of the
+    characters the labels use.
+
+    Args:
+        crops: The labelled crops (used for the whitelist).
+        upscale_factors: Upscale factors; None means adaptive.
+        denoise_methods: Denoise methods.
+        threshold_methods: Threshold methods.
+        psm_modes: Tesseract page segmentation modes.
+
+    Returns:
+        The parameter combinations.
+    """
+    whitelists = [""]
+    whitelist = label_whitelist(crops)
+    if whitelist:
+        whitelists.append(whitelist)
+    return [
+        TuningParams(upscale, denoise, threshold, psm, chars)
+        for upscale, denoise, threshold, psm, chars in itertools.product(
+            upscale_factors, denoise_methods, threshold_methods, psm_modes, whitelists
+        )
+    ]
+
+
+def _screen(
+    strategy: PipelineStrategy,
+    crops: list[LabelledCrop],
+    engine: TesseractOCR,
+    max_misses: int,
+) -> int:
+    """Counts exact reads, giving up after more than max_misses misreads."""
+    config = strategy.tesseract_config()
+    hits = misses = 0
+    for crop in crops:
+        # Score what TesseractOCR.extract_text returns (no postprocess_text)
+        text = engine._image_to_string(strategy.preprocess(crop.image), config).strip()
+        if normalize_text(text) == normalize_text(crop.label):
+            hits += 1
+        else:
+            misses += 1
+            if misses > max_misses:
+                break
+    return hits
+
+
+def tune_strategy(
+    crops: list[LabelledCrop],
+    target_accuracy: float = DEFAULT_TARGET_ACCURACY,
+    engine: TesseractOCR | None = None,
+    space: list[TuningParams] | None = None,
+    repeat: int = 1,
+) -> TuningResult:
+    """Finds the fastest strategy reading a crop set at the target accuracy.
+
+    Each candidate is first screened for accuracy, abandoning it as soon as
+    it misreads more crops than the target allows (shared stage prefixes
+    are memoized, so screening many candidates on the same crops is cheap).
+    Only the candidates that pass are timed.
+
+    Args:
+        crops: Labelled crops of one element.
+        target_accuracy: Fraction of crops that must be read exactly.
+        engine: Tesseract engine used for recognition. Defaults to TesseractOCR.
+        space: Parameter combinations to try. Defaults to search_space(crops).
+        repeat: Timed runs per crop for the passing candidates.
+
+    Returns:
+        The TuningResult. If no candidate reaches the target, the most
+        accurate one (then the fastest) is returned with meets_target False.
+
+    Raises:
+        ValueError: If crops is empty or target_accuracy is outside 0 to 1.
+    """
+    if not crops:
+        raise ValueError("Cannot tune on an empty crop set")
+    if not 0.0 <= target_accuracy <= 1.0:
+        raise ValueError(
+            f"Target accuracy must be between 0 and 1, got {target_accuracy}"
+        )
+    engine = engine or TesseractOCR()
+    space = space if space is not None else search_space(crops)
+    max_misses = int(len(crops) * (1.0 - target_accuracy) + 1e-9)
+
+    passing = [
+        params
+        for params in space
+        if _screen(params.strategy(), crops, engine, max_misses)
+        >= len(crops) - max_misses
+    ]
+    logger.info(f"{len(passing)}/{len(space)} candidate(s) reach {target_accuracy:.0%}")
+    meets_target = bool(passing)
+    if not meets_target:
+        # Rescreen without early exit and keep the most accurate candidates
+        hits = {
+            params: _screen(params.strategy(), crops, engine, len(crops))
+            for params in space
+        }
+        best = max(hits.values())
+        passing = [params for params in space if hits[params] == best]
+
+    timed = [
+        (
+            benchmark_strategy(
+                repr(params), params.strategy(), crops, engine=engine, repeat=repeat
+            ),
+            params,
+        )
+        for params in passing
+    ]
+    benchmark, params = min(timed, key=lambda item: item[0].total_ms)
+    return TuningResult(
+        params=params,
+        benchmark=benchmark,
+        meets_target=meets_target,
+        candidates=len(space),
+    )
+
+
+def tune_elements(
+    crop_sets: dict[str, list[LabelledCrop]],
+    target_accuracy: float = DEFAULT_TARGET_ACCURACY,
+    engine: TesseractOCR | None = None,
+    repeat: int = 1,
+) -> dict[str, TuningResult]:
+    """Tunes a strategy for every element of a crop collection.
+
+    Args:
+        crop_sets: Labelled crops keyed by element label.
+        target_accuracy: Fraction of crops that must be read exactly.
+        engine: Tesseract engine used for recognition. Defaults to TesseractOCR.
+        repeat: Timed runs per crop for the passing candidates.
+
+    Returns:
+        The TuningResult of each element, keyed by element label.
+    """
+    engine = engine or TesseractOCR()
+    results = {}
+    for label, crops in crop_sets.items():
+        results[label] = tune_strategy(
+            crops, target_accuracy, engine=engine, repeat=repeat
+        )
+        logger.info(f"Tuned {label}: {results[label].params}")
+    return results
+
+
+def load_element_crops(root: str | Path) -> dict[str, list[LabelledCrop]]:
+    """Loads one labelled crop set per element subdirectory.
+
+    Args:
+        root: Directory holding one subdirectory per element label, each with
+            its crop images and ``labels.json``.
+
+    Returns:
+        The labelled crops keyed by element label.
+
+    Raises:
+        ValueError: If no subdirectory holds a ``labels.json``.
+    """
+    root = Path(root)
+    directories = (
+        sorted(path.parent for path in root.glob(f"*/{LABELS_FILENAME}"))
+        if root.is_dir()
+        else []
+    )
+    if not directories:
+        raise ValueError(f"No element crop directories found in {root}")
+    return {directory.name: load_labelled_crops(directory) for directory in directories}
+
+
+def save_tuning(results: dict[str, TuningResult], path: str | Path) -> None:
+    """Writes tuning results as JSON, keyed by element label.
+
+    Args:
+        results: The tuning results keyed by element label.
+        path: Destination file.
+    """
+    Path(path).write_text(
+        json.dumps(
+            {label: result.to_dict() for label, result in results.items()}, indent=2
+        )
+    )
+
+
+def load_tuned_strategies(path: str | Path) -> dict[str, PipelineStrategy]:
+    """Loads the strategies saved by save_tuning.
+
+    Args:
+        path: File written by save_tuning.
+
+    Returns:
+        A strategy for every tuned element, keyed by element label.
+
+    Raises:
+        ValueError: If the file is missing or malformed.
+    """
+    try:
+        data = json.loads(Path(path).read_text())
+        return {
+            label: TuningParams(**entry["params"]).strategy()
+            for label, entry in data.items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid tuning file {path}: {e}") from e
+
+
+def apply_tuned_strategies(
+    elements: Iterable[object], tuned: dict[str, PipelineStrategy]
+) -> int:
+    """Sets the tuned strategy on every text element with a tuned label.
+
+    Args:
+        elements: UI elements; only those with an ``extract_strategy``
+            attribute (PymordialText) are updated.
+        tuned: Strategies keyed by element label.
+
+    Returns:
+        The number of elements updated.
+    """
+    updated = 0
+    for element in elements:
+        label = getattr(element, "label", None)
+        if label in tuned and hasattr(element, "extract_strategy"):
+            element.extract_strategy = tuned[label]
+            updated += 1
+    return updated
@@ -4,9 +4,13 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from pymordial.ocr.result import OcrResult
+
 if TYPE_CHECKING:
     import numpy as np
 
+    from pymordial.core.frame import Frame
+
 
 class PymordialOCR(ABC):
     """Abstract base class for OCR engines.
@@ -16,11 +20,13 @@ class PymordialOCR(ABC):
     """
 
     @abstractmethod
-    def extract_text(self, image_path: "Path | bytes | str | np.ndarray") -> str:
+    def extract_text(
+        self, image_path: "Path | bytes | str | np.ndarray | Frame"
+    ) -> str:
         """Extracts text from an image.
 
         Args:
-            image_path: Path to image file, image bytes, or numpy array.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
 
         Returns:
             Extracted text from the image.
@@ -32,13 +38,13 @@ class PymordialOCR(ABC):
 
     @abstractmethod
     def find_text(
-        self, search_text: str, image_path: "Path | bytes | str | np.ndarray"
+        self, search_text: str, image_path: "Path | bytes | str | np.ndarray | Frame"
     ) -> tuple[int, int] | None:
         """Finds the coordinates (center) of the specified text in the image.
 
         Args:
             search_text: Text to search for.
-            image_path: Path to image file, image bytes, or numpy array.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
 
         Returns:
             (x, y) coordinates of the center of the found text, or None if not found.
@@ -46,13 +52,13 @@ class PymordialOCR(ABC):
         pass
 
     def contains_text(
-        self, search_text: str, image_path: "Path | bytes | str | np.ndarray"
+        self, search_text: str, image_path: "Path | bytes | str | np.ndarray | Frame"
     ) -> bool:
         """Checks if image contains specific text.
 
         Args:
             search_text: Text to search for.
-            image_path: Path to image file, image bytes, or numpy array.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
 
         Returns:
             True if text is found, False otherwise.
@@ -60,14 +66,30 @@ class PymordialOCR(ABC):
         extracted = self.extract_text(image_path)
         return search_text.lower() in extracted.lower()
 
-    def extract_lines(self, image_path: "Path | bytes | str | np.ndarray") -> list[str]:
+    def extract_lines(
+        self, image_path: "Path | bytes | str | np.ndarray | Frame"
+    ) -> list[str]:
         """Extracts text as individual lines.
 
         Args:
-            image_path: Path to image file, image bytes, or numpy array.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
 
         Returns:
             List of text lines.
         """
         text = self.extract_text(image_path)
         return [line.strip() for line in text.split("\n") if line.strip()]
+
+    def read(self, image_path: "Path | bytes | str | np.ndarray | Frame") -> OcrResult:
+        """Reads all text of an image in one pass for repeated querying.
+
+        Engines that can report word boxes should override this; the default
+        wraps ``extract_text`` and leaves every box empty.
+
+        Args:
+            image_path: Path to image file, image bytes, numpy array, or Frame.
+
+        Returns:
+            The OcrResult.
+        """
+        return OcrResult.from_text(self.extract_text(image_path))
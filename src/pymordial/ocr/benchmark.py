@@ -0,0 +1,222 @@
+"""Benchmarks of OCR preprocessing strategies on labelled crops.
+
+A labelled crop set is a directory of images plus a ``labels.json`` file
+mapping each image file name to the text it shows::
+
+    {"hp_bar.png": "HP 100", "attack_button.png": "Attack"}
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+from pymordial.ocr.matching import edit_distance, normalize_text
+from pymordial.ocr.pipeline import clear_pipeline_cache
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+
+logger = logging.getLogger(__name__)
+
+LABELS_FILENAME = "labels.json"
+
+
+@dataclass(frozen=True)
+class LabelledCrop:
+    """An image crop and the text it is known to show.
+
+    Attributes:
+        name: Identifier of the crop, e.g. its file name.
+        image: The crop as a BGR numpy array.
+        label: The expected text.
+    """
+
+    name: str
+    image: np.ndarray
+    label: str
+
+
+@dataclass(frozen=True)
+class StrategyBenchmark:
+    """Timing and accuracy of one strategy over a crop set.
+
+    Attributes:
+        name: Name of the benchmarked strategy.
+        samples: Number of crops read.
+        preprocess_ms: Mean preprocessing time per crop, in milliseconds.
+        ocr_ms: Mean recognition time per crop, in milliseconds.
+        accuracy: Fraction of crops read exactly (ignoring case and spacing).
+        char_accuracy: Mean character-level accuracy, from 0 to 1.
+    """
+
+    name: str
+    samples: int
+    preprocess_ms: float
+    ocr_ms: float
+    accuracy: float
+    char_accuracy: float
+
+    @property
+    def total_ms(self) -> float:
+        """Mean end-to-end time per crop, in milliseconds."""
+        return self.preprocess_ms + self.ocr_ms
+
+
+def character_accuracy(expected: str, actual: str) -> float:
+    """Returns 1 minus the normalized edit distance, floored at 0.
+
+    Args:
+        expected: The labelled text.
+        actual: The recognized text.
+
+    Returns:
+        Accuracy from 0 to 1.
+    """
+    expected, actual = normalize_text(expected), normalize_text(actual)
+    if not expected:
+        return 1.0 if not actual else 0.0
+    return max(0.0, 1.0 - edit_distance(expected, actual) / len(expected))
+
+
+def load_labelled_crops(directory: str | Path) -> list[LabelledCrop]:
+    """Loads a labelled crop set.
+
+    Args:
+        directory: Directory holding the images and ``labels.json``.
+
+    Returns:
+        The crops, in label file order.
+
+    Raises:
+        ValueError: If the label file is missing or an image cannot be read.
+    """
+    directory = Path(directory)
+    labels_path = directory / LABELS_FILENAME
+    try:
+        labels = json.loads(labels_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read crop labels from {labels_path}: {e}") from e
+
+    crops = []
+    for filename, label in labels.items():
+        image = cv2.imread(str(directory / filename))
+        if image is None:
+            raise ValueError(f"Could not read crop image {directory / filename}")
+        crops.append(LabelledCrop(name=filename, image=image, label=label))
+    return crops
+
+
+def benchmark_strategy(
+    name: str,
+    strategy: PymordialExtractStrategy,
+    crops: list[LabelledCrop],
+    engine: TesseractOCR | None = None,
+    repeat: int = 1,
+) -> StrategyBenchmark:
+    """Times and scores one strategy on a crop set.
+
+    Preprocessing and recognition are timed separately; the best of
+    ``repeat`` runs is kept for each, per crop.
+
+    Args:
+        name: Name to report the strategy under.
+        strategy: The strategy to benchmark.
+        crops: The labelled crops.
+        engine: Tesseract engine used for recognition. Defaults to TesseractOCR.
+        repeat: Number of timed runs per crop.
+
+    Returns:
+        The StrategyBenchmark.
+
+    Raises:
+        ValueError: If crops is empty or repeat is smaller than 1.
+    """
+    if not crops:
+        raise ValueError("Cannot benchmark an empty crop set")
+    if repeat < 1:
+        raise ValueError(f"Repeat must be at least 1, got {repeat}")
+    engine = engine or TesseractOCR()
+    config = strategy.tesseract_config() or engine.config
+
+    preprocess_times, ocr_times, exact, char_scores = [], [], 0, []
+    for crop in crops:
+        best_preprocess = best_ocr = float("inf")
+        for _ in range(repeat):
+            # Time every stage, not outputs memoized by an earlier run
+            clear_pipeline_cache()
+            start = time.perf_counter()
+            processed = strategy.preprocess(crop.image)
+            best_preprocess = min(best_preprocess, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            text = engine._image_to_string(processed, config)
+            best_ocr = min(best_ocr, time.perf_counter() - start)
+
+        # Score what TesseractOCR.extract_text returns, which does not apply
+        # postprocess_text
+        text = text.strip()
+        preprocess_times.append(best_preprocess)
+        ocr_times.append(best_ocr)
+        exact += normalize_text(text) == normalize_text(crop.label)
+        char_scores.append(character_accuracy(crop.label, text))
+        logger.debug(f"{name}: {crop.name} read as {text!r} (expected {crop.label!r})")
+
+    return StrategyBenchmark(
+        name=name,
+        samples=len(crops),
+        preprocess_ms=float(np.mean(preprocess_times)) * 1000,
+        ocr_ms=float(np.mean(ocr_times)) * 1000,
+        accuracy=exact / len(crops),
+        char_accuracy=float(np.mean(char_scores)),
+    )
+
+
+def benchmark_strategies(
+    strategies: dict[str, PymordialExtractStrategy],
+    crops: list[LabelledCrop],
+    engine: TesseractOCR | None = None,
+    repeat: int = 1,
+) -> list[StrategyBenchmark]:
+    """Benchmarks several strategies on the same crop set.
+
+    Args:
+        strategies: Strategies keyed by the name to report them under.
+        crops: The labelled crops.
+        engine: Tesseract engine used for recognition. Defaults to TesseractOCR.
+        repeat: Number of timed runs per crop.
+
+    Returns:
+        One StrategyBenchmark per strategy, in input order.
+    """
+    engine = engine or TesseractOCR()
+    return [
+        benchmark_strategy(name, strategy, crops, engine=engine, repeat=repeat)
+        for name, strategy in strategies.items()
+    ]
+
+
+def format_benchmarks(results: list[StrategyBenchmark]) -> str:
+    """Formats benchmark results as a plain-text table.
+
+    Args:
+        results: The benchmark results.
+
+    Returns:
+        The table.
+    """
+    width = max([len("strategy")] + [len(result.name) for result in results])
+    lines = [
+        f"{'strategy':<{width}}  {'prep ms':>8}  {'ocr ms':>8}  "
+        f"{'total ms':>8}  {'exact':>6}  {'chars':>6}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}}  {result.preprocess_ms:>8.2f}  "
+            f"{result.ocr_ms:>8.2f}  {result.total_ms:>8.2f}  "
+            f"{result.accuracy:>6.1%}  {result.char_accuracy:>6.1%}"
+        )
+    return "\n".join(lines)
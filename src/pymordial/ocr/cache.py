@@ -0,0 +1,235 @@
+"""Content-addressed cache of OCR results."""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from pymordial.core.frame import Frame
+
+if TYPE_CHECKING:
+    from pymordial.ocr.base import PymordialOCR
+    from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+
+logger = logging.getLogger(__name__)
+
+DIGEST_SIZE = 16
+
+
+def image_digest(image: "Path | bytes | str | np.ndarray | Frame") -> bytes:
+    """Returns a BLAKE2b digest of an image's content.
+
+    Encoded bytes are hashed as-is, so a cache hit never decodes the image.
+    Arrays are hashed together with their shape and dtype. Digests of Frames
+    are memoized on the frame.
+
+    Args:
+        image: Path to image file, image bytes, numpy array, or Frame.
+
+    Returns:
+        The digest bytes.
+    """
+    if isinstance(image, Frame):
+        frame = image
+        return frame.cached(
+            ("ocr_digest",),
+            lambda: image_digest(frame.data if frame.data is not None else frame.rgb),
+        )
+
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    if isinstance(image, np.ndarray):
+        hasher.update(f"{image.shape}{image.dtype.str}".encode())
+        hasher.update(np.ascontiguousarray(image).data)
+    elif isinstance(image, (bytes, bytearray, memoryview)):
+        hasher.update(image)
+    else:
+        hasher.update(Path(image).read_bytes())
+    return hasher.digest()
+
+
+def _is_hashable(value: object) -> bool:
+    """Returns whether a value can be used in a cache key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _setting_identity(value: object) -> Hashable | None:
+    """Returns the cache-key form of one strategy attribute.
+
+    Returns None if the value has no identity that is safe to compare.
+    """
+    from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+
+    if value is None or isinstance(value, (str, int, float, bool, Path)):
+        return (value,)
+    if isinstance(value, tuple) and _is_hashable(value):
+        return (value,)
+    if isinstance(value, PymordialExtractStrategy):
+        return strategy_identity(value)
+    return None
+
+
+def strategy_identity(strategy: "PymordialExtractStrategy | None") -> tuple | None:
+    """Returns a hashable identity for a preprocessing strategy.
+
+    Two strategies are considered the same when they share a class, every
+    attribute (scalars, paths, hashable tuples such as pipeline stages, and
+    nested strategies) and their Tesseract config, so freshly constructed
+    instances with the same settings share cache entries. A strategy holding
+    any other value (a list, a dict, an arbitrary object) has no safe
+    identity and is not cached.
+
+    Args:
+        strategy: The strategy, or None for the engine default.
+
+    Returns:
+        A hashable tuple, or None if results for the strategy must not be
+        cached.
+    """
+    if strategy is None:
+        return (None,)
+    settings = []
+    for name, value in sorted(vars(strategy).items()):
+        identity = _setting_identity(value)
+        if identity is None:
+            return None
+        settings.append((name, identity))
+    return (
+        f"{type(strategy).__module__}.{type(strategy).__qualname__}",
+        tuple(settings),
+        strategy.tesseract_config(),
+    )
+
+
+def engine_identity(engine: "PymordialOCR") -> tuple:
+    """Returns a hashable identity for an OCR engine and its config.
+
+    Args:
+        engine: The OCR engine.
+
+    Returns:
+        A hashable tuple.
+    """
+    return (
+        f"{type(engine).__module__}.{type(engine).__qualname__}",
+        str(getattr(engine, "config", "")),
+        str(getattr(engine, "language", getattr(engine, "languages", ""))),
+    )
+
+
+@dataclass(frozen=True)
+class OcrCacheStats:
+    """Snapshot of OCR cache counters.
+
+    Attributes:
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that ran OCR.
+        size: Number of cached results.
+        maxsize: Maximum number of cached results.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class OcrCache:
+    """Bounded, thread-safe LRU cache of OCR results keyed by content.
+
+    Keys combine a digest of the image bytes with the identity of the engine,
+    strategy and operation, so polling an unchanged region costs a hash
+    instead of an OCR run.
+
+    Attributes:
+        maxsize: Maximum number of cached results.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached results.
+
+        Raises:
+            ValueError: If maxsize is smaller than 1.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the cached value for ``key``, computing it on a miss.
+
+        Exceptions raised by ``compute`` propagate and nothing is cached.
+
+        Args:
+            key: Hashable cache key.
+            compute: Zero-argument callable producing the value.
+
+        Returns:
+            The cached or computed value.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> OcrCacheStats:
+        """Returns the current hit/miss counters."""
+        with self._lock:
+            return OcrCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """Drops every cached result and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cached results."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the cache."""
+        stats = self.stats()
+        return (
+            f"OcrCache(size={stats.size}, maxsize={stats.maxsize}, "
+            f"hits={stats.hits}, misses={stats.misses})"
+        )
@@ -1,47 +1,217 @@
 """OCR implementation using EasyOCR."""
 
 import logging
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 import cv2
 import easyocr
 import numpy as np
 
+from pymordial.core.frame import Frame
 from pymordial.ocr.base import PymordialOCR
 from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+from pymordial.ocr.result import OcrResult, OcrWord
 from pymordial.utils.config import get_config
 
-if TYPE_CHECKING:
-    pass
-
 logger = logging.getLogger(__name__)
 
 _CONFIG = get_config()
 
 # --- EasyOCR Configuration ---
 DEFAULT_LANGUAGES = _CONFIG["easyocr"]["default_languages"]
+DEFAULT_GPU = _CONFIG["easyocr"]["gpu"]
+DEFAULT_QUANTIZE = _CONFIG["easyocr"]["quantize"]
+DEFAULT_BATCH_SIZE = _CONFIG["easyocr"]["batch_size"]
+WARMUP_IMAGE_SIZE = (32, 128)
+
+# Process-wide readers keyed by (languages, device, quantize)
+_readers: dict[tuple[tuple[str, ...], str, bool], "easyocr.Reader"] = {}
+_readers_lock = threading.Lock()
+
+
+def resolve_device(gpu: bool | str) -> str:
+    """Returns the torch device EasyOCR will run on.
+
+    Mirrors EasyOCR's own resolution, so ``gpu=True`` on a host without CUDA
+    (or without torch installed) resolves to "cpu" and shares the CPU reader.
+
+    Args:
+        gpu: True for CUDA if available, False for CPU, or a torch device
+            string such as "cuda:1" or "mps".
+
+    Returns:
+        The device string.
+    """
+    if gpu is False:
+        return "cpu"
+    if gpu is True:
+        try:
+            import torch
+        except ImportError:
+            return "cpu"
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    return gpu
+
+
+def get_easyocr_reader(
+    languages: list[str] | None = None,
+    gpu: bool | str = DEFAULT_GPU,
+    quantize: bool = DEFAULT_QUANTIZE,
+) -> "easyocr.Reader":
+    """Returns the shared EasyOCR reader for a language set and device.
+
+    Readers load hundreds of megabytes of models, so one is created per
+    (languages, device, quantize) on first use and shared by every engine in
+    the process.
+
+    Args:
+        languages: List of language codes. Defaults to config values.
+        gpu: True for CUDA if available, False for CPU, or a device string.
+        quantize: Whether to use the quantized recognition model on CPU.
+
+    Returns:
+        The shared reader.
+    """
+    languages = tuple(languages or DEFAULT_LANGUAGES)
+    device = resolve_device(gpu)
+    key = (languages, device, quantize)
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            logger.info(f"Loading EasyOCR reader for {list(languages)} on {device}")
+            reader = easyocr.Reader(
+                list(languages),
+                gpu=False if device == "cpu" else device,
+                quantize=quantize,
+            )
+            _readers[key] = reader
+        return reader
+
+
+def warmup_easyocr_reader(
+    languages: list[str] | None = None,
+    gpu: bool | str = DEFAULT_GPU,
+    quantize: bool = DEFAULT_QUANTIZE,
+) -> "easyocr.Reader":
+    """Loads the shared reader and runs one tiny inference ahead of use.
+
+    The first inference initializes lazily built kernels and buffers; doing
+    it at startup keeps that cost out of the first real read.
+
+    Args:
+        languages: List of language codes. Defaults to config values.
+        gpu: True for CUDA if available, False for CPU, or a device string.
+        quantize: Whether to use the quantized recognition model on CPU.
+
+    Returns:
+        The warmed-up reader.
+    """
+    reader = get_easyocr_reader(languages, gpu=gpu, quantize=quantize)
+    reader.readtext(np.full((*WARMUP_IMAGE_SIZE, 3), 255, dtype=np.uint8), detail=0)
+    return reader
+
+
+def clear_easyocr_readers() -> None:
+    """Drops every shared reader so their models can be freed."""
+    with _readers_lock:
+        _readers.clear()
+
+
+def _words_from_detections(
+    detections: list, offset: tuple[int, int] = (0, 0)
+) -> list[OcrWord]:
+    """Converts EasyOCR (bbox, text, confidence) detections into OcrWords.
+
+    Each detection becomes one OcrWord on its own line.
+    """
+    offset_x, offset_y = offset
+    words = []
+    for index, (bbox, text, confidence) in enumerate(detections):
+        x_coords = [int(point[0]) for point in bbox]
+        y_coords = [int(point[1]) for point in bbox]
+        words.append(
+            OcrWord(
+                text=text,
+                box=(
+                    offset_x + min(x_coords),
+                    offset_y + min(y_coords),
+                    max(x_coords) - min(x_coords),
+                    max(y_coords) - min(y_coords),
+                ),
+                confidence=float(confidence) * 100,
+                line=(index,),
+            )
+        )
+    return words
 
 
 class EasyOcrOCR(PymordialOCR):
     """OCR implementation using EasyOCR.
 
+    The EasyOCR reader is loaded lazily, on first use, from a process-wide
+    registry, so engines with the same languages and device share one set
+    of models.
+
     Attributes:
         languages: List of language codes to use.
-        reader: The EasyOCR reader instance.
+        gpu: True for CUDA if available, False for CPU, or a device string.
+        device: The device ``gpu`` resolved to when the engine was created.
+        quantize: Whether the quantized recognition model is used on CPU.
+        batch_size: Number of regions recognized per model batch.
     """
 
-    def __init__(self, languages: list[str] | None = None, gpu: bool = True):
-        """Initializes EasyOcrOCR.
+    def __init__(
+        self,
+        languages: list[str] | None = None,
+        gpu: bool | str = DEFAULT_GPU,
+        quantize: bool = DEFAULT_QUANTIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """Initializes EasyOcrOCR. The reader is loaded on first use.
 
         Args:
             languages: List of language codes. Defaults to config values.
-            gpu: Whether to use GPU acceleration.
+            gpu: True for CUDA if available, False for CPU, or a torch device
+                string such as "cuda:1".
+            quantize: Whether to use the dynamically quantized recognition
+                model on CPU.
+            batch_size: Number of regions recognized per model batch.
         """
         self.languages = languages if languages else DEFAULT_LANGUAGES
-        self.reader = easyocr.Reader(self.languages, gpu=gpu)
+        self.gpu = gpu
+        self.device = resolve_device(gpu)
+        self.quantize = quantize
+        self.batch_size = batch_size
+
+    @property
+    def reader(self) -> "easyocr.Reader":
+        """The shared EasyOCR reader for this engine's languages and device."""
+        return get_easyocr_reader(
+            self.languages, gpu=self.device, quantize=self.quantize
+        )
+
+    def warmup(self) -> None:
+        """Loads the shared reader and runs one tiny inference ahead of use."""
+        warmup_easyocr_reader(self.languages, gpu=self.device, quantize=self.quantize)
+
+    @classmethod
+    def for_cpu(cls, languages: list[str] | None = None) -> "EasyOcrOCR":
+        """Creates an engine tuned for CPU-only hosts.
 
-    def extract_text(self, image_path: "Path | bytes | str | np.ndarray") -> str:
+        Disables the GPU and uses the quantized recognition model.
+
+        Args:
+            languages: List of language codes. Defaults to config values.
+
+        Returns:
+            The EasyOcrOCR.
+        """
+        return cls(languages, gpu=False, quantize=True)
+
+    def extract_text(
+        self, image_path: "Path | bytes | str | np.ndarray | Frame"
+    ) -> str:
         """Extracts text from an image.
 
         Args:
@@ -55,7 +225,7 @@ class EasyOcrOCR(PymordialOCR):
 
     def read_text(
         self,
-        image_path: "Path | bytes | str | np.ndarray",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         strategy: PymordialExtractStrategy | None = None,
     ) -> list[str]:
         """Extracts text from an image using EasyOCR.
@@ -70,18 +240,41 @@ class EasyOcrOCR(PymordialOCR):
         """
         # TODO: Implement preprocessing strategies for EasyOCR
         try:
-            image_bytes = self._load_image(image_path)
-            # EasyOCR can read from bytes directly
-            result = self.reader.readtext(image_bytes, detail=0)
+            image = self._load_image(image_path)
+            result = self.reader.readtext(image, detail=0)
             return result
         except Exception as e:
             logger.error(f"Error reading text with EasyOCR: {e}")
             return []
 
+    def read(self, image_path: "Path | bytes | str | np.ndarray | Frame") -> OcrResult:
+        """Reads every text detection of an image with a single readtext pass.
+
+        Each EasyOCR detection becomes one OcrWord on its own line.
+
+        Args:
+            image_path: Path to image file, image bytes, string path, or numpy array.
+
+        Returns:
+            The OcrResult.
+
+        Raises:
+            ValueError: If the image cannot be processed.
+        """
+        try:
+            image = self._load_image(image_path)
+            result = self.reader.readtext(image, detail=1)
+        except Exception as e:
+            logger.error(f"Error reading text with EasyOCR: {e}")
+            raise ValueError(f"Failed to read text: {e}")
+
+        words = _words_from_detections(result)
+        return OcrResult(words=tuple(words))
+
     def find_text(
         self,
         search_text: str,
-        image_path: "Path | bytes | str | np.ndarray",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
     ) -> tuple[int, int] | None:
         """Finds the coordinates (center) of the specified text in the image.
 
@@ -93,47 +286,166 @@ class EasyOcrOCR(PymordialOCR):
             (x, y) coordinates of the center of the found text, or None if not found.
         """
         try:
-            image_bytes = self._load_image(image_path)
-            # EasyOCR readtext returns (bbox, text, confidence)
-            result = self.reader.readtext(image_bytes, detail=1)
-
-            search_text_lower = search_text.lower()
-            for bbox, text, confidence in result:
-                if search_text_lower in text.lower():
-                    # bbox is [[x1,y1], [x2,y2], [x3,y3], [x4,y4]]
-                    # Calculate center from bounding box
-                    x_coords = [point[0] for point in bbox]
-                    y_coords = [point[1] for point in bbox]
-                    center_x = int(sum(x_coords) / len(x_coords))
-                    center_y = int(sum(y_coords) / len(y_coords))
-                    return (center_x, center_y)
-            return None
-        except Exception as e:
+            match = self.read(image_path).find(search_text)
+        except ValueError as e:
             logger.error(f"Error finding text with EasyOCR: {e}")
             return None
+        return match.center if match is not None else None
+
+    def read_batch(
+        self,
+        images: "list[Path | bytes | str | np.ndarray | Frame]",
+        offsets: list[tuple[int, int]] | None = None,
+    ) -> list[list[OcrWord]]:
+        """Recognizes many images with one ``readtext_batched`` call.
 
-    def _load_image(self, image_path: "Path | bytes | str | np.ndarray") -> bytes:
-        """Helper to load image into bytes.
+        Images are padded (replicating their edges) to a common size so no
+        resizing distorts the text, then detected and recognized together in
+        batches of ``batch_size``.
 
         Args:
-            image_path: Path to image file, bytes, string path, or numpy array.
+            images: The images to read (e.g. crops of labels).
+            offsets: Optional (x, y) position of each image in a larger frame;
+                added to the returned boxes.
 
         Returns:
-            Image bytes.
+            One list of OcrWords per input image, in input order.
+
+        Raises:
+            ValueError: If an image cannot be processed or the offsets do not
+                match the images.
+        """
+        if offsets is not None and len(offsets) != len(images):
+            raise ValueError(f"Expected {len(images)} offsets, got {len(offsets)}")
+        if not images:
+            return []
+
+        try:
+            arrays = [self._load_array(image) for image in images]
+            height = max(array.shape[0] for array in arrays)
+            width = max(array.shape[1] for array in arrays)
+            padded = [
+                cv2.copyMakeBorder(
+                    array,
+                    0,
+                    height - array.shape[0],
+                    0,
+                    width - array.shape[1],
+                    cv2.BORDER_REPLICATE,
+                )
+                for array in arrays
+            ]
+            results = self.reader.readtext_batched(
+                padded, detail=1, batch_size=self.batch_size
+            )
+        except Exception as e:
+            logger.error(f"Error in batch OCR with EasyOCR: {e}")
+            raise ValueError(f"Failed to extract text in batch: {e}")
+
+        return [
+            _words_from_detections(
+                detections, offsets[index] if offsets is not None else (0, 0)
+            )
+            for index, detections in enumerate(results)
+        ]
+
+    def extract_text_batch(
+        self, images: "list[Path | bytes | str | np.ndarray | Frame]"
+    ) -> list[str]:
+        """Extracts the text of many images with one batched call.
+
+        Args:
+            images: The images to read.
+
+        Returns:
+            The text of each image, in input order. Detections are separated
+            by newlines.
+
+        Raises:
+            ValueError: If an image cannot be processed.
+        """
+        return [OcrResult(words=tuple(words)).text for words in self.read_batch(images)]
+
+    def read_regions(
+        self,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        regions: list[tuple[int, int, int, int]],
+    ) -> list[list[OcrWord]]:
+        """Reads several (left, top, right, bottom) regions of one image at once.
+
+        Args:
+            image_path: The full image (path, bytes, numpy array, or Frame).
+            regions: The regions to read.
+
+        Returns:
+            One list of OcrWords per region, with boxes in the coordinates of
+            the full image.
+
+        Raises:
+            ValueError: If the image cannot be processed.
+        """
+        image = self._load_array(image_path)
+        crops = [
+            image[int(top) : int(bottom), int(left) : int(right)]
+            for left, top, right, bottom in regions
+        ]
+        offsets = [(int(left), int(top)) for left, top, _, _ in regions]
+        return self.read_batch(crops, offsets=offsets)
+
+    def _load_array(
+        self, image_path: "Path | bytes | str | np.ndarray | Frame"
+    ) -> np.ndarray:
+        """Loads any supported input as an RGB (or grayscale) numpy array.
+
+        Args:
+            image_path: Path to image file, bytes, string path, numpy array, or
+                Frame.
+
+        Returns:
+            The image array.
+
+        Raises:
+            ValueError: If the image cannot be read.
+        """
+        image = self._load_image(image_path)
+        if isinstance(image, np.ndarray):
+            return image
+        if isinstance(image, bytes):
+            decoded = cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_COLOR)
+        else:
+            decoded = cv2.imread(str(image))
+        if decoded is None:
+            raise ValueError(f"Could not read image from {image_path}")
+        return cv2.cvtColor(decoded, cv2.COLOR_BGR2RGB)
+
+    def _load_image(
+        self, image_path: "Path | bytes | str | np.ndarray | Frame"
+    ) -> "np.ndarray | bytes | str":
+        """Prepares an input for ``reader.readtext`` without re-encoding.
+
+        Frames are passed as their cached RGB array and NumPy arrays (BGR, as
+        elsewhere in Pymordial) are converted to RGB in memory. Bytes and
+        paths are handed to EasyOCR, which decodes them itself.
+
+        Args:
+            image_path: Path to image file, bytes, string path, numpy array, or
+                Frame.
+
+        Returns:
+            An RGB or grayscale array, encoded image bytes, or a path string.
 
         Raises:
             ValueError: If image path type is invalid.
         """
+        if isinstance(image_path, Frame):
+            return image_path.rgb
         if isinstance(image_path, bytes):
             return image_path
         elif isinstance(image_path, np.ndarray):
-            # Convert numpy array to bytes
-            success, buffer = cv2.imencode(".png", image_path)
-            if not success:
-                raise ValueError("Failed to encode numpy array to image bytes")
-            return buffer.tobytes()
+            if image_path.ndim == 3 and image_path.shape[2] == 3:
+                return cv2.cvtColor(image_path, cv2.COLOR_BGR2RGB)
+            return image_path
         elif isinstance(image_path, (str, Path)):
-            with open(image_path, "rb") as f:
-                return f.read()
+            return str(image_path)
         else:
             raise ValueError(f"Invalid image path type: {type(image_path)}")
@@ -0,0 +1,179 @@
+"""Process-pool executor for recognizing many text regions in parallel."""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pymordial.core.frame import Frame
+from pymordial.ocr.base import PymordialOCR
+from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+
+logger = logging.getLogger(__name__)
+
+# Engine owned by each worker process, created once by the pool initializer
+_worker_engine: PymordialOCR | None = None
+
+
+def _init_worker(engine_class: type[PymordialOCR], engine_kwargs: dict[str, Any]):
+    """Creates the worker's OCR engine so every job reuses a warm instance."""
+    global _worker_engine
+    _worker_engine = engine_class(**engine_kwargs)
+
+
+def _run_job(image: np.ndarray, strategy: PymordialExtractStrategy | None) -> str:
+    """Preprocesses and recognizes one region inside a worker process."""
+    if strategy is not None and isinstance(_worker_engine, TesseractOCR):
+        return _worker_engine.extract_text(image, strategy=strategy)
+    return _worker_engine.extract_text(image)
+
+
+def _warm(_: int) -> int:
+    """Returns the worker's process id; used to force worker start-up."""
+    return os.getpid()
+
+
+@dataclass(frozen=True)
+class OcrJob:
+    """One region to recognize.
+
+    Attributes:
+        image: The screen image (path, bytes, numpy array, or Frame).
+        region: Optional (left, top, right, bottom) area of the image.
+        strategy: Optional preprocessing strategy. Must be picklable.
+    """
+
+    image: "Path | bytes | str | np.ndarray | Frame"
+    region: tuple[int, int, int, int] | None = None
+    strategy: PymordialExtractStrategy | None = None
+
+
+class OcrExecutor:
+    """Fans OCR jobs out to a pool of worker processes with warm engines.
+
+    Each worker builds its own engine once, at start-up, and runs both the
+    strategy preprocessing and recognition, so the parent only crops the
+    regions and ships the pixels. Use it as a context manager, or call
+    ``shutdown()`` when done.
+
+    Attributes:
+        max_workers: Number of worker processes.
+    """
+
+    def __init__(
+        self,
+        engine_class: type[PymordialOCR] = TesseractOCR,
+        engine_kwargs: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ):
+        """Initializes the executor. Workers are started on first use.
+
+        Args:
+            engine_class: OCR engine class instantiated in every worker.
+            engine_kwargs: Keyword arguments for the engine constructor.
+            max_workers: Number of worker processes. Defaults to the CPU count.
+
+        Raises:
+            ValueError: If max_workers is smaller than 1.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"Max workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Spawned workers behave the same on Windows and POSIX and do not
+        # inherit threads (or OCR handles) from the parent
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(engine_class, engine_kwargs or {}),
+        )
+        self._engine_name = engine_class.__name__
+
+    @staticmethod
+    def _prepare(job: OcrJob) -> np.ndarray:
+        """Crops a job's region in the parent so only its pixels are sent."""
+        if isinstance(job.image, np.ndarray) and job.region is None:
+            return job.image
+        frame = Frame.from_image(job.image)
+        if job.region is not None:
+            frame = frame.crop(job.region)
+        return frame.bgr
+
+    def submit(
+        self,
+        image: "Path | bytes | str | np.ndarray | Frame",
+        region: tuple[int, int, int, int] | None = None,
+        strategy: PymordialExtractStrategy | None = None,
+    ) -> "Future[str]":
+        """Schedules recognition of one region.
+
+        Args:
+            image: The screen image (path, bytes, numpy array, or Frame).
+                Numpy arrays without a region are sent as-is and treated as
+                BGR, like TesseractOCR does.
+            region: Optional (left, top, right, bottom) area of the image.
+            strategy: Optional preprocessing strategy. Must be picklable.
+
+        Returns:
+            A Future resolving to the extracted text.
+        """
+        job = OcrJob(image=image, region=region, strategy=strategy)
+        return self._pool.submit(_run_job, self._prepare(job), job.strategy)
+
+    def extract_batch(self, jobs: list[OcrJob]) -> list[str]:
+        """Recognizes several regions in parallel and waits for all of them.
+
+        Args:
+            jobs: The regions to recognize.
+
+        Returns:
+            Extracted texts, in job order.
+
+        Raises:
+            ValueError: If any job fails.
+        """
+        futures: list[Future[str]] = []
+        try:
+            for job in jobs:
+                futures.append(self.submit(job.image, job.region, job.strategy))
+            return [future.result() for future in futures]
+        except Exception as e:
+            for future in futures:
+                future.cancel()
+            logger.error(f"Error in batch OCR: {e}")
+            raise ValueError(f"Failed to extract text in batch: {e}") from e
+
+    def warmup(self) -> None:
+        """Starts every worker and builds its engine ahead of the first job."""
+        pids = set(self._pool.map(_warm, range(self.max_workers * 2)))
+        logger.debug(f"Warmed up {len(pids)} OCR worker(s) with {self._engine_name}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker processes.
+
+        Args:
+            wait: Whether to wait for pending jobs to finish.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "OcrExecutor":
+        """Returns the executor for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Shuts the worker processes down."""
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the executor."""
+        return (
+            f"OcrExecutor("
+            f"engine={self._engine_name}, "
+            f"max_workers={self.max_workers})"
+        )
@@ -0,0 +1,87 @@
+"""Approximate string matching for OCR output.
+
+OCR routinely misreads a character or two ("Phant0m Force", "Attaek"), so
+text queries can be scored by edit distance instead of requiring an exact
+substring.
+"""
+
+import re
+
+from pymordial.utils.config import get_config
+
+_CONFIG = get_config()
+
+# --- Matching Configuration ---
+DEFAULT_MIN_SCORE = _CONFIG["text_controller"]["match_min_score"]
+
+
+def normalize_text(text: str) -> str:
+    """Lowercases text and collapses whitespace for comparison."""
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Returns the Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def similarity(a: str, b: str) -> float:
+    """Returns 1 minus the edit distance divided by the longer length.
+
+    Args:
+        a: First string.
+        b: Second string.
+
+    Returns:
+        Similarity from 0 (nothing in common) to 1 (equal).
+    """
+    if not a and not b:
+        return 1.0
+    return 1.0 - edit_distance(a, b) / max(len(a), len(b))
+
+
+def partial_similarity(needle: str, haystack: str) -> float:
+    """Scores the best approximate occurrence of needle anywhere in haystack.
+
+    The edit distance is taken against the best-aligned substring of the
+    haystack (free leading and trailing characters), so an exact substring
+    scores 1 and every misread character costs ``1 / len(needle)``.
+
+    Args:
+        needle: Text to look for.
+        haystack: Text to look in.
+
+    Returns:
+        Score from 0 to 1.
+    """
+    if not needle:
+        return 1.0
+    # Row 0 is all zeros: the match may start anywhere in the haystack
+    previous = [0] * (len(haystack) + 1)
+    for i, char_n in enumerate(needle, start=1):
+        current = [i]
+        for j, char_h in enumerate(haystack, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_n != char_h),
+                )
+            )
+        previous = current
+    # ...and end anywhere
+    return max(0.0, 1.0 - min(previous) / len(needle))
@@ -0,0 +1,526 @@
+"""Composable OCR preprocessing stages with shared intermediate results.
+
+A pipeline is a tuple of small, frozen (and therefore hashable) stages::
+
+    (Crop((0.42, 0.0, 1.0, 0.77), relative=True), Resize(3.0), Gray(),
+     Denoise("median"), Threshold(), Invert(), Pad(40))
+
+Running a pipeline memoizes the output of every stage prefix on the source
+image, so several strategies applied to the same region only compute the
+steps they have in common once. Sources are Frames (memoized on the frame)
+or numpy arrays (memoized by a digest of their content, so a buffer refilled
+in place never serves stale results).
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import cv2
+import numpy as np
+
+from pymordial.ocr.cache import image_digest
+from pymordial.utils.config import get_config
+
+if TYPE_CHECKING:
+    from pymordial.core.frame import Frame
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Preprocessing Constants ---
+_DEFAULT = _CONFIG["extract_strategy"]["default"]
+DEFAULT_UPSCALE_FACTOR = _DEFAULT["upscale_factor"]
+DEFAULT_DENOISE_STRENGTH = _DEFAULT["denoise_strength"]
+DEFAULT_DENOISE_TEMPLATE_WINDOW = _DEFAULT["denoise_template_window"]
+DEFAULT_DENOISE_SEARCH_WINDOW = _DEFAULT["denoise_search_window"]
+THRESHOLD_BINARY_MAX = _DEFAULT["threshold_binary_max"]
+INVERSION_THRESHOLD_MEAN = _DEFAULT["inversion_threshold_mean"]
+
+_FAST_CONFIG = _DEFAULT["fast"]
+FAST_TARGET_TEXT_HEIGHT = _FAST_CONFIG["target_text_height"]
+FAST_MIN_UPSCALE = _FAST_CONFIG["min_upscale"]
+FAST_MAX_UPSCALE = _FAST_CONFIG["max_upscale"]
+MEDIAN_KERNEL_SIZE = _FAST_CONFIG["median_kernel"]
+BILATERAL_DIAMETER = _FAST_CONFIG["bilateral_diameter"]
+BILATERAL_SIGMA = _FAST_CONFIG["bilateral_sigma"]
+
+_REVOMON = _CONFIG["extract_strategy"]["revomon"]
+PADDING_VALUE_WHITE = _REVOMON["padding_value_white"]
+ADAPTIVE_THRESH_BLOCK_SIZE = _REVOMON["adaptive_thresh_block_size"]
+ADAPTIVE_THRESH_C = _REVOMON["adaptive_thresh_c"]
+
+PIPELINE_CACHE_SIZE = _CONFIG["extract_strategy"]["pipeline"]["cache_size"]
+
+DENOISE_NLMEANS = "nlmeans"
+DENOISE_BILATERAL = "bilateral"
+DENOISE_MEDIAN = "median"
+DENOISE_NONE = "none"
+
+THRESHOLD_OTSU = "otsu"
+THRESHOLD_ADAPTIVE = "adaptive"
+
+INVERT_AUTO = "auto"
+INVERT_ALWAYS = "always"
+
+_INTERPOLATIONS = {
+    "nearest": cv2.INTER_NEAREST,
+    "linear": cv2.INTER_LINEAR,
+    "cubic": cv2.INTER_CUBIC,
+    "area": cv2.INTER_AREA,
+}
+
+
+def to_gray(image: np.ndarray) -> np.ndarray:
+    """Converts a BGR or BGRA image to grayscale; grayscale passes through."""
+    if image.ndim == 2:
+        return image
+    if image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def estimate_text_height(gray: np.ndarray) -> int:
+    """Estimates the height in pixels of the tallest text line in a crop.
+
+    Otsu-thresholds the crop, treats the minority color as ink and returns the
+    longest run of consecutive rows containing ink.
+
+    Args:
+        gray: Grayscale crop.
+
+    Returns:
+        The estimated text height, or the crop height if no ink is found.
+    """
+    _, ink = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if ink.mean() > 0.5:
+        ink = 1 - ink
+    # Ignore rows with only a few specks of noise
+    rows = ink.sum(axis=1) > max(1, gray.shape[1] // 100)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], rows.view(np.int8), [0]))))
+    runs = edges[1::2] - edges[::2]
+    return int(runs.max()) if runs.size else gray.shape[0]
+
+
+def adaptive_upscale_factor(
+    gray: np.ndarray,
+    target_height: int = FAST_TARGET_TEXT_HEIGHT,
+    min_factor: float = FAST_MIN_UPSCALE,
+    max_factor: float = FAST_MAX_UPSCALE,
+) -> float:
+    """Returns the factor that scales the crop's text to the target height.
+
+    Args:
+        gray: Grayscale crop.
+        target_height: Text height in pixels Tesseract reads best.
+        min_factor: Smallest factor returned.
+        max_factor: Largest factor returned.
+
+    Returns:
+        The upscale factor.
+    """
+    factor = target_height / estimate_text_height(gray)
+    return float(min(max(factor, min_factor), max_factor))
+
+
+def denoise(gray: np.ndarray, method: str) -> np.ndarray:
+    """Denoises a grayscale image.
+
+    Args:
+        gray: Grayscale image.
+        method: One of "nlmeans" (slow, strongest), "bilateral", "median" or
+            "none".
+
+    Returns:
+        The denoised image.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method == DENOISE_NLMEANS:
+        return cv2.fastNlMeansDenoising(
+            gray,
+            None,
+            DEFAULT_DENOISE_STRENGTH,
+            DEFAULT_DENOISE_TEMPLATE_WINDOW,
+            DEFAULT_DENOISE_SEARCH_WINDOW,
+        )
+    if method == DENOISE_BILATERAL:
+        return cv2.bilateralFilter(
+            gray, BILATERAL_DIAMETER, BILATERAL_SIGMA, BILATERAL_SIGMA
+        )
+    if method == DENOISE_MEDIAN:
+        return cv2.medianBlur(gray, MEDIAN_KERNEL_SIZE)
+    if method == DENOISE_NONE:
+        return gray
+    raise ValueError(f"Unknown denoise method: {method}")
+
+
+def binarize(gray: np.ndarray) -> np.ndarray:
+    """Otsu-thresholds an image into black text on a white background.
+
+    Args:
+        gray: Grayscale image.
+
+    Returns:
+        The binary image.
+    """
+    return Invert().apply(Threshold().apply(gray))
+
+
+class PreprocessStage(ABC):
+    """Base class of pipeline stages.
+
+    Stages are frozen dataclasses, so equal settings compare and hash equal
+    and any tuple of stages can key a cache.
+    """
+
+    @abstractmethod
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Applies the stage.
+
+        Args:
+            image: Output of the previous stage (BGR or grayscale).
+
+        Returns:
+            The transformed image.
+        """
+
+    def box_to_input(
+        self,
+        box: tuple[float, float, float, float],
+        input_shape: tuple[int, ...],
+        output_shape: tuple[int, ...],
+    ) -> tuple[float, float, float, float]:
+        """Maps a box of the stage's output onto its input.
+
+        Stages that keep the geometry return the box unchanged.
+
+        Args:
+            box: (left, top, width, height) in output coordinates.
+            input_shape: Shape of the image the stage was given.
+            output_shape: Shape of the image the stage produced.
+
+        Returns:
+            The box in input coordinates.
+        """
+        return box
+
+
+@dataclass(frozen=True)
+class Crop(PreprocessStage):
+    """Crops to a (left, top, right, bottom) box.
+
+    Attributes:
+        box: The box, in pixels or, if ``relative``, as fractions of the
+            image width and height.
+        relative: Whether the box is given as fractions.
+    """
+
+    box: tuple[float, float, float, float]
+    relative: bool = False
+
+    def _pixels(self, shape: tuple[int, ...]) -> tuple[int, int, int, int]:
+        """Returns the box in pixels for an image of the given shape."""
+        left, top, right, bottom = self.box
+        if self.relative:
+            height, width = shape[:2]
+            left, right = left * width, right * width
+            top, bottom = top * height, bottom * height
+        return int(left), int(top), int(right), int(bottom)
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Returns the cropped view of the image."""
+        left, top, right, bottom = self._pixels(image.shape)
+        return image[top:bottom, left:right]
+
+    def box_to_input(self, box, input_shape, output_shape):
+        """Shifts the box by the crop origin."""
+        left, top, _, _ = self._pixels(input_shape)
+        return (box[0] + max(0, left), box[1] + max(0, top), box[2], box[3])
+
+
+@dataclass(frozen=True)
+class Resize(PreprocessStage):
+    """Scales the image.
+
+    Attributes:
+        factor: Scale factor, or None to pick one from the estimated text
+            height (see adaptive_upscale_factor).
+        max_factor: Largest adaptive factor.
+        interpolation: "nearest", "linear", "cubic" or "area".
+    """
+
+    factor: float | None = DEFAULT_UPSCALE_FACTOR
+    max_factor: float = FAST_MAX_UPSCALE
+    interpolation: str = "cubic"
+
+    def __post_init__(self):
+        """Validates the settings."""
+        if self.interpolation not in _INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation: {self.interpolation}")
+        if self.factor is not None and self.factor <= 0:
+            raise ValueError(f"Resize factor must be positive, got {self.factor}")
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Returns the scaled image."""
+        factor = self.factor
+        if factor is None:
+            factor = adaptive_upscale_factor(to_gray(image), max_factor=self.max_factor)
+        if factor == 1.0:
+            return image
+        return cv2.resize(
+            image,
+            None,
+            fx=factor,
+            fy=factor,
+            interpolation=_INTERPOLATIONS[self.interpolation],
+        )
+
+    def box_to_input(self, box, input_shape, output_shape):
+        """Scales the box back by the applied factor."""
+        scale_x = input_shape[1] / output_shape[1]
+        scale_y = input_shape[0] / output_shape[0]
+        return (box[0] * scale_x, box[1] * scale_y, box[2] * scale_x, box[3] * scale_y)
+
+
+@dataclass(frozen=True)
+class Gray(PreprocessStage):
+    """Converts BGR to grayscale."""
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Returns the grayscale image."""
+        return to_gray(image)
+
+
+@dataclass(frozen=True)
+class Denoise(PreprocessStage):
+    """Denoises a grayscale image.
+
+    Attributes:
+        method: "nlmeans", "bilateral", "median" or "none".
+    """
+
+    method: str = DENOISE_NLMEANS
+
+    def __post_init__(self):
+        """Validates the method."""
+        if self.method not in (
+            DENOISE_NLMEANS,
+            DENOISE_BILATERAL,
+            DENOISE_MEDIAN,
+            DENOISE_NONE,
+        ):
+            raise ValueError(f"Unknown denoise method: {self.method}")
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Returns the denoised image."""
+        return denoise(to_gray(image), self.method)
+
+
+@dataclass(frozen=True)
+class Threshold(PreprocessStage):
+    """Binarizes a grayscale image.
+
+    Attributes:
+        method: "otsu" (global) or "adaptive" (Gaussian, local).
+        block_size: Neighbourhood size of the adaptive method.
+        c: Constant subtracted from the adaptive mean.
+    """
+
+    method: str = THRESHOLD_OTSU
+    block_size: int = ADAPTIVE_THRESH_BLOCK_SIZE
+    c: int = ADAPTIVE_THRESH_C
+
+    def __post_init__(self):
+        """Validates the method."""
+        if self.method not in (THRESHOLD_OTSU, THRESHOLD_ADAPTIVE):
+            raise ValueError(f"Unknown threshold method: {self.method}")
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Returns the binary image."""
+        gray = to_gray(image)
+        if self.method == THRESHOLD_ADAPTIVE:
+            return cv2.adaptiveThreshold(
+                gray,
+                THRESHOLD_BINARY_MAX,
+                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                cv2.THRESH_BINARY,
+                self.block_size,
+                self.c,
+            )
+        _, thresh = cv2.threshold(
+            gray, 0, THRESHOLD_BINARY_MAX, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+        )
+        return thresh
+
+
+@dataclass(frozen=True)
+class Invert(PreprocessStage):
+    """Inverts the image.
+
+    Attributes:
+        mode: "auto" inverts only dark backgrounds (so text ends up black on
+            white); "always" inverts unconditionally.
+    """
+
+    mode: str = INVERT_AUTO
+
+    def __post_init__(self):
+        """Validates the mode."""
+        if self.mode not in (INVERT_AUTO, INVERT_ALWAYS):
+            raise ValueError(f"Unknown invert mode: {self.mode}")
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Returns the inverted (or unchanged) image."""
+        if self.mode == INVERT_AUTO and np.mean(image) >= INVERSION_THRESHOLD_MEAN:
+            return image
+        return cv2.bitwise_not(image)
+
+
+@dataclass(frozen=True)
+class Pad(PreprocessStage):
+    """Adds a constant border.
+
+    Attributes:
+        size: Border width in pixels on every side.
+        value: Border intensity.
+    """
+
+    size: int
+    value: int = PADDING_VALUE_WHITE
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """Returns the padded image."""
+        return cv2.copyMakeBorder(
+            image,
+            self.size,
+            self.size,
+            self.size,
+            self.size,
+            cv2.BORDER_CONSTANT,
+            value=self.value,
+        )
+
+    def box_to_input(self, box, input_shape, output_shape):
+        """Removes the border offset, clipping boxes that start inside it."""
+        left, top = box[0] - self.size, box[1] - self.size
+        return (
+            max(0, left),
+            max(0, top),
+            box[2] + min(0, left),
+            box[3] + min(0, top),
+        )
+
+
+# Stage outputs of recent array sources, keyed by a digest of their content:
+# identity is not enough, since capture buffers are refilled in place and
+# freed arrays' ids are reused
+_array_memos: OrderedDict[bytes, dict] = OrderedDict()
+_array_memos_lock = threading.Lock()
+
+
+def _memo_for(source: np.ndarray) -> dict:
+    """Returns the stage-prefix memo of a numpy array source."""
+    key = image_digest(source)
+    with _array_memos_lock:
+        memo = _array_memos.get(key)
+        if memo is not None:
+            _array_memos.move_to_end(key)
+            return memo
+        memo = _array_memos[key] = {}
+        while len(_array_memos) > PIPELINE_CACHE_SIZE:
+            _array_memos.popitem(last=False)
+        return memo
+
+
+def clear_pipeline_cache() -> None:
+    """Forgets every memoized stage output of numpy array sources."""
+    with _array_memos_lock:
+        _array_memos.clear()
+
+
+def run_pipeline(
+    image: "Frame | np.ndarray", stages: Sequence[PreprocessStage]
+) -> np.ndarray:
+    """Runs preprocessing stages, reusing any memoized stage prefix.
+
+    Every intermediate result is stored under its stage prefix, so another
+    pipeline on the same source starting with the same stages resumes from
+    the longest prefix already computed.
+
+    Args:
+        image: A Frame (processed as BGR) or a BGR/grayscale numpy array.
+            Returned arrays are shared with the cache and must be treated as
+            read-only.
+        stages: The stages to apply, in order.
+
+    Returns:
+        The processed image.
+    """
+    return _run(*_source_and_memo(image), tuple(stages))
+
+
+def _source_and_memo(image: "Frame | np.ndarray") -> tuple[np.ndarray, dict]:
+    """Returns the array a pipeline starts from and its stage-prefix memo."""
+    if isinstance(image, np.ndarray):
+        memo = _memo_for(image)
+        source = memo.get(())
+        if source is None:
+            # Stages such as Crop return views; run them on a private copy so
+            # memoized outputs never alias a buffer the caller may refill
+            source = memo[()] = image.copy()
+            source.flags.writeable = False
+        return source, memo
+    return image.bgr, image.cached(("preprocess",), dict)
+
+
+def _run(
+    source: np.ndarray, memo: dict, stages: tuple[PreprocessStage, ...]
+) -> np.ndarray:
+    """Runs stages on a source, resuming from the longest memoized prefix."""
+    start, result = 0, source
+    for end in range(len(stages), 0, -1):
+        cached = memo.get(stages[:end])
+        if cached is not None:
+            start, result = end, cached
+            break
+
+    for end in range(start + 1, len(stages) + 1):
+        result = stages[end - 1].apply(result)
+        memo[stages[:end]] = result
+    if start:
+        logger.debug(f"Reused {start}/{len(stages)} preprocessing stage(s)")
+    return result
+
+
+def map_box_to_source(
+    box: tuple[float, float, float, float],
+    image: "Frame | np.ndarray",
+    stages: Sequence[PreprocessStage],
+) -> tuple[int, int, int, int]:
+    """Maps a box found in a pipeline's output back onto its source image.
+
+    Walks the stages backwards, undoing padding, resizing (including
+    adaptive factors) and crop offsets. Intermediate shapes come from the
+    stage memo, so this is cheap right after run_pipeline.
+
+    Args:
+        box: (left, top, width, height) in the processed image.
+        image: The source given to run_pipeline.
+        stages: The stages given to run_pipeline.
+
+    Returns:
+        The (left, top, width, height) box in source coordinates.
+    """
+    stages = tuple(stages)
+    source, memo = _source_and_memo(image)
+    shapes = [_run(source, memo, stages[:end]).shape for end in range(len(stages) + 1)]
+    for index in range(len(stages) - 1, -1, -1):
+        box = stages[index].box_to_input(box, shapes[index], shapes[index + 1])
+    return tuple(round(value) for value in box)
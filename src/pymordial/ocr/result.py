@@ -0,0 +1,305 @@
+"""Structured OCR output."""
+
+from dataclasses import dataclass
+
+from pymordial.ocr.matching import (
+    DEFAULT_MIN_SCORE,
+    normalize_text,
+    partial_similarity,
+)
+
+
+@dataclass(frozen=True)
+class OcrWord:
+    """A recognized word and where it was found.
+
+    Attributes:
+        text: The recognized word.
+        box: (left, top, width, height) in the coordinates of the source image.
+        confidence: Recognition confidence from 0 to 100.
+        line: Key identifying the text line the word belongs to; words with
+            equal keys are on the same line.
+    """
+
+    text: str
+    box: tuple[int, int, int, int]
+    confidence: float
+    line: tuple[int, ...] = ()
+
+    @property
+    def center(self) -> tuple[int, int]:
+        """The (x, y) center of the word box."""
+        left, top, width, height = self.box
+        return (left + width // 2, top + height // 2)
+
+
+@dataclass(frozen=True)
+class TextMatch:
+    """An approximate occurrence of a query in an OcrResult.
+
+    Attributes:
+        text: The recognized text of the matched words.
+        box: (left, top, width, height) spanning the matched words.
+        score: Match score from 0 to 1; 1 is an exact (substring) match and
+            every misread character lowers it.
+        confidence: Lowest OCR confidence (0 to 100) of the matched words.
+        span: (start, end) indices of the matched words in
+            ``OcrResult.words``, end exclusive.
+    """
+
+    text: str
+    box: tuple[int, int, int, int]
+    score: float
+    confidence: float
+    span: tuple[int, int]
+
+    @property
+    def center(self) -> tuple[int, int]:
+        """The (x, y) center of the matched span."""
+        left, top, width, height = self.box
+        return (left + width // 2, top + height // 2)
+
+
+def _union(words: "list[OcrWord]") -> OcrWord:
+    """Merges consecutive words into one OcrWord spanning all of them."""
+    left = min(word.box[0] for word in words)
+    top = min(word.box[1] for word in words)
+    right = max(word.box[0] + word.box[2] for word in words)
+    bottom = max(word.box[1] + word.box[3] for word in words)
+    return OcrWord(
+        text=" ".join(word.text for word in words),
+        box=(left, top, right - left, bottom - top),
+        confidence=min(word.confidence for word in words),
+        line=words[0].line,
+    )
+
+
+@dataclass(frozen=True)
+class OcrResult:
+    """Everything one OCR pass found in an image.
+
+    Read an image once, then answer any number of text queries against the
+    result instead of re-running OCR per query.
+
+    Attributes:
+        words: Recognized words in reading order.
+    """
+
+    words: tuple[OcrWord, ...] = ()
+
+    @classmethod
+    def from_text(cls, text: str) -> "OcrResult":
+        """Builds a result without word boxes from plain text.
+
+        Used for engines that only report text. Every word gets an empty box.
+
+        Args:
+            text: The recognized text; lines separated by newlines.
+
+        Returns:
+            The OcrResult.
+        """
+        words = [
+            OcrWord(text=token, box=(0, 0, 0, 0), confidence=0.0, line=(number,))
+            for number, line in enumerate(text.splitlines())
+            for token in line.split()
+        ]
+        return cls(words=tuple(words))
+
+    @property
+    def text(self) -> str:
+        """All recognized text, one line per text line."""
+        return "\n".join(self.lines())
+
+    def _grouped_lines(self) -> list[list[OcrWord]]:
+        """Returns the words grouped by line, in reading order."""
+        lines: dict[tuple[int, ...], list[OcrWord]] = {}
+        for word in self.words:
+            lines.setdefault(word.line, []).append(word)
+        return list(lines.values())
+
+    def _indexed_lines(self) -> list[list[int]]:
+        """Returns the indices of the words of each line, in reading order."""
+        lines: dict[tuple[int, ...], list[int]] = {}
+        for index, word in enumerate(self.words):
+            lines.setdefault(word.line, []).append(index)
+        return list(lines.values())
+
+    def lines(self) -> list[str]:
+        """Returns the text of each line.
+
+        Returns:
+            List of text lines.
+        """
+        return [" ".join(word.text for word in line) for line in self._grouped_lines()]
+
+    def contains(
+        self, text: str, case_sensitive: bool = False, min_score: float = 1.0
+    ) -> bool:
+        """Checks whether the text appears anywhere in the result.
+
+        Args:
+            text: Text to search for. May span several words of a line.
+            case_sensitive: Whether the comparison is case-sensitive.
+            min_score: Lowest accepted match score; below 1, approximate
+                matches (see match) count.
+
+        Returns:
+            True if the text was found.
+        """
+        if min_score < 1.0:
+            return (
+                self.match(text, min_score=min_score, case_sensitive=case_sensitive)
+                is not None
+            )
+        if case_sensitive:
+            return text in self.text
+        return text.lower() in self.text.lower()
+
+    def find_all(self, text: str, case_sensitive: bool = False) -> list[OcrWord]:
+        """Finds every occurrence of the text.
+
+        Single words match any recognized word containing them. Phrases match
+        consecutive words on one line and are returned as one OcrWord whose box
+        spans the phrase.
+
+        Args:
+            text: Text to search for.
+            case_sensitive: Whether the comparison is case-sensitive.
+
+        Returns:
+            Matching words, in reading order.
+        """
+        needle = text if case_sensitive else text.lower()
+        span = max(len(needle.split()), 1)
+        matches = []
+        for line in self._grouped_lines():
+            for start in range(len(line) - span + 1):
+                window = line[start : start + span]
+                joined = " ".join(word.text for word in window)
+                if needle in (joined if case_sensitive else joined.lower()):
+                    matches.append(window[0] if span == 1 else _union(window))
+        return matches
+
+    def find(self, text: str, case_sensitive: bool = False) -> OcrWord | None:
+        """Finds the first occurrence of the text.
+
+        Args:
+            text: Text to search for.
+            case_sensitive: Whether the comparison is case-sensitive.
+
+        Returns:
+            The first matching OcrWord, or None.
+        """
+        matches = self.find_all(text, case_sensitive=case_sensitive)
+        return matches[0] if matches else None
+
+    def match_all(
+        self,
+        text: str,
+        min_score: float = DEFAULT_MIN_SCORE,
+        case_sensitive: bool = False,
+    ) -> list[TextMatch]:
+        """Finds every approximate occurrence of the text.
+
+        Windows of consecutive words on one line (one word fewer to one more
+        than the query has, absorbing words OCR split or merged) are scored
+        with partial_similarity. Overlapping candidates are resolved in favour
+        of the higher score, then the shorter span.
+
+        Args:
+            text: Text to search for. May span several words.
+            min_score: Lowest accepted score, from 0 to 1.
+            case_sensitive: Whether the comparison is case-sensitive.
+
+        Returns:
+            Non-overlapping matches, in reading order.
+
+        Raises:
+            ValueError: If min_score is outside 0 to 1.
+        """
+        if not 0.0 <= min_score <= 1.0:
+            raise ValueError(f"min_score must be between 0 and 1, got {min_score}")
+        needle = " ".join(text.split()) if case_sensitive else normalize_text(text)
+        tokens = max(len(needle.split()), 1)
+
+        matches: list[TextMatch] = []
+        for line in self._indexed_lines():
+            candidates = []
+            for start in range(len(line)):
+                for span in range(max(1, tokens - 1), tokens + 2):
+                    if start + span > len(line):
+                        break
+                    joined = " ".join(
+                        self.words[index].text for index in line[start : start + span]
+                    )
+                    if not case_sensitive:
+                        joined = normalize_text(joined)
+                    score = partial_similarity(needle, joined)
+                    if score >= min_score:
+                        candidates.append((score, span, start))
+
+            taken: set[int] = set()
+            for score, span, start in sorted(
+                candidates, key=lambda c: (-c[0], c[1], c[2])
+            ):
+                positions = set(range(start, start + span))
+                if positions & taken:
+                    continue
+                taken |= positions
+                indices = line[start : start + span]
+                merged = _union([self.words[index] for index in indices])
+                matches.append(
+                    TextMatch(
+                        text=merged.text,
+                        box=merged.box,
+                        score=score,
+                        confidence=merged.confidence,
+                        span=(indices[0], indices[-1] + 1),
+                    )
+                )
+        return sorted(matches, key=lambda match: match.span)
+
+    def match(
+        self,
+        text: str,
+        min_score: float = DEFAULT_MIN_SCORE,
+        case_sensitive: bool = False,
+    ) -> TextMatch | None:
+        """Finds the best approximate occurrence of the text.
+
+        Args:
+            text: Text to search for. May span several words.
+            min_score: Lowest accepted score, from 0 to 1.
+            case_sensitive: Whether the comparison is case-sensitive.
+
+        Returns:
+            The highest-scoring TextMatch (the first in reading order on
+            ties), or None.
+        """
+        matches = self.match_all(
+            text, min_score=min_score, case_sensitive=case_sensitive
+        )
+        return max(matches, key=lambda match: match.score) if matches else None
+
+    def within(self, region: tuple[int, int, int, int]) -> "OcrResult":
+        """Returns the words whose center lies in a (left, top, right, bottom) region.
+
+        Args:
+            region: The region to keep.
+
+        Returns:
+            A new OcrResult.
+        """
+        left, top, right, bottom = region
+        return OcrResult(
+            words=tuple(
+                word
+                for word in self.words
+                if left <= word.center[0] < right and top <= word.center[1] < bottom
+            )
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of words."""
+        return len(self.words)
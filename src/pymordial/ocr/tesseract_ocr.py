@@ -1,17 +1,24 @@
 """Tesseract OCR implementation (requires Tesseract installation)."""
 
 import logging
+import re
+from bisect import bisect_right
+from collections.abc import Iterator
+from dataclasses import replace
 from pathlib import Path
 
 import cv2
 import numpy as np
 import pytesseract
 
+from pymordial.core.frame import Frame
 from pymordial.ocr.base import PymordialOCR
 from pymordial.ocr.extract_strategy import (
     DefaultExtractStrategy,
     PymordialExtractStrategy,
+    strategy_source_box,
 )
+from pymordial.ocr.result import OcrResult, OcrWord
 from pymordial.utils.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -20,6 +27,10 @@ _CONFIG = get_config()
 
 # --- Tesseract Configuration ---
 DEFAULT_CONFIG = _CONFIG["extract_strategy"]["tesseract"]["default_config"]
+PSM_BLOCK = _CONFIG["extract_strategy"]["tesseract"]["psm"]["block"]
+BATCH_SEPARATOR = _CONFIG["extract_strategy"]["tesseract"]["batch"]["separator"]
+BATCH_PADDING = _CONFIG["extract_strategy"]["tesseract"]["batch"]["padding"]
+BATCH_BACKGROUND = 255
 
 
 class TesseractOCR(PymordialOCR):
@@ -64,13 +75,14 @@ class TesseractOCR(PymordialOCR):
 
     def extract_text(
         self,
-        image_path: "Path | bytes | str | np.ndarray",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         strategy: PymordialExtractStrategy | None = None,
     ) -> str:
         """Extracts text from an image using Tesseract with optional preprocessing.
 
         Args:
-            image_path: Path to image file, image bytes, numpy array, or a string path.
+            image_path: Path to image file, image bytes, numpy array, Frame, or a
+                string path.
             strategy: Optional PymordialExtractStrategy instance. If None, a
                 DefaultExtractStrategy is used, providing generic preprocessing
                 suitable for any image.
@@ -92,7 +104,7 @@ class TesseractOCR(PymordialOCR):
             # Use strategy-provided Tesseract config (fallback to self.config)
             config = strategy.tesseract_config() or self.config
             # Extract text using Tesseract
-            text = pytesseract.image_to_string(processed, config=config)
+            text = self._image_to_string(processed, config)
             return text.strip()
         except Exception as e:
             logger.error(f"Error extracting text with Tesseract: {e}")
@@ -101,63 +113,277 @@ class TesseractOCR(PymordialOCR):
     def find_text(
         self,
         search_text: str,
-        image_path: "Path | bytes | str | np.ndarray",
+        image_path: "Path | bytes | str | np.ndarray | Frame",
         strategy: PymordialExtractStrategy | None = None,
     ) -> tuple[int, int] | None:
         """Finds the coordinates (center) of the specified text in the image.
 
         Args:
             search_text: Text to search for.
-            image_path: Path to image file, image bytes, or numpy array.
+            image_path: Path to image file, image bytes, numpy array, or Frame.
             strategy: Optional preprocessing strategy.
 
         Returns:
             (x, y) coordinates of the center of the found text, or None if not found.
         """
+        try:
+            match = self.read(image_path, strategy=strategy).find(search_text)
+        except ValueError as e:
+            logger.error(f"Error finding text with Tesseract: {e}")
+            return None
+        return match.center if match is not None else None
+
+    def read(
+        self,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        strategy: PymordialExtractStrategy | None = None,
+    ) -> OcrResult:
+        """Reads every word of an image with a single ``image_to_data`` pass.
+
+        Args:
+            image_path: Path to image file, image bytes, numpy array, or Frame.
+            strategy: Optional preprocessing strategy.
+
+        Returns:
+            OcrResult with word boxes in the coordinates of the source image,
+            undoing the strategy's rescaling.
+
+        Raises:
+            ValueError: If the image cannot be processed.
+        """
         try:
             image = self._load_image(image_path)
             if strategy is None:
                 strategy = DefaultExtractStrategy()
             processed = strategy.preprocess(image)
             config = strategy.tesseract_config() or self.config
+            data = self._image_to_data(processed, config)
+        except Exception as e:
+            logger.error(f"Error reading text with Tesseract: {e}")
+            raise ValueError(f"Failed to read text: {e}")
+
+        words = [
+            replace(word, box=strategy_source_box(strategy, word.box, image, processed))
+            for word in self._words(data)
+        ]
+        return OcrResult(words=tuple(words))
+
+    def read_batch(
+        self,
+        images: "list[Path | bytes | str | np.ndarray | Frame]",
+        strategy: PymordialExtractStrategy | None = None,
+        offsets: list[tuple[int, int]] | None = None,
+    ) -> list[list[OcrWord]]:
+        """Recognizes many small images with a single Tesseract call.
 
-            data = pytesseract.image_to_data(
-                processed, config=config, output_type=pytesseract.Output.DICT
+        Every image is preprocessed, converted to grayscale and stacked
+        vertically on one white canvas, separated by blank bands so each
+        lands on its own text line. ``image_to_data`` runs once on the canvas
+        and each word box is mapped back to the image it came from, undoing
+        the canvas placement and the strategy's rescaling.
+
+        Args:
+            images: The images to read (e.g. crops of short labels).
+            strategy: Optional preprocessing strategy applied to every image.
+            offsets: Optional (x, y) position of each image in a larger frame;
+                added to the returned boxes.
+
+        Returns:
+            One list of OcrWords per input image, in input order.
+
+        Raises:
+            ValueError: If an image cannot be processed or the offsets do not
+                match the images.
+        """
+        if offsets is not None and len(offsets) != len(images):
+            raise ValueError(f"Expected {len(images)} offsets, got {len(offsets)}")
+        if not images:
+            return []
+
+        try:
+            if strategy is None:
+                strategy = DefaultExtractStrategy()
+            sources = [self._load_image(image) for image in images]
+            crops = []
+            for source in sources:
+                processed = strategy.preprocess(source)
+                if processed.ndim == 3:
+                    processed = cv2.cvtColor(processed, cv2.COLOR_BGR2GRAY)
+                crops.append(processed)
+
+            canvas_width = max(crop.shape[1] for crop in crops) + 2 * BATCH_PADDING
+            bands: list[np.ndarray] = []
+            tops: list[int] = []
+            y = BATCH_PADDING
+            for crop in crops:
+                tops.append(y)
+                band = np.full(
+                    (crop.shape[0] + BATCH_SEPARATOR, canvas_width),
+                    BATCH_BACKGROUND,
+                    dtype=np.uint8,
+                )
+                band[: crop.shape[0], BATCH_PADDING : BATCH_PADDING + crop.shape[1]] = (
+                    crop
+                )
+                bands.append(band)
+                y += band.shape[0]
+            canvas = np.vstack(
+                [np.full((BATCH_PADDING, canvas_width), BATCH_BACKGROUND, np.uint8)]
+                + bands
+                + [np.full((BATCH_PADDING, canvas_width), BATCH_BACKGROUND, np.uint8)]
             )
 
-            search_text_lower = search_text.lower()
-            n_boxes = len(data["text"])
-            for i in range(n_boxes):
-                # Check if confidence is sufficient (e.g. > 0) to avoid noise
-                if int(data["conf"][i]) > 0:
-                    text = data["text"][i].strip().lower()
-                    if search_text_lower in text:
-                        (x, y, w, h) = (
-                            data["left"][i],
-                            data["top"][i],
-                            data["width"][i],
-                            data["height"][i],
-                        )
-                        center_x = x + w // 2
-                        center_y = y + h // 2
-                        return (center_x, center_y)
-            return None
+            # Stacked labels form one block regardless of the strategy's PSM
+            config = strategy.tesseract_config() or self.config
+            config = re.sub(r"--psm\s+\d+", "", config) + f" --psm {PSM_BLOCK}"
+            data = self._image_to_data(canvas, config)
         except Exception as e:
-            logger.error(f"Error finding text with Tesseract: {e}")
-            return None
+            logger.error(f"Error in batch OCR with Tesseract: {e}")
+            raise ValueError(f"Failed to extract text in batch: {e}")
+
+        results: list[list[OcrWord]] = [[] for _ in images]
+        for word in self._words(data):
+            left, top, width, height = word.box
+            center_y = top + height / 2
+            index = bisect_right(tops, center_y) - 1
+            if index < 0 or center_y > tops[index] + crops[index].shape[0]:
+                continue
+
+            # Canvas -> preprocessed crop -> source image coordinates
+            left, top, width, height = strategy_source_box(
+                strategy,
+                (left - BATCH_PADDING, top - tops[index], width, height),
+                sources[index],
+                crops[index],
+            )
+            offset_x, offset_y = offsets[index] if offsets is not None else (0, 0)
+            results[index].append(
+                replace(word, box=(offset_x + left, offset_y + top, width, height))
+            )
+        return results
+
+    def extract_text_batch(
+        self,
+        images: "list[Path | bytes | str | np.ndarray | Frame]",
+        strategy: PymordialExtractStrategy | None = None,
+    ) -> list[str]:
+        """Extracts the text of many small images with a single Tesseract call.
+
+        Args:
+            images: The images to read.
+            strategy: Optional preprocessing strategy applied to every image.
+
+        Returns:
+            The text of each image, in input order. Lines are separated by
+            newlines.
+
+        Raises:
+            ValueError: If an image cannot be processed.
+        """
+        return [
+            OcrResult(words=tuple(words)).text
+            for words in self.read_batch(images, strategy=strategy)
+        ]
+
+    def read_regions(
+        self,
+        image_path: "Path | bytes | str | np.ndarray | Frame",
+        regions: list[tuple[int, int, int, int]],
+        strategy: PymordialExtractStrategy | None = None,
+    ) -> list[list[OcrWord]]:
+        """Reads several (left, top, right, bottom) regions of one image at once.
+
+        Args:
+            image_path: The full image (path, bytes, numpy array, or Frame).
+            regions: The regions to read.
+            strategy: Optional preprocessing strategy applied to every region.
+
+        Returns:
+            One list of OcrWords per region, with boxes in the coordinates of
+            the full image.
+
+        Raises:
+            ValueError: If the image cannot be processed.
+        """
+        image = self._load_image(image_path)
+        crops = [
+            image[int(top) : int(bottom), int(left) : int(right)]
+            for left, top, right, bottom in regions
+        ]
+        offsets = [(int(left), int(top)) for left, top, _, _ in regions]
+        return self.read_batch(crops, strategy=strategy, offsets=offsets)
+
+    @staticmethod
+    def _words(data: dict[str, list]) -> Iterator[OcrWord]:
+        """Yields the recognized words of an ``image_to_data`` result.
+
+        Empty rows and rows without a confidence (blocks, lines) are skipped.
+        Boxes are in the coordinates of the image Tesseract was given.
+        """
+        for i in range(len(data["text"])):
+            text = str(data["text"][i]).strip()
+            if not text or float(data["conf"][i]) < 0:
+                continue
+            yield OcrWord(
+                text=text,
+                box=(
+                    int(data["left"][i]),
+                    int(data["top"][i]),
+                    int(data["width"][i]),
+                    int(data["height"][i]),
+                ),
+                confidence=float(data["conf"][i]),
+                line=(
+                    int(data["block_num"][i]),
+                    int(data["par_num"][i]),
+                    int(data["line_num"][i]),
+                ),
+            )
+
+    def _image_to_string(self, image: np.ndarray, config: str) -> str:
+        """Runs Tesseract on a preprocessed image and returns its text.
+
+        Args:
+            image: The preprocessed image.
+            config: Tesseract configuration string.
+
+        Returns:
+            The raw recognized text.
+        """
+        return pytesseract.image_to_string(image, config=config)
+
+    def _image_to_data(self, image: np.ndarray, config: str) -> dict[str, list]:
+        """Runs Tesseract on a preprocessed image and returns word boxes.
+
+        Args:
+            image: The preprocessed image.
+            config: Tesseract configuration string.
+
+        Returns:
+            Dictionary of parallel lists in ``pytesseract.Output.DICT`` layout
+            (``text``, ``conf``, ``left``, ``top``, ``width``, ``height``, ...).
+        """
+        return pytesseract.image_to_data(
+            image, config=config, output_type=pytesseract.Output.DICT
+        )
 
-    def _load_image(self, image_path: "Path | bytes | str | np.ndarray") -> np.ndarray:
-        """Loads image from path, bytes, or numpy array.
+    def _load_image(
+        self, image_path: "Path | bytes | str | np.ndarray | Frame"
+    ) -> np.ndarray:
+        """Loads image from path, bytes, numpy array, or Frame.
 
         Args:
-            image_path: Path to image file, image bytes, numpy array, or a string path.
+            image_path: Path to image file, image bytes, numpy array, Frame, or a
+                string path.
 
         Returns:
-            The loaded image as a numpy array.
+            The loaded image as a numpy array (BGR for Frames, bytes and paths).
 
         Raises:
             ValueError: If the image cannot be read.
         """
+        if isinstance(image_path, Frame):
+            return image_path.bgr
         if isinstance(image_path, np.ndarray):
             return image_path
         if isinstance(image_path, bytes):
@@ -0,0 +1,353 @@
+"""In-process Tesseract OCR implementation (requires tesserocr)."""
+
+import logging
+import queue
+import shlex
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import cv2
+import numpy as np
+import tesserocr
+
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+from pymordial.utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Tesseract Configuration ---
+DEFAULT_CONFIG = _CONFIG["extract_strategy"]["tesseract"]["default_config"]
+DEFAULT_LANGUAGE = _CONFIG["extract_strategy"]["tesseract"]["language"]
+DEFAULT_POOL_SIZE = _CONFIG["extract_strategy"]["tesseract"]["api_pool_size"]
+TESSDATA_DIR = _CONFIG["extract_strategy"]["tesseract"]["tessdata_dir"]
+
+BUNDLED_TESSDATA_DIR = Path(__file__).parent.parent / "bin" / "tesseract" / "tessdata"
+
+
+def parse_tesseract_config(
+    config: str,
+) -> tuple[int | None, int | None, dict[str, str], str | None]:
+    """Splits a Tesseract command-line config string into its parts.
+
+    Args:
+        config: Config string such as ``"--oem 3 --psm 6 -c key=value"``.
+
+    Returns:
+        (psm, oem, variables, language). Options that are not present are
+        None (or an empty dict for variables).
+
+    Raises:
+        ValueError: If the config string is malformed.
+    """
+    psm: int | None = None
+    oem: int | None = None
+    language: str | None = None
+    variables: dict[str, str] = {}
+
+    tokens = shlex.split(config or "")
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        try:
+            if token == "--psm":
+                index += 1
+                psm = int(tokens[index])
+            elif token == "--oem":
+                index += 1
+                oem = int(tokens[index])
+            elif token == "-l":
+                index += 1
+                language = tokens[index]
+            elif token == "-c":
+                index += 1
+                key, separator, value = tokens[index].partition("=")
+                if not separator:
+                    raise ValueError(
+                        f"Expected key=value after -c, got '{tokens[index]}'"
+                    )
+                variables[key] = value
+            elif token.startswith("-c") and "=" in token:
+                key, _, value = token[2:].partition("=")
+                variables[key] = value
+            else:
+                logger.debug(f"Ignoring unsupported Tesseract option: {token}")
+        except IndexError:
+            raise ValueError(f"Missing value for Tesseract option {token}")
+        index += 1
+
+    return psm, oem, variables, language
+
+
+class TesseractApiPool:
+    """Thread-safe pool of initialized ``PyTessBaseAPI`` handles.
+
+    Handles are created lazily, up to ``size`` per (language, OEM) pair, and
+    reused across calls, so the traineddata model is loaded once per handle
+    instead of once per recognition. A handle is used by one thread at a
+    time; callers beyond ``size`` block until a handle is returned.
+
+    Attributes:
+        size: Maximum number of handles per (language, OEM) pair.
+        tessdata_dir: Directory containing the ``.traineddata`` files.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        tessdata_dir: str | Path | None = None,
+    ):
+        """Initializes an empty pool.
+
+        Args:
+            size: Maximum number of handles per (language, OEM) pair.
+            tessdata_dir: Directory containing the ``.traineddata`` files.
+                Defaults to the configured directory, then the bundled one,
+                then tesserocr's default.
+
+        Raises:
+            ValueError: If size is smaller than 1.
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.size = size
+        if tessdata_dir is None:
+            if TESSDATA_DIR:
+                tessdata_dir = TESSDATA_DIR
+            elif BUNDLED_TESSDATA_DIR.exists():
+                tessdata_dir = BUNDLED_TESSDATA_DIR
+        self.tessdata_dir = str(tessdata_dir) if tessdata_dir else None
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, int], queue.LifoQueue] = {}
+        self._slots: dict[tuple[str, int], threading.BoundedSemaphore] = {}
+        self._handles: list[tesserocr.PyTessBaseAPI] = []
+
+    def _create(self, language: str, oem: int) -> tesserocr.PyTessBaseAPI:
+        """Creates and initializes a new API handle."""
+        kwargs = {"lang": language, "oem": oem, "init": True}
+        if self.tessdata_dir:
+            kwargs["path"] = self.tessdata_dir
+        try:
+            api = tesserocr.PyTessBaseAPI(**kwargs)
+        except RuntimeError as e:
+            raise ValueError(
+                f"Failed to initialize Tesseract for '{language}' (oem {oem}): {e}"
+            ) from e
+        with self._lock:
+            self._handles.append(api)
+        logger.debug(f"Initialized Tesseract API handle for '{language}' (oem {oem})")
+        return api
+
+    @contextmanager
+    def acquire(
+        self, language: str = DEFAULT_LANGUAGE, oem: int = tesserocr.OEM.DEFAULT
+    ) -> Iterator[tesserocr.PyTessBaseAPI]:
+        """Borrows a handle for the duration of a ``with`` block.
+
+        Args:
+            language: Tesseract language code(s), e.g. "eng" or "eng+deu".
+            oem: OCR engine mode.
+
+        Yields:
+            An initialized PyTessBaseAPI owned by the caller until the block
+            exits.
+        """
+        key = (language, int(oem))
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue()
+                self._slots[key] = threading.BoundedSemaphore(self.size)
+            idle, slots = self._idle[key], self._slots[key]
+
+        slots.acquire()
+        try:
+            try:
+                api = idle.get_nowait()
+            except queue.Empty:
+                api = self._create(language, int(oem))
+            try:
+                yield api
+            finally:
+                api.Clear()
+                idle.put(api)
+        finally:
+            slots.release()
+
+    def close(self) -> None:
+        """Releases every handle. The pool can be reused afterwards."""
+        with self._lock:
+            handles, self._handles = self._handles, []
+            self._idle.clear()
+            self._slots.clear()
+        for api in handles:
+            api.End()
+
+    def __len__(self) -> int:
+        """Returns the number of handles created so far."""
+        return len(self._handles)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the pool."""
+        return f"TesseractApiPool(size={self.size}, handles={len(self)})"
+
+
+class TesserocrOCR(TesseractOCR):
+    """Tesseract OCR running in process through tesserocr.
+
+    Unlike TesseractOCR, which spawns a ``tesseract`` process and reloads the
+    model for every call, this engine keeps a pool of loaded API handles and
+    passes NumPy arrays to Tesseract directly, without temporary files. It
+    accepts the same config strings and extraction strategies.
+
+    Requirements:
+    - ``pip install pymordial[tesserocr]``
+    - A tessdata directory with the required ``.traineddata`` files
+
+    Attributes:
+        config: Tesseract configuration string.
+        language: Default Tesseract language code(s).
+        pool: The pool of API handles.
+    """
+
+    def __init__(
+        self,
+        config: str = DEFAULT_CONFIG,
+        language: str = DEFAULT_LANGUAGE,
+        pool: TesseractApiPool | None = None,
+    ):
+        """Initializes the in-process Tesseract engine.
+
+        Args:
+            config: Tesseract configuration string.
+            language: Default Tesseract language code(s).
+            pool: Optional shared handle pool. A new pool is created if None.
+        """
+        self.config = config
+        self.language = language
+        self.pool = pool if pool is not None else TesseractApiPool()
+
+    @contextmanager
+    def _recognized(self, image: np.ndarray, config: str):
+        """Runs recognition on an image with a pooled handle.
+
+        Config variables are applied for the duration of the call and then
+        restored, so handles can be shared across configs.
+        """
+        psm, oem, variables, language = parse_tesseract_config(config)
+        with self.pool.acquire(
+            language or self.language,
+            tesserocr.OEM.DEFAULT if oem is None else oem,
+        ) as api:
+            previous = {key: api.GetVariableAsString(key) for key in variables}
+            try:
+                for key, value in variables.items():
+                    if not api.SetVariable(key, value):
+                        logger.warning(f"Unknown Tesseract variable: {key}")
+                api.SetPageSegMode(tesserocr.PSM.SINGLE_BLOCK if psm is None else psm)
+                self._set_image(api, image)
+                api.Recognize()
+                yield api
+            finally:
+                for key, value in previous.items():
+                    if value is not None:
+                        api.SetVariable(key, value)
+
+    @staticmethod
+    def _set_image(api: tesserocr.PyTessBaseAPI, image: np.ndarray) -> None:
+        """Hands a grayscale, BGR or BGRA array to Tesseract without encoding."""
+        if image.dtype != np.uint8:
+            image = cv2.convertScaleAbs(image)
+        if image.ndim == 3 and image.shape[2] == 4:
+            image = cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
+        elif image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        channels = 1 if image.ndim == 2 else image.shape[2]
+        api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+
+    def _image_to_string(self, image: np.ndarray, config: str) -> str:
+        """Recognizes a preprocessed image with a pooled handle.
+
+        Args:
+            image: The preprocessed image.
+            config: Tesseract configuration string.
+
+        Returns:
+            The raw recognized text.
+        """
+        with self._recognized(image, config) as api:
+            return api.GetUTF8Text()
+
+    def _image_to_data(self, image: np.ndarray, config: str) -> dict[str, list]:
+        """Recognizes a preprocessed image and returns its word boxes.
+
+        Args:
+            image: The preprocessed image.
+            config: Tesseract configuration string.
+
+        Returns:
+            Word-level rows in ``pytesseract.Output.DICT`` layout.
+        """
+        data: dict[str, list] = {
+            key: []
+            for key in (
+                "level",
+                "block_num",
+                "par_num",
+                "line_num",
+                "word_num",
+                "left",
+                "top",
+                "width",
+                "height",
+                "conf",
+                "text",
+            )
+        }
+        block = paragraph = line = word = 0
+        RIL = tesserocr.RIL
+        with self._recognized(image, config) as api:
+            iterator = api.GetIterator()
+            if iterator is None:
+                return data
+            for result in tesserocr.iterate_level(iterator, RIL.WORD):
+                if result.IsAtBeginningOf(RIL.BLOCK):
+                    block, paragraph, line = block + 1, 0, 0
+                if result.IsAtBeginningOf(RIL.PARA):
+                    paragraph, line = paragraph + 1, 0
+                if result.IsAtBeginningOf(RIL.TEXTLINE):
+                    line, word = line + 1, 0
+                word += 1
+                box = result.BoundingBox(RIL.WORD)
+                if box is None:
+                    continue
+                left, top, right, bottom = box
+                data["level"].append(5)
+                data["block_num"].append(block)
+                data["par_num"].append(paragraph)
+                data["line_num"].append(line)
+                data["word_num"].append(word)
+                data["left"].append(left)
+                data["top"].append(top)
+                data["width"].append(right - left)
+                data["height"].append(bottom - top)
+                data["conf"].append(result.Confidence(RIL.WORD))
+                data["text"].append(result.GetUTF8Text(RIL.WORD) or "")
+        return data
+
+    def close(self) -> None:
+        """Releases the Tesseract handles held by this engine's pool."""
+        self.pool.close()
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the engine."""
+        return (
+            f"TesserocrOCR("
+            f"config='{self.config}', "
+            f"language='{self.language}', "
+            f"pool={self.pool})"
+        )
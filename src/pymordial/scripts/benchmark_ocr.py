@@ -0,0 +1,103 @@
+"""OCR Preprocessing Benchmark Script.
+
+This script reads a labelled crop set with each preprocessing profile of
+DefaultExtractStrategy and reports the mean preprocessing time, recognition
+time and accuracy of each.
+
+Usage:
+    uv run src/pymordial/scripts/benchmark_ocr.py CROPS_DIR [--engine tesserocr] [--repeat N]
+
+CROPS_DIR holds the crop images and a labels.json mapping each file name to
+its expected text.
+"""
+
+import argparse
+import logging
+import sys
+
+from pymordial.ocr.benchmark import (
+    benchmark_strategies,
+    format_benchmarks,
+    load_labelled_crops,
+)
+from pymordial.ocr.extract_strategy import (
+    DENOISE_BILATERAL,
+    DENOISE_MEDIAN,
+    DENOISE_NONE,
+    PROFILE_FAST,
+    DefaultExtractStrategy,
+    PymordialExtractStrategy,
+)
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def profile_strategies() -> dict[str, PymordialExtractStrategy]:
+    """Returns the built-in preprocessing profiles to compare.
+
+    Returns:
+        Strategies keyed by display name.
+    """
+    return {
+        "accurate": DefaultExtractStrategy(),
+        "fast-median": DefaultExtractStrategy(PROFILE_FAST, denoise=DENOISE_MEDIAN),
+        "fast-bilateral": DefaultExtractStrategy(
+            PROFILE_FAST, denoise=DENOISE_BILATERAL
+        ),
+        "fast-none": DefaultExtractStrategy(PROFILE_FAST, denoise=DENOISE_NONE),
+    }
+
+
+def create_engine(name: str) -> TesseractOCR:
+    """Creates the OCR engine to benchmark with.
+
+    Args:
+        name: "tesseract" or "tesserocr".
+
+    Returns:
+        The engine.
+    """
+    if name == "tesserocr":
+        from pymordial.ocr.tesserocr_ocr import TesserocrOCR
+
+        return TesserocrOCR()
+    return TesseractOCR()
+
+
+def main() -> None:
+    """Main entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(description="OCR Preprocessing Benchmark")
+    parser.add_argument("crops", help="Directory of crops with a labels.json")
+    parser.add_argument(
+        "--engine",
+        choices=["tesseract", "tesserocr"],
+        default="tesseract",
+        help="OCR engine used for recognition",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per crop (best is kept)"
+    )
+    args = parser.parse_args()
+
+    try:
+        crops = load_labelled_crops(args.crops)
+        results = benchmark_strategies(
+            profile_strategies(),
+            crops,
+            engine=create_engine(args.engine),
+            repeat=args.repeat,
+        )
+    except (ImportError, ValueError) as e:
+        logger.error(f"Benchmark failed: {e}")
+        sys.exit(1)
+
+    print(f"{len(crops)} crop(s), engine={args.engine}, repeat={args.repeat}\n")
+    print(format_benchmarks(results))
+
+
+if __name__ == "__main__":
+    main()
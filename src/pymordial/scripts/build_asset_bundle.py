@@ -0,0 +1,117 @@
+"""Asset Bundle Build Script.
+
+This script compiles the image assets of an app's screens (or Pymordial's own
+BlueStacks UI elements) into a single memory-mappable bundle file.
+
+Usage:
+    uv run src/pymordial/scripts/build_asset_bundle.py OUTPUT [--app module:attribute]
+        [--root ASSET_DIR]
+
+Load the result at startup with ``controller.image.add_asset_bundle(OUTPUT)``.
+"""
+
+import argparse
+import importlib
+import logging
+import sys
+from types import SimpleNamespace
+
+from pymordial.controller.bluestacks_controller import (
+    DEFAULT_REF_WINDOW_SIZE,
+    BluestacksElements,
+)
+from pymordial.core.pymordial_app import PymordialApp
+from pymordial.core.pymordial_element import PymordialElement
+from pymordial.vision.bundle import build_asset_bundle
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def app_elements(app: PymordialApp) -> list[PymordialElement]:
+    """Collects the elements of every screen of an app.
+
+    Elements shared by several screens are listed once.
+
+    Args:
+        app: The PymordialApp.
+
+    Returns:
+        The distinct elements of all screens, in screen order.
+    """
+    elements = {
+        id(element): element
+        for screen in app.screens.values()
+        for element in screen.elements.values()
+    }
+    return list(elements.values())
+
+
+def bluestacks_elements() -> list[PymordialElement]:
+    """Collects Pymordial's built-in BlueStacks UI elements.
+
+    Returns:
+        The BlueStacks elements.
+    """
+    elements = BluestacksElements(
+        SimpleNamespace(ref_window_size=DEFAULT_REF_WINDOW_SIZE)
+    )
+    return [
+        value
+        for value in vars(elements).values()
+        if isinstance(value, PymordialElement)
+    ]
+
+
+def load_app(spec: str) -> PymordialApp:
+    """Imports a PymordialApp from a "module:attribute" string.
+
+    Args:
+        spec: Import path of the app, e.g. "mygame.app:app".
+
+    Returns:
+        The PymordialApp.
+
+    Raises:
+        ValueError: If the spec is malformed or does not name a PymordialApp.
+    """
+    module_name, _, attribute = spec.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"App must be given as 'module:attribute', got '{spec}'")
+    app = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(app, PymordialApp):
+        raise ValueError(f"{spec} is a {type(app).__name__}, not a PymordialApp")
+    return app
+
+
+def main() -> None:
+    """Main entry point for the build script."""
+    parser = argparse.ArgumentParser(description="Asset Bundle Build Script")
+    parser.add_argument("output", help="Path of the bundle file to write")
+    parser.add_argument(
+        "--app",
+        help="PymordialApp to bundle as 'module:attribute' (default: BlueStacks UI)",
+    )
+    parser.add_argument(
+        "--root",
+        help="Asset directory the bundle keys are relative to "
+        "(default: deepest directory holding every image)",
+    )
+    args = parser.parse_args()
+
+    try:
+        elements = (
+            app_elements(load_app(args.app)) if args.app else bluestacks_elements()
+        )
+        path = build_asset_bundle(elements, args.output, root=args.root)
+    except (ImportError, AttributeError, ValueError) as e:
+        logger.error(f"Failed to build asset bundle: {e}")
+        sys.exit(1)
+
+    logger.info(f"✅ Asset bundle written to {path}")
+
+
+if __name__ == "__main__":
+    main()
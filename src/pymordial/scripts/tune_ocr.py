@@ -0,0 +1,94 @@
+"""OCR Strategy Autotuning Script.
+
+This script searches upscale, denoise, threshold, page segmentation and
+whitelist settings for every element of a labelled crop collection and writes
+the cheapest strategy reaching the target accuracy for each element.
+
+Usage:
+    uv run src/pymordial/scripts/tune_ocr.py CROPS_ROOT [--target 0.95] [--output tuned_ocr.json] [--engine tesserocr] [--repeat N]
+
+CROPS_ROOT holds one subdirectory per element label, each with its crop
+images and a labels.json mapping each file name to its expected text.
+"""
+
+import argparse
+import logging
+import sys
+
+from pymordial.ocr.autotune import (
+    DEFAULT_TARGET_ACCURACY,
+    load_element_crops,
+    save_tuning,
+    tune_elements,
+)
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def create_engine(name: str) -> TesseractOCR:
+    """Creates the OCR engine to tune with.
+
+    Args:
+        name: "tesseract" or "tesserocr".
+
+    Returns:
+        The engine.
+    """
+    if name == "tesserocr":
+        from pymordial.ocr.tesserocr_ocr import TesserocrOCR
+
+        return TesserocrOCR()
+    return TesseractOCR()
+
+
+def main() -> None:
+    """Main entry point for the tuning script."""
+    parser = argparse.ArgumentParser(description="OCR Strategy Autotuning")
+    parser.add_argument("crops", help="Directory of per-element crop directories")
+    parser.add_argument(
+        "--target",
+        type=float,
+        default=DEFAULT_TARGET_ACCURACY,
+        help="Fraction of crops each strategy must read exactly",
+    )
+    parser.add_argument(
+        "--output", default="tuned_ocr.json", help="Where to write the results"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["tesseract", "tesserocr"],
+        default="tesseract",
+        help="OCR engine used for recognition",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per crop (best is kept)"
+    )
+    args = parser.parse_args()
+
+    try:
+        results = tune_elements(
+            load_element_crops(args.crops),
+            target_accuracy=args.target,
+            engine=create_engine(args.engine),
+            repeat=args.repeat,
+        )
+        save_tuning(results, args.output)
+    except (ImportError, OSError, ValueError) as e:
+        logger.error(f"Tuning failed: {e}")
+        sys.exit(1)
+
+    for label, result in results.items():
+        status = "ok" if result.meets_target else "BELOW TARGET"
+        print(
+            f"{label}: {result.benchmark.accuracy:.1%} in "
+            f"{result.benchmark.total_ms:.2f} ms [{status}] {result.params}"
+        )
+    print(f"\nWrote {len(results)} strategy(ies) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
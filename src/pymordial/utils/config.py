@@ -85,6 +85,7 @@ class BluestacksConfig(TypedDict):
     default_timeout: int
     default_transport_timeout_s: float
     wait_for_load_timeout: int
+    ui_settle_time: float
     hd_player_exe: str
     window_title: str
     ui: BluestacksUiConfig
@@ -94,9 +95,51 @@ class ImageControllerConfig(TypedDict):
     default_find_ui_retries: int
 
 
+class TextControllerConfig(TypedDict):
+    ocr_cache_size: int
+    match_min_score: float
+
+
+class VisionFeaturesConfig(TypedDict):
+    detector: str
+    orb_max_features: int
+    ratio_test: float
+    min_matches: int
+    ransac_reproj_threshold: float
+
+
+class VisionFingerprintConfig(TypedDict):
+    method: str
+    max_distance: int
+
+
+class VisionTextDetectionConfig(TypedDict):
+    detection_width: int
+    close_width: int
+    min_height: int
+    max_height: int
+    min_width: int
+    min_fill_ratio: float
+    padding: int
+    cache_size: int
+    max_distance: int
+
+
+class VisionConfig(TypedDict):
+    features: VisionFeaturesConfig
+    fingerprint: VisionFingerprintConfig
+    text_detection: VisionTextDetectionConfig
+
+
+class AppScreenDetectionConfig(TypedDict):
+    max_signature_elements: int
+    min_confidence: float
+
+
 class AppConfig(TypedDict):
     action_timeout: int
     action_wait_time: int
+    screen_detection: AppScreenDetectionConfig
 
 
 class ElementConfig(TypedDict):
@@ -104,6 +147,16 @@ class ElementConfig(TypedDict):
     pixel_size: list[int]
 
 
+class ExtractStrategyFastConfig(TypedDict):
+    denoise: str
+    target_text_height: int
+    min_upscale: float
+    max_upscale: float
+    median_kernel: int
+    bilateral_diameter: int
+    bilateral_sigma: int
+
+
 class ExtractStrategyDefaultConfig(TypedDict):
     upscale_factor: int
     denoise_strength: int
@@ -112,6 +165,20 @@ class ExtractStrategyDefaultConfig(TypedDict):
     threshold_binary_max: int
     inversion_threshold_mean: int
     tesseract_config: str
+    fast: ExtractStrategyFastConfig
+
+
+class ExtractStrategyPipelineConfig(TypedDict):
+    cache_size: int
+
+
+class ExtractStrategyAutotuneConfig(TypedDict):
+    target_accuracy: float
+    upscale_factors: list[float | None]
+    denoise_methods: list[str]
+    threshold_methods: list[str]
+    psm_modes: list[int]
+    whitelist_chars: str
 
 
 class RevomonMoveConfig(TypedDict):
@@ -150,22 +217,44 @@ class TesseractPreprocessConfig(TypedDict):
     inversion_threshold: int
 
 
+class TesseractBatchConfig(TypedDict):
+    separator: int
+    padding: int
+
+
 class TesseractConfig(TypedDict):
     base_config: str
     default_config: str
     tesseract_cmd: str
+    language: str
+    tessdata_dir: str
+    api_pool_size: int
+    batch: TesseractBatchConfig
     preprocess: TesseractPreprocessConfig
     psm: TesseractPsmConfig
 
 
 class ExtractStrategyConfig(TypedDict):
     default: ExtractStrategyDefaultConfig
+    pipeline: ExtractStrategyPipelineConfig
+    autotune: ExtractStrategyAutotuneConfig
     revomon: RevomonConfig
     tesseract: TesseractConfig
 
 
 class EasyOcrConfig(TypedDict):
     default_languages: list[str]
+    gpu: bool
+    quantize: bool
+    batch_size: int
+
+
+class GlyphOcrConfig(TypedDict):
+    glyph_width: int
+    glyph_height: int
+    min_score: float
+    min_height_ratio: float
+    space_ratio: float
 
 
 class SetupConfig(TypedDict):
@@ -184,23 +273,41 @@ class AssetsConfig(TypedDict):
     adb_screenshot_img: str
 
 
+class ControllerWaitConfig(TypedDict):
+    timeout: float
+    initial_interval: float
+    max_interval: float
+    backoff: float
+
+
 class ControllerConfig(TypedDict):
     default_click_times: int
     default_max_tries: int
     click_coord_times: int
+    wait: ControllerWaitConfig
+
+
+class DebugImagesConfig(TypedDict):
+    queue_size: int
+    sample_every: int
+    pixel_snapshot_size: int
 
 
 class PymordialConfig(TypedDict):
     adb: AdbConfig
     bluestacks: BluestacksConfig
     image_controller: ImageControllerConfig
+    text_controller: TextControllerConfig
+    vision: VisionConfig
     app: AppConfig
     element: ElementConfig
     extract_strategy: ExtractStrategyConfig
     easyocr: EasyOcrConfig
+    glyph_ocr: GlyphOcrConfig
     setup: SetupConfig
     assets: AssetsConfig
     controller: ControllerConfig
+    debug_images: DebugImagesConfig
 
 
 def _validate_config(config: dict) -> None:
@@ -216,13 +323,17 @@ def _validate_config(config: dict) -> None:
         "adb",
         "bluestacks",
         "image_controller",
+        "text_controller",
+        "vision",
         "app",
         "element",
         "extract_strategy",
         "easyocr",
+        "glyph_ocr",
         "setup",
         "assets",
         "controller",
+        "debug_images",
     ]
     for key in required_keys:
         if key not in config:
@@ -0,0 +1,132 @@
+"""Time budgets shared by nested controller calls.
+
+A deadline opened with ``deadline_scope`` applies to everything called inside
+the ``with`` block on the same thread: every RetryPolicy run stops retrying
+and clips its sleeps once the deadline passes, so nested retries (a click
+that finds an element that retries a capture, or an app launch that polls
+the process list) share one budget instead of each spending its own.
+
+Example:
+    with deadline_scope(3.0):
+        controller.click_element(play_button)  # at most ~3 s in total
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class Deadline:
+    """A point in time after which work should stop.
+
+    Attributes:
+        expires_at: ``time.monotonic()`` value at which the deadline passes.
+    """
+
+    def __init__(self, expires_at: float):
+        """Initializes the deadline.
+
+        Args:
+            expires_at: ``time.monotonic()`` value at which the deadline passes.
+        """
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Creates a deadline a number of seconds from now.
+
+        Args:
+            seconds: Length of the budget.
+
+        Returns:
+            The Deadline.
+
+        Raises:
+            ValueError: If seconds is negative.
+        """
+        if seconds < 0:
+            raise ValueError(f"Deadline cannot be negative, got {seconds}")
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Returns the seconds left, never less than zero."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def bound(self, timeout: float | None) -> float:
+        """Returns a timeout shortened to the time left.
+
+        Args:
+            timeout: Seconds the caller would wait, or None for no limit.
+
+        Returns:
+            The smaller of timeout and the remaining time.
+        """
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the deadline."""
+        return f"Deadline(remaining={self.remaining():.3f}s)"
+
+
+_scopes = threading.local()
+
+
+def current_deadline() -> Deadline | None:
+    """Returns the innermost deadline active on the calling thread, if any."""
+    stack = getattr(_scopes, "stack", None)
+    return stack[-1] if stack else None
+
+
+def bound_timeout(timeout: float | None) -> float | None:
+    """Shortens a timeout to the active deadline, if there is one.
+
+    Args:
+        timeout: Seconds the caller would wait, or None for no limit.
+
+    Returns:
+        The bounded timeout, or timeout unchanged outside a deadline scope.
+    """
+    active = current_deadline()
+    return timeout if active is None else active.bound(timeout)
+
+
+@contextmanager
+def deadline_scope(timeout: "float | Deadline | None") -> Iterator[Deadline | None]:
+    """Applies a deadline to every call inside a ``with`` block.
+
+    Scopes nest: an inner scope can shorten the budget but never extend the
+    one of an enclosing scope. Deadlines are per thread; work handed to
+    other threads does not inherit them.
+
+    Args:
+        timeout: Seconds from now, a Deadline, or None to keep the enclosing
+            deadline (if any) unchanged.
+
+    Yields:
+        The deadline in effect inside the block, or None if there is none.
+
+    Raises:
+        ValueError: If timeout is negative.
+    """
+    active = current_deadline()
+    if timeout is None:
+        yield active
+        return
+    deadline = timeout if isinstance(timeout, Deadline) else Deadline.after(timeout)
+    if active is not None and active.expires_at <= deadline.expires_at:
+        deadline = active
+
+    if not hasattr(_scopes, "stack"):
+        _scopes.stack = []
+    _scopes.stack.append(deadline)
+    try:
+        yield deadline
+    finally:
+        _scopes.stack.pop()
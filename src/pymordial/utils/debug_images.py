@@ -0,0 +1,267 @@
+"""Background writer for debug snapshots.
+
+Encoding a PNG takes longer than most of the OCR and matching work it is
+meant to explain, so debug images are handed to a worker thread through a
+bounded queue instead of being written on the caller's thread. When the queue
+is full the snapshot is dropped rather than blocking, and ``sample_every``
+keeps only one snapshot in N, so debug capture can stay on in production.
+"""
+
+import atexit
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Full, Queue
+
+import cv2
+import numpy as np
+
+from pymordial.utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Debug Image Configuration ---
+_DEBUG_IMAGES = _CONFIG["debug_images"]
+DEFAULT_QUEUE_SIZE = _DEBUG_IMAGES["queue_size"]
+DEFAULT_SAMPLE_EVERY = _DEBUG_IMAGES["sample_every"]
+PIXEL_SNAPSHOT_SIZE = _DEBUG_IMAGES["pixel_snapshot_size"]
+
+BOX_COLOR_BGR = (0, 0, 255)
+
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class DebugWriterStats:
+    """Counters of a DebugImageWriter.
+
+    Attributes:
+        submitted: Snapshots offered to the writer.
+        skipped: Snapshots left out by 1-in-N sampling.
+        dropped: Snapshots discarded because the queue was full.
+        written: Snapshots saved to disk.
+        failed: Snapshots that could not be encoded or saved.
+    """
+
+    submitted: int = 0
+    skipped: int = 0
+    dropped: int = 0
+    written: int = 0
+    failed: int = 0
+
+
+class DebugImageWriter:
+    """Saves debug images on a background thread.
+
+    Submitted images are queued by reference, not copied: they must not be
+    modified afterwards. Frames, their cached views and memoized pipeline
+    outputs are already treated as read-only, so they can be passed as is.
+
+    Attributes:
+        output_dir: Directory the images are written to.
+        queue_size: Most snapshots waiting to be written; further snapshots
+            are dropped until the worker catches up.
+        sample_every: Keep one snapshot in this many.
+    """
+
+    def __init__(
+        self,
+        output_dir: str | Path,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+    ):
+        """Initializes the writer. The worker thread starts on first use.
+
+        Args:
+            output_dir: Directory the images are written to. It is created
+                when the first image is written.
+            queue_size: Most snapshots waiting to be written.
+            sample_every: Keep one snapshot in this many.
+
+        Raises:
+            ValueError: If queue_size or sample_every is not positive.
+        """
+        if queue_size < 1:
+            raise ValueError(f"Queue size must be positive, got {queue_size}")
+        if sample_every < 1:
+            raise ValueError(f"Sample interval must be positive, got {sample_every}")
+        self.output_dir = Path(output_dir)
+        self.queue_size = queue_size
+        self.sample_every = sample_every
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._counts = {name: 0 for name in DebugWriterStats.__dataclass_fields__}
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(
+        self,
+        name: str,
+        image: np.ndarray,
+        boxes: "tuple[tuple[int, int, int, int], ...] | list" = (),
+    ) -> bool:
+        """Queues an image for writing without waiting for it.
+
+        Args:
+            name: File name prefix; a sequence number and ``.png`` are added.
+            image: BGR or grayscale image.
+            boxes: (left, top, right, bottom) boxes outlined on a copy of the
+                image by the worker.
+
+        Returns:
+            True if the image was queued, False if it was sampled out,
+            dropped or the writer is closed.
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            sequence = self._counts["submitted"]
+            self._counts["submitted"] += 1
+            if sequence % self.sample_every:
+                self._counts["skipped"] += 1
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pymordial-debug-writer", daemon=True
+                )
+                self._thread.start()
+            try:
+                self._queue.put_nowait((name, sequence, image, tuple(boxes)))
+            except Full:
+                self._counts["dropped"] += 1
+                return False
+            self._pending += 1
+            return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until every queued image has been written.
+
+        Args:
+            timeout: Most seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if the queue drained, False on timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Writes the queued images and stops the worker thread.
+
+        Later submissions are ignored.
+
+        Args:
+            timeout: Most seconds to wait for the queue to drain.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self.flush(timeout)
+            # The queue may still be full after a timeout; the worker is a
+            # daemon, so it is simply left behind
+            try:
+                self._queue.put_nowait(_STOP)
+            except Full:
+                return
+            thread.join(timeout)
+
+    @property
+    def stats(self) -> DebugWriterStats:
+        """Returns a snapshot of the writer's counters."""
+        with self._lock:
+            return DebugWriterStats(**self._counts)
+
+    def _run(self) -> None:
+        """Writes queued images until the stop sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            outcome = "written" if self._write(*item) else "failed"
+            with self._idle:
+                self._counts[outcome] += 1
+                self._pending -= 1
+                if not self._pending:
+                    self._idle.notify_all()
+
+    def _write(
+        self,
+        name: str,
+        sequence: int,
+        image: np.ndarray,
+        boxes: tuple[tuple[int, int, int, int], ...],
+    ) -> bool:
+        """Encodes and saves one image, returning whether it succeeded."""
+        try:
+            if boxes:
+                image = (
+                    cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+                    if image.ndim == 2
+                    else image.copy()
+                )
+                for left, top, right, bottom in boxes:
+                    cv2.rectangle(
+                        image,
+                        (int(left), int(top)),
+                        (int(right) - 1, int(bottom) - 1),
+                        BOX_COLOR_BGR,
+                        1,
+                    )
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            safe_name = re.sub(r"[^\w.-]", "_", name)
+            path = self.output_dir / f"{safe_name}_{sequence:06d}.png"
+            if not cv2.imwrite(str(path), image):
+                raise OSError(f"Could not encode {path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to write debug image {name}: {e}")
+            return False
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the writer."""
+        return (
+            f"DebugImageWriter(output_dir='{self.output_dir}', "
+            f"queue_size={self.queue_size}, sample_every={self.sample_every})"
+        )
+
+
+_shared_writers: dict[Path, DebugImageWriter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_debug_writer(output_dir: str | Path) -> DebugImageWriter:
+    """Returns the shared writer of a directory, creating it on first use.
+
+    Every strategy or controller writing to the same directory shares one
+    queue and worker thread. Shared writers are flushed at interpreter exit.
+
+    Args:
+        output_dir: Directory the images are written to.
+
+    Returns:
+        The DebugImageWriter.
+    """
+    key = Path(output_dir).resolve()
+    with _shared_lock:
+        writer = _shared_writers.get(key)
+        if writer is None:
+            writer = _shared_writers[key] = DebugImageWriter(output_dir)
+        return writer
+
+
+@atexit.register
+def _close_shared_writers() -> None:
+    """Writes the snapshots still queued by shared writers."""
+    with _shared_lock:
+        writers = list(_shared_writers.values())
+    for writer in writers:
+        writer.close(timeout=5.0)
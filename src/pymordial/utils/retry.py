@@ -0,0 +1,256 @@
+"""Pluggable retry timing with attempt and latency statistics.
+
+Every retry loop in Pymordial (opening and closing apps, finding elements,
+waiting for BlueStacks) runs through a RetryPolicy, so its timing can be
+changed in one place and measured: each ``run`` records how many attempts
+the operation took and how long it took to succeed, keyed by operation name.
+
+Example:
+    policy = ExponentialRetry(initial=0.1, max_interval=2.0, timeout=10)
+    controller.image.where_element(button, retry_policy=policy)
+    print(get_retry_stats()["image.where_element"])
+"""
+
+import logging
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import TypeVar
+
+from pymordial.utils.deadline import deadline_scope
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class RetryStats:
+    """Outcome counters of one retried operation.
+
+    Attributes:
+        calls: Number of runs.
+        successes: Runs that succeeded.
+        attempts: Attempts made over all runs.
+        max_attempts: Most attempts made by a single run.
+        success_seconds: Total time from start to success, over successful runs.
+        max_success_seconds: Longest time to success.
+    """
+
+    calls: int = 0
+    successes: int = 0
+    attempts: int = 0
+    max_attempts: int = 0
+    success_seconds: float = 0.0
+    max_success_seconds: float = 0.0
+
+    @property
+    def failures(self) -> int:
+        """Runs that gave up."""
+        return self.calls - self.successes
+
+    @property
+    def mean_attempts(self) -> float:
+        """Mean attempts per run."""
+        return self.attempts / self.calls if self.calls else 0.0
+
+    @property
+    def mean_success_seconds(self) -> float:
+        """Mean time to success, in seconds."""
+        return self.success_seconds / self.successes if self.successes else 0.0
+
+
+_stats: dict[str, RetryStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(name: str, attempts: int, succeeded: bool, elapsed: float) -> None:
+    """Adds one run to the statistics of an operation."""
+    with _stats_lock:
+        stats = _stats.setdefault(name, RetryStats())
+        stats.calls += 1
+        stats.attempts += attempts
+        stats.max_attempts = max(stats.max_attempts, attempts)
+        if succeeded:
+            stats.successes += 1
+            stats.success_seconds += elapsed
+            stats.max_success_seconds = max(stats.max_success_seconds, elapsed)
+
+
+def get_retry_stats() -> dict[str, RetryStats]:
+    """Returns a copy of the statistics of every retried operation.
+
+    Returns:
+        RetryStats keyed by operation name (e.g. "adb.open_app").
+    """
+    with _stats_lock:
+        return {name: replace(stats) for name, stats in _stats.items()}
+
+
+def reset_retry_stats() -> None:
+    """Clears the statistics of every retried operation."""
+    with _stats_lock:
+        _stats.clear()
+
+
+@dataclass(frozen=True)
+class RetryPolicy(ABC):
+    """Decides how often and for how long an operation is retried.
+
+    Subclasses define the delay before each retry; attempts stop at
+    ``max_attempts`` or once ``timeout`` seconds have passed, whichever comes
+    first (at least one attempt is always made). The timeout is applied as a
+    deadline scope around the attempts, so retries nested inside them share
+    its budget, and an enclosing ``deadline_scope`` bounds it in turn.
+
+    Attributes:
+        max_attempts: Most attempts, or None for no limit.
+        timeout: Most seconds from the first attempt, or None for no limit.
+        jitter: Random fraction (0 to 1) added to or removed from each delay,
+            so that many bots do not poll in lockstep.
+    """
+
+    max_attempts: int | None = None
+    timeout: float | None = None
+    jitter: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Validates the policy.
+
+        Raises:
+            ValueError: If a limit is not positive or jitter is outside 0 to 1.
+        """
+        if self.max_attempts is not None and self.max_attempts < 1:
+            raise ValueError(f"Max attempts must be positive, got {self.max_attempts}")
+        if self.timeout is not None and self.timeout < 0:
+            raise ValueError(f"Timeout cannot be negative, got {self.timeout}")
+        if not 0.0 <= self.jitter <= 1.0:
+            raise ValueError(f"Jitter must be between 0 and 1, got {self.jitter}")
+
+    @abstractmethod
+    def base_delay(self, attempt: int) -> float:
+        """Returns the delay after a failed attempt, before jitter.
+
+        Args:
+            attempt: Number of the failed attempt, starting at 1.
+
+        Returns:
+            Seconds to wait.
+        """
+
+    def delay(self, attempt: int) -> float:
+        """Returns the jittered delay after a failed attempt.
+
+        Args:
+            attempt: Number of the failed attempt, starting at 1.
+
+        Returns:
+            Seconds to wait.
+        """
+        delay = self.base_delay(attempt)
+        if self.jitter:
+            delay *= 1.0 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+    def with_limits(
+        self, max_attempts: int | None = None, timeout: float | None = None
+    ) -> "RetryPolicy":
+        """Returns a copy whose limits are at most the given ones.
+
+        Args:
+            max_attempts: Attempt limit to apply, or None to keep the policy's.
+            timeout: Time limit to apply, or None to keep the policy's.
+
+        Returns:
+            The bounded policy.
+        """
+        if max_attempts is not None and self.max_attempts is not None:
+            max_attempts = min(max_attempts, self.max_attempts)
+        if timeout is not None and self.timeout is not None:
+            timeout = min(timeout, self.timeout)
+        return replace(
+            self,
+            max_attempts=self.max_attempts if max_attempts is None else max_attempts,
+            timeout=self.timeout if timeout is None else timeout,
+        )
+
+    def run(
+        self,
+        attempt: Callable[[], T],
+        name: str = "retry",
+        until: Callable[[T], bool] = bool,
+    ) -> T:
+        """Calls an operation until it succeeds or the policy gives up.
+
+        Exceptions raised by the operation propagate; catch them inside the
+        operation to retry on errors.
+
+        Args:
+            attempt: The operation, called once per attempt.
+            name: Operation name the statistics are recorded under.
+            until: Decides whether a result is a success. Defaults to truth.
+
+        Returns:
+            The first successful result, or the last result if the policy
+            gave up.
+        """
+        start = time.monotonic()
+        number = 0
+        with deadline_scope(self.timeout) as deadline:
+            while True:
+                number += 1
+                result = attempt()
+                if until(result):
+                    _record(name, number, True, time.monotonic() - start)
+                    return result
+                if self.max_attempts is not None and number >= self.max_attempts:
+                    break
+                delay = self.delay(number)
+                if deadline is not None:
+                    remaining = deadline.remaining()
+                    if remaining <= 0:
+                        break
+                    delay = min(delay, remaining)
+                logger.debug(
+                    f"{name}: attempt {number} failed, retrying in {delay:.2f}s"
+                )
+                time.sleep(delay)
+        _record(name, number, False, time.monotonic() - start)
+        return result
+
+
+@dataclass(frozen=True)
+class FixedRetry(RetryPolicy):
+    """Waits the same interval between attempts.
+
+    Attributes:
+        interval: Seconds between attempts.
+    """
+
+    interval: float = 1.0
+
+    def base_delay(self, attempt: int) -> float:
+        """Returns the fixed interval."""
+        return self.interval
+
+
+@dataclass(frozen=True)
+class ExponentialRetry(RetryPolicy):
+    """Waits ``initial * factor ** (attempt - 1)`` seconds, up to a cap.
+
+    Attributes:
+        initial: Delay after the first failed attempt.
+        factor: Growth factor of each following delay.
+        max_interval: Longest delay.
+    """
+
+    initial: float = 0.05
+    factor: float = 2.0
+    max_interval: float = 1.0
+
+    def base_delay(self, attempt: int) -> float:
+        """Returns the capped exponential delay."""
+        return min(self.initial * self.factor ** (attempt - 1), self.max_interval)
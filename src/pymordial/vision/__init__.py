@@ -0,0 +1,43 @@
+"""Image matching engines for Pymordial.
+
+This module provides detection backends used by the ImageController beyond
+plain template matching.
+"""
+
+from pymordial.vision.bundle import AssetBundle, build_asset_bundle, load_asset_bundle
+from pymordial.vision.features import (
+    FeatureMatch,
+    FeatureSet,
+    extract_features,
+    load_template_features,
+    match_features,
+)
+from pymordial.vision.fingerprint import (
+    FingerprintMatch,
+    ScreenFingerprintIndex,
+    dhash,
+    fingerprint,
+    phash,
+)
+from pymordial.vision.templates import Template, load_template, match_template
+from pymordial.vision.text_regions import TextRegionDetector
+
+__all__ = [
+    "AssetBundle",
+    "FeatureMatch",
+    "FeatureSet",
+    "FingerprintMatch",
+    "ScreenFingerprintIndex",
+    "Template",
+    "TextRegionDetector",
+    "build_asset_bundle",
+    "dhash",
+    "extract_features",
+    "fingerprint",
+    "load_asset_bundle",
+    "load_template",
+    "load_template_features",
+    "match_features",
+    "match_template",
+    "phash",
+]
@@ -0,0 +1,384 @@
+"""Precompiled, memory-mapped bundles of decoded element assets.
+
+A bundle is a single binary file holding the pre-decoded BGR, grayscale and
+mask arrays of every image asset of an app, plus per-asset metadata. It is
+opened with one ``mmap``, so startup does not decode any PNG and processes
+loading the same bundle share its pages through the OS page cache.
+
+Assets are keyed by the image's path relative to the asset root (by default
+the deepest directory holding every bundled image), so elements sharing an
+image (or reusing a label across screens) share one asset, and a bundle
+built on one machine matches the same assets installed anywhere else: a
+filepath finds the asset whose key is its longest trailing part. Each asset
+records the SHA-1 digest of its source file, letting callers detect an image
+that was edited after the bundle was built.
+
+File layout::
+
+    magic (8 bytes) | header length (uint64, little-endian) | JSON header
+    | padding to a 64-byte boundary | raw array data
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pymordial.core.elements.pymordial_image import PymordialImage
+from pymordial.core.pymordial_element import PymordialElement
+from pymordial.vision.templates import Template, decode_template
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_MAGIC = b"PYMBNDL1"
+BUNDLE_VERSION = 2
+BUNDLE_SUFFIX = ".pymb"
+_ALIGNMENT = 64
+_PREFIX = struct.Struct("<8sQ")
+
+
+def _align(offset: int) -> int:
+    """Rounds an offset up to the next alignment boundary."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def asset_key(filepath: str | Path, root: str | Path) -> str:
+    """Returns the bundle key of an image file.
+
+    Args:
+        filepath: Path of the image, as given to the element.
+        root: Asset root the key is relative to.
+
+    Returns:
+        The path relative to root, in POSIX form.
+
+    Raises:
+        ValueError: If the file is not under root.
+    """
+    return Path(filepath).relative_to(root).as_posix()
+
+
+def file_digest(filepath: str | Path) -> str:
+    """Returns the SHA-1 hex digest of a file's contents.
+
+    Args:
+        filepath: Path of the file.
+
+    Returns:
+        The hex digest.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    return hashlib.sha1(Path(filepath).read_bytes()).hexdigest()
+
+
+def build_asset_bundle(
+    elements: Iterable[PymordialElement],
+    output: str | Path,
+    root: str | Path | None = None,
+) -> Path:
+    """Compiles the image assets of several elements into one bundle file.
+
+    Elements that are not PymordialImages are skipped. Elements sharing an
+    image file are stored once; the asset lists every label it was used with.
+    Arrays are stored at the file's native size and scaled at match time,
+    like a decoded PNG, so one asset serves every original resolution.
+
+    Args:
+        elements: Elements to include, keyed in the bundle by their filepath
+            relative to root.
+        output: Path of the bundle to write.
+        root: Asset root of the keys. Defaults to the deepest directory
+            holding every image.
+
+    Returns:
+        The path of the written bundle.
+
+    Raises:
+        ValueError: If an asset cannot be read or is not under root.
+    """
+    images = [element for element in elements if isinstance(element, PymordialImage)]
+    if root is None and images:
+        root = os.path.commonpath(
+            [Path(image.filepath).resolve().parent for image in images]
+        )
+    assets: dict[str, dict[str, Any]] = {}
+    blobs: list[np.ndarray] = []
+    offset = 0
+
+    for element in images:
+        key = asset_key(Path(element.filepath).resolve(), Path(root).resolve())
+        if key in assets:
+            if element.label not in assets[key]["labels"]:
+                assets[key]["labels"].append(element.label)
+            continue
+
+        bgr, gray, mask = decode_template(element.filepath)
+        try:
+            digest = file_digest(element.filepath)
+        except OSError as e:
+            raise ValueError(f"Could not read asset {element.filepath}: {e}") from e
+        arrays: dict[str, dict[str, Any]] = {}
+        for name, array in (("bgr", bgr), ("gray", gray), ("mask", mask)):
+            if array is None:
+                continue
+            array = np.ascontiguousarray(array)
+            arrays[name] = {
+                "offset": offset,
+                "shape": list(array.shape),
+                "dtype": array.dtype.str,
+            }
+            blobs.append(array)
+            offset = _align(offset + array.nbytes)
+
+        assets[key] = {
+            "labels": [element.label],
+            "sha1": digest,
+            "arrays": arrays,
+        }
+
+    header = json.dumps({"version": BUNDLE_VERSION, "assets": assets}).encode()
+    data_start = _align(_PREFIX.size + len(header))
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "wb") as f:
+        f.write(_PREFIX.pack(BUNDLE_MAGIC, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(b"\0" * (_align(f.tell()) - f.tell()))
+            f.write(blob.tobytes())
+        f.write(b"\0" * (data_start + offset - f.tell()))
+
+    logger.info(f"Wrote asset bundle with {len(assets)} asset(s) to {output}")
+    return output
+
+
+class AssetBundle:
+    """Read-only, memory-mapped view of a compiled asset bundle.
+
+    Arrays returned by this class are views into the mapping and must be
+    treated as read-only.
+
+    Attributes:
+        path: Path of the bundle file.
+    """
+
+    def __init__(self, path: str | Path):
+        """Maps a bundle file into memory.
+
+        Args:
+            path: Path of the bundle file.
+
+        Raises:
+            ValueError: If the file is not a valid bundle.
+        """
+        self.path = Path(path)
+        try:
+            self._buffer = np.memmap(self.path, dtype=np.uint8, mode="r")
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not open asset bundle {self.path}: {e}") from e
+
+        if len(self._buffer) < _PREFIX.size:
+            raise ValueError(f"Not an asset bundle: {self.path}")
+        magic, header_length = _PREFIX.unpack(bytes(self._buffer[: _PREFIX.size]))
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not an asset bundle: {self.path}")
+
+        header = json.loads(
+            bytes(self._buffer[_PREFIX.size : _PREFIX.size + header_length])
+        )
+        if header.get("version") != BUNDLE_VERSION:
+            raise ValueError(
+                f"Unsupported asset bundle version {header.get('version')} in {self.path}"
+            )
+        self._assets: dict[str, dict[str, Any]] = header["assets"]
+        self._data_start = _align(_PREFIX.size + header_length)
+        self._templates: dict[tuple[str, tuple[float, float]], Template] = {}
+        # Source files found unchanged, keyed by (path, mtime_ns, size)
+        self._verified: dict[tuple[str, int, int], bool] = {}
+        self._lookups: dict[str, str | None] = {}
+
+    @property
+    def keys(self) -> list[str]:
+        """Root-relative keys of every asset in the bundle."""
+        return list(self._assets)
+
+    def key_for(self, filepath: str | Path) -> str | None:
+        """Returns the key of the asset an image path refers to.
+
+        The key is the longest trailing part of the path that names an
+        asset, so the lookup does not depend on where the assets are
+        installed.
+
+        Args:
+            filepath: The element's image path.
+
+        Returns:
+            The asset key, or None if the bundle has no such asset.
+        """
+        path = str(filepath)
+        if path not in self._lookups:
+            parts = Path(filepath).parts
+            self._lookups[path] = next(
+                (
+                    key
+                    for key in ("/".join(parts[i:]) for i in range(len(parts)))
+                    if key in self._assets
+                ),
+                None,
+            )
+        return self._lookups[path]
+
+    def _asset(self, filepath: str | Path) -> dict[str, Any]:
+        """Returns the stored entry of an asset, raising KeyError if missing."""
+        key = self.key_for(filepath)
+        if key is None:
+            raise KeyError(str(filepath))
+        return self._assets[key]
+
+    def metadata(self, filepath: str | Path) -> dict[str, Any]:
+        """Returns the stored metadata of an asset.
+
+        Args:
+            filepath: The asset's image path.
+
+        Returns:
+            Dictionary with ``labels`` and ``sha1``.
+
+        Raises:
+            KeyError: If the asset is not in the bundle.
+        """
+        asset = self._asset(filepath)
+        return {key: value for key, value in asset.items() if key != "arrays"}
+
+    def matches(self, filepath: str | Path) -> bool:
+        """Checks whether the bundle holds an up-to-date asset for an image.
+
+        The asset must exist for the filepath (see ``key_for``). If the
+        source file is present on disk, its contents must also still match
+        the bundled digest; this check is cached until the file's size or
+        modification time changes.
+
+        Args:
+            filepath: The element's image path.
+
+        Returns:
+            True if the bundled asset can stand in for the file.
+        """
+        key = self.key_for(filepath)
+        if key is None:
+            return False
+        asset = self._assets[key]
+        try:
+            stat = Path(filepath).stat()
+        except OSError:
+            # Deployed without the source images; the bundle is authoritative
+            return True
+        stamp = (str(filepath), stat.st_mtime_ns, stat.st_size)
+        if stamp not in self._verified:
+            try:
+                fresh = file_digest(filepath) == asset["sha1"]
+            except OSError:
+                fresh = True
+            if not fresh:
+                logger.warning(f"{filepath} changed since {self.path} was built")
+            self._verified[stamp] = fresh
+        return self._verified[stamp]
+
+    def _array(self, filepath: str | Path, name: str) -> np.ndarray | None:
+        """Returns a zero-copy view of one stored array."""
+        spec = self._asset(filepath)["arrays"].get(name)
+        if spec is None:
+            return None
+        dtype = np.dtype(spec["dtype"])
+        start = self._data_start + spec["offset"]
+        count = int(np.prod(spec["shape"]))
+        return (
+            self._buffer[start : start + count * dtype.itemsize]
+            .view(dtype)
+            .reshape(spec["shape"])
+        )
+
+    def gray(self, filepath: str | Path) -> np.ndarray:
+        """Returns the grayscale array of an asset."""
+        return self._array(filepath, "gray")
+
+    def bgr(self, filepath: str | Path) -> np.ndarray:
+        """Returns the BGR array of an asset."""
+        return self._array(filepath, "bgr")
+
+    def mask(self, filepath: str | Path) -> np.ndarray | None:
+        """Returns the alpha mask of an asset, or None if it is opaque."""
+        return self._array(filepath, "mask")
+
+    def template(
+        self, filepath: str | Path, scale: tuple[float, float] = (1.0, 1.0)
+    ) -> Template:
+        """Returns the asset as a matching Template, cached per scale.
+
+        Args:
+            filepath: The asset's image path.
+            scale: (x, y) factors applied to the template size.
+
+        Returns:
+            The Template.
+
+        Raises:
+            KeyError: If the asset is not in the bundle.
+        """
+        key = (self.key_for(filepath), (float(scale[0]), float(scale[1])))
+        if key[0] is None:
+            raise KeyError(str(filepath))
+        if key not in self._templates:
+            base = Template(gray=self.gray(filepath), mask=self.mask(filepath))
+            self._templates[key] = base.scaled(key[1])
+        return self._templates[key]
+
+    def __contains__(self, filepath: object) -> bool:
+        """Returns whether the bundle holds an asset for the filepath."""
+        if not isinstance(filepath, (str, Path)):
+            return False
+        return self.key_for(filepath) is not None
+
+    def __len__(self) -> int:
+        """Returns the number of assets in the bundle."""
+        return len(self._assets)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the bundle."""
+        return f"AssetBundle(path='{self.path}', assets={len(self)})"
+
+
+@lru_cache(maxsize=None)
+def _load_asset_bundle(path: str, mtime_ns: int) -> AssetBundle:
+    """Cached loader keyed by path and modification time."""
+    return AssetBundle(path)
+
+
+def load_asset_bundle(path: str | Path) -> AssetBundle:
+    """Opens a bundle, reusing the existing mapping if it is already open.
+
+    Args:
+        path: Path of the bundle file.
+
+    Returns:
+        The AssetBundle.
+
+    Raises:
+        ValueError: If the file is missing or not a valid bundle.
+    """
+    path = Path(path).resolve()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError as e:
+        raise ValueError(f"Could not open asset bundle {path}: {e}") from e
+    return _load_asset_bundle(str(path), mtime_ns)
@@ -0,0 +1,242 @@
+"""Keypoint and descriptor matching for scaled, rotated or animated elements."""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from pymordial.utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Feature Matching Configuration ---
+DEFAULT_DETECTOR = _CONFIG["vision"]["features"]["detector"]
+ORB_MAX_FEATURES = _CONFIG["vision"]["features"]["orb_max_features"]
+DEFAULT_RATIO_TEST = _CONFIG["vision"]["features"]["ratio_test"]
+DEFAULT_MIN_MATCHES = _CONFIG["vision"]["features"]["min_matches"]
+RANSAC_REPROJ_THRESHOLD = _CONFIG["vision"]["features"]["ransac_reproj_threshold"]
+
+SUPPORTED_DETECTORS = ("orb", "akaze")
+TEMPLATE_CACHE_SIZE = 256
+# ORB ignores a 31px band along image edges; padding keeps small UI assets usable
+DETECTION_BORDER = 32
+
+
+@dataclass(frozen=True)
+class FeatureSet:
+    """Keypoints and binary descriptors extracted from one image.
+
+    Attributes:
+        points: (N, 2) float32 array of keypoint coordinates.
+        descriptors: (N, D) uint8 descriptor array, or None if no keypoints
+            were found.
+        size: (width, height) of the source image.
+    """
+
+    points: np.ndarray
+    descriptors: np.ndarray | None
+    size: tuple[int, int]
+
+    def __len__(self) -> int:
+        """Returns the number of keypoints."""
+        return len(self.points)
+
+
+@dataclass(frozen=True)
+class FeatureMatch:
+    """Location of a template found by feature matching.
+
+    Attributes:
+        box: (left, top, width, height) bounding box of the projected template.
+        center: (x, y) center of the projected template.
+        inliers: Number of descriptor matches consistent with the homography.
+        inlier_ratio: Fraction of ratio-test matches that are inliers.
+    """
+
+    box: tuple[int, int, int, int]
+    center: tuple[int, int]
+    inliers: int
+    inlier_ratio: float
+
+
+def create_detector(detector: str = DEFAULT_DETECTOR) -> cv2.Feature2D:
+    """Creates a binary-descriptor keypoint detector.
+
+    Args:
+        detector: "orb" or "akaze".
+
+    Returns:
+        The OpenCV detector instance.
+
+    Raises:
+        ValueError: If the detector name is not supported.
+    """
+    match detector:
+        case "orb":
+            return cv2.ORB_create(nfeatures=ORB_MAX_FEATURES)
+        case "akaze":
+            # AKAZE moved to the contrib modules in OpenCV 5
+            akaze_create = getattr(cv2, "AKAZE_create", None)
+            if akaze_create is None:
+                raise ValueError(
+                    "The 'akaze' detector is not available in this OpenCV build"
+                )
+            return akaze_create()
+        case _:
+            raise ValueError(
+                f"Unsupported detector '{detector}'. Expected one of {SUPPORTED_DETECTORS}"
+            )
+
+
+def extract_features(gray: np.ndarray, detector: str = DEFAULT_DETECTOR) -> FeatureSet:
+    """Detects keypoints and computes descriptors on a grayscale image.
+
+    The image is padded before detection so keypoints close to its edges
+    (most of a small button asset) are not discarded.
+
+    Args:
+        gray: Single-channel uint8 image.
+        detector: "orb" or "akaze".
+
+    Returns:
+        The extracted FeatureSet, with coordinates relative to ``gray``.
+    """
+    padded = cv2.copyMakeBorder(
+        gray,
+        DETECTION_BORDER,
+        DETECTION_BORDER,
+        DETECTION_BORDER,
+        DETECTION_BORDER,
+        cv2.BORDER_REPLICATE,
+    )
+    keypoints, descriptors = create_detector(detector).detectAndCompute(padded, None)
+    points = np.array([kp.pt for kp in keypoints], dtype=np.float32).reshape(-1, 2)
+    points -= DETECTION_BORDER
+    height, width = gray.shape[:2]
+
+    inside = (
+        (points[:, 0] >= 0)
+        & (points[:, 1] >= 0)
+        & (points[:, 0] < width)
+        & (points[:, 1] < height)
+    )
+    if descriptors is not None and not inside.all():
+        points, descriptors = points[inside], descriptors[inside]
+    return FeatureSet(points=points, descriptors=descriptors, size=(width, height))
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _load_template_features(path: str, mtime_ns: int, detector: str) -> FeatureSet:
+    """Cached loader keyed by path, modification time and detector."""
+    gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        raise ValueError(f"Could not read template image from {path}")
+    features = extract_features(gray, detector)
+    logger.debug(f"Computed {len(features)} {detector} keypoints for template {path}")
+    return features
+
+
+def load_template_features(
+    filepath: str | Path, detector: str = DEFAULT_DETECTOR
+) -> FeatureSet:
+    """Returns the template's descriptors, computing them once per asset.
+
+    The cache is invalidated automatically when the file on disk changes.
+
+    Args:
+        filepath: Path to the template image.
+        detector: "orb" or "akaze".
+
+    Returns:
+        The template's FeatureSet.
+
+    Raises:
+        ValueError: If the image cannot be read.
+    """
+    path = Path(filepath)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError as e:
+        raise ValueError(f"Could not read template image from {path}: {e}") from e
+    return _load_template_features(str(path), mtime_ns, detector)
+
+
+def clear_template_cache() -> None:
+    """Drops all cached template descriptors."""
+    _load_template_features.cache_clear()
+
+
+def match_features(
+    template: FeatureSet,
+    scene: FeatureSet,
+    ratio_test: float = DEFAULT_RATIO_TEST,
+    min_matches: int = DEFAULT_MIN_MATCHES,
+    min_inlier_ratio: float = 0.0,
+) -> FeatureMatch | None:
+    """Locates a template in a scene by descriptor matching and homography.
+
+    Descriptors are matched with a brute-force Hamming index, filtered with
+    Lowe's ratio test, and the surviving matches are fitted with a RANSAC
+    homography. The template outline is projected into the scene to produce
+    the bounding box.
+
+    Args:
+        template: Features of the template image.
+        scene: Features of the image to search.
+        ratio_test: Maximum best/second-best distance ratio for a match.
+        min_matches: Minimum number of homography inliers.
+        min_inlier_ratio: Minimum fraction of ratio-test matches that must be
+            inliers.
+
+    Returns:
+        The FeatureMatch, or None if the template was not found.
+    """
+    if (
+        template.descriptors is None
+        or scene.descriptors is None
+        or len(template) < 2
+        or len(scene) < 2
+    ):
+        return None
+
+    matcher = cv2.BFMatcher(cv2.NORM_HAMMING)
+    knn = matcher.knnMatch(template.descriptors, scene.descriptors, k=2)
+    good = [
+        pair[0]
+        for pair in knn
+        if len(pair) == 2 and pair[0].distance < ratio_test * pair[1].distance
+    ]
+    if len(good) < max(min_matches, 4):
+        return None
+
+    src = template.points[[m.queryIdx for m in good]].reshape(-1, 1, 2)
+    dst = scene.points[[m.trainIdx for m in good]].reshape(-1, 1, 2)
+    homography, mask = cv2.findHomography(src, dst, cv2.RANSAC, RANSAC_REPROJ_THRESHOLD)
+    if homography is None:
+        return None
+
+    inliers = int(mask.sum())
+    inlier_ratio = inliers / len(good)
+    if inliers < min_matches or inlier_ratio < min_inlier_ratio:
+        return None
+
+    width, height = template.size
+    corners = np.float32([[0, 0], [width, 0], [width, height], [0, height]])
+    quad = cv2.perspectiveTransform(corners.reshape(-1, 1, 2), homography)
+    # A degenerate homography folds the outline over itself
+    if not cv2.isContourConvex(quad):
+        return None
+
+    left, top, box_width, box_height = cv2.boundingRect(quad)
+    center_x, center_y = quad.reshape(-1, 2).mean(axis=0)
+    return FeatureMatch(
+        box=(left, top, box_width, box_height),
+        center=(int(center_x), int(center_y)),
+        inliers=inliers,
+        inlier_ratio=inlier_ratio,
+    )
@@ -0,0 +1,245 @@
+"""Perceptual-hash fingerprints for identifying the visible screen."""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import cv2
+import numpy as np
+
+from pymordial.core.frame import Frame
+from pymordial.utils.config import get_config
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from pymordial.core.pymordial_screen import PymordialScreen
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Fingerprint Configuration ---
+DEFAULT_METHOD = _CONFIG["vision"]["fingerprint"]["method"]
+DEFAULT_MAX_DISTANCE = _CONFIG["vision"]["fingerprint"]["max_distance"]
+
+SUPPORTED_METHODS = ("dhash", "phash")
+HASH_BITS = 64
+_HASH_SIDE = 8
+_PHASH_SIDE = 32
+
+
+def dhash(gray: np.ndarray) -> int:
+    """Computes a 64-bit difference hash of a grayscale image.
+
+    Args:
+        gray: Single-channel uint8 image.
+
+    Returns:
+        The hash as an unsigned 64-bit integer.
+    """
+    small = cv2.resize(gray, (_HASH_SIDE + 1, _HASH_SIDE), interpolation=cv2.INTER_AREA)
+    return _pack_bits(small[:, 1:] > small[:, :-1])
+
+
+def phash(gray: np.ndarray) -> int:
+    """Computes a 64-bit DCT perceptual hash of a grayscale image.
+
+    Args:
+        gray: Single-channel uint8 image.
+
+    Returns:
+        The hash as an unsigned 64-bit integer.
+    """
+    small = cv2.resize(gray, (_PHASH_SIDE, _PHASH_SIDE), interpolation=cv2.INTER_AREA)
+    low = cv2.dct(np.float32(small))[:_HASH_SIDE, :_HASH_SIDE]
+    # Exclude the DC term so overall brightness does not dominate the median
+    return _pack_bits(low > np.median(low.flatten()[1:]))
+
+
+def _pack_bits(bits: np.ndarray) -> int:
+    """Packs a boolean array of 64 bits into an integer."""
+    return int(np.packbits(bits.flatten()).view(">u8")[0])
+
+
+_HASHERS = {"dhash": dhash, "phash": phash}
+
+
+def fingerprint(
+    image: "Frame | bytes | np.ndarray | Image.Image | Path | str",
+    method: str = DEFAULT_METHOD,
+) -> int:
+    """Computes the perceptual hash of an image, caching it on Frames.
+
+    Args:
+        image: The image to hash.
+        method: "dhash" or "phash".
+
+    Returns:
+        The hash as an unsigned 64-bit integer.
+
+    Raises:
+        ValueError: If the method is not supported.
+    """
+    if method not in _HASHERS:
+        raise ValueError(
+            f"Unsupported fingerprint method '{method}'. Expected one of {SUPPORTED_METHODS}"
+        )
+    frame = Frame.from_image(image)
+    return frame.cached(("fingerprint", method), lambda: _HASHERS[method](frame.gray))
+
+
+@dataclass(frozen=True)
+class FingerprintMatch:
+    """Result of a fingerprint lookup.
+
+    Attributes:
+        name: Name of the matching screen.
+        distance: Hamming distance between the frame and the closest reference.
+        confidence: ``1 - distance / 64``.
+    """
+
+    name: str
+    distance: int
+    confidence: float
+
+
+class ScreenFingerprintIndex:
+    """Compact index of reference-screenshot hashes for instant screen lookup.
+
+    Hashes are stored in one ``uint64`` array, so identifying a frame is a
+    single vectorized XOR and popcount over every reference screenshot.
+
+    Attributes:
+        method: The hash method ("dhash" or "phash").
+        max_distance: Maximum Hamming distance accepted as a match.
+    """
+
+    def __init__(
+        self,
+        method: str = DEFAULT_METHOD,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+    ):
+        """Initializes an empty index.
+
+        Args:
+            method: The hash method ("dhash" or "phash").
+            max_distance: Maximum Hamming distance (0-64) accepted as a match.
+
+        Raises:
+            ValueError: If the method or max_distance is invalid.
+        """
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(
+                f"Unsupported fingerprint method '{method}'. Expected one of {SUPPORTED_METHODS}"
+            )
+        if not (0 <= max_distance <= HASH_BITS):
+            raise ValueError(
+                f"Max distance must be between 0 and {HASH_BITS}, got {max_distance}"
+            )
+        self.method = method
+        self.max_distance = max_distance
+        self._names: list[str] = []
+        self._hashes: np.ndarray = np.empty(0, dtype=np.uint64)
+
+    @classmethod
+    def from_screens(
+        cls,
+        screens: "Iterable[PymordialScreen]",
+        method: str = DEFAULT_METHOD,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+    ) -> "ScreenFingerprintIndex":
+        """Builds an index from the reference images of several screens.
+
+        Args:
+            screens: Screens whose ``reference_images`` should be indexed.
+            method: The hash method.
+            max_distance: Maximum Hamming distance accepted as a match.
+
+        Returns:
+            The populated index.
+        """
+        index = cls(method=method, max_distance=max_distance)
+        for screen in screens:
+            index.add_screen(screen)
+        return index
+
+    def add(
+        self,
+        name: str,
+        image: "Frame | bytes | np.ndarray | Image.Image | Path | str",
+    ) -> None:
+        """Adds one reference screenshot for a screen.
+
+        Args:
+            name: Screen name returned on match.
+            image: The reference screenshot.
+        """
+        value = np.array([fingerprint(image, self.method)], dtype=np.uint64)
+        self._hashes = np.concatenate([self._hashes, value])
+        self._names.append(name)
+
+    def add_screen(self, screen: "PymordialScreen") -> None:
+        """Adds every reference image of a screen.
+
+        Args:
+            screen: The screen to index.
+        """
+        for reference in screen.reference_images:
+            self.add(screen.name, reference)
+        logger.debug(
+            f"Indexed {len(screen.reference_images)} reference image(s) for screen '{screen.name}'"
+        )
+
+    def distances(
+        self, image: "Frame | bytes | np.ndarray | Image.Image | Path | str"
+    ) -> np.ndarray:
+        """Returns the Hamming distance from the image to every reference.
+
+        Args:
+            image: The frame to compare.
+
+        Returns:
+            Array of distances aligned with insertion order.
+        """
+        value = np.uint64(fingerprint(image, self.method))
+        return np.bitwise_count(self._hashes ^ value)
+
+    def match(
+        self, image: "Frame | bytes | np.ndarray | Image.Image | Path | str"
+    ) -> FingerprintMatch | None:
+        """Identifies the screen showing in a frame.
+
+        Args:
+            image: The live frame.
+
+        Returns:
+            The closest FingerprintMatch within ``max_distance``, or None.
+        """
+        if not self._names:
+            return None
+        distances = self.distances(image)
+        best = int(np.argmin(distances))
+        distance = int(distances[best])
+        if distance > self.max_distance:
+            return None
+        return FingerprintMatch(
+            name=self._names[best],
+            distance=distance,
+            confidence=1 - distance / HASH_BITS,
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of indexed reference images."""
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the index."""
+        return (
+            f"ScreenFingerprintIndex("
+            f"method='{self.method}', "
+            f"screens={len(set(self._names))}, "
+            f"references={len(self._names)})"
+        )
@@ -0,0 +1,226 @@
+"""Template matching with alpha-channel masks for non-rectangular assets."""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_CACHE_SIZE = 256
+# Best masked-correlation peaks checked with the zero-mean score
+MASKED_VERIFY_CANDIDATES = 5
+
+
+@dataclass(frozen=True)
+class Template:
+    """A decoded template image ready for matching.
+
+    Attributes:
+        gray: Single-channel uint8 template.
+        mask: uint8 mask (255 = compare, 0 = ignore) built from the PNG alpha
+            channel, or None if the template is fully opaque.
+    """
+
+    gray: np.ndarray
+    mask: np.ndarray | None
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """The (width, height) of the template."""
+        height, width = self.gray.shape[:2]
+        return (width, height)
+
+    @property
+    def is_masked(self) -> bool:
+        """Whether the template carries an alpha mask."""
+        return self.mask is not None
+
+    def scaled(self, scale: tuple[float, float]) -> "Template":
+        """Returns the template resized by (x, y) factors.
+
+        Args:
+            scale: (x, y) factors applied to the template size.
+
+        Returns:
+            The resized Template, or this template if the scale is (1, 1).
+        """
+        if tuple(scale) == (1.0, 1.0):
+            return self
+        width, height = self.size
+        size = (max(1, int(width * scale[0])), max(1, int(height * scale[1])))
+        mask = None
+        if self.mask is not None:
+            mask = cv2.resize(self.mask, size, interpolation=cv2.INTER_NEAREST)
+        return Template(
+            gray=cv2.resize(self.gray, size, interpolation=cv2.INTER_AREA), mask=mask
+        )
+
+
+def decode_template(
+    path: str | Path,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Decodes a template image into BGR, grayscale and alpha-mask arrays.
+
+    Args:
+        path: Path to the template image.
+
+    Returns:
+        (bgr, gray, mask) uint8 arrays. ``mask`` is None for fully opaque
+        images.
+
+    Raises:
+        ValueError: If the image cannot be read.
+    """
+    image = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise ValueError(f"Could not read template image from {path}")
+    if image.dtype != np.uint8:
+        image = cv2.convertScaleAbs(image, alpha=255 / np.iinfo(image.dtype).max)
+
+    mask = None
+    if image.ndim == 2:
+        bgr = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+    elif image.shape[2] == 4:
+        bgr = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+        alpha = image[:, :, 3]
+        # Fully opaque PNGs match faster without a mask
+        if (alpha < 255).any():
+            mask = np.where(alpha > 0, 255, 0).astype(np.uint8)
+    else:
+        bgr = image
+    gray = image if image.ndim == 2 else cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    return bgr, gray, mask
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _load_template(path: str, mtime_ns: int, scale: tuple[float, float]) -> Template:
+    """Cached loader keyed by path, modification time and scale."""
+    _, gray, mask = decode_template(path)
+    logger.debug(f"Loaded template {path} at scale {scale} (masked={mask is not None})")
+    return Template(gray=gray, mask=mask).scaled(scale)
+
+
+def load_template(
+    filepath: str | Path, scale: tuple[float, float] = (1.0, 1.0)
+) -> Template:
+    """Returns the decoded, scaled and masked template, cached per asset.
+
+    The cache is invalidated automatically when the file on disk changes.
+
+    Args:
+        filepath: Path to the template image.
+        scale: (x, y) factors applied to the template size.
+
+    Returns:
+        The Template.
+
+    Raises:
+        ValueError: If the image cannot be read.
+    """
+    path = Path(filepath)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError as e:
+        raise ValueError(f"Could not read template image from {path}: {e}") from e
+    return _load_template(str(path), mtime_ns, (float(scale[0]), float(scale[1])))
+
+
+def clear_template_cache() -> None:
+    """Drops all cached templates."""
+    _load_template.cache_clear()
+
+
+def masked_zncc(window: np.ndarray, template: Template) -> float:
+    """Scores a window against a masked template by zero-mean correlation.
+
+    This is ``TM_CCOEFF_NORMED`` restricted to the opaque pixels, so it is
+    on the same scale as the score of unmasked templates. Flat templates,
+    for which correlation is undefined, are scored by mean absolute
+    difference instead.
+
+    Args:
+        window: Grayscale window the size of the template.
+        template: A masked template.
+
+    Returns:
+        The score, from -1.0 to 1.0.
+    """
+    opaque = template.mask > 0
+    patch = window[opaque].astype(np.float32)
+    needle = template.gray[opaque].astype(np.float32)
+    patch -= patch.mean()
+    needle -= needle.mean()
+    needle_energy = float(np.dot(needle, needle))
+    if needle_energy == 0.0:
+        difference = window[opaque].astype(np.int16) - template.gray[opaque]
+        return 1.0 - float(np.abs(difference).mean()) / 255
+    patch_energy = float(np.dot(patch, patch))
+    if patch_energy == 0.0:
+        return 0.0
+    return float(np.dot(patch, needle)) / float(np.sqrt(patch_energy * needle_energy))
+
+
+def match_template(
+    template: Template,
+    haystack: np.ndarray,
+    confidence: float,
+    region: tuple[int, int, int, int] | None = None,
+) -> tuple[int, int, int, int] | None:
+    """Finds the best match of a template in a grayscale image.
+
+    Masked templates are located with ``TM_CCORR_NORMED`` over the opaque
+    pixels only, so the background behind a round or irregular asset does
+    not lower the score. That score runs high even on unrelated content, so
+    the ``MASKED_VERIFY_CANDIDATES`` best peaks are re-scored with
+    ``masked_zncc`` and the first to reach ``confidence`` on that scale wins. Unmasked templates use
+    ``TM_CCOEFF_NORMED``, the same method as ``pyscreeze``. Confidences
+    therefore mean the same for masked and unmasked templates.
+
+    Args:
+        template: The template to find.
+        haystack: Single-channel uint8 image to search.
+        confidence: Minimum score (0.0 to 1.0) for a match.
+        region: Optional (left, top, right, bottom) area to search in.
+
+    Returns:
+        (left, top, width, height) of the best match, or None if no location
+        reaches ``confidence``.
+    """
+    left, top = 0, 0
+    if region:
+        left, top = int(region[0]), int(region[1])
+        haystack = haystack[top : int(region[3]), left : int(region[2])]
+
+    width, height = template.size
+    if haystack.shape[0] < height or haystack.shape[1] < width:
+        return None
+
+    if template.is_masked:
+        scores = cv2.matchTemplate(
+            haystack, template.gray, cv2.TM_CCORR_NORMED, mask=template.mask
+        )
+        # Zero-variance windows produce inf/nan under a mask
+        scores = np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0)
+        for _ in range(MASKED_VERIFY_CANDIDATES):
+            _, peak, _, (x, y) = cv2.minMaxLoc(scores)
+            if peak <= 0.0:
+                return None
+            window = haystack[y : y + height, x : x + width]
+            if masked_zncc(window, template) >= confidence:
+                return (left + x, top + y, width, height)
+            # Suppress this peak and its neighbourhood
+            scores[
+                max(0, y - height // 2) : y + height // 2 + 1,
+                max(0, x - width // 2) : x + width // 2 + 1,
+            ] = 0.0
+        return None
+
+    scores = cv2.matchTemplate(haystack, template.gray, cv2.TM_CCOEFF_NORMED)
+    _, best_score, _, (x, y) = cv2.minMaxLoc(scores)
+    if best_score < confidence:
+        return None
+    return (left + x, top + y, width, height)
@@ -0,0 +1,239 @@
+"""Fast text-region proposals that restrict OCR to candidate areas.
+
+Text strokes have strong, dense local contrast. The detector takes the
+morphological gradient of a downscaled grayscale frame, binarizes it, joins
+neighbouring characters with a horizontal closing and keeps the connected
+components shaped like words or lines. It runs in a few milliseconds on a
+1080p frame, so OCR only sees the small fraction of the screen holding text.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from pymordial.core.frame import Frame
+from pymordial.utils.config import get_config
+from pymordial.vision.fingerprint import fingerprint
+
+logger = logging.getLogger(__name__)
+
+_CONFIG = get_config()
+
+# --- Text Detection Configuration ---
+_TEXT_DETECTION = _CONFIG["vision"]["text_detection"]
+DEFAULT_DETECTION_WIDTH = _TEXT_DETECTION["detection_width"]
+DEFAULT_CLOSE_WIDTH = _TEXT_DETECTION["close_width"]
+DEFAULT_MIN_HEIGHT = _TEXT_DETECTION["min_height"]
+DEFAULT_MAX_HEIGHT = _TEXT_DETECTION["max_height"]
+DEFAULT_MIN_WIDTH = _TEXT_DETECTION["min_width"]
+DEFAULT_MIN_FILL_RATIO = _TEXT_DETECTION["min_fill_ratio"]
+DEFAULT_PADDING = _TEXT_DETECTION["padding"]
+DEFAULT_CACHE_SIZE = _TEXT_DETECTION["cache_size"]
+DEFAULT_MAX_DISTANCE = _TEXT_DETECTION["max_distance"]
+
+
+def _merge_overlapping(
+    boxes: list[tuple[int, int, int, int]],
+) -> list[tuple[int, int, int, int]]:
+    """Merges (left, top, right, bottom) boxes until none overlap."""
+    merged = sorted(boxes)
+    changed = True
+    while changed:
+        changed = False
+        result: list[tuple[int, int, int, int]] = []
+        for box in merged:
+            for i, other in enumerate(result):
+                if (
+                    box[0] < other[2]
+                    and other[0] < box[2]
+                    and box[1] < other[3]
+                    and other[1] < box[3]
+                ):
+                    result[i] = (
+                        min(box[0], other[0]),
+                        min(box[1], other[1]),
+                        max(box[2], other[2]),
+                        max(box[3], other[3]),
+                    )
+                    changed = True
+                    break
+            else:
+                result.append(box)
+        merged = result
+    # Reading order: top to bottom, then left to right
+    return sorted(merged, key=lambda box: (box[1], box[0]))
+
+
+class TextRegionDetector:
+    """Proposes (left, top, right, bottom) boxes likely to contain text.
+
+    Results are memoized on each Frame and, optionally, per screen: frames
+    whose perceptual fingerprints are within ``max_distance`` bits of an
+    earlier frame reuse its regions, since a screen's text layout rarely
+    moves while its values change.
+
+    Attributes:
+        detection_width: Frames wider than this are downscaled for detection.
+        close_width: Width of the horizontal kernel joining characters.
+        min_height: Smallest text height kept, in full-frame pixels.
+        max_height: Largest text height kept, in full-frame pixels.
+        min_width: Smallest region width kept, in full-frame pixels.
+        min_fill_ratio: Smallest fraction of edge pixels inside a region.
+        padding: Pixels added around every region.
+        cache_size: Number of screens whose regions are remembered; 0
+            disables per-screen caching.
+        max_distance: Largest fingerprint Hamming distance treated as the
+            same screen.
+    """
+
+    def __init__(
+        self,
+        detection_width: int = DEFAULT_DETECTION_WIDTH,
+        close_width: int = DEFAULT_CLOSE_WIDTH,
+        min_height: int = DEFAULT_MIN_HEIGHT,
+        max_height: int = DEFAULT_MAX_HEIGHT,
+        min_width: int = DEFAULT_MIN_WIDTH,
+        min_fill_ratio: float = DEFAULT_MIN_FILL_RATIO,
+        padding: int = DEFAULT_PADDING,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+    ):
+        """Initializes the detector.
+
+        Args:
+            detection_width: Frames wider than this are downscaled for
+                detection.
+            close_width: Width of the horizontal kernel joining characters.
+            min_height: Smallest text height kept, in full-frame pixels.
+            max_height: Largest text height kept, in full-frame pixels.
+            min_width: Smallest region width kept, in full-frame pixels.
+            min_fill_ratio: Smallest fraction of edge pixels inside a region.
+            padding: Pixels added around every region.
+            cache_size: Number of screens whose regions are remembered; 0
+                disables per-screen caching.
+            max_distance: Largest fingerprint Hamming distance treated as the
+                same screen.
+
+        Raises:
+            ValueError: If a size is not positive or cache_size is negative.
+        """
+        if detection_width < 1 or close_width < 1:
+            raise ValueError("Detection width and close width must be positive")
+        if cache_size < 0:
+            raise ValueError(f"Cache size cannot be negative, got {cache_size}")
+        self.detection_width = detection_width
+        self.close_width = close_width
+        self.min_height = min_height
+        self.max_height = max_height
+        self.min_width = min_width
+        self.min_fill_ratio = min_fill_ratio
+        self.padding = padding
+        self.cache_size = cache_size
+        self.max_distance = max_distance
+        self._screens: OrderedDict[int, list[tuple[int, int, int, int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def detect(
+        self, image: "Frame | bytes | np.ndarray | Path | str"
+    ) -> list[tuple[int, int, int, int]]:
+        """Returns the candidate text regions of an image.
+
+        Args:
+            image: The screen image.
+
+        Returns:
+            (left, top, right, bottom) regions in reading order.
+        """
+        frame = Frame.from_image(image)
+        return frame.cached(
+            ("text_regions", id(self)), lambda: self._detect_cached(frame)
+        )
+
+    def _detect_cached(self, frame: Frame) -> list[tuple[int, int, int, int]]:
+        """Looks the frame's screen up in the cache before detecting."""
+        if not self.cache_size:
+            return self.detect_uncached(frame.gray)
+
+        key = fingerprint(frame, method="dhash")
+        with self._lock:
+            for screen, regions in self._screens.items():
+                if (screen ^ key).bit_count() <= self.max_distance:
+                    self._screens.move_to_end(screen)
+                    return regions
+
+        regions = self.detect_uncached(frame.gray)
+        with self._lock:
+            self._screens[key] = regions
+            while len(self._screens) > self.cache_size:
+                self._screens.popitem(last=False)
+        return regions
+
+    def detect_uncached(self, gray: np.ndarray) -> list[tuple[int, int, int, int]]:
+        """Runs detection on a grayscale image, bypassing every cache.
+
+        Args:
+            gray: Grayscale image.
+
+        Returns:
+            (left, top, right, bottom) regions in reading order.
+        """
+        height, width = gray.shape[:2]
+        scale = min(1.0, self.detection_width / width)
+        small = (
+            cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            if scale < 1.0
+            else gray
+        )
+
+        gradient = cv2.morphologyEx(
+            small,
+            cv2.MORPH_GRADIENT,
+            cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)),
+        )
+        _, edges = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        close_width = max(1, round(self.close_width * scale))
+        joined = cv2.morphologyEx(
+            edges,
+            cv2.MORPH_CLOSE,
+            cv2.getStructuringElement(cv2.MORPH_RECT, (close_width, 1)),
+        )
+        # Components, not external contours: text inside a bordered panel
+        # must not be swallowed by the panel outline
+        _, _, stats, _ = cv2.connectedComponentsWithStats(joined, connectivity=8)
+
+        boxes = []
+        for x, y, w, h, _ in stats[1:]:
+            if not (self.min_height <= h / scale <= self.max_height):
+                continue
+            if w / scale < self.min_width:
+                continue
+            fill = cv2.countNonZero(edges[y : y + h, x : x + w]) / (w * h)
+            if fill < self.min_fill_ratio:
+                continue
+            boxes.append(
+                (
+                    max(0, int(x / scale) - self.padding),
+                    max(0, int(y / scale) - self.padding),
+                    min(width, int(np.ceil((x + w) / scale)) + self.padding),
+                    min(height, int(np.ceil((y + h) / scale)) + self.padding),
+                )
+            )
+        regions = _merge_overlapping(boxes)
+        logger.debug(f"Detected {len(regions)} text region(s)")
+        return regions
+
+    def clear_cache(self) -> None:
+        """Forgets the regions of every remembered screen."""
+        with self._lock:
+            self._screens.clear()
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the detector."""
+        return (
+            f"TextRegionDetector(detection_width={self.detection_width}, "
+            f"screens={len(self._screens)}/{self.cache_size})"
+        )
@@ -46,6 +46,7 @@ def mock_config():
             "window_title": "BlueStacks App Player",
             "default_transport_timeout_s": 30,
             "wait_for_load_timeout": 60,
+            "ui_settle_time": 5,
             "hd_player_exe": "HD-Player.exe",
             "resolution": [1280, 720],
             "default_max_retries": 3,
@@ -56,14 +57,28 @@ def mock_config():
             "default_click_times": 1,
             "default_max_tries": 3,
             "click_coord_times": 1,
+            "wait": {
+                "timeout": 10.0,
+                "initial_interval": 0.05,
+                "max_interval": 1.0,
+                "backoff": 1.5,
+            },
         },
         "app": {
             "action_timeout": 60,
             "action_wait_time": 10,
+            "screen_detection": {
+                "max_signature_elements": 3,
+                "min_confidence": 0.75,
+            },
         },
         "image_controller": {
             "default_find_ui_retries": 3,
         },
+        "text_controller": {
+            "ocr_cache_size": 256,
+            "match_min_score": 0.8,
+        },
         "element": {
             "default_confidence": 0.9,
             "pixel_size": [10, 10],
@@ -77,6 +92,24 @@ def mock_config():
                 "threshold_binary_max": 255,
                 "inversion_threshold_mean": 127,
                 "tesseract_config": "--oem 3 --psm 6",
+                "fast": {
+                    "denoise": "median",
+                    "target_text_height": 32,
+                    "min_upscale": 1.0,
+                    "max_upscale": 4.0,
+                    "median_kernel": 3,
+                    "bilateral_diameter": 5,
+                    "bilateral_sigma": 50,
+                },
+            },
+            "pipeline": {"cache_size": 8},
+            "autotune": {
+                "target_accuracy": 0.95,
+                "upscale_factors": [None, 1.0, 2.0, 3.0],
+                "denoise_methods": ["none", "median", "nlmeans"],
+                "threshold_methods": ["otsu", "adaptive"],
+                "psm_modes": [7, 6],
+                "whitelist_chars": "/:%.-+",
             },
             "revomon": {
                 "padding_value_white": 255,
@@ -97,11 +130,32 @@ def mock_config():
             "tesseract": {
                 "default_config": "--oem 3 --psm 6",
                 "base_config": "--oem 3",
+                "language": "eng",
+                "tessdata_dir": "",
+                "api_pool_size": 4,
+                "batch": {"separator": 24, "padding": 10},
                 "psm": {"single_word": 8, "single_line": 7, "block": 6},
             },
         },
-        "easyocr": {"default_languages": ["en"]},
+        "easyocr": {
+            "default_languages": ["en"],
+            "gpu": True,
+            "quantize": True,
+            "batch_size": 8,
+        },
+        "glyph_ocr": {
+            "glyph_width": 16,
+            "glyph_height": 24,
+            "min_score": 0.5,
+            "min_height_ratio": 0.35,
+            "space_ratio": 0.4,
+        },
         "setup": {"installer_name": "bs5_installer.exe"},
+        "debug_images": {
+            "queue_size": 64,
+            "sample_every": 1,
+            "pixel_snapshot_size": 32,
+        },
     }
     with patch("pymordial.utils.config.get_config", return_value=config):
         yield config
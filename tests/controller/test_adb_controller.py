@@ -183,6 +183,29 @@ def test_close_app(mock_config, mock_adb_device):
     mock_adb_device.shell.assert_called()
 
 
+def test_close_app_retries_force_stop(mock_config, mock_adb_device):
+    """Test that close_app re-issues force-stop until the process is gone."""
+    app = PymordialApp(app_name="TestApp", package_name="com.test.app")
+
+    controller = AdbController()
+    controller.connect()
+
+    with (
+        patch.object(controller, "_app_process_found", side_effect=[True, False]),
+        patch("pymordial.utils.retry.time.sleep") as sleep,
+    ):
+        result = controller.close_app(app, timeout=5, wait_time=1)
+
+    assert result is True
+    force_stops = [
+        call
+        for call in mock_adb_device.shell.call_args_list
+        if "force-stop" in call.args[0]
+    ]
+    assert len(force_stops) == 2
+    sleep.assert_called_once_with(1)
+
+
 def test_press_home(mock_config, mock_adb_device):
     """Test pressing home button."""
     controller = AdbController()
@@ -241,3 +264,24 @@ def test_get_latest_frame_no_frame(mock_config):
     frame = controller.get_latest_frame()
 
     assert frame is None
+
+
+def test_wait_for_frame(mock_config):
+    """Test that frame waiters wake on new frames and time out otherwise."""
+    import threading
+
+    controller = AdbController()
+    controller._is_streaming.set()
+
+    def publish():
+        with controller._new_frame:
+            controller._frame_index += 1
+            controller._new_frame.notify_all()
+
+    threading.Timer(0.05, publish).start()
+    assert controller.wait_for_frame(0, timeout=5) == 1
+    assert controller.frame_index == 1
+    assert controller.wait_for_frame(1, timeout=0.01) is None
+
+    controller._is_streaming.clear()
+    assert controller.wait_for_frame(1, timeout=5) is None
@@ -8,6 +8,7 @@ from PIL import Image
 from pymordial.controller.image_controller import ImageController
 from pymordial.core.elements.pymordial_image import PymordialImage
 from pymordial.core.elements.pymordial_pixel import PymordialPixel
+from pymordial.utils.retry import FixedRetry
 
 
 @pytest.fixture
@@ -126,13 +127,11 @@ def test_where_element_not_found(mock_config, mock_pymordial_controller):
 
     # Create test images
     mock_screen = Image.new("RGB", (1920, 1080), color=(0, 0, 0))
-    mock_template = Image.new("RGB", (100, 100), color=(255, 255, 255))
 
-    with patch(
-        "pymordial.controller.image_controller.Image.open",
-        return_value=mock_template,
-    ):
-        with patch("pymordial.controller.image_controller.locate", return_value=None):
+    with patch.object(controller, "get_template"):
+        with patch(
+            "pymordial.controller.image_controller.match_template", return_value=None
+        ):
             result = controller.where_element(
                 pymordial_element=image_elem,
                 screenshot_img_bytes=mock_screen,
@@ -140,8 +139,204 @@ def test_where_element_not_found(mock_config, mock_pymordial_controller):
             assert result is None
 
 
+def test_where_element_retry_policy(mock_config, mock_pymordial_controller):
+    """Test that where_element retries on fresh captures using the policy."""
+    controller = ImageController(mock_pymordial_controller)
+    image_elem = PymordialImage(
+        label="test",
+        filepath="test.png",
+        confidence=0.8,
+        og_resolution=(1920, 1080),
+    )
+    mock_screen = Image.new("RGB", (1920, 1080), color=(0, 0, 0))
+    mock_pymordial_controller.capture_screen.return_value = mock_screen
+    policy = FixedRetry(interval=0.25)
+
+    with (
+        patch.object(controller, "get_template"),
+        patch(
+            "pymordial.controller.image_controller.match_template",
+            side_effect=[None, None, (10, 10, 20, 20)],
+        ),
+        patch("pymordial.utils.retry.time.sleep") as sleep,
+    ):
+        result = controller.where_element(
+            image_elem,
+            screenshot_img_bytes=mock_screen,
+            max_tries=5,
+            retry_policy=policy,
+        )
+
+    assert result == (20, 20)
+    assert mock_pymordial_controller.capture_screen.call_count == 2
+    assert [call.args[0] for call in sleep.call_args_list] == [0.25, 0.25]
+
+
 def test_image_controller_repr(mock_config, mock_pymordial_controller):
     """Test string representation."""
     controller = ImageController(mock_pymordial_controller)
     repr_str = repr(controller)
     assert "ImageController" in repr_str
+
+
+def test_where_element_feature_image(mock_config, mock_pymordial_controller, tmp_path):
+    """Test that feature images are located by keypoint matching."""
+    import cv2
+    import numpy as np
+
+    from pymordial.core.elements.pymordial_feature_image import PymordialFeatureImage
+
+    controller = ImageController(mock_pymordial_controller)
+
+    rng = np.random.default_rng(0)
+    blocks = rng.integers(0, 256, size=(9, 12), dtype=np.uint8)
+    template = cv2.resize(blocks, (120, 90), interpolation=cv2.INTER_NEAREST)
+    template_path = tmp_path / "feature.png"
+    cv2.imwrite(str(template_path), template)
+
+    scene = np.full((480, 640, 3), 127, dtype=np.uint8)
+    scaled = cv2.resize(template, None, fx=1.2, fy=1.2)
+    h, w = scaled.shape
+    scene[100 : 100 + h, 200 : 200 + w] = scaled[:, :, None]
+
+    element = PymordialFeatureImage(
+        label="feature", filepath=template_path, confidence=0.5
+    )
+
+    result = controller.where_element(
+        pymordial_element=element, screenshot_img_bytes=scene, max_tries=1
+    )
+
+    assert result is not None
+    assert abs(result[0] - (200 + w // 2)) <= 5
+    assert abs(result[1] - (100 + h // 2)) <= 5
+
+
+def test_where_element_masked_template(
+    mock_config, mock_pymordial_controller, tmp_path
+):
+    """Test that transparent template pixels are ignored when matching."""
+    import cv2
+    import numpy as np
+
+    controller = ImageController(mock_pymordial_controller)
+
+    rng = np.random.default_rng(1)
+    icon = rng.integers(0, 256, size=(40, 40), dtype=np.uint8)
+    circle = np.zeros((40, 40), dtype=np.uint8)
+    cv2.circle(circle, (20, 20), 15, 255, -1)
+    bgra = cv2.merge([icon, icon, icon, circle])
+    template_path = tmp_path / "round.png"
+    cv2.imwrite(str(template_path), bgra)
+
+    # Same icon on a background that differs from the template's corners
+    scene = np.full((200, 300, 3), 30, dtype=np.uint8)
+    patch_ = scene[50:90, 120:160]
+    patch_[circle > 0] = icon[circle > 0][:, None]
+
+    element = PymordialImage(
+        label="round",
+        filepath=template_path,
+        confidence=0.95,
+        og_resolution=(300, 200),
+    )
+
+    result = controller.where_element(
+        pymordial_element=element, screenshot_img_bytes=scene, max_tries=1
+    )
+
+    assert result == (140, 70)
+
+
+def test_get_template_prefers_asset_bundle(
+    mock_config, mock_pymordial_controller, tmp_path
+):
+    """Test that registered bundles are used instead of the image file."""
+    import cv2
+    import numpy as np
+
+    from pymordial.vision.bundle import build_asset_bundle
+
+    controller = ImageController(mock_pymordial_controller)
+    asset = tmp_path / "button.png"
+    cv2.imwrite(str(asset), np.full((10, 20, 3), 200, dtype=np.uint8))
+    element = PymordialImage(label="button", filepath=asset, confidence=0.8)
+    bundle_path = build_asset_bundle([element], tmp_path / "app.pymb")
+    asset.unlink()
+
+    bundle = controller.add_asset_bundle(bundle_path)
+    template = controller.get_template(element)
+
+    assert controller.asset_bundles == [bundle]
+    assert template.size == (20, 10)
+    assert controller.add_asset_bundle(bundle) is bundle
+    assert len(controller.asset_bundles) == 1
+
+
+def test_get_template_skips_stale_bundle_assets(
+    mock_config, mock_pymordial_controller, tmp_path
+):
+    """Test that edited files bypass the bundle at any resolution."""
+    import cv2
+    import numpy as np
+
+    from pymordial.vision.bundle import build_asset_bundle
+
+    controller = ImageController(mock_pymordial_controller)
+    asset = tmp_path / "button.png"
+    cv2.imwrite(str(asset), np.full((10, 20, 3), 200, dtype=np.uint8))
+    element = PymordialImage(label="button", filepath=asset, confidence=0.8)
+    controller.add_asset_bundle(build_asset_bundle([element], tmp_path / "app.pymb"))
+
+    other_resolution = PymordialImage(
+        label="button", filepath=asset, confidence=0.8, og_resolution=(1280, 720)
+    )
+    with patch("pymordial.controller.image_controller.load_template") as load_template:
+        assert controller.get_template(other_resolution).size == (20, 10)
+        load_template.assert_not_called()
+
+    cv2.imwrite(str(asset), np.full((12, 24, 3), 50, dtype=np.uint8))
+    assert controller.get_template(element).size == (24, 12)
+
+
+def test_debug_snapshots_for_pixels_and_templates(
+    mock_config, mock_pymordial_controller, tmp_path
+):
+    """Test that pixel checks and template matches queue debug snapshots."""
+    import cv2
+    import numpy as np
+
+    from pymordial.utils.debug_images import DebugImageWriter
+
+    controller = ImageController(mock_pymordial_controller)
+    controller.debug_writer = DebugImageWriter(tmp_path)
+    scene = np.zeros((100, 100, 3), dtype=np.uint8)
+    pixel = PymordialPixel(
+        label="hp", position=(50, 50), pixel_color=(0, 0, 0), tolerance=0
+    )
+    element = PymordialImage(
+        label="icon",
+        filepath=tmp_path / "missing.png",
+        confidence=0.9,
+        og_resolution=(100, 100),
+        position=(0, 0),
+        size=(40, 40),
+    )
+
+    assert controller.check_pixel_color(pixel, scene) is True
+    with (
+        patch(
+            "pymordial.controller.image_controller.match_template",
+            return_value=(10, 10, 8, 8),
+        ),
+        patch.object(controller, "get_template"),
+    ):
+        controller.where_element(element, screenshot_img_bytes=scene, max_tries=1)
+    assert controller.debug_writer.flush(timeout=5)
+
+    names = sorted(path.name for path in tmp_path.glob("*.png"))
+    assert names == ["pixel_hp_match_000000.png", "template_icon_found_000001.png"]
+
+    snapshot = cv2.imread(str(tmp_path / names[1]))
+    assert snapshot.shape[:2] == (40, 40)
+    assert tuple(snapshot[10, 10]) == (0, 0, 255)
@@ -26,3 +26,291 @@ def test_add_app():
                 app = PymordialApp(app_name="TestApp", package_name="com.test")
                 controller.add_app(app)
                 assert "TestApp" in controller._apps
+
+
+def test_text_elements_share_one_ocr_per_frame():
+    """Test that text elements in the same region reuse one OCR pass."""
+    import numpy as np
+
+    from pymordial.core.elements.pymordial_text import PymordialText
+    from pymordial.core.frame import Frame
+    from pymordial.ocr.result import OcrResult
+
+    with patch("pymordial.controller.pymordial_controller.AdbController"):
+        with patch("pymordial.controller.pymordial_controller.BluestacksController"):
+            with patch("pymordial.controller.pymordial_controller.ImageController"):
+                with patch(
+                    "pymordial.controller.pymordial_controller.TextController"
+                ) as mock_text:
+                    controller = PymordialController()
+    controller.text = mock_text.return_value
+    controller.text.read.return_value = OcrResult.from_text("Battle Start\nHP 100")
+
+    box = {"position": (0, 0), "size": (50, 20)}
+    victory = PymordialText(label="victory", element_text="Victory", **box)
+    start = PymordialText(label="start", element_text="Battle Start", **box)
+    hp = PymordialText(label="hp", element_text="HP", **box)
+    frame = Frame(np.zeros((40, 80, 3), dtype=np.uint8))
+
+    assert controller.is_element_visible(victory, frame) is False
+    assert controller.is_element_visible(start, frame) is True
+    assert controller.is_element_visible(hp, frame) is True
+    controller.text.read.assert_called_once()
+
+
+def test_find_element_reads_only_the_text_region():
+    """Test that text elements are found in their region, in screen coordinates."""
+    import numpy as np
+
+    from pymordial.core.elements.pymordial_text import PymordialText
+    from pymordial.core.frame import Frame
+    from pymordial.ocr.result import OcrResult, OcrWord
+
+    with patch("pymordial.controller.pymordial_controller.AdbController"):
+        with patch("pymordial.controller.pymordial_controller.BluestacksController"):
+            with patch("pymordial.controller.pymordial_controller.ImageController"):
+                with patch(
+                    "pymordial.controller.pymordial_controller.TextController"
+                ) as mock_text:
+                    controller = PymordialController()
+    controller.text = mock_text.return_value
+    controller.text.read.return_value = OcrResult(
+        words=(OcrWord(text="Attack", box=(10, 4, 40, 12), confidence=90.0),)
+    )
+
+    attack = PymordialText(
+        label="attack", element_text="attack", position=(600, 300), size=(120, 40)
+    )
+    frame = Frame(np.zeros((720, 1280, 3), dtype=np.uint8))
+
+    assert controller.find_element(attack, frame) == (630, 310)
+    crop = controller.text.read.call_args.args[0]
+    assert crop.rgb.shape == (40, 120, 3)
+    assert np.shares_memory(crop.rgb, frame.rgb)
+    # Visibility checks on the same frame reuse the read
+    assert controller.is_element_visible(attack, frame) is True
+    controller.text.read.assert_called_once()
+    controller.text.find_text.assert_not_called()
+
+
+def test_snapshot_captures_once_and_memoizes():
+    """Test that every check inside a snapshot shares one capture."""
+    import numpy as np
+
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+    from pymordial.core.elements.pymordial_text import PymordialText
+    from pymordial.ocr.result import OcrResult
+
+    with patch("pymordial.controller.pymordial_controller.AdbController"):
+        with patch("pymordial.controller.pymordial_controller.BluestacksController"):
+            with patch("pymordial.controller.pymordial_controller.ImageController"):
+                with patch(
+                    "pymordial.controller.pymordial_controller.TextController"
+                ) as mock_text:
+                    controller = PymordialController()
+    controller.text = mock_text.return_value
+    controller.text.read.return_value = OcrResult.from_text("Battle Start")
+    controller.image.check_pixel_color.return_value = True
+    controller.adb.capture_screenshot.return_value = np.zeros(
+        (40, 80, 3), dtype=np.uint8
+    )
+
+    box = {"position": (0, 0), "size": (50, 20)}
+    start = PymordialText(label="start", element_text="Battle Start", **box)
+    victory = PymordialText(label="victory", element_text="Victory", **box)
+    hp = PymordialPixel(label="hp", position=(5, 5), pixel_color=(0, 0, 0))
+
+    with controller.snapshot() as snap:
+        assert controller.is_element_visible(victory) or controller.is_element_visible(
+            start
+        )
+        assert controller.find_element(hp) == (5, 5)
+        assert controller.is_element_visible(start) is True
+        assert controller.capture_screen() is snap.frame
+        with controller.snapshot() as inner:
+            assert inner is snap
+        assert snap.hits == 1
+    assert controller.active_snapshot is None
+
+    controller.adb.capture_screenshot.assert_called_once()
+    controller.text.read.assert_called_once()
+    controller.image.check_pixel_color.assert_called_once()
+
+
+def test_snapshot_with_failed_capture():
+    """Test that a failed capture makes every element invisible."""
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+
+    with patch("pymordial.controller.pymordial_controller.AdbController"):
+        with patch("pymordial.controller.pymordial_controller.BluestacksController"):
+            with patch("pymordial.controller.pymordial_controller.ImageController"):
+                controller = PymordialController()
+    controller.adb.capture_screenshot.return_value = None
+    hp = PymordialPixel(label="hp", position=(5, 5), pixel_color=(0, 0, 0))
+
+    with controller.snapshot() as snap:
+        assert snap.frame is None
+        assert controller.is_element_visible(hp) is False
+        assert controller.find_element(hp) is None
+        assert snap.read_text().text == ""
+    controller.image.check_pixel_color.assert_not_called()
+
+
+def _wait_controller():
+    """Returns a controller with a mocked ADB and a real ImageController."""
+    with patch("pymordial.controller.pymordial_controller.AdbController"):
+        with patch("pymordial.controller.pymordial_controller.BluestacksController"):
+            return PymordialController()
+
+
+def _screens(*pixels):
+    """Returns 20x20 RGB frames, each with the given pixels set to red."""
+    import numpy as np
+
+    frames = []
+    for points in pixels:
+        frame = np.zeros((20, 20, 3), dtype=np.uint8)
+        for x, y in points:
+            frame[y, x] = (255, 0, 0)
+        frames.append(frame)
+    return frames
+
+
+def test_wait_for_polls_with_backoff():
+    """Test that polling waits return on the first matching capture."""
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+
+    controller = _wait_controller()
+    controller.adb.capture_screenshot.side_effect = _screens([], [], [(5, 5)])
+    red = PymordialPixel(label="red", position=(5, 5), pixel_color=(255, 0, 0))
+
+    with patch("pymordial.controller.pymordial_controller.time.sleep") as sleep:
+        assert controller.wait_for(red, timeout=5) == (5, 5)
+
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert len(delays) == 2 and delays[1] > delays[0]
+
+
+def test_wait_for_streaming_skips_unchanged_regions():
+    """Test that streaming waits evaluate only frames whose regions changed."""
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+
+    controller = _wait_controller()
+    controller.is_streaming = True
+    controller.adb.frame_index = 0
+    controller.adb.wait_for_frame.side_effect = [1, 2, 3]
+    controller.adb.get_latest_frame.side_effect = _screens([], [], [(10, 10)], [(5, 5)])
+    red = PymordialPixel(label="red", position=(5, 5), pixel_color=(255, 0, 0))
+
+    with (
+        patch.object(
+            controller.image,
+            "check_pixel_color",
+            wraps=controller.image.check_pixel_color,
+        ) as check,
+        patch("pymordial.controller.pymordial_controller.time.sleep") as sleep,
+    ):
+        assert controller.wait_for(red, timeout=5) == (5, 5)
+
+    assert check.call_count == 2
+    sleep.assert_not_called()
+    controller.adb.capture_screenshot.assert_not_called()
+
+
+def test_wait_for_any_and_until_gone():
+    """Test waiting on several elements and on disappearance."""
+    import pytest
+
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+
+    controller = _wait_controller()
+    red = PymordialPixel(label="red", position=(5, 5), pixel_color=(255, 0, 0))
+    blue = PymordialPixel(label="blue", position=(1, 1), pixel_color=(255, 0, 0))
+
+    controller.adb.capture_screenshot.side_effect = _screens([(1, 1)])
+    assert controller.wait_for_any([red, blue], timeout=0) == (blue, (1, 1))
+
+    controller.adb.capture_screenshot.side_effect = _screens([(5, 5)], [])
+    with patch("pymordial.controller.pymordial_controller.time.sleep"):
+        assert controller.wait_until_gone(red, timeout=5) is True
+
+    controller.adb.capture_screenshot.side_effect = _screens([])
+    assert controller.wait_for(red, timeout=0) is None
+    with pytest.raises(ValueError):
+        controller.wait_for_any([], timeout=1)
+    with pytest.raises(ValueError):
+        controller.wait_for(red, timeout=-1)
+
+
+def test_wait_for_inside_snapshot_captures_fresh_frames():
+    """Test that waits do not poll the unchanging frame of a snapshot."""
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+
+    controller = _wait_controller()
+    controller.adb.capture_screenshot.side_effect = _screens([], [], [(5, 5)])
+    red = PymordialPixel(label="red", position=(5, 5), pixel_color=(255, 0, 0))
+
+    with (
+        controller.snapshot() as snap,
+        patch("pymordial.controller.pymordial_controller.time.sleep"),
+    ):
+        assert controller.wait_for(red, timeout=5) == (5, 5)
+        # The enclosing snapshot keeps its own frame
+        assert controller.capture_screen() is snap.frame
+        assert snap.is_visible(red) is False
+
+    assert controller.adb.capture_screenshot.call_count == 3
+
+
+def test_find_element_timeout_bounds_nested_retries():
+    """Test that one budget bounds find_element's unlimited retries."""
+    from pymordial.core.elements.pymordial_image import PymordialImage
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+    from pymordial.utils.deadline import deadline_scope
+
+    controller = _wait_controller()
+    button = PymordialImage(label="play", filepath="play.png", confidence=0.8)
+    now = [0.0]
+
+    def fake_sleep(seconds):
+        now[0] += seconds
+
+    with (
+        patch("pymordial.utils.retry.time.monotonic", side_effect=lambda: now[0]),
+        patch("pymordial.utils.retry.time.sleep", side_effect=fake_sleep),
+        patch.object(controller.image, "_capture_for", return_value=b"img"),
+        patch.object(controller.image, "_locate", return_value=None) as locate,
+    ):
+        assert controller.find_element(button, max_tries=None, timeout=2.5) is None
+        assert now[0] == 2.5
+        assert locate.call_count == 4
+
+        # Waits inside an exhausted scope check once and return
+        red = PymordialPixel(label="red", position=(5, 5), pixel_color=(255, 0, 0))
+        controller.adb.capture_screenshot.side_effect = _screens([])
+        with deadline_scope(0):
+            assert controller.wait_for(red, timeout=5) is None
+        assert now[0] == 2.5
+
+
+def test_is_element_visible_applies_timeout_to_every_element_type():
+    """Test that pixel checks run inside the caller's deadline scope."""
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+    from pymordial.utils.deadline import current_deadline
+
+    controller = _wait_controller()
+    red = PymordialPixel(label="red", position=(5, 5), pixel_color=(255, 0, 0))
+    seen = []
+
+    def check_pixel_color(**kwargs):
+        seen.append(current_deadline())
+        return True
+
+    with patch.object(
+        controller.image, "check_pixel_color", side_effect=check_pixel_color
+    ):
+        assert controller.is_element_visible(red, _screens([])[0], timeout=2.0)
+        assert controller.find_element(red, _screens([])[0]) == (5, 5)
+
+    assert 0 < seen[0].remaining() <= 2.0
+    assert seen[1] is None
@@ -127,3 +127,114 @@ def test_read_text_error_handling(mock_config):
         checker.read_text(image_path=b"fake_image")
     with pytest.raises(ValueError, match="Error reading text"):
         checker.read_text(image_path=b"fake_image")
+
+
+def test_repeated_reads_hit_cache(mock_config):
+    """Test that identical image content is only OCR'd once."""
+    mock_ocr = Mock()
+    mock_ocr.extract_text.return_value = "HP 100"
+    checker = TextController(ocr_engine=mock_ocr)
+
+    assert checker.check_text("hp", b"same_pixels") is True
+    assert checker.read_text(b"same_pixels") == ["hp 100"]
+    checker.check_text("hp", b"other_pixels")
+
+    assert mock_ocr.extract_text.call_count == 2
+    stats = checker.cache_stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_cache_can_be_disabled(mock_config):
+    """Test that cache_size=0 always runs OCR."""
+    mock_ocr = Mock()
+    mock_ocr.extract_text.return_value = "Text"
+    checker = TextController(ocr_engine=mock_ocr, cache_size=0)
+
+    checker.read_text(b"same_pixels")
+    checker.read_text(b"same_pixels")
+
+    assert mock_ocr.extract_text.call_count == 2
+    assert checker.cache_stats() is None
+
+
+def test_strategies_differing_in_a_list_are_not_cached(mock_config):
+    """Test that a list-valued strategy setting bypasses the cache."""
+
+    class WhitelistStrategy(DefaultExtractStrategy):
+        def __init__(self, words):
+            super().__init__()
+            self.words = words
+
+    mock_ocr = Mock(spec=TesseractOCR)
+    mock_ocr.extract_text.side_effect = lambda image, strategy: strategy.words[0]
+    checker = TextController(ocr_engine=mock_ocr)
+
+    hp = checker.read_text(b"same_pixels", strategy=WhitelistStrategy(["HP"]))
+    mp = checker.read_text(b"same_pixels", strategy=WhitelistStrategy(["MP"]))
+
+    assert (hp, mp) == (["hp"], ["mp"])
+    assert checker.cache_stats().size == 0
+
+
+def test_read_returns_cached_ocr_result(mock_config):
+    """Test that read() returns one OcrResult per image content."""
+    from pymordial.ocr.result import OcrResult
+
+    mock_ocr = Mock()
+    mock_ocr.read.return_value = OcrResult.from_text("Victory\nRewards")
+    checker = TextController(ocr_engine=mock_ocr)
+
+    first = checker.read(b"same_pixels")
+    second = checker.read(b"same_pixels")
+
+    assert first is second
+    assert first.contains("rewards")
+    mock_ocr.read.assert_called_once_with(b"same_pixels")
+
+
+def test_find_text_reads_only_detected_regions(mock_config):
+    """Test that a text detector limits OCR to its regions."""
+    import numpy as np
+
+    from pymordial.ocr.result import OcrWord
+
+    detector = Mock()
+    detector.detect.return_value = [(10, 10, 60, 30), (100, 50, 180, 80)]
+    mock_ocr = Mock()
+    mock_ocr.read_regions.return_value = [
+        [OcrWord("HP", (12, 12, 20, 10), 90.0, (1,))],
+        [OcrWord("Victory", (110, 55, 60, 20), 90.0, (1,))],
+    ]
+    checker = TextController(ocr_engine=mock_ocr, text_detector=detector)
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+
+    assert checker.find_text("victory", image) == (140, 65)
+    mock_ocr.read_regions.assert_called_once_with(image, detector.detect.return_value)
+    mock_ocr.find_text.assert_not_called()
+
+    detector.detect.return_value = []
+    assert checker.find_text("victory", np.ones((5, 5, 3), np.uint8)) is None
+
+
+def test_fuzzy_check_find_and_match_text(mock_config):
+    """Test min_score on check_text/find_text and the scored match_text."""
+    from pymordial.ocr.result import OcrResult, OcrWord
+
+    mock_ocr = Mock()
+    mock_ocr.extract_text.return_value = "Phant0m Force"
+    mock_ocr.read.return_value = OcrResult(
+        words=(
+            OcrWord("Phant0m", (10, 10, 60, 12), 60.0, (1,)),
+            OcrWord("Force", (75, 10, 40, 12), 85.0, (1,)),
+        )
+    )
+    checker = TextController(ocr_engine=mock_ocr)
+
+    assert checker.check_text("phantom force", b"pixels") is False
+    assert checker.check_text("phantom force", b"pixels", min_score=0.9) is True
+    assert checker.find_text("phantom force", b"pixels", min_score=0.9) == (62, 16)
+    match = checker.match_text("phantom force", b"pixels")
+    assert (match.text, match.span) == ("Phant0m Force", (0, 2))
+    assert checker.match_text("defend", b"pixels") is None
+    # One OCR pass answers every fuzzy query
+    mock_ocr.read.assert_called_once()
@@ -0,0 +1,50 @@
+"""Tests for PymordialFeatureImage element."""
+
+import pytest
+
+from pymordial.core.elements.pymordial_feature_image import PymordialFeatureImage
+from pymordial.core.elements.pymordial_image import PymordialImage
+
+
+def test_pymordial_feature_image_defaults(mock_config):
+    """Test feature image initialization with config defaults."""
+    element = PymordialFeatureImage(
+        label="Spinner", filepath="spinner.png", confidence=0.5
+    )
+
+    assert isinstance(element, PymordialImage)
+    assert element.detector == "orb"
+    assert element.min_matches >= 4
+
+
+def test_pymordial_feature_image_detector_normalized(mock_config):
+    """Test detector names are lowercased."""
+    element = PymordialFeatureImage(
+        label="spinner", filepath="spinner.png", confidence=0.5, detector="AKAZE"
+    )
+
+    assert element.detector == "akaze"
+
+
+def test_pymordial_feature_image_invalid_detector(mock_config):
+    """Test unsupported detectors raise ValueError."""
+    with pytest.raises(ValueError, match="Detector must be one of"):
+        PymordialFeatureImage(
+            label="spinner", filepath="spinner.png", confidence=0.5, detector="sift"
+        )
+
+
+def test_pymordial_feature_image_invalid_min_matches(mock_config):
+    """Test that too few matches for a homography raise ValueError."""
+    with pytest.raises(ValueError, match="at least 4"):
+        PymordialFeatureImage(
+            label="spinner", filepath="spinner.png", confidence=0.5, min_matches=3
+        )
+
+
+def test_pymordial_feature_image_invalid_ratio_test(mock_config):
+    """Test ratio_test outside (0, 1] raises ValueError."""
+    with pytest.raises(ValueError, match="Ratio test"):
+        PymordialFeatureImage(
+            label="spinner", filepath="spinner.png", confidence=0.5, ratio_test=1.5
+        )
@@ -118,3 +118,12 @@ def test_pymordial_text_region(mock_config):
         size=(50, 30),
     )
     assert text_elem.region == (100, 200, 150, 230)
+
+
+def test_pymordial_text_min_score_validation():
+    """Test that min_score must lie between 0 and 1."""
+    text_elem = PymordialText(label="move", element_text="Phantom Force", min_score=0.8)
+    assert text_elem.min_score == 0.8
+
+    with pytest.raises(ValueError):
+        PymordialText(label="move", element_text="Phantom Force", min_score=1.2)
@@ -173,6 +173,7 @@ def test_revomon_text_strategy_with_debug_output(mock_config, tmp_path):
     # Process an image to trigger debug save
     image = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
     strategy.preprocess(image)
+    assert strategy.debug_writer.flush(timeout=5)
 
     # Check debug file was created
     import os
@@ -180,6 +181,31 @@ def test_revomon_text_strategy_with_debug_output(mock_config, tmp_path):
     assert os.path.exists(debug_dir)
 
 
+def test_revomon_text_strategy_with_debug_output_pickles(mock_config, tmp_path):
+    """Test that a debugging strategy can be sent to worker processes."""
+    import pickle
+
+    from pymordial.utils.debug_images import DebugImageWriter, get_debug_writer
+
+    debug_dir = str(tmp_path / "debug")
+    custom = DebugImageWriter(tmp_path / "custom")
+    try:
+        for strategy in (
+            RevomonTextStrategy(mode="level", debug_output_dir=debug_dir),
+            RevomonTextStrategy(
+                mode="level", debug_output_dir=debug_dir, debug_writer=custom
+            ),
+        ):
+            copy = pickle.loads(pickle.dumps(strategy))
+
+            assert copy.mode == "level"
+            assert copy.debug_output_dir == debug_dir
+            assert copy.debug_writer is get_debug_writer(debug_dir)
+        assert strategy.debug_writer is custom
+    finally:
+        custom.close()
+
+
 def test_default_extract_strategy_color_inversion(mock_config):
     """Test default strategy handles color inversion."""
     strategy = DefaultExtractStrategy()
@@ -216,3 +242,65 @@ def test_revomon_tesseract_config_level(mock_config):
     assert "tessedit_char_whitelist" in config
     assert "0123456789" in config
     assert "0123456789" in config
+
+
+def _label(text="Attack", scale=0.6, size=(30, 140)):
+    """Renders dark text on a light background."""
+    import cv2
+
+    image = np.full((*size, 3), 230, dtype=np.uint8)
+    cv2.putText(image, text, (5, size[0] - 8), cv2.FONT_HERSHEY_SIMPLEX, scale, 0, 1)
+    return image
+
+
+def test_estimate_text_height_tracks_font_size(mock_config):
+    """Test that larger text gives a larger height estimate."""
+    import cv2
+
+    from pymordial.ocr.extract_strategy import estimate_text_height
+
+    small = cv2.cvtColor(_label(scale=0.5, size=(60, 200)), cv2.COLOR_BGR2GRAY)
+    large = cv2.cvtColor(_label(scale=1.5, size=(60, 200)), cv2.COLOR_BGR2GRAY)
+
+    assert 5 <= estimate_text_height(small) < estimate_text_height(large) < 60
+
+
+def test_fast_profile_upscales_adaptively(mock_config):
+    """Test that the fast profile scales small text more than large text."""
+    strategy = DefaultExtractStrategy(profile="fast")
+
+    small = strategy.preprocess(_label(scale=0.4))
+    large = strategy.preprocess(_label("Go", scale=1.0, size=(40, 140)))
+
+    assert small.ndim == 2
+    assert small.shape[0] / 30 > large.shape[0] / 40
+    assert set(np.unique(small)) <= {0, 255}
+    # Text stays black on white
+    assert small.mean() > 127
+
+
+def test_fast_profile_denoise_options(mock_config):
+    """Test that each denoise option is accepted and unknown ones rejected."""
+    import pytest
+
+    for denoise in ("median", "bilateral", "none", "nlmeans"):
+        result = DefaultExtractStrategy("fast", denoise=denoise).preprocess(_label())
+        assert result.ndim == 2
+
+    assert DefaultExtractStrategy("fast").denoise == "median"
+    assert DefaultExtractStrategy().denoise == "nlmeans"
+    with pytest.raises(ValueError):
+        DefaultExtractStrategy("turbo")
+    with pytest.raises(ValueError):
+        DefaultExtractStrategy("fast", denoise="gaussian")
+
+
+def test_revomon_move_mode_fast_profile(mock_config):
+    """Test that move mode's fast profile caps the upscale at 3x."""
+    strategy = RevomonTextStrategy(mode="move", profile="fast")
+    image = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+
+    result = strategy.preprocess(image)
+
+    assert result.ndim == 2
+    assert result.shape[0] <= 80 * 3 + 2 * 5 + 1
@@ -0,0 +1,133 @@
+"""Tests for Frame."""
+
+from io import BytesIO
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pymordial.core.frame import Frame
+
+
+@pytest.fixture
+def png_bytes():
+    """Returns a 40x20 PNG with a red left half and a blue right half."""
+    image = Image.new("RGB", (40, 20), color=(255, 0, 0))
+    image.paste((0, 0, 255), (20, 0, 40, 20))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_frame_from_bytes_decodes_lazily(png_bytes):
+    """Test that bytes are not decoded until a view is requested."""
+    frame = Frame(png_bytes)
+
+    assert frame.data == png_bytes
+    assert "rgb" not in repr(frame)
+    assert frame.rgb.shape == (20, 40, 3)
+
+
+def test_frame_decodes_once(png_bytes):
+    """Test that repeated accesses reuse the cached decode."""
+    frame = Frame(png_bytes)
+
+    with patch("pymordial.core.frame.Image.open", wraps=Image.open) as mock_open:
+        first = frame.rgb
+        second = frame.rgb
+        _ = frame.gray
+        _ = frame.bgr
+
+        assert first is second
+        mock_open.assert_called_once()
+
+
+def test_frame_color_views(png_bytes):
+    """Test RGB, BGR, and grayscale conversions."""
+    frame = Frame(png_bytes)
+
+    assert tuple(frame.rgb[0, 0]) == (255, 0, 0)
+    assert tuple(frame.bgr[0, 0]) == (0, 0, 255)
+    assert frame.gray.shape == (20, 40)
+    assert frame.gray is frame.gray
+
+
+def test_frame_from_rgb_array():
+    """Test that stream arrays are treated as RGB."""
+    array = np.zeros((10, 10, 3), dtype=np.uint8)
+    array[:, :, 1] = 200
+    frame = Frame(array)
+
+    assert frame.rgb is array
+    assert frame.pixel(5, 5) == (0, 200, 0)
+    assert frame.size == (10, 10)
+
+
+def test_frame_from_gray_array():
+    """Test that single-channel arrays are used as the grayscale view."""
+    array = np.full((8, 6), 128, dtype=np.uint8)
+    frame = Frame(array)
+
+    assert frame.gray is array
+    assert frame.rgb.shape == (8, 6, 3)
+    assert frame.size == (6, 8)
+
+
+def test_frame_size_does_not_decode(png_bytes):
+    """Test that size is read from the image header."""
+    frame = Frame(png_bytes)
+
+    assert frame.size == (40, 20)
+    assert frame._rgb is None
+
+
+def test_frame_from_image_passthrough(png_bytes):
+    """Test that from_image returns existing frames unchanged."""
+    frame = Frame(png_bytes)
+
+    assert Frame.from_image(frame) is frame
+    assert isinstance(Frame.from_image(png_bytes), Frame)
+
+
+def test_frame_invalid_source():
+    """Test that unsupported sources raise TypeError."""
+    with pytest.raises(TypeError):
+        Frame(12345)
+
+
+def test_frame_crop_is_view(png_bytes):
+    """Test that cropping shares memory with the parent frame."""
+    frame = Frame(png_bytes)
+    cropped = frame.crop((20, 0, 40, 10))
+
+    assert cropped.size == (20, 10)
+    assert cropped.pixel(0, 0) == (0, 0, 255)
+    assert np.shares_memory(cropped.rgb, frame.rgb)
+
+
+def test_frame_downscaled_is_memoized(png_bytes):
+    """Test downscaled variants are cached per factor."""
+    frame = Frame(png_bytes)
+    half = frame.downscaled(2)
+
+    assert half.shape == (10, 20, 3)
+    assert frame.downscaled(2) is half
+    assert frame.downscaled(1) is frame.rgb
+
+    with pytest.raises(ValueError):
+        frame.downscaled(0.5)
+
+
+def test_frame_cached_computes_once(png_bytes):
+    """Test that cached memoizes derived values per key."""
+    frame = Frame(png_bytes)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "value"
+
+    assert frame.cached("key", compute) == "value"
+    assert frame.cached("key", compute) == "value"
+    assert len(calls) == 1
@@ -148,3 +148,100 @@ def test_app_repr(mock_config):
     assert "PymordialApp" in repr_str
     assert "TestApp" in repr_str
     assert "com.test.app" in repr_str
+
+
+def test_identify_screen_uses_fingerprints(mock_config, tmp_path):
+    """Test identify_screen returns the screen matching the frame."""
+    import cv2
+    import numpy as np
+
+    from pymordial.core.frame import Frame
+    from pymordial.core.pymordial_screen import PymordialScreen
+
+    images = []
+    for seed in range(2):
+        rng = np.random.default_rng(seed)
+        blocks = rng.integers(0, 256, size=(9, 16, 3), dtype=np.uint8)
+        images.append(cv2.resize(blocks, (640, 360), interpolation=cv2.INTER_NEAREST))
+        cv2.imwrite(str(tmp_path / f"{seed}.png"), images[-1])
+
+    app = PymordialApp(app_name="TestApp", package_name="com.test.app")
+    app.add_screen(PymordialScreen(name="home", reference_images=[tmp_path / "0.png"]))
+    app.add_screen(PymordialScreen(name="shop", reference_images=[tmp_path / "1.png"]))
+
+    screen = app.identify_screen(Frame(images[1][:, :, ::-1].copy()))
+
+    assert screen is app.screens["shop"]
+
+
+def test_identify_screen_requires_controller(mock_config):
+    """Test identify_screen without a frame needs a controller."""
+    app = PymordialApp(app_name="TestApp", package_name="com.test.app")
+
+    with pytest.raises(ValueError, match="not initialized"):
+        app.identify_screen()
+
+
+def test_detect_screen_checks_signatures_on_one_capture(mock_config):
+    """Test detect_screen with pixel signatures on a single capture."""
+    from unittest.mock import patch
+
+    import numpy as np
+
+    from pymordial.controller.pymordial_controller import PymordialController
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+    from pymordial.core.pymordial_screen import PymordialScreen
+
+    with patch("pymordial.controller.pymordial_controller.AdbController"):
+        with patch("pymordial.controller.pymordial_controller.BluestacksController"):
+            controller = PymordialController()
+    screen = np.zeros((20, 20, 3), dtype=np.uint8)
+    screen[5, 5] = (255, 0, 0)
+    controller.adb.capture_screenshot.return_value = screen
+
+    app = PymordialApp(app_name="TestApp", package_name="com.test.app")
+    controller.add_app(app)
+    for name, color in [("home", (0, 0, 255)), ("battle", (255, 0, 0))]:
+        pixel = PymordialPixel(label=f"{name}_px", position=(5, 5), pixel_color=color)
+        app.add_screen(PymordialScreen(name=name, elements={pixel.label: pixel}))
+
+    detection = app.detect_screen()
+
+    assert detection.screen is app.screens["battle"]
+    assert detection.confidence == 1.0
+    controller.adb.capture_screenshot.assert_called_once()
+    # The last detected screen is checked first next time
+    assert app.detect_screen().checks == 1
+
+    with pytest.raises(ValueError, match="not initialized"):
+        PymordialApp(app_name="Other", package_name="com.other").detect_screen()
+
+
+def test_screen_indexes_follow_screen_and_element_changes(mock_config, tmp_path):
+    """Test the indexes are rebuilt after screens or elements change."""
+    import cv2
+    import numpy as np
+
+    from pymordial.core.elements.pymordial_pixel import PymordialPixel
+    from pymordial.core.pymordial_screen import PymordialScreen
+
+    app = PymordialApp(app_name="TestApp", package_name="com.test.app")
+    home = PymordialScreen(name="home")
+    app.add_screen(home)
+    signatures = app.signature_index
+    assert app.signature_index is signatures
+
+    pixel = PymordialPixel(label="home_px", position=(5, 5), pixel_color=(0, 0, 0))
+    home.add_element(pixel)
+    assert app.signature_index is not signatures
+    signatures = app.signature_index
+
+    home.remove_element("home_px")
+    assert app.signature_index is not signatures
+
+    assert len(app.fingerprint_index) == 0
+    cv2.imwrite(str(tmp_path / "shop.png"), np.zeros((36, 64, 3), dtype=np.uint8))
+    app.screens["shop"] = PymordialScreen(
+        name="shop", reference_images=[tmp_path / "shop.png"]
+    )
+    assert len(app.fingerprint_index) == 1
@@ -40,3 +40,20 @@ def test_add_element(mock_config):
     assert "playbutton" in screen.elements  # Labels are lowercase
     assert screen.elements["playbutton"] == button
     assert screen.elements["playbutton"] == button
+
+
+def test_reference_images_are_resolved(mock_config):
+    """Test reference image paths are normalized to absolute Paths."""
+    from pathlib import Path
+
+    screen = PymordialScreen(name="MainScreen", reference_images=["main.png"])
+
+    assert screen.reference_images == [Path("main.png").resolve()]
+
+
+def test_reference_images_invalid_type(mock_config):
+    """Test non-path reference images raise TypeError."""
+    import pytest
+
+    with pytest.raises(TypeError, match="Reference images"):
+        PymordialScreen(name="MainScreen", reference_images=[123])
@@ -0,0 +1,103 @@
+"""Tests for signature-based screen detection."""
+
+import pytest
+
+from pymordial.core.elements.pymordial_image import PymordialImage
+from pymordial.core.elements.pymordial_pixel import PymordialPixel
+from pymordial.core.elements.pymordial_text import PymordialText
+from pymordial.core.pymordial_screen import PymordialScreen
+from pymordial.core.screen_signatures import (
+    COST_PIXEL,
+    COST_REGION_TEXT,
+    COST_TEMPLATE,
+    ScreenSignatureIndex,
+    element_cost,
+)
+
+
+class FakeSnapshot:
+    """Snapshot stand-in reporting a fixed set of visible labels."""
+
+    def __init__(self, visible):
+        self.visible = set(visible)
+        self.checked = []
+
+    def is_visible(self, element):
+        self.checked.append(element.label)
+        return element.label in self.visible
+
+
+def _pixel(label, x=1):
+    return PymordialPixel(label=label, position=(x, 1), pixel_color=(0, 0, 0))
+
+
+def _text(label, text="Battle"):
+    return PymordialText(label=label, element_text=text, position=(0, 0), size=(50, 20))
+
+
+def _screens(tmp_path):
+    icon = PymordialImage(
+        label="menu_icon", filepath=tmp_path / "icon.png", confidence=0.9
+    )
+    home = PymordialScreen(
+        name="home",
+        elements={
+            "title": _text("title", "Home"),
+            "menu_icon": icon,
+            "home_bg": _pixel("home_bg"),
+            "back": _pixel("back", 2),
+        },
+    )
+    battle = PymordialScreen(
+        name="battle",
+        elements={
+            "hp_bar": _pixel("hp_bar"),
+            "attack": _text("attack", "Attack"),
+            "back": _pixel("back", 2),
+        },
+    )
+    return home, battle
+
+
+def test_element_cost_orders_checks(tmp_path):
+    """Test that pixels are cheapest and OCR the most expensive."""
+    image = PymordialImage(label="i", filepath=tmp_path / "i.png", confidence=0.9)
+
+    assert element_cost(_pixel("p")) == COST_PIXEL
+    assert element_cost(image) == COST_TEMPLATE
+    assert element_cost(_text("t")) == COST_REGION_TEXT
+    assert element_cost(_text("t", "")) is None
+
+
+def test_signatures_prefer_cheap_unique_elements(mock_config, tmp_path):
+    """Test that shared labels are left out and checks run cheapest first."""
+    home, battle = _screens(tmp_path)
+
+    index = ScreenSignatureIndex([home, battle], max_elements=2)
+
+    assert [e.label for e in index.signatures["home"]] == ["home_bg", "menu_icon"]
+    assert [e.label for e in index.signatures["battle"]] == ["hp_bar", "attack"]
+    with pytest.raises(ValueError):
+        ScreenSignatureIndex([home], max_elements=0)
+
+
+def test_detect_exits_early(mock_config, tmp_path):
+    """Test early exit within and across screens."""
+    home, battle = _screens(tmp_path)
+    index = ScreenSignatureIndex([home, battle], max_elements=2)
+
+    snapshot = FakeSnapshot({"hp_bar", "attack"})
+    detection = index.detect(snapshot, min_confidence=1.0, prefer=["home"])
+
+    assert detection.screen is battle
+    assert detection.confidence == 1.0
+    # home is abandoned after its first (pixel) miss
+    assert snapshot.checked == ["home_bg", "hp_bar", "attack"]
+    assert detection.checks == 3
+
+    snapshot = FakeSnapshot({"hp_bar"})
+    assert index.detect(snapshot, min_confidence=1.0) is None
+    partial = index.detect(FakeSnapshot({"hp_bar"}), min_confidence=0.5)
+    assert partial.screen is battle and partial.confidence == 0.5
+    with pytest.raises(ValueError):
+        index.detect(snapshot, min_confidence=0.0)
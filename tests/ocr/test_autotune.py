@@ -0,0 +1,168 @@
+"""Tests for the OCR strategy autotuner."""
+
+import json
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.core.elements.pymordial_text import PymordialText
+from pymordial.ocr.autotune import (
+    TuningParams,
+    apply_tuned_strategies,
+    label_whitelist,
+    load_element_crops,
+    load_tuned_strategies,
+    save_tuning,
+    search_space,
+    tune_strategy,
+)
+from pymordial.ocr.benchmark import LabelledCrop
+from pymordial.ocr.pipeline import Resize
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+
+
+def _crops(label="12/30", count=4):
+    image = np.full((20, 60, 3), 255, np.uint8)
+    cv2.putText(image, "12", (5, 15), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 0, 1)
+    return [LabelledCrop(f"{i}.png", image, label) for i in range(count)]
+
+
+def _small_space(crops):
+    return search_space(
+        crops,
+        upscale_factors=[None, 1.0, 2.0],
+        denoise_methods=["none"],
+        threshold_methods=["otsu"],
+        psm_modes=[7, 6],
+    )
+
+
+def test_params_build_strategy(mock_config):
+    """Test that parameters map to stages and a Tesseract configuration."""
+    params = TuningParams(upscale=2.0, psm=7, whitelist="0123/")
+    strategy = params.strategy()
+
+    assert Resize(2.0) in strategy.stages()
+    assert "--psm 7" in strategy.tesseract_config()
+    assert "tessedit_char_whitelist=0123/" in strategy.tesseract_config()
+    assert not any(
+        isinstance(stage, Resize) for stage in TuningParams(upscale=1.0).stages()
+    )
+    assert "whitelist" not in TuningParams().tesseract_config()
+
+
+def test_search_space_adds_label_whitelist(mock_config):
+    """Test that the whitelist comes from the label characters."""
+    crops = _crops()
+
+    assert label_whitelist(crops) == "/0123"
+    assert label_whitelist(_crops("Hello!")) == ""
+    space = _small_space(crops)
+    assert len(space) == 3 * 2 * 2
+    assert {params.whitelist for params in space} == {"", "/0123"}
+
+
+def test_tune_picks_cheapest_passing_candidate(mock_config):
+    """Test that only candidates reaching the target are kept."""
+    crops = _crops()
+    engine = TesseractOCR()
+
+    def read(image, config):
+        return "12/30" if "whitelist" in config else "12/3O"
+
+    with patch.object(engine, "_image_to_string", side_effect=read) as ocr:
+        result = tune_strategy(
+            crops, target_accuracy=1.0, engine=engine, space=_small_space(crops)
+        )
+
+    assert result.meets_target
+    assert result.params.whitelist == "/0123"
+    assert result.benchmark.accuracy == 1.0
+    assert result.candidates == 12
+    # Failing candidates stop after their first miss: 6 * 1 screening reads,
+    # 6 * 4 screening reads and 6 * 4 timed reads for the passing ones
+    assert ocr.call_count == 6 + 24 + 24
+
+
+def test_tune_falls_back_to_most_accurate(mock_config):
+    """Test the result when no candidate reaches the target."""
+    crops = _crops()
+    engine = TesseractOCR()
+
+    def read(image, config):
+        return "12/30" if "--psm 6" in config and image.shape[0] > 20 else "x"
+
+    with patch.object(engine, "_image_to_string", side_effect=read):
+        result = tune_strategy(
+            crops[:1] + _crops("99", 1),
+            target_accuracy=1.0,
+            engine=engine,
+            space=_small_space(crops),
+        )
+
+    assert not result.meets_target
+    assert result.benchmark.accuracy == 0.5
+    assert result.params.psm == 6 and result.params.upscale != 1.0
+
+
+def test_tune_scores_extract_text_output(mock_config):
+    """Test that tuning ignores postprocess_text, like extract_text does."""
+    from pymordial.ocr.extract_strategy import PipelineStrategy
+
+    crops = _crops()
+    engine = TesseractOCR()
+
+    with (
+        patch.object(engine, "_image_to_string", return_value=" 12/3O\n"),
+        patch.object(PipelineStrategy, "postprocess_text", return_value="12/30"),
+    ):
+        result = tune_strategy(
+            crops, target_accuracy=1.0, engine=engine, space=_small_space(crops)
+        )
+
+    assert not result.meets_target
+    assert result.benchmark.accuracy == 0.0
+
+
+def test_tune_validates_input(mock_config):
+    """Test that empty crop sets and bad targets are rejected."""
+    with pytest.raises(ValueError):
+        tune_strategy([])
+    with pytest.raises(ValueError):
+        tune_strategy(_crops(), target_accuracy=1.5)
+
+
+def test_save_load_and_apply(mock_config, tmp_path):
+    """Test the crop layout and the round trip through the tuning file."""
+    for label in ["hp_value", "move_1"]:
+        (tmp_path / label).mkdir()
+        cv2.imwrite(str(tmp_path / label / "a.png"), np.zeros((5, 5, 3), np.uint8))
+        (tmp_path / label / "labels.json").write_text(json.dumps({"a.png": "12"}))
+    assert sorted(load_element_crops(tmp_path)) == ["hp_value", "move_1"]
+    with pytest.raises(ValueError):
+        load_element_crops(tmp_path / "hp_value")
+
+    crops = _crops()
+    engine = TesseractOCR()
+    with patch.object(engine, "_image_to_string", return_value="12/30"):
+        result = tune_strategy(
+            crops, engine=engine, space=[TuningParams(2.0, whitelist="/0123")]
+        )
+    path = tmp_path / "tuned.json"
+    save_tuning({"hp_value": result}, path)
+
+    tuned = load_tuned_strategies(path)
+    assert tuned["hp_value"].stages() == result.strategy().stages()
+    assert tuned["hp_value"].tesseract_config() == result.params.tesseract_config()
+
+    hp = PymordialText(label="hp_value", og_resolution=(1920, 1080), element_text="")
+    other = PymordialText(label="other", og_resolution=(1920, 1080), element_text="")
+    assert apply_tuned_strategies([hp, other], tuned) == 1
+    assert hp.extract_strategy is tuned["hp_value"]
+    assert other.extract_strategy is None
+
+    path.write_text("{not json")
+    with pytest.raises(ValueError):
+        load_tuned_strategies(path)
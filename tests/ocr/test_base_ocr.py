@@ -26,3 +26,11 @@ def test_concrete_ocr_read():
     result = ocr.extract_text(b"fake_image")
 
     assert result == "Mock OCR Text"
+
+
+def test_default_read_wraps_extract_text():
+    """Test that engines without word boxes still return an OcrResult."""
+    result = ConcreteOCR().read(b"fake_image")
+
+    assert result.lines() == ["Mock OCR Text"]
+    assert result.contains("ocr text")
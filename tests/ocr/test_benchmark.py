@@ -0,0 +1,96 @@
+"""Tests for the OCR preprocessing benchmark."""
+
+import json
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.ocr.benchmark import (
+    LabelledCrop,
+    benchmark_strategies,
+    character_accuracy,
+    edit_distance,
+    format_benchmarks,
+    load_labelled_crops,
+)
+from pymordial.ocr.extract_strategy import DefaultExtractStrategy, RevomonTextStrategy
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+
+
+def test_edit_distance_and_character_accuracy():
+    """Test the text comparison helpers."""
+    assert edit_distance("kitten", "sitting") == 3
+    assert edit_distance("", "abc") == 3
+    assert character_accuracy("HP 100", "hp  100") == 1.0
+    assert character_accuracy("Attack", "Atack") == pytest.approx(5 / 6)
+    assert character_accuracy("ab", "something else") == 0.0
+
+
+def test_load_labelled_crops(tmp_path):
+    """Test loading a crop directory with labels.json."""
+    cv2.imwrite(str(tmp_path / "a.png"), np.zeros((5, 5, 3), np.uint8))
+    (tmp_path / "labels.json").write_text(json.dumps({"a.png": "HP"}))
+
+    crops = load_labelled_crops(tmp_path)
+
+    assert [(crop.name, crop.label, crop.image.shape) for crop in crops] == [
+        ("a.png", "HP", (5, 5, 3))
+    ]
+    (tmp_path / "labels.json").write_text(json.dumps({"missing.png": "HP"}))
+    with pytest.raises(ValueError):
+        load_labelled_crops(tmp_path)
+    with pytest.raises(ValueError):
+        load_labelled_crops(tmp_path / "nowhere")
+
+
+def test_benchmark_reports_time_and_accuracy(mock_config):
+    """Test that each strategy gets timings and accuracy scores."""
+    crops = [
+        LabelledCrop("a", np.full((20, 60, 3), 255, np.uint8), "Attack"),
+        LabelledCrop("b", np.full((20, 60, 3), 255, np.uint8), "Escape"),
+    ]
+    engine = TesseractOCR()
+
+    with patch.object(engine, "_image_to_string", side_effect=["Attack", "Escap"] * 2):
+        results = benchmark_strategies(
+            {
+                "accurate": DefaultExtractStrategy(),
+                "fast": DefaultExtractStrategy("fast"),
+            },
+            crops,
+            engine=engine,
+        )
+
+    assert [result.name for result in results] == ["accurate", "fast"]
+    for result in results:
+        assert result.samples == 2
+        assert result.accuracy == 0.5
+        assert result.char_accuracy == pytest.approx((1 + 5 / 6) / 2)
+        assert result.total_ms == result.preprocess_ms + result.ocr_ms
+    table = format_benchmarks(results)
+    assert "accurate" in table and "50.0%" in table
+
+
+def test_benchmark_scores_extract_text_output(mock_config):
+    """Test that accuracy reflects the text extract_text returns."""
+    crops = [LabelledCrop("a", np.full((20, 60, 3), 255, np.uint8), "Phantom Force")]
+    engine = TesseractOCR()
+
+    with patch.object(engine, "_image_to_string", return_value=" Phantom\nForce,\n"):
+        (result,) = benchmark_strategies(
+            {"move": RevomonTextStrategy("move")}, crops, engine=engine
+        )
+        extracted = engine.extract_text(crops[0].image, RevomonTextStrategy("move"))
+
+    # postprocess_text would drop the comma, but extract_text keeps it
+    assert extracted == "Phantom\nForce,"
+    assert result.accuracy == 0.0
+    assert result.char_accuracy == character_accuracy("Phantom Force", extracted)
+
+
+def test_benchmark_validates_input(mock_config):
+    """Test that empty crop sets and bad repeat counts are rejected."""
+    with pytest.raises(ValueError):
+        benchmark_strategies({"x": DefaultExtractStrategy()}, [])
@@ -1,7 +1,30 @@
 """Tests for EasyOCR implementation."""
 
-from unittest.mock import patch
-from pymordial.ocr.easyocr_ocr import EasyOcrOCR
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pymordial.ocr.easyocr_ocr import (
+    EasyOcrOCR,
+    clear_easyocr_readers,
+    resolve_device,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_readers():
+    """Keeps shared readers from leaking between tests."""
+    clear_easyocr_readers()
+    yield
+    clear_easyocr_readers()
+
+
+@pytest.fixture(autouse=True)
+def _cpu_device():
+    """Resolves every engine to the CPU so the tests do not need torch."""
+    with patch("pymordial.ocr.easyocr_ocr.resolve_device", return_value="cpu"):
+        yield
+
 
 def test_easyocr_init(mock_config):
     """Test EasyOCR initialization."""
@@ -10,6 +33,7 @@ def test_easyocr_init(mock_config):
         assert ocr.reader is not None
         mock_reader.assert_called_once()
 
+
 def test_easyocr_read(mock_config):
     """Test reading text with EasyOCR."""
     with patch("pymordial.ocr.easyocr_ocr.easyocr.Reader") as mock_reader_class:
@@ -26,4 +50,104 @@ def test_easyocr_read(mock_config):
 
         # Check that the text components are present in the result tuples
         assert any(r[1] == "Hello" for r in result)
-        assert any(r[1] == "World" for r in result)
\ No newline at end of file
+        assert any(r[1] == "World" for r in result)
+
+
+def test_easyocr_passes_arrays_without_encoding(mock_config):
+    """Test that arrays reach readtext directly, converted BGR -> RGB."""
+    import numpy as np
+
+    from pymordial.core.frame import Frame
+
+    with patch("pymordial.ocr.easyocr_ocr.easyocr.Reader") as mock_reader_class:
+        mock_reader = mock_reader_class.return_value
+        mock_reader.readtext.return_value = ["Hello"]
+        ocr = EasyOcrOCR()
+        pixels = np.zeros((10, 20, 3), dtype=np.uint8)
+        pixels[..., 0] = 255
+        frame = Frame(pixels)  # Frames wrap RGB arrays
+
+        with patch("pymordial.ocr.easyocr_ocr.cv2.imencode") as mock_encode:
+            ocr.read_text(pixels)
+            ocr.read_text(frame)
+            mock_encode.assert_not_called()
+
+        from_array = mock_reader.readtext.call_args_list[0].args[0]
+        from_frame = mock_reader.readtext.call_args_list[1].args[0]
+        assert from_array[0, 0].tolist() == [0, 0, 255]
+        assert from_frame[0, 0].tolist() == [255, 0, 0]
+
+
+def test_easyocr_read_batch_pads_and_offsets(mock_config):
+    """Test that regions share one readtext_batched call."""
+    import numpy as np
+
+    with patch("pymordial.ocr.easyocr_ocr.easyocr.Reader") as mock_reader_class:
+        mock_reader = mock_reader_class.return_value
+        mock_reader.readtext_batched.return_value = [
+            [([(1, 2), (11, 2), (11, 8), (1, 8)], "Attack", 0.9)],
+            [],
+        ]
+        ocr = EasyOcrOCR(batch_size=4)
+        screen = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        results = ocr.read_regions(screen, [(10, 20, 50, 40), (0, 0, 30, 60)])
+
+        mock_reader.readtext_batched.assert_called_once()
+        batch = mock_reader.readtext_batched.call_args.args[0]
+        assert [image.shape for image in batch] == [(60, 40, 3), (60, 40, 3)]
+        assert mock_reader.readtext_batched.call_args.kwargs["batch_size"] == 4
+        assert results[0][0].text == "Attack"
+        assert results[0][0].box == (11, 22, 10, 6)
+        assert results[1] == []
+
+
+def test_easyocr_cpu_mode(mock_config):
+    """Test the CPU-tuned constructor."""
+    with patch("pymordial.ocr.easyocr_ocr.easyocr.Reader") as mock_reader_class:
+        ocr = EasyOcrOCR.for_cpu(["en"])
+        mock_reader_class.assert_not_called()
+
+        assert ocr.reader is mock_reader_class.return_value
+        mock_reader_class.assert_called_once_with(["en"], gpu=False, quantize=True)
+        assert ocr.gpu is False
+
+
+def test_readers_are_shared_per_languages_and_device(mock_config):
+    """Test that engines share one lazily created reader per key."""
+    from pymordial.ocr.easyocr_ocr import get_easyocr_reader, warmup_easyocr_reader
+
+    with patch("pymordial.ocr.easyocr_ocr.easyocr.Reader") as mock_reader_class:
+        mock_reader_class.side_effect = lambda *args, **kwargs: Mock()
+        a = EasyOcrOCR(["en"], gpu=False)
+        b = EasyOcrOCR(["en"], gpu=False)
+        c = EasyOcrOCR(["en", "fr"], gpu=False)
+
+        assert a.reader is b.reader
+        assert a.reader is get_easyocr_reader(["en"], gpu=False)
+        assert c.reader is not a.reader
+        assert mock_reader_class.call_count == 2
+
+        assert warmup_easyocr_reader(["en"], gpu=False) is a.reader
+        assert mock_reader_class.call_count == 2
+
+
+def test_gpu_without_cuda_shares_cpu_reader(mock_config):
+    """Test that gpu=True resolves to the CPU reader on hosts without CUDA."""
+    with patch("pymordial.ocr.easyocr_ocr.easyocr.Reader") as mock_reader_class:
+        with patch("pymordial.ocr.easyocr_ocr.resolve_device", return_value="cpu"):
+            gpu_engine = EasyOcrOCR(["en"], gpu=True)
+            cpu_engine = EasyOcrOCR(["en"], gpu=False)
+
+            assert gpu_engine.reader is cpu_engine.reader
+        mock_reader_class.assert_called_once_with(["en"], gpu=False, quantize=True)
+
+
+def test_resolve_device_without_torch():
+    """Test that gpu=True falls back to the CPU when torch is missing."""
+    import sys
+
+    with patch.dict(sys.modules, {"torch": None}):
+        assert resolve_device(True) == "cpu"
+    assert resolve_device(False) == "cpu"
+    assert resolve_device("cuda:1") == "cuda:1"
@@ -0,0 +1,97 @@
+"""Tests for the glyph-template recognizer."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.core.frame import Frame
+from pymordial.ocr.extract_strategy import DefaultExtractStrategy
+from pymordial.ocr.glyph_ocr import GlyphOCR, normalize_glyph, segment_glyphs
+
+TRAINING = ["0123456789", "9876543210", "1/20"]
+
+
+def _render(text: str, dark: bool = True) -> np.ndarray:
+    """Renders a HUD-style number (light on dark by default) as BGR."""
+    background, ink = ((30, 30, 30), (255, 255, 255)) if dark else (255, 0)
+    image = np.full((32, 20 * len(text) + 20, 3), background, dtype=np.uint8)
+    cv2.putText(image, text, (6, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.7, ink, 2)
+    return image
+
+
+@pytest.fixture(scope="module")
+def ocr():
+    return GlyphOCR.train([(_render(text), text) for text in TRAINING])
+
+
+def test_segment_glyphs_left_to_right():
+    """Test that each character becomes one glyph and short marks are dropped."""
+    gray = cv2.cvtColor(_render("12/5."), cv2.COLOR_BGR2GRAY)
+
+    boxes = [box for box, _ in segment_glyphs(gray)]
+
+    assert len(boxes) == 4
+    assert [box[0] for box in boxes] == sorted(box[0] for box in boxes)
+
+
+def test_normalize_glyph_keeps_narrow_glyphs_narrow():
+    """Test that normalization pads instead of stretching."""
+    canvas = normalize_glyph(np.ones((20, 4), dtype=bool), (16, 24))
+
+    assert canvas.shape == (24, 16)
+    assert canvas[:, 0].sum() == 0 and canvas[:, 8].sum() > 0
+
+
+@pytest.mark.parametrize("text", ["1250", "42", "100/120", "7 8"])
+def test_reads_unseen_numbers(ocr, text):
+    """Test reading values that were not in the training set."""
+    assert ocr.extract_text(_render(text)) == text
+
+
+def test_reads_frames_bytes_and_inverted_colors(ocr):
+    """Test input types and dark-on-light text."""
+    image = _render("305")
+    encoded = cv2.imencode(".png", image)[1].tobytes()
+
+    assert ocr.extract_text(Frame(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))) == "305"
+    assert ocr.extract_text(encoded) == "305"
+    assert ocr.extract_text(_render("64", dark=False)) == "64"
+
+
+def test_read_result_boxes_and_find(ocr):
+    """Test word grouping, confidence and find_text."""
+    result = ocr.read(_render("12 34"))
+
+    assert result.lines() == ["12 34"]
+    assert [word.text for word in result.words] == ["12", "34"]
+    assert all(word.confidence > 50 for word in result.words)
+    x, _ = ocr.find_text("34", _render("12 34"))
+    assert x > result.find("12").center[0]
+    assert ocr.find_text("99", _render("12 34")) is None
+    assert ocr.extract_text(np.zeros((20, 20, 3), np.uint8)) == ""
+
+
+def test_save_and_load_round_trip(ocr, tmp_path):
+    """Test persisting trained templates."""
+    path = ocr.save(tmp_path / "hud_digits.npz")
+    loaded = GlyphOCR.load(path)
+
+    assert loaded.characters == ocr.characters
+    assert loaded.extract_text(_render("2048")) == "2048"
+    with pytest.raises(ValueError):
+        GlyphOCR.load(tmp_path / "missing.npz")
+
+
+def test_training_with_strategy_and_bad_samples(mock_config):
+    """Test strategy-aware training and rejection of unusable samples."""
+    strategy = DefaultExtractStrategy(profile="fast")
+    ocr = GlyphOCR.train(
+        [(_render(text), text) for text in TRAINING] + [(_render("12"), "123")],
+        strategy=strategy,
+    )
+
+    assert ocr.extract_text(_render("4096")) == "4096"
+    with pytest.raises(ValueError):
+        GlyphOCR.train([(_render("12"), "1")])
+    with pytest.raises(ValueError):
+        GlyphOCR({})
@@ -0,0 +1,38 @@
+"""Tests for approximate OCR text matching."""
+
+import pytest
+
+from pymordial.ocr.matching import (
+    edit_distance,
+    normalize_text,
+    partial_similarity,
+    similarity,
+)
+
+
+def test_normalize_text():
+    """Test case folding and whitespace collapsing."""
+    assert normalize_text("  Phantom \n Force ") == "phantom force"
+
+
+def test_similarity():
+    """Test whole-string similarity."""
+    assert similarity("attack", "attack") == 1.0
+    assert similarity("attack", "attaek") == pytest.approx(5 / 6)
+    assert similarity("", "") == 1.0
+    assert edit_distance("kitten", "sitting") == 3
+
+
+@pytest.mark.parametrize(
+    ("needle", "haystack", "expected"),
+    [
+        ("hp", "hp:100", 1.0),
+        ("phantom force", "phant0m force", 12 / 13),
+        ("phantom force", "xx phantom forc", 12 / 13),
+        ("attack", "defend", 0.0),
+        ("", "anything", 1.0),
+    ],
+)
+def test_partial_similarity(needle, haystack, expected):
+    """Test best-substring scoring."""
+    assert partial_similarity(needle, haystack) == pytest.approx(expected)
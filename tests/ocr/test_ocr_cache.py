@@ -0,0 +1,92 @@
+"""Tests for the content-addressed OCR cache."""
+
+import numpy as np
+import pytest
+
+from pymordial.core.frame import Frame
+from pymordial.ocr.cache import OcrCache, image_digest, strategy_identity
+from pymordial.ocr.extract_strategy import DefaultExtractStrategy, RevomonTextStrategy
+
+
+def test_image_digest_is_content_addressed():
+    """Test that equal pixels give equal digests and different pixels do not."""
+    a = np.zeros((10, 10, 3), dtype=np.uint8)
+    b = a.copy()
+    c = a.copy()
+    c[0, 0, 0] = 1
+
+    assert image_digest(a) == image_digest(b)
+    assert image_digest(a) != image_digest(c)
+    assert image_digest(a) != image_digest(a.reshape(10, 30))
+    assert image_digest(b"abc") == image_digest(b"abc")
+
+
+def test_image_digest_memoized_on_frame():
+    """Test that a frame is only hashed once."""
+    frame = Frame(np.zeros((4, 4, 3), dtype=np.uint8))
+
+    assert image_digest(frame) is image_digest(frame)
+
+
+def test_strategy_identity_ignores_instance():
+    """Test that equivalent strategies share an identity."""
+    assert strategy_identity(DefaultExtractStrategy()) == strategy_identity(
+        DefaultExtractStrategy()
+    )
+    assert strategy_identity(RevomonTextStrategy("move")) != strategy_identity(
+        RevomonTextStrategy("level")
+    )
+
+
+def test_strategy_identity_rejects_unrepresentable_settings():
+    """Test that strategies holding lists or dicts have no shared identity."""
+
+    class WhitelistStrategy(DefaultExtractStrategy):
+        def __init__(self, words):
+            super().__init__()
+            self._words = words
+
+    assert strategy_identity(WhitelistStrategy(["HP"])) is None
+    assert strategy_identity(WhitelistStrategy(("HP",))) != strategy_identity(
+        WhitelistStrategy(("MP",))
+    )
+    assert strategy_identity(RevomonTextStrategy("move")) is not None
+
+
+def test_cache_lru_eviction_and_stats():
+    """Test bounded LRU eviction and hit/miss counters."""
+    cache = OcrCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    cache.get_or_compute("a", lambda: compute("A"))
+    cache.get_or_compute("b", lambda: compute("B"))
+    assert cache.get_or_compute("a", lambda: compute("A2")) == "A"
+    cache.get_or_compute("c", lambda: compute("C"))  # evicts "b"
+    cache.get_or_compute("b", lambda: compute("B2"))
+
+    assert calls == ["A", "B", "C", "B2"]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 4, 2)
+    assert stats.hit_rate == pytest.approx(0.2)
+
+
+def test_cache_does_not_store_failures():
+    """Test that exceptions propagate and are not cached."""
+    cache = OcrCache(maxsize=4)
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute("key", fail)
+    assert len(cache) == 0
+
+
+def test_cache_rejects_invalid_size():
+    """Test that the cache needs room for at least one entry."""
+    with pytest.raises(ValueError):
+        OcrCache(maxsize=0)
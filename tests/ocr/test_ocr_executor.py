@@ -0,0 +1,94 @@
+"""Tests for the process-pool OCR executor."""
+
+import os
+
+import numpy as np
+import pytest
+
+from pymordial.core.frame import Frame
+from pymordial.ocr.base import PymordialOCR
+from pymordial.ocr.executor import OcrExecutor, OcrJob
+from pymordial.ocr.extract_strategy import PymordialExtractStrategy
+from pymordial.ocr.tesseract_ocr import TesseractOCR
+
+
+class ShapeOCR(PymordialOCR):
+    """Engine reporting the shape it received and the worker it ran in."""
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+
+    def extract_text(self, image_path) -> str:
+        if not isinstance(image_path, np.ndarray):
+            raise ValueError("expected an array")
+        return f"{self.prefix}{image_path.shape[1]}x{image_path.shape[0]}@{os.getpid()}"
+
+    def find_text(self, search_text, image_path):
+        return None
+
+
+class UpperStrategy(PymordialExtractStrategy):
+    """Strategy that doubles the image width."""
+
+    def preprocess(self, image: np.ndarray) -> np.ndarray:
+        return np.hstack([image, image])
+
+    def tesseract_config(self) -> str:
+        return "--psm 7"
+
+
+class StrategyOCR(TesseractOCR):
+    """TesseractOCR whose recognition reports the preprocessed shape."""
+
+    def _image_to_string(self, image: np.ndarray, config: str) -> str:
+        return f"{image.shape[1]}x{image.shape[0]} {config}"
+
+
+@pytest.fixture
+def screen():
+    """Returns a 200x100 RGB screen."""
+    return np.zeros((100, 200, 3), dtype=np.uint8)
+
+
+def test_submit_runs_in_worker_process(screen):
+    """Test that regions are cropped and recognized in a worker."""
+    with OcrExecutor(ShapeOCR, {"prefix": "w:"}, max_workers=2) as executor:
+        text = executor.submit(Frame(screen), region=(10, 20, 60, 40)).result()
+
+    size, pid = text.split("@")
+    assert size == "w:50x20"
+    assert int(pid) != os.getpid()
+
+
+def test_extract_batch_preserves_order(screen):
+    """Test that batch results come back in job order."""
+    jobs = [OcrJob(image=Frame(screen), region=(0, 0, w, 10)) for w in (5, 50, 150)]
+
+    with OcrExecutor(ShapeOCR, max_workers=2) as executor:
+        executor.warmup()
+        texts = executor.extract_batch(jobs)
+
+    assert [text.split("@")[0] for text in texts] == ["5x10", "50x10", "150x10"]
+
+
+def test_strategy_preprocessing_runs_in_worker(screen):
+    """Test that strategies are applied by the worker's engine."""
+    with OcrExecutor(StrategyOCR, max_workers=1) as executor:
+        text = executor.submit(
+            screen, region=(0, 0, 30, 10), strategy=UpperStrategy()
+        ).result()
+
+    assert text == "60x10 --psm 7"
+
+
+def test_extract_batch_raises_on_failure():
+    """Test that a failing job surfaces as ValueError."""
+    with OcrExecutor(ShapeOCR, max_workers=1) as executor:
+        with pytest.raises(ValueError, match="batch"):
+            executor.extract_batch([OcrJob(image=b"not an image")])
+
+
+def test_invalid_worker_count():
+    """Test that at least one worker is required."""
+    with pytest.raises(ValueError):
+        OcrExecutor(ShapeOCR, max_workers=0)
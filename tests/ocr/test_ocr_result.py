@@ -0,0 +1,123 @@
+"""Tests for structured OCR results."""
+
+import pytest
+
+from pymordial.ocr.result import OcrResult, OcrWord
+
+
+def _result():
+    return OcrResult(
+        words=(
+            OcrWord("Battle", (10, 10, 40, 10), 95.0, (1, 1, 1)),
+            OcrWord("Start", (55, 12, 30, 10), 80.0, (1, 1, 1)),
+            OcrWord("HP", (10, 40, 15, 8), 90.0, (1, 1, 2)),
+            OcrWord("Start", (30, 40, 30, 8), 70.0, (1, 1, 2)),
+        )
+    )
+
+
+def test_lines_and_text():
+    """Test that words are grouped by line in reading order."""
+    result = _result()
+
+    assert result.lines() == ["Battle Start", "HP Start"]
+    assert result.text == "Battle Start\nHP Start"
+    assert len(result) == 4
+
+
+def test_contains_is_case_insensitive_by_default():
+    """Test substring and phrase containment."""
+    result = _result()
+
+    assert result.contains("battle start")
+    assert not result.contains("battle start", case_sensitive=True)
+    assert not result.contains("Defeat")
+
+
+def test_find_phrase_merges_boxes():
+    """Test that a phrase spanning words returns one spanning box."""
+    word = _result().find("battle start")
+
+    assert word.text == "Battle Start"
+    assert word.box == (10, 10, 75, 12)
+    assert word.confidence == 80.0
+    assert word.center == (47, 16)
+
+
+def test_find_all_and_missing():
+    """Test that every occurrence is returned, in reading order."""
+    result = _result()
+
+    assert [word.box for word in result.find_all("start")] == [
+        (55, 12, 30, 10),
+        (30, 40, 30, 8),
+    ]
+    assert result.find("defeat") is None
+    assert result.find_all("hp start battle") == []
+
+
+def test_within_keeps_words_centered_in_region():
+    """Test filtering a result down to a region."""
+    assert _result().within((0, 30, 100, 60)).lines() == ["HP Start"]
+
+
+def test_from_text_has_no_boxes():
+    """Test building a result from plain text."""
+    result = OcrResult.from_text("Level 5\n  Ready ")
+
+    assert result.lines() == ["Level 5", "Ready"]
+    assert result.contains("level 5")
+    assert result.find("ready").box == (0, 0, 0, 0)
+
+
+def _misread_result():
+    return OcrResult(
+        words=(
+            OcrWord("Phant0m", (10, 10, 60, 12), 60.0, (1, 1, 1)),
+            OcrWord("Force", (75, 10, 40, 12), 85.0, (1, 1, 1)),
+            OcrWord("Attaek", (10, 40, 50, 12), 55.0, (1, 1, 2)),
+            OcrWord("Defend", (70, 40, 50, 12), 90.0, (1, 1, 2)),
+        )
+    )
+
+
+def test_match_phrase_tolerates_misreads():
+    """Test fuzzy phrase matching across adjacent words."""
+    result = _misread_result()
+
+    assert result.find("phantom force") is None
+    match = result.match("Phantom Force")
+
+    assert match.text == "Phant0m Force"
+    assert match.box == (10, 10, 105, 12)
+    assert match.span == (0, 2)
+    assert match.score == pytest.approx(12 / 13)
+    assert match.confidence == 60.0
+    assert match.center == (62, 16)
+
+
+def test_match_threshold_and_best_score():
+    """Test the score threshold and picking the best candidate."""
+    result = _misread_result()
+
+    assert result.match("attack", min_score=0.9) is None
+    assert result.match("attack", min_score=0.8).text == "Attaek"
+    assert result.match("defend").score == 1.0
+    assert [m.text for m in result.match_all("force")] == ["Force"]
+    assert result.contains("attack", min_score=0.8)
+    assert not result.contains("attack")
+    with pytest.raises(ValueError):
+        result.match("attack", min_score=1.5)
+
+
+def test_match_all_returns_non_overlapping_spans():
+    """Test that each word belongs to at most one match."""
+    result = _result()
+
+    matches = result.match_all("start", min_score=1.0)
+
+    assert [m.span for m in matches] == [(1, 2), (3, 4)]
+    assert [m.text for m in result.match_all("Start", case_sensitive=True)] == [
+        "Start",
+        "Start",
+    ]
@@ -0,0 +1,218 @@
+"""Tests for the composable preprocessing pipeline."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.core.frame import Frame
+from pymordial.ocr import pipeline
+from pymordial.ocr.extract_strategy import (
+    DefaultExtractStrategy,
+    PipelineStrategy,
+    RevomonTextStrategy,
+)
+from pymordial.ocr.pipeline import (
+    Crop,
+    Denoise,
+    Gray,
+    Invert,
+    Pad,
+    Resize,
+    Threshold,
+    run_pipeline,
+)
+
+
+class CountingStage(Gray):
+    """Gray stage that counts how often it runs."""
+
+    calls = 0
+
+    def apply(self, image):
+        type(self).calls += 1
+        return super().apply(image)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    pipeline.clear_pipeline_cache()
+    CountingStage.calls = 0
+    yield
+    pipeline.clear_pipeline_cache()
+
+
+def _label(text: str = "Attack") -> np.ndarray:
+    image = np.full((40, 160, 3), 30, dtype=np.uint8)
+    cv2.putText(image, text, (8, 28), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (240,) * 3, 2)
+    return image
+
+
+def test_stages_are_hashable_values():
+    """Test that equal settings make equal, hashable stages."""
+    assert Resize(3.0) == Resize(3.0)
+    assert len({(Crop((0, 0, 10, 10)), Gray()), (Crop((0, 0, 10, 10)), Gray())}) == 1
+    with pytest.raises(ValueError):
+        Denoise("gaussian")
+    with pytest.raises(ValueError):
+        Resize(interpolation="lanczos")
+
+
+def test_individual_stages():
+    """Test the output shape and content of each stage."""
+    image = _label()
+
+    assert Crop((10, 5, 50, 25)).apply(image).shape == (20, 40, 3)
+    assert Crop((0.5, 0.0, 1.0, 0.5), relative=True).apply(image).shape == (20, 80, 3)
+    assert Resize(2.0).apply(image).shape == (80, 320, 3)
+    assert Gray().apply(image).ndim == 2
+    binary = Threshold().apply(Gray().apply(image))
+    assert set(np.unique(binary)) <= {0, 255}
+    # Dark background is flipped to black text on white
+    assert Invert().apply(binary).mean() > 127
+    assert Invert("always").apply(np.zeros((2, 2), np.uint8)).max() == 255
+    assert Pad(5).apply(binary).shape == (50, 170)
+    assert Threshold("adaptive").apply(image).ndim == 2
+
+
+def test_shared_prefix_runs_once():
+    """Test that strategies sharing a stage prefix reuse its output."""
+    image = _label()
+    base = (Crop((0, 0, 120, 40)), CountingStage())
+
+    otsu = run_pipeline(image, (*base, Threshold(), Invert()))
+    adaptive = run_pipeline(image, (*base, Threshold("adaptive")))
+    again = run_pipeline(image, (*base, Threshold(), Invert()))
+
+    assert CountingStage.calls == 1
+    assert again is otsu
+    assert adaptive.shape == otsu.shape
+
+
+def test_memo_is_per_content():
+    """Test that array sources are memoized by content, not identity."""
+    stages = (CountingStage(), Threshold())
+
+    run_pipeline(_label("Attack"), stages)
+    run_pipeline(_label("Attack"), stages)
+    run_pipeline(_label("Defend"), stages)
+
+    assert CountingStage.calls == 2
+
+
+def test_frames_memoize_on_the_frame():
+    """Test Frame sources, processed as BGR and cached on the frame."""
+    image = _label()
+    frame = Frame(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+
+    first = run_pipeline(frame, (CountingStage(), Threshold()))
+    run_pipeline(frame, (CountingStage(),))
+
+    assert CountingStage.calls == 1
+    np.testing.assert_array_equal(first, run_pipeline(image, (Gray(), Threshold())))
+
+
+def test_refilled_buffer_is_not_served_stale_results():
+    """Test that refilling a source array in place invalidates its outputs."""
+    buffer = _label("Attack")
+    stages = (Crop((0, 0, 120, 40)), Gray())
+    first = run_pipeline(buffer, stages).copy()
+
+    buffer[:] = _label("Defend")
+    refilled = run_pipeline(buffer, stages)
+
+    assert not np.array_equal(first, refilled)
+    np.testing.assert_array_equal(refilled, Gray().apply(buffer[:, :120]))
+
+    # Views into the source are taken from a private copy, not the buffer
+    buffer[:] = 0
+    np.testing.assert_array_equal(run_pipeline(_label("Defend"), stages), refilled)
+
+
+def test_array_memos_are_bounded(monkeypatch):
+    """Test that the array memo evicts the least recently used sources."""
+    monkeypatch.setattr(pipeline, "PIPELINE_CACHE_SIZE", 2)
+    for text in ("A", "B", "C"):
+        run_pipeline(_label(text), (Gray(),))
+
+    assert len(pipeline._array_memos) == 2
+
+
+def test_stages_must_implement_apply():
+    """Test that a stage without apply cannot be created."""
+
+    class Incomplete(pipeline.PreprocessStage):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_default_strategy_matches_stages(mock_config):
+    """Test that the default strategy is expressed as a shared pipeline."""
+    image = _label()
+    accurate = DefaultExtractStrategy()
+    median = DefaultExtractStrategy(denoise="median")
+
+    assert accurate.stages()[:2] == median.stages()[:2]
+    assert accurate.preprocess(image).shape == (80, 320)
+    assert set(np.unique(median.preprocess(image))) <= {0, 255}
+
+
+def test_revomon_modes_extend_default_stages(mock_config):
+    """Test that Revomon modes prepend crops and append padding."""
+    default_stages = DefaultExtractStrategy().stages()
+
+    level = RevomonTextStrategy(mode="level").stages()
+    move = RevomonTextStrategy(mode="move").stages()
+
+    assert isinstance(level[0], Crop) and level[1:] == default_stages
+    assert isinstance(move[0], Crop) and isinstance(move[-1], Pad)
+
+
+def test_pipeline_strategy(mock_config):
+    """Test building a strategy from explicit stages."""
+    strategy = PipelineStrategy([Gray(), Threshold(), Invert()], config="--psm 7")
+
+    assert strategy.tesseract_config() == "--psm 7"
+    assert strategy.preprocess(_label()).shape == (40, 160)
+    with pytest.raises(TypeError):
+        PipelineStrategy([Gray(), "threshold"])
+
+
+def test_map_box_to_source_undoes_crop_resize_and_pad():
+    """Test mapping a processed box back through every geometric stage."""
+    image = _label()
+    stages = (Crop((20, 10, 120, 40)), Resize(3.0), Gray(), Pad(5))
+    processed = run_pipeline(image, stages)
+    assert processed.shape == (90 + 10, 300 + 10)
+
+    # Box at (35, 20, 30, 15) in the processed image
+    assert pipeline.map_box_to_source((35, 20, 30, 15), image, stages) == (
+        20 + 10,
+        10 + 5,
+        10,
+        5,
+    )
+
+
+def test_strategy_source_box_adaptive_and_fallback(mock_config):
+    """Test mapping boxes for pipeline and custom strategies."""
+    from pymordial.ocr.extract_strategy import strategy_source_box
+
+    image = _label()
+    fast = DefaultExtractStrategy(profile="fast")
+    processed = fast.preprocess(image)
+    factor = processed.shape[1] / image.shape[1]
+
+    left, top, width, height = strategy_source_box(
+        fast, (round(40 * factor), 0, round(20 * factor), 10), image, processed
+    )
+    assert (left, width) == (40, 20)
+
+    class Doubling:
+        def preprocess(self, image):
+            return cv2.resize(image, None, fx=2, fy=2)
+
+    assert strategy_source_box(
+        Doubling(), (20, 10, 8, 4), image, Doubling().preprocess(image)
+    ) == (10, 5, 4, 2)
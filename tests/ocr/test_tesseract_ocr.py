@@ -45,4 +45,86 @@ def test_tesseract_ocr_read_with_config(mock_config):
             ocr = TesseractOCR(config="--psm 7")
             result = ocr.extract_text(b"fake_image")
 
-            assert result == "Configured Text"
\ No newline at end of file
+            assert result == "Configured Text"
+
+
+class _UpscaleStrategy:
+    """Strategy that upscales 2x without other changes."""
+
+    def preprocess(self, image):
+        import cv2
+
+        return cv2.resize(image, None, fx=2, fy=2, interpolation=cv2.INTER_NEAREST)
+
+    def tesseract_config(self):
+        return "--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789"
+
+
+def test_read_batch_single_call_maps_boxes_back(mock_config):
+    """Test that crops are stacked once and word boxes mapped to each source."""
+    ocr = TesseractOCR()
+    crops = [np.zeros((10, 40, 3), np.uint8), np.zeros((20, 30, 3), np.uint8)]
+    canvases = []
+
+    def fake_image_to_data(canvas, config):
+        canvases.append((canvas, config))
+        # Second crop starts at y = padding + (2 * 10 + separator) = 10 + 44
+        return {
+            "text": ["12", "", "34"],
+            "conf": [90, -1, 80],
+            "left": [14, 0, 20],
+            "top": [12, 0, 58],
+            "width": [20, 0, 10],
+            "height": [10, 0, 20],
+            "block_num": [1, 1, 1],
+            "par_num": [1, 1, 1],
+            "line_num": [1, 1, 2],
+        }
+
+    with patch.object(ocr, "_image_to_data", side_effect=fake_image_to_data):
+        results = ocr.read_batch(
+            crops, strategy=_UpscaleStrategy(), offsets=[(100, 200), (0, 0)]
+        )
+
+    assert len(canvases) == 1
+    canvas, config = canvases[0]
+    assert canvas.ndim == 2
+    assert "--psm 6" in config and "--psm 7" not in config
+    assert "tessedit_char_whitelist" in config
+    assert [word.text for word in results[0]] == ["12"]
+    assert results[0][0].box == (102, 201, 10, 5)
+    assert [word.text for word in results[1]] == ["34"]
+    assert results[1][0].box == (5, 2, 5, 10)
+
+
+def test_read_batch_validates_offsets(mock_config):
+    """Test that offsets must align with the images."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        TesseractOCR().read_batch([np.zeros((5, 5, 3), np.uint8)], offsets=[])
+    assert TesseractOCR().read_batch([]) == []
+
+
+def test_read_single_pass_maps_boxes_back(mock_config):
+    """Test that read() runs image_to_data once and undoes the upscale."""
+    ocr = TesseractOCR()
+    data = {
+        "text": ["", "HP", "100"],
+        "conf": [-1, 91, 88],
+        "left": [0, 10, 40],
+        "top": [0, 6, 6],
+        "width": [0, 20, 30],
+        "height": [0, 10, 10],
+        "block_num": [1, 1, 1],
+        "par_num": [1, 1, 1],
+        "line_num": [1, 1, 1],
+    }
+
+    with patch.object(ocr, "_image_to_data", return_value=data) as mock_data:
+        result = ocr.read(np.zeros((20, 60, 3), np.uint8), strategy=_UpscaleStrategy())
+
+    mock_data.assert_called_once()
+    assert result.lines() == ["HP 100"]
+    assert result.find("hp").box == (5, 3, 10, 5)
+    assert result.find("hp 100").box == (5, 3, 30, 5)
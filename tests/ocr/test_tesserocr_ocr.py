@@ -0,0 +1,187 @@
+"""Tests for the in-process Tesseract implementation."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+import pytest
+
+pytest.importorskip("tesserocr")
+
+from pymordial.core.frame import Frame  # noqa: E402
+from pymordial.ocr.extract_strategy import PymordialExtractStrategy  # noqa: E402
+from pymordial.ocr.tesserocr_ocr import (  # noqa: E402
+    TesseractApiPool,
+    TesserocrOCR,
+    parse_tesseract_config,
+)
+
+
+class _PassthroughStrategy(PymordialExtractStrategy):
+    """Strategy that feeds the image to Tesseract unchanged."""
+
+    def __init__(self, config: str = "--oem 3 --psm 7"):
+        self.config = config
+
+    def preprocess(self, image: np.ndarray) -> np.ndarray:
+        return image
+
+    def tesseract_config(self) -> str:
+        return self.config
+
+
+def _render(text: str, width: int = 320) -> np.ndarray:
+    """Renders black text on a white BGR canvas."""
+    image = np.full((60, width, 3), 255, dtype=np.uint8)
+    cv2.putText(image, text, (10, 42), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+    return image
+
+
+@pytest.fixture(scope="module")
+def ocr():
+    """Returns a shared engine so the model is loaded once for the module."""
+    engine = TesserocrOCR(pool=TesseractApiPool(size=2))
+    yield engine
+    engine.close()
+
+
+def test_parse_tesseract_config():
+    """Test that config strings are split into psm, oem and variables."""
+    psm, oem, variables, language = parse_tesseract_config(
+        "--oem 1 --psm 7 -l eng -c tessedit_char_whitelist=0123456789"
+    )
+
+    assert (psm, oem, language) == (7, 1, "eng")
+    assert variables == {"tessedit_char_whitelist": "0123456789"}
+    assert parse_tesseract_config("") == (None, None, {}, None)
+
+    with pytest.raises(ValueError):
+        parse_tesseract_config("--psm")
+
+
+def test_extract_text_from_array(ocr):
+    """Test recognition of a NumPy array without subprocesses."""
+    text = ocr.extract_text(_render("Hello World"), strategy=_PassthroughStrategy())
+
+    assert text == "Hello World"
+
+
+def test_extract_text_from_frame_and_default_strategy(ocr):
+    """Test that Frames and the default preprocessing are supported."""
+    frame = Frame(cv2.cvtColor(_render("Battle"), cv2.COLOR_BGR2RGB))
+
+    assert "Battle" in ocr.extract_text(frame)
+
+
+def test_config_variables_are_scoped_to_the_call(ocr):
+    """Test that -c variables do not leak into later calls on the same handle."""
+    digits_only = _PassthroughStrategy("--psm 7 -c tessedit_char_whitelist=0123456789")
+    image = _render("Level 42")
+
+    assert ocr.extract_text(image, strategy=digits_only) == "42"
+    assert "Level" in ocr.extract_text(image, strategy=_PassthroughStrategy())
+
+
+def test_find_text_returns_word_center(ocr):
+    """Test that find_text uses word boxes from the in-process API."""
+    coords = ocr.find_text(
+        "world", _render("Hello World"), strategy=_PassthroughStrategy()
+    )
+
+    assert coords is not None
+    assert 100 < coords[0] < 200
+    assert 10 < coords[1] < 50
+
+
+def test_pool_is_thread_safe_and_bounded(ocr):
+    """Test concurrent calls reuse at most ``size`` handles."""
+    words = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Hotel", "Kilo", "Lima"]
+    images = [_render(word) for word in words]
+    strategy = _PassthroughStrategy()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        texts = list(
+            executor.map(lambda im: ocr.extract_text(im, strategy=strategy), images)
+        )
+
+    assert texts == words
+    assert len(ocr.pool) <= ocr.pool.size
+
+
+def test_pool_rejects_invalid_size():
+    """Test that the pool needs at least one handle."""
+    with pytest.raises(ValueError):
+        TesseractApiPool(size=0)
+
+
+def test_read_regions_single_pass(ocr):
+    """Test reading several labels of one screen with one recognition."""
+    screen = np.full((200, 400, 3), 255, dtype=np.uint8)
+    labels = {(10, 10, 200, 60): "Attack", (210, 120, 400, 170): "Escape"}
+    for (left, top, _, _), text in labels.items():
+        cv2.putText(
+            screen, text, (left + 5, top + 35), cv2.FONT_HERSHEY_SIMPLEX, 1, 0, 2
+        )
+
+    results = ocr.read_regions(screen, list(labels), strategy=_PassthroughStrategy())
+
+    assert [[word.text for word in words] for words in results] == [
+        ["Attack"],
+        ["Escape"],
+    ]
+    left, top, width, height = results[1][0].box
+    assert 210 <= left < 230 and 125 <= top < 160
+
+
+def test_read_answers_many_queries_from_one_pass(ocr):
+    """Test that one read() result locates several words."""
+    result = ocr.read(_render("Hello World"), strategy=_PassthroughStrategy())
+
+    assert result.contains("hello world")
+    hello, world = result.find("hello"), result.find("world")
+    assert hello.center[0] < world.center[0]
+    assert result.find("hello world").box[2] > hello.box[2]
+
+
+def test_find_text_via_detected_regions(ocr):
+    """Test full-frame find_text that only OCRs detected text regions."""
+    from pymordial.controller.text_controller import TextController
+    from pymordial.vision.text_regions import TextRegionDetector
+
+    screen = np.full((720, 1280, 3), 90, dtype=np.uint8)
+    cv2.rectangle(screen, (50, 50), (500, 400), (220, 220, 220), -1)
+    cv2.putText(screen, "Attack", (80, 150), cv2.FONT_HERSHEY_SIMPLEX, 1, 0, 2)
+    cv2.putText(
+        screen, "Escape", (900, 600), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2
+    )
+    controller = TextController(ocr, text_detector=TextRegionDetector(cache_size=0))
+
+    x, y = controller.find_text("escape", Frame(screen))
+
+    assert 900 <= x < 1020 and 570 <= y < 605
+
+
+def test_find_text_maps_cropped_padded_strategy_to_source(ocr):
+    """Test that find_text undoes a strategy's crop, upscale and padding."""
+    from pymordial.ocr.extract_strategy import PipelineStrategy
+    from pymordial.ocr.pipeline import Crop, Gray, Invert, Pad, Resize, Threshold
+
+    image = np.full((120, 400, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "Attack", (200, 80), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0,) * 3, 2)
+    strategy = PipelineStrategy(
+        (
+            Crop((150, 40, 400, 100)),
+            Resize(2.0),
+            Gray(),
+            Threshold(),
+            Invert(),
+            Pad(30),
+        ),
+        config="--oem 3 --psm 7",
+    )
+
+    x, y = ocr.find_text("attack", image, strategy=strategy)
+
+    ink_y, ink_x = np.nonzero(image[:, :, 0] < 128)
+    assert abs(x - (ink_x.min() + ink_x.max()) / 2) <= 4
+    assert abs(y - (ink_y.min() + ink_y.max()) / 2) <= 4
@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from pymordial.controller.pymordial_controller import PymordialController
+from pymordial.core.frame import Frame
 
 
 class TestConvenienceMethods:
@@ -64,7 +65,8 @@ class TestConvenienceMethods:
 
         # Verify
         controller.adb.capture_screenshot.assert_called_once()  # Verify ADB call
-        assert result == mock_screenshot
+        assert isinstance(result, Frame)
+        assert result.data == mock_screenshot
 
     def test_capture_screen_returns_none_on_failure(self, controller):
         """Test that capture_screen() properly returns None on failure."""
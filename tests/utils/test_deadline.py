@@ -0,0 +1,82 @@
+"""Tests for deadline scopes and their effect on retries."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pymordial.utils.deadline import (
+    Deadline,
+    bound_timeout,
+    current_deadline,
+    deadline_scope,
+)
+from pymordial.utils.retry import FixedRetry
+
+
+@pytest.fixture
+def clock():
+    """Replaces monotonic time with a clock advanced only by sleeps."""
+    now = [100.0]
+
+    def fake_sleep(seconds):
+        now[0] += seconds
+
+    with (
+        patch("pymordial.utils.retry.time.monotonic", side_effect=lambda: now[0]),
+        patch("pymordial.utils.retry.time.sleep", side_effect=fake_sleep) as sleep,
+    ):
+        yield now, sleep
+
+
+def test_scopes_nest_to_tightest(clock):
+    """Test that inner scopes can shorten but never extend the budget."""
+    assert current_deadline() is None
+    assert bound_timeout(7.0) == 7.0
+
+    with deadline_scope(2.0) as outer:
+        assert outer.remaining() == 2.0
+        with deadline_scope(5.0) as inner:
+            assert inner is outer
+        with deadline_scope(0.5) as inner:
+            assert inner.remaining() == 0.5
+            assert bound_timeout(None) == 0.5
+        with deadline_scope(None) as same:
+            assert same is outer
+        assert bound_timeout(7.0) == 2.0
+
+    assert current_deadline() is None
+
+
+def test_deadline_validation():
+    """Test that negative budgets are rejected."""
+    with pytest.raises(ValueError):
+        Deadline.after(-1)
+
+
+def test_nested_retries_share_budget(clock):
+    """Test that an inner retry loop cannot outlast the outer timeout."""
+    now, sleep = clock
+    start = now[0]
+    inner = MagicMock(return_value=False)
+
+    def outer_attempt():
+        # Would take 5 attempts x 1 s on its own
+        return FixedRetry(interval=1.0, max_attempts=5).run(inner, name="inner")
+
+    result = FixedRetry(interval=1.0, timeout=2.5).run(outer_attempt, name="outer")
+
+    assert result is False
+    assert now[0] - start == pytest.approx(2.5)
+    assert inner.call_count == 4
+
+
+def test_expired_deadline_allows_single_attempt(clock):
+    """Test that an exhausted budget still makes one attempt without sleeping."""
+    _, sleep = clock
+    attempt = MagicMock(return_value=None)
+
+    with deadline_scope(0.0):
+        FixedRetry(interval=1.0, max_attempts=5).run(attempt)
+
+    assert attempt.call_count == 1
+    sleep.assert_not_called()
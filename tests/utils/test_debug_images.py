@@ -0,0 +1,71 @@
+"""Tests for the background debug image writer."""
+
+import threading
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.utils.debug_images import DebugImageWriter, get_debug_writer
+
+
+def test_writer_saves_images_in_background(tmp_path):
+    """Test that queued images are written and boxes drawn on a copy."""
+    writer = DebugImageWriter(tmp_path / "debug")
+    image = np.zeros((20, 30), np.uint8)
+
+    assert writer.submit("pixel/hp bar", image, boxes=[(2, 2, 10, 10)])
+    assert writer.submit("plain", np.zeros((5, 5, 3), np.uint8))
+    assert writer.flush(timeout=5)
+
+    written = sorted(path.name for path in (tmp_path / "debug").iterdir())
+    assert written == ["pixel_hp_bar_000000.png", "plain_000001.png"]
+    saved = cv2.imread(str(tmp_path / "debug" / written[0]))
+    assert tuple(saved[2, 2]) == (0, 0, 255)
+    assert not image.any()
+    assert writer.stats.written == 2
+    writer.close()
+    assert not writer.submit("late", image)
+
+
+def test_writer_samples_and_drops(tmp_path):
+    """Test 1-in-N sampling and dropping when the queue is full."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow_imwrite(path, image):
+        started.set()
+        release.wait(5)
+        return True
+
+    writer = DebugImageWriter(tmp_path, queue_size=1, sample_every=2)
+    image = np.zeros((4, 4), np.uint8)
+    with patch("pymordial.utils.debug_images.cv2.imwrite", side_effect=slow_imwrite):
+        assert writer.submit("a", image)  # picked up by the worker
+        assert started.wait(5)
+        assert not writer.submit("b", image)  # sampled out
+        assert writer.submit("c", image)  # fills the queue
+        assert not writer.submit("d", image)  # sampled out
+        assert not writer.submit("e", image)  # dropped
+        release.set()
+        assert writer.flush(timeout=5)
+
+    stats = writer.stats
+    assert (stats.submitted, stats.skipped, stats.dropped, stats.written) == (
+        5,
+        2,
+        1,
+        2,
+    )
+    writer.close(timeout=5)
+
+
+def test_writer_validates_and_shares(tmp_path):
+    """Test argument validation and per-directory shared writers."""
+    with pytest.raises(ValueError):
+        DebugImageWriter(tmp_path, queue_size=0)
+    with pytest.raises(ValueError):
+        DebugImageWriter(tmp_path, sample_every=0)
+    assert get_debug_writer(tmp_path) is get_debug_writer(str(tmp_path))
+    assert get_debug_writer(tmp_path) is not get_debug_writer(tmp_path / "other")
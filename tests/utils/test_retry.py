@@ -0,0 +1,109 @@
+"""Tests for retry policies and their statistics."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pymordial.utils.retry import (
+    ExponentialRetry,
+    FixedRetry,
+    RetryPolicy,
+    get_retry_stats,
+    reset_retry_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    """Clears the retry statistics around each test."""
+    reset_retry_stats()
+    yield
+    reset_retry_stats()
+
+
+def test_fixed_retry_until_success():
+    """Test that a fixed policy retries at its interval and records stats."""
+    attempt = MagicMock(side_effect=[False, False, True])
+
+    with patch("pymordial.utils.retry.time.sleep") as sleep:
+        result = FixedRetry(interval=0.5, max_attempts=5).run(attempt, name="op")
+
+    assert result is True
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 0.5]
+    stats = get_retry_stats()["op"]
+    assert (stats.calls, stats.successes, stats.attempts) == (1, 1, 3)
+    assert stats.max_attempts == 3
+
+
+def test_retry_gives_up_at_max_attempts():
+    """Test that the last result is returned when attempts run out."""
+    attempt = MagicMock(return_value=None)
+
+    with patch("pymordial.utils.retry.time.sleep"):
+        result = FixedRetry(interval=0, max_attempts=3).run(attempt, name="op")
+
+    assert result is None
+    assert attempt.call_count == 3
+    stats = get_retry_stats()["op"]
+    assert stats.failures == 1
+    assert stats.mean_success_seconds == 0.0
+
+
+def test_retry_stops_at_deadline():
+    """Test that sleeps are clipped to the remaining time budget."""
+    now = [0.0]
+
+    def fake_sleep(seconds):
+        now[0] += seconds
+
+    with (
+        patch("pymordial.utils.retry.time.monotonic", side_effect=lambda: now[0]),
+        patch("pymordial.utils.retry.time.sleep", side_effect=fake_sleep) as sleep,
+    ):
+        result = FixedRetry(interval=0.5, timeout=0.8).run(lambda: 0, name="op")
+
+    assert result == 0
+    assert [call.args[0] for call in sleep.call_args_list] == pytest.approx([0.5, 0.3])
+    assert get_retry_stats()["op"].attempts == 3
+
+
+def test_exponential_and_jitter():
+    """Test capped exponential delays and jitter bounds."""
+    policy = ExponentialRetry(initial=0.1, factor=2.0, max_interval=0.3)
+    assert [policy.delay(n) for n in (1, 2, 3, 4)] == pytest.approx(
+        [0.1, 0.2, 0.3, 0.3]
+    )
+
+    jittered = FixedRetry(interval=1.0, jitter=0.5)
+    assert all(0.5 <= jittered.delay(1) <= 1.5 for _ in range(50))
+
+
+def test_with_limits_keeps_tighter_bound():
+    """Test that call-site limits never loosen a policy."""
+    policy = FixedRetry(interval=1.0, max_attempts=3, timeout=10)
+
+    assert policy.with_limits(max_attempts=5).max_attempts == 3
+    assert policy.with_limits(timeout=2).timeout == 2
+    assert FixedRetry().with_limits(max_attempts=None).max_attempts is None
+
+
+def test_policy_validation():
+    """Test that invalid limits are rejected."""
+    with pytest.raises(ValueError):
+        FixedRetry(max_attempts=0)
+    with pytest.raises(ValueError):
+        FixedRetry(timeout=-1)
+    with pytest.raises(ValueError):
+        ExponentialRetry(jitter=2.0)
+
+
+def test_policy_requires_base_delay():
+    """Test that a policy without a delay cannot be created."""
+
+    class Incomplete(RetryPolicy):
+        pass
+
+    with pytest.raises(TypeError):
+        RetryPolicy()
+    with pytest.raises(TypeError):
+        Incomplete(max_attempts=3)
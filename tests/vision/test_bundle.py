@@ -0,0 +1,169 @@
+"""Tests for precompiled asset bundles."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.core.elements.pymordial_image import PymordialImage
+from pymordial.core.elements.pymordial_pixel import PymordialPixel
+from pymordial.vision.bundle import AssetBundle, build_asset_bundle, load_asset_bundle
+from pymordial.vision.templates import load_template
+
+
+@pytest.fixture
+def elements(tmp_path):
+    """Returns an opaque and an alpha-masked image element plus a pixel."""
+    rng = np.random.default_rng(0)
+    opaque = rng.integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+    cv2.imwrite(str(tmp_path / "opaque.png"), opaque)
+
+    alpha = np.zeros((16, 16), dtype=np.uint8)
+    cv2.circle(alpha, (8, 8), 6, 255, -1)
+    masked = np.dstack([rng.integers(0, 256, size=(16, 16, 3), dtype=np.uint8), alpha])
+    cv2.imwrite(str(tmp_path / "masked.png"), masked)
+
+    return [
+        PymordialImage(
+            label="opaque",
+            filepath=tmp_path / "opaque.png",
+            confidence=0.8,
+            og_resolution=(1280, 720),
+        ),
+        PymordialImage(
+            label="masked", filepath=tmp_path / "masked.png", confidence=0.9
+        ),
+        PymordialPixel(label="pixel", position=(1, 1), pixel_color=(0, 0, 0)),
+    ]
+
+
+def test_bundle_round_trip(tmp_path, elements):
+    """Test that bundled arrays match the decoded assets."""
+    path = build_asset_bundle(elements, tmp_path / "app.pymb")
+    bundle = AssetBundle(path)
+
+    opaque, masked = elements[0].filepath, elements[1].filepath
+    assert len(bundle) == 2
+    assert "pixel" not in bundle
+    assert bundle.keys == ["opaque.png", "masked.png"]
+    assert np.array_equal(bundle.bgr(opaque), cv2.imread(str(opaque)))
+    assert bundle.mask(opaque) is None
+
+    direct = load_template(masked)
+    assert np.array_equal(bundle.gray(masked), direct.gray)
+    assert np.array_equal(bundle.mask(masked), direct.mask)
+    assert bundle.metadata(masked)["labels"] == ["masked"]
+
+
+def test_bundle_arrays_are_memory_mapped(tmp_path, elements):
+    """Test that arrays are read-only views into one mapping."""
+    bundle = AssetBundle(build_asset_bundle(elements, tmp_path / "app.pymb"))
+    gray = bundle.gray(elements[0].filepath)
+
+    assert isinstance(gray.base, np.memmap) or isinstance(gray, np.memmap)
+    assert not gray.flags.writeable
+
+
+def test_bundle_template_cached_per_scale(tmp_path, elements):
+    """Test that scaled templates are computed once per scale."""
+    bundle = AssetBundle(build_asset_bundle(elements, tmp_path / "app.pymb"))
+
+    half = bundle.template(elements[1].filepath, (0.5, 0.5))
+    assert half.size == (8, 8)
+    assert half.is_masked
+    assert bundle.template(elements[1].filepath, (0.5, 0.5)) is half
+
+
+def test_build_shares_assets_between_elements(tmp_path, elements):
+    """Test that shared elements and reused images are stored once."""
+    opaque = elements[0]
+    same_file = PymordialImage(
+        label="opaque_again",
+        filepath=opaque.filepath,
+        confidence=0.7,
+        og_resolution=(1920, 1080),
+    )
+    reused_label = PymordialImage(
+        label="opaque", filepath=elements[1].filepath, confidence=0.9
+    )
+
+    bundle = AssetBundle(
+        build_asset_bundle(
+            [opaque, opaque, same_file, reused_label], tmp_path / "app.pymb"
+        )
+    )
+
+    assert len(bundle) == 2
+    assert bundle.metadata(opaque.filepath)["labels"] == ["opaque", "opaque_again"]
+
+
+def test_bundle_matches_checks_source(tmp_path, elements):
+    """Test that stale or missing assets are not used."""
+    opaque = elements[0]
+    bundle = AssetBundle(build_asset_bundle(elements, tmp_path / "app.pymb"))
+
+    assert bundle.matches(opaque.filepath)
+    assert not bundle.matches(tmp_path / "other.png")
+
+    cv2.imwrite(str(opaque.filepath), np.zeros((20, 30, 3), dtype=np.uint8))
+    assert not bundle.matches(opaque.filepath)
+
+    opaque.filepath.unlink()
+    assert bundle.matches(opaque.filepath)
+
+
+def test_bundle_matches_assets_installed_elsewhere(tmp_path):
+    """Test that a bundle built in one directory works from another."""
+    image = np.random.default_rng(1).integers(0, 256, size=(12, 18, 3), dtype=np.uint8)
+    for install in ("build", "deploy"):
+        for screen in ("home", "shop"):
+            (tmp_path / install / "assets" / screen).mkdir(parents=True)
+            cv2.imwrite(str(tmp_path / install / "assets" / screen / "play.png"), image)
+    cv2.imwrite(str(tmp_path / "build" / "assets" / "shop" / "play.png"), 255 - image)
+
+    def element(install, screen):
+        return PymordialImage(
+            label=f"{screen}_play",
+            filepath=tmp_path / install / "assets" / screen / "play.png",
+            confidence=0.8,
+        )
+
+    bundle = AssetBundle(
+        build_asset_bundle(
+            [element("build", "home"), element("build", "shop")],
+            tmp_path / "app.pymb",
+        )
+    )
+    assert bundle.keys == ["home/play.png", "shop/play.png"]
+
+    home, shop = element("deploy", "home"), element("deploy", "shop")
+    assert bundle.matches(home.filepath)
+    assert np.array_equal(bundle.bgr(home.filepath), image)
+    assert np.array_equal(bundle.bgr(shop.filepath), 255 - image)
+    # The deployed shop image differs from the one bundled
+    assert not bundle.matches(shop.filepath)
+
+    shop.filepath.unlink()
+    assert bundle.matches(shop.filepath)
+    assert not bundle.matches(tmp_path / "deploy" / "assets" / "play.png")
+    with pytest.raises(ValueError):
+        build_asset_bundle(
+            [element("build", "home")], tmp_path / "x.pymb", root=tmp_path / "deploy"
+        )
+
+
+def test_invalid_bundle(tmp_path):
+    """Test that non-bundle files are rejected."""
+    path = tmp_path / "bad.pymb"
+    path.write_bytes(b"not a bundle at all")
+
+    with pytest.raises(ValueError, match="Not an asset bundle"):
+        AssetBundle(path)
+    with pytest.raises(ValueError, match="Could not open"):
+        load_asset_bundle(tmp_path / "missing.pymb")
+
+
+def test_load_asset_bundle_reuses_mapping(tmp_path, elements):
+    """Test that the same file is only mapped once."""
+    path = build_asset_bundle(elements, tmp_path / "app.pymb")
+
+    assert load_asset_bundle(path) is load_asset_bundle(str(path))
@@ -0,0 +1,83 @@
+"""Tests for feature-based matching."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.vision.features import (
+    clear_template_cache,
+    create_detector,
+    extract_features,
+    load_template_features,
+    match_features,
+)
+
+
+@pytest.fixture
+def template_gray():
+    """Returns a 120x90 blocky grayscale texture with plenty of corners."""
+    rng = np.random.default_rng(0)
+    blocks = rng.integers(0, 256, size=(9, 12), dtype=np.uint8)
+    return cv2.resize(blocks, (120, 90), interpolation=cv2.INTER_NEAREST)
+
+
+@pytest.fixture
+def scaled_scene(template_gray):
+    """Returns a 640x480 scene holding the template scaled by 1.25 at (300, 200)."""
+    scene = np.full((480, 640), 127, dtype=np.uint8)
+    scaled = cv2.resize(template_gray, None, fx=1.25, fy=1.25)
+    h, w = scaled.shape
+    scene[200 : 200 + h, 300 : 300 + w] = scaled
+    return scene, (300 + w // 2, 200 + h // 2)
+
+
+def test_create_detector_rejects_unknown():
+    """Test that unsupported detectors raise ValueError."""
+    with pytest.raises(ValueError, match="Unsupported detector"):
+        create_detector("sift")
+
+
+@pytest.mark.parametrize("detector", ["orb", "akaze"])
+def test_match_features_finds_scaled_template(template_gray, scaled_scene, detector):
+    """Test that a scaled template is located in one pass."""
+    if detector == "akaze" and not hasattr(cv2, "AKAZE_create"):
+        pytest.skip("AKAZE not available in this OpenCV build")
+    scene, expected_center = scaled_scene
+
+    match = match_features(
+        extract_features(template_gray, detector),
+        extract_features(scene, detector),
+    )
+
+    assert match is not None
+    assert abs(match.center[0] - expected_center[0]) <= 5
+    assert abs(match.center[1] - expected_center[1]) <= 5
+    assert match.inlier_ratio > 0.5
+
+
+def test_match_features_not_found(template_gray):
+    """Test that a blank scene yields no match."""
+    scene = np.full((480, 640), 127, dtype=np.uint8)
+
+    match = match_features(extract_features(template_gray), extract_features(scene))
+
+    assert match is None
+
+
+def test_load_template_features_is_cached(tmp_path, template_gray):
+    """Test that template descriptors are computed once per asset."""
+    clear_template_cache()
+    path = tmp_path / "template.png"
+    cv2.imwrite(str(path), template_gray)
+
+    first = load_template_features(path)
+    second = load_template_features(str(path))
+
+    assert first is second
+    assert len(first) > 0
+
+
+def test_load_template_features_missing_file(tmp_path):
+    """Test that a missing template raises ValueError."""
+    with pytest.raises(ValueError, match="Could not read template"):
+        load_template_features(tmp_path / "missing.png")
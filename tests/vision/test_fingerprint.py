@@ -0,0 +1,105 @@
+"""Tests for perceptual-hash screen fingerprints."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.core.frame import Frame
+from pymordial.core.pymordial_screen import PymordialScreen
+from pymordial.vision.fingerprint import (
+    ScreenFingerprintIndex,
+    dhash,
+    fingerprint,
+    phash,
+)
+
+
+def _screen(seed: int) -> np.ndarray:
+    """Returns a distinct 1280x720 RGB test screen."""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, size=(9, 16, 3), dtype=np.uint8)
+    return cv2.resize(blocks, (1280, 720), interpolation=cv2.INTER_NEAREST)
+
+
+@pytest.mark.parametrize("hasher", [dhash, phash])
+def test_hash_is_stable_under_noise(hasher):
+    """Test that small pixel noise barely changes the hash."""
+    gray = cv2.cvtColor(_screen(0), cv2.COLOR_RGB2GRAY)
+    noisy = np.clip(
+        gray.astype(np.int16) + np.random.default_rng(1).integers(-4, 5, gray.shape),
+        0,
+        255,
+    ).astype(np.uint8)
+
+    assert bin(hasher(gray) ^ hasher(noisy)).count("1") <= 4
+
+
+def test_fingerprint_is_cached_on_frame():
+    """Test that a frame is hashed once per method."""
+    frame = Frame(_screen(0))
+
+    first = fingerprint(frame)
+    frame._rgb = None  # Would break a recomputation
+    frame._gray = None
+
+    assert fingerprint(frame) == first
+
+
+def test_fingerprint_invalid_method():
+    """Test unsupported methods raise ValueError."""
+    with pytest.raises(ValueError, match="Unsupported fingerprint method"):
+        fingerprint(_screen(0), method="ahash")
+
+
+@pytest.mark.parametrize("method", ["dhash", "phash"])
+def test_index_identifies_screen(method):
+    """Test that the closest reference within range is returned."""
+    index = ScreenFingerprintIndex(method=method, max_distance=10)
+    for seed, name in enumerate(["home", "battle", "shop"]):
+        index.add(name, _screen(seed))
+
+    match = index.match(Frame(_screen(1)))
+
+    assert match is not None
+    assert match.name == "battle"
+    assert match.distance == 0
+    assert match.confidence == 1.0
+    assert len(index) == 3
+
+
+def test_index_no_match_beyond_distance():
+    """Test that unknown screens are rejected."""
+    index = ScreenFingerprintIndex(max_distance=2)
+    index.add("home", _screen(0))
+
+    assert index.match(_screen(42)) is None
+
+
+def test_index_empty_returns_none():
+    """Test that an empty index matches nothing."""
+    assert ScreenFingerprintIndex().match(_screen(0)) is None
+
+
+def test_index_invalid_max_distance():
+    """Test that max_distance must fit in a 64-bit hash."""
+    with pytest.raises(ValueError, match="Max distance"):
+        ScreenFingerprintIndex(max_distance=65)
+
+
+def test_index_from_screens(tmp_path, mock_config):
+    """Test building an index from screen reference images."""
+    paths = []
+    for seed in range(2):
+        path = tmp_path / f"screen_{seed}.png"
+        cv2.imwrite(str(path), _screen(seed))
+        paths.append(path)
+    screens = [
+        PymordialScreen(name="home", reference_images=[paths[0]]),
+        PymordialScreen(name="battle", reference_images=[str(paths[1])]),
+        PymordialScreen(name="no_refs"),
+    ]
+
+    index = ScreenFingerprintIndex.from_screens(screens)
+
+    assert len(index) == 2
+    assert index.match(paths[1].read_bytes()).name == "battle"
@@ -0,0 +1,113 @@
+"""Tests for masked template matching."""
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.vision.templates import (
+    clear_template_cache,
+    load_template,
+    match_template,
+)
+
+
+@pytest.fixture
+def icon():
+    """Returns a 30x30 random grayscale icon and a circular alpha mask."""
+    rng = np.random.default_rng(0)
+    gray = rng.integers(0, 256, size=(30, 30), dtype=np.uint8)
+    alpha = np.zeros((30, 30), dtype=np.uint8)
+    cv2.circle(alpha, (15, 15), 12, 255, -1)
+    return gray, alpha
+
+
+def test_load_template_builds_mask_from_alpha(tmp_path, icon):
+    """Test that a PNG alpha channel becomes a binary mask."""
+    gray, alpha = icon
+    path = tmp_path / "icon.png"
+    cv2.imwrite(str(path), cv2.merge([gray, gray, gray, alpha]))
+
+    template = load_template(path)
+
+    assert template.is_masked
+    assert template.size == (30, 30)
+    assert set(np.unique(template.mask)) == {0, 255}
+
+
+def test_load_template_opaque_has_no_mask(tmp_path, icon):
+    """Test that opaque images are matched without a mask."""
+    gray, _ = icon
+    path = tmp_path / "opaque.png"
+    cv2.imwrite(str(path), cv2.merge([gray, gray, gray, np.full_like(gray, 255)]))
+
+    assert not load_template(path).is_masked
+
+
+def test_load_template_is_cached_and_scaled(tmp_path, icon):
+    """Test caching per scale and resizing of the mask."""
+    clear_template_cache()
+    gray, alpha = icon
+    path = tmp_path / "icon.png"
+    cv2.imwrite(str(path), cv2.merge([gray, gray, gray, alpha]))
+
+    assert load_template(path) is load_template(path)
+    scaled = load_template(path, scale=(2.0, 2.0))
+    assert scaled.size == (60, 60)
+    assert scaled.mask.shape == (60, 60)
+
+
+def test_load_template_missing_file(tmp_path):
+    """Test that unreadable templates raise ValueError."""
+    with pytest.raises(ValueError, match="Could not read template"):
+        load_template(tmp_path / "missing.png")
+
+
+def test_match_template_ignores_masked_background(tmp_path, icon):
+    """Test that a masked template scores highly over a different background."""
+    gray, alpha = icon
+    path = tmp_path / "icon.png"
+    cv2.imwrite(str(path), cv2.merge([gray, gray, gray, alpha]))
+    template = load_template(path)
+
+    scene = np.full((120, 160), 200, dtype=np.uint8)
+    window = scene[40:70, 60:90]
+    window[alpha > 0] = gray[alpha > 0]
+
+    assert match_template(template, scene, confidence=0.99) == (60, 40, 30, 30)
+
+
+def test_match_template_region_and_threshold(icon):
+    """Test region offsets and rejection below confidence."""
+    gray, _ = icon
+    from pymordial.vision.templates import Template
+
+    template = Template(gray=gray, mask=None)
+    scene = np.zeros((100, 100), dtype=np.uint8)
+    scene[60:90, 50:80] = gray
+
+    assert match_template(
+        template, scene, confidence=0.9, region=(40, 40, 100, 100)
+    ) == (50, 60, 30, 30)
+    assert match_template(template, np.zeros((100, 100), np.uint8), 0.9) is None
+    assert match_template(template, scene, 0.9, region=(0, 0, 10, 10)) is None
+
+
+def test_masked_template_rejects_unrelated_scene(icon):
+    """Test that masked matches are verified on the zero-mean score scale."""
+    from pymordial.vision.templates import Template, masked_zncc
+
+    gray, alpha = icon
+    template = Template(gray=gray, mask=alpha)
+    unrelated = np.random.default_rng(1).integers(0, 256, (200, 300), np.uint8)
+
+    ccorr = cv2.matchTemplate(unrelated, gray, cv2.TM_CCORR_NORMED, mask=alpha)
+    assert np.nan_to_num(ccorr).max() > 0.7
+    for confidence in (0.5, 0.7, 0.8):
+        assert match_template(template, unrelated, confidence) is None
+
+    # A brightness-shifted copy still matches on the zero-mean scale
+    shifted = unrelated.copy()
+    window = shifted[100:130, 150:180]
+    window[alpha > 0] = (gray[alpha > 0] // 2 + 100).astype(np.uint8)
+    assert match_template(template, shifted, confidence=0.7) == (150, 100, 30, 30)
+    assert masked_zncc(shifted[100:130, 150:180], template) > 0.99
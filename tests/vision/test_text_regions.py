@@ -0,0 +1,73 @@
+"""Tests for text-region proposals."""
+
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from pymordial.core.frame import Frame
+from pymordial.vision.text_regions import TextRegionDetector
+
+LABELS = [
+    ((150, 200), "Battle Start", 1.2),
+    ((150, 400), "Items", 0.8),
+    ((1200, 900), "HP 100/120", 1.0),
+    ((1600, 100), "Lv 42", 0.7),
+]
+
+
+def _screen(hp: str = "HP 100/120") -> np.ndarray:
+    """Returns a 1920x1080 RGB screen with text on and off a bordered panel."""
+    image = np.full((1080, 1920, 3), (60, 80, 40), dtype=np.uint8)
+    cv2.rectangle(image, (100, 100), (700, 600), (200, 200, 200), -1)
+    cv2.circle(image, (1500, 500), 200, (30, 30, 200), -1)
+    for (x, y), text, scale in LABELS:
+        text = hp if text.startswith("HP") else text
+        color = (0, 0, 0) if x < 700 else (255, 255, 255)
+        cv2.putText(image, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, scale, color, 2)
+    return image
+
+
+def _contains(region, point) -> bool:
+    left, top, right, bottom = region
+    return left <= point[0] < right and top <= point[1] < bottom
+
+
+def test_detects_each_label_and_nothing_else():
+    """Test that every label gets a region and shapes without text do not."""
+    regions = TextRegionDetector(cache_size=0).detect(Frame(_screen()))
+
+    assert len(regions) == len(LABELS)
+    for (x, y), _, _ in LABELS:
+        # Text baseline origin sits just inside the bottom-left of its region
+        assert any(_contains(region, (x + 5, y - 5)) for region in regions)
+    covered = sum((r - l) * (b - t) for l, t, r, b in regions)
+    assert covered < 0.05 * 1920 * 1080
+
+
+def test_regions_are_memoized_per_frame_and_screen():
+    """Test that a frame is analysed once and a similar screen reuses regions."""
+    detector = TextRegionDetector(cache_size=4)
+    frame = Frame(_screen())
+
+    with patch.object(
+        detector, "detect_uncached", wraps=detector.detect_uncached
+    ) as spy:
+        first = detector.detect(frame)
+        assert detector.detect(frame) is first
+        # Same layout, different value: served from the per-screen cache
+        assert detector.detect(Frame(_screen(hp="HP 99/120"))) == first
+        assert spy.call_count == 1
+
+        detector.clear_cache()
+        detector.detect(Frame(_screen(hp="HP 98/120")))
+        assert spy.call_count == 2
+
+
+def test_rejects_invalid_settings():
+    """Test constructor validation."""
+    with pytest.raises(ValueError):
+        TextRegionDetector(detection_width=0)
+    with pytest.raises(ValueError):
+        TextRegionDetector(cache_size=-1)